@@ -1,7 +1,71 @@
 # Test file
 
-# Run with "python cht_01.py"
+# Evaluates every function at the points of a binary file (int64 number of
+# points followed by the float64 x and y coordinates) or at quasi-random
+# points in the domain, and prints the throughput and checksum of each one
 
+# Run with "python test.py [points.bin | npoints] [repeats]"
+
+import os
+import sys
+import math
+import time
+import array
 import cht_01
 
-# Insert code
+# functions, number of components and arguments beyond (x, y)
+FUNCTIONS = [("uA", 2, ()), ("uB", 2, ()), ("phiA", 1, ()), ("phiB", 1, ()), ("fA", 1, ()), ("fB", 1, ())]
+
+# load points from binary file
+def load_points(path):
+    with open(path, "rb") as fh:
+        n = array.array("q")
+        n.fromfile(fh, 1)
+        x = array.array("d")
+        y = array.array("d")
+        x.fromfile(fh, n[0])
+        y.fromfile(fh, n[0])
+    return x, y
+
+# quasi-random points in the domain
+def random_points(n):
+    x = array.array("d", bytes(8*n))
+    y = array.array("d", bytes(8*n))
+    for i in range(n):
+        u = (i + 1)*0.7548776662466927
+        v = (i + 1)*0.5698402909980532
+        u -= math.floor(u)
+        v -= math.floor(v)
+        x[i] = math.sqrt(0.5*0.5 + u*(1.0*1.0 - 0.5*0.5))*math.cos(6.283185307179586*v)
+        y[i] = math.sqrt(0.5*0.5 + u*(1.0*1.0 - 0.5*0.5))*math.sin(6.283185307179586*v)
+    return x, y
+
+# evaluate function at all points
+def evaluate(func, dim, args, x, y):
+    res = []
+    if dim == 1:
+        for xi, yi in zip(x, y):
+            res.append(func(xi, yi, *args))
+    else:
+        for xi, yi in zip(x, y):
+            res.extend(func(xi, yi, *args))
+    return res
+
+arg = sys.argv[1] if len(sys.argv) > 1 else "100000"
+x, y = load_points(arg) if os.path.isfile(arg) else random_points(int(arg))
+repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+print(f"{len(x)} points, {repeats} repeats, 1 threads")
+for func_name, dim, args in FUNCTIONS:
+    func = getattr(cht_01, func_name)
+    best = math.inf
+    for k in range(repeats + 1):
+        start = time.perf_counter()
+        res = evaluate(func, dim, args, x, y)
+        seconds = time.perf_counter() - start
+        if k > 0 or repeats == 0:
+            best = min(best, seconds)
+    checksum = 0.0
+    for value in res:
+        checksum += value
+    print(f"{func_name:<12s} {len(x)/best:12.4e} points/s {1.0e9*best/len(x):10.2f} ns/point  "
+          f"checksum {checksum: .12e}")
@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | BENCHMARKS
+===============================================================================
+
+DESCRIPTION:
+------------
+Benchmark harness comparing the throughput of the generated implementations
+of a case (`codes/<name>.*`) across languages: C/C++ (g++), Fortran
+(gfortran), Octave (when installed) and Python, both the scalar generated
+module and the vectorised NumPy evaluation of `fields.py`. For compiled and
+Octave backends, a driver calling every generated function is written and
+built in a temporary directory; it reads the points from a binary file,
+evaluates each function over all points (one warm-up pass and the best of
+several repetitions) and writes the results back, so that the values of all
+backends are compared with the reference backend. Every function is
+evaluated at the nodes of the cells of each given mesh, and the points per
+second, the nanoseconds per point and the maximum difference to the
+reference backend are reported and appended to a JSON history file, together
+with the hashes of the generated code and the compiler versions.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+– g++, gfortran and Octave (optional, backends skipped when not installed)
+
+USAGE:
+------
+python benchmarks.py ../meshes/triamesh_4.msh ../meshes/quadmesh_4.msh --history benchmarks.json
+python benchmarks.py ../meshes/triamesh_4.msh --backends cpp fortran numpy --repeats 10
+
+===============================================================================
+"""
+
+# import modules
+import os
+import sys
+import glob
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import textwrap
+import subprocess
+import importlib.util
+import numpy as np
+from meshes import load_mesh, file_hash
+from fields import load_bound_case, code_path, DEFAULT_ARGUMENTS
+
+#============================================
+# PARAMETERS
+#============================================
+
+# benchmark backends
+BACKENDS = ["numpy", "python", "cpp", "fortran", "octave"]
+
+# reference backend of the differences
+REFERENCE_BACKEND = "numpy"
+
+# tools required by each backend
+TOOLS = {"cpp": "g++", "fortran": "gfortran", "octave": "octave"}
+
+# generated code file of each backend
+EXTENSIONS = {"python": ".py", "numpy": ".py", "cpp": ".h", "fortran": ".f", "octave": ".m"}
+
+# compiler flags
+CXXFLAGS = ["-O2", "-std=c++11"]
+FFLAGS = ["-O2", "-cpp", "-ffree-form", "-ffree-line-length-none"]
+
+# timed repetitions (after one warm-up pass)
+REPEATS = 5
+
+#============================================
+# FUNCTIONS
+#============================================
+
+# generated functions and their dimensions
+def case_functions(case, x, y):
+    """
+    Return the generated functions of a case as a list of (name, dim, values),
+    with dim 1 for scalar functions and the number of components for vector
+    functions and the values of their arguments beyond (x, y) bound when
+    loading the case (e.g. `t`), and a dictionary {name: error} of the
+    functions that cannot be evaluated at the given points.
+    """
+    functions, failed = [], {}
+    for name, func in case["functions"].items():
+        try:
+            values = func(x[:1], y[:1])
+        except Exception as e:
+            failed[name] = f"{type(e).__name__}: {e}"
+            continue
+        functions.append((name, int(np.prod(values.shape[1:], dtype=np.int64)),
+                          [case["constants"][arg] for arg in case["arguments"][name]]))
+    return functions, failed
+
+# available backends
+def available_backends(codes_dir, backends=None):
+    """
+    Return the requested backends (all by default) whose generated code and
+    tools are available, and a dictionary {backend: reason} of the others.
+    """
+    name = os.path.splitext(os.path.basename(code_path(codes_dir)))[0]
+    found, missing = [], {}
+    for backend in backends or BACKENDS:
+        if backend not in EXTENSIONS:
+            raise ValueError(f"Unknown backend '{backend}' (expected one of {', '.join(BACKENDS)}).")
+        if not os.path.isfile(os.path.join(codes_dir, name + EXTENSIONS[backend])):
+            missing[backend] = f"{name + EXTENSIONS[backend]} not found"
+        elif backend in TOOLS and shutil.which(TOOLS[backend]) is None:
+            missing[backend] = f"{TOOLS[backend]} not installed"
+        else:
+            found.append(backend)
+    return found, missing
+
+# version of a tool
+def tool_version(backend):
+    """
+    Return the first line of the version of the tool of a backend.
+    """
+    if backend not in TOOLS:
+        return platform.python_implementation() + " " + platform.python_version() + ", NumPy " + np.__version__
+    try:
+        out = subprocess.run([TOOLS[backend], "--version"], capture_output=True, text=True, timeout=60).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.splitlines()[0] if out else None
+
+#============================================
+# DRIVERS
+#============================================
+
+# C/C++ driver
+def cpp_driver(name, functions):
+    """
+    Return the source of the C/C++ benchmark driver of the generated functions.
+    """
+    calls = []
+    for func, dim, values in functions:
+        args = "".join(f", {value!r}" for value in values)
+        call = f"res[i] = {func}(x[i], y[i]{args});" if dim == 1 else f"{func}(x[i], y[i]{args}, &res[{dim}*i]);"
+        calls.append(textwrap.indent(textwrap.dedent(f"""
+        {{
+            std::vector<double> res({dim}*npoints);
+            double best = 1.0e300;
+            for (int k = 0; k <= repeats; k++) {{
+                auto start = std::chrono::steady_clock::now();
+                for (long long i = 0; i < npoints; i++) {call}
+                std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+                if (k > 0 && seconds.count() < best) best = seconds.count();
+            }}
+            printf("{func} %.9e\\n", best);
+            fwrite(res.data(), sizeof(double), res.size(), out);
+        }}
+        """).strip(), "    "))
+    return textwrap.dedent("""
+    // Benchmark driver generated by benchmarks.py
+
+    #include <cstdio>
+    #include <cstdlib>
+    #include <chrono>
+    #include <vector>
+    #include "{name}.h"
+
+    int main(int argc, char** argv) {{
+        if (argc < 4) {{
+            fprintf(stderr, "Usage: %s points output repeats\\n", argv[0]);
+            return 1;
+        }}
+        long long npoints;
+        FILE* in = fopen(argv[1], "rb");
+        if (!in || fread(&npoints, sizeof(npoints), 1, in) != 1) return 1;
+        std::vector<double> x(npoints), y(npoints);
+        if (fread(x.data(), sizeof(double), npoints, in) != (size_t)npoints) return 1;
+        if (fread(y.data(), sizeof(double), npoints, in) != (size_t)npoints) return 1;
+        fclose(in);
+        int repeats = atoi(argv[3]);
+        FILE* out = fopen(argv[2], "wb");
+    {calls}
+        fclose(out);
+        return 0;
+    }}
+    """).lstrip().format(name=name, calls="\n".join(calls))
+
+# Fortran driver
+def fortran_driver(name, functions):
+    """
+    Return the source of the Fortran benchmark driver of the generated
+    functions (local names prefixed to avoid clashes with the constants).
+    """
+    calls = []
+    for func, dim, values in functions:
+        args = "".join(f", {value!r}d0" for value in values)
+        call = f"bm_res(1, bm_i) = {func}(bm_x(bm_i), bm_y(bm_i){args})" if dim == 1 \
+            else f"call {func}(bm_x(bm_i), bm_y(bm_i){args}, bm_res(:, bm_i))"
+        calls.append(textwrap.indent(textwrap.dedent(f"""
+        allocate(bm_res({dim}, bm_n))
+        bm_best = huge(1.0d0)
+        do bm_k = 0, bm_repeats
+            call system_clock(bm_count0, bm_rate)
+            do bm_i = 1, bm_n
+                {call}
+            end do
+            call system_clock(bm_count1)
+            if (bm_k > 0) bm_best = min(bm_best, real(bm_count1 - bm_count0, 8)/real(bm_rate, 8))
+        end do
+        print "(a, 1x, es16.9)", "{func}", bm_best
+        write(bm_out) bm_res
+        deallocate(bm_res)
+        """).strip(), "    "))
+    return textwrap.dedent("""
+    ! Benchmark driver generated by benchmarks.py
+
+    #include "{name}.f"
+
+    program benchmark
+
+        use {module}
+
+        implicit none
+        integer(8) :: bm_n, bm_i, bm_count0, bm_count1, bm_rate
+        integer :: bm_k, bm_repeats, bm_in, bm_out
+        real(8), allocatable :: bm_x(:), bm_y(:), bm_res(:, :)
+        real(8) :: bm_best
+        character(len=4096) :: bm_arg
+
+        call get_command_argument(1, bm_arg)
+        open(newunit=bm_in, file=trim(bm_arg), access="stream", form="unformatted", status="old")
+        read(bm_in) bm_n
+        allocate(bm_x(bm_n), bm_y(bm_n))
+        read(bm_in) bm_x
+        read(bm_in) bm_y
+        close(bm_in)
+        call get_command_argument(3, bm_arg)
+        read(bm_arg, *) bm_repeats
+        call get_command_argument(2, bm_arg)
+        open(newunit=bm_out, file=trim(bm_arg), access="stream", form="unformatted", status="replace")
+    {calls}
+        close(bm_out)
+
+    end program benchmark
+    """).lstrip().format(name=name, module=name.upper(), calls="\n".join(calls))
+
+# Octave driver
+def octave_driver(name, functions):
+    """
+    Return the source of the Octave benchmark driver of the generated
+    functions (called point by point, as their vector results require).
+    """
+    calls = []
+    for func, dim, values in functions:
+        args = "".join(f", {value!r}" for value in values)
+        calls.append(textwrap.dedent(f"""
+        bm_res = zeros({dim}, bm_n);
+        bm_best = Inf;
+        for bm_k = 0:bm_repeats
+            tic;
+            for bm_i = 1:bm_n
+                bm_res(:, bm_i) = {func}(bm_x(bm_i), bm_y(bm_i){args});
+            end
+            bm_seconds = toc;
+            if bm_k > 0
+                bm_best = min(bm_best, bm_seconds);
+            end
+        end
+        printf("%s %.9e\\n", "{func}", bm_best);
+        fwrite(bm_out, bm_res, "double");
+        """).strip())
+    return textwrap.dedent("""
+    % Benchmark driver generated by benchmarks.py
+
+    {name}
+
+    bm_args = argv();
+    bm_in = fopen(bm_args{{1}}, "r");
+    bm_n = fread(bm_in, 1, "int64");
+    bm_x = fread(bm_in, bm_n, "double");
+    bm_y = fread(bm_in, bm_n, "double");
+    fclose(bm_in);
+    bm_repeats = str2double(bm_args{{3}});
+    bm_out = fopen(bm_args{{2}}, "w");
+
+    {calls}
+
+    fclose(bm_out);
+    """).lstrip().format(name=name, calls="\n\n".join(calls))
+
+# build driver
+def build_driver(backend, codes_dir, name, functions, builddir):
+    """
+    Write (and compile) the benchmark driver of a backend in `builddir` and
+    return the command running it (followed by the points file, output file
+    and repetitions).
+    """
+    codes_dir = os.path.abspath(codes_dir)
+    if backend == "cpp":
+        source, exe = os.path.join(builddir, "benchmark.cpp"), os.path.join(builddir, "benchmark_cpp")
+        with open(source, "w", encoding="utf-8") as fh:
+            fh.write(cpp_driver(name, functions))
+        subprocess.run([TOOLS[backend]] + CXXFLAGS + ["-I", codes_dir, source, "-o", exe],
+                       check=True, capture_output=True, text=True)
+        return [exe]
+    if backend == "fortran":
+        source, exe = os.path.join(builddir, "benchmark.f90"), os.path.join(builddir, "benchmark_fortran")
+        with open(source, "w", encoding="utf-8") as fh:
+            fh.write(fortran_driver(name, functions))
+        subprocess.run([TOOLS[backend]] + FFLAGS + ["-I", codes_dir, "-J", builddir, source, "-o", exe],
+                       check=True, capture_output=True, text=True)
+        return [exe]
+    if backend == "octave":
+        source = os.path.join(builddir, "benchmark_octave.m")
+        with open(source, "w", encoding="utf-8") as fh:
+            fh.write(octave_driver(name, functions))
+        return [TOOLS[backend], "--no-gui", "--quiet", "--path", codes_dir, source]
+    raise ValueError(f"Backend '{backend}' has no driver.")
+
+# run driver
+def run_driver(command, x, y, functions, repeats, builddir):
+    """
+    Run a benchmark driver on the points (x, y) and return the best times
+    {name: seconds} and the values {name: (n, ...)} of the functions.
+    """
+    points, output = os.path.join(builddir, "points.bin"), os.path.join(builddir, "values.bin")
+    with open(points, "wb") as fh:
+        fh.write(np.array([len(x)], dtype="<i8").tobytes())
+        fh.write(np.ascontiguousarray(x, dtype="<f8").tobytes())
+        fh.write(np.ascontiguousarray(y, dtype="<f8").tobytes())
+    out = subprocess.run(command + [points, output, str(repeats)], check=True, capture_output=True,
+                         text=True).stdout
+    times = {}
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            times[parts[0]] = float(parts[1])
+    data = np.fromfile(output, dtype="<f8")
+    values, offset = {}, 0
+    for func, dim, _ in functions:
+        size = dim*len(x)
+        values[func] = data[offset:offset + size].reshape((len(x),) + ((dim,) if dim > 1 else ()))
+        offset += size
+    return times, values
+
+#============================================
+# PYTHON BACKENDS
+#============================================
+
+# scalar generated module
+def load_module(codes_dir):
+    """
+    Import the generated Python code of a case as a standalone module (with
+    the standard `math` functions).
+    """
+    path = code_path(codes_dir)
+    spec = importlib.util.spec_from_file_location("benchmark_" + os.path.splitext(os.path.basename(path))[0], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# time a Python backend
+def run_python(evaluate, x, y, functions, repeats):
+    """
+    Time evaluate(name, x, y) for the generated functions (one warm-up pass
+    and the best of the repetitions) and return the best times and values.
+    """
+    times, values = {}, {}
+    for func, dim, _ in functions:
+        best = np.inf
+        for k in range(repeats + 1):
+            start = time.perf_counter()
+            res = evaluate(func, x, y)
+            seconds = time.perf_counter() - start
+            if k > 0:
+                best = min(best, seconds)
+        times[func] = best
+        values[func] = np.asarray(res, dtype=np.float64).reshape((len(x),) + ((dim,) if dim > 1 else ()))
+    return times, values
+
+# Python evaluators
+def python_evaluator(backend, case, codes_dir):
+    """
+    Return evaluate(name, x, y) of a Python backend: the vectorised NumPy
+    functions of the case, or the scalar generated module point by point
+    (with the arguments bound in the case).
+    """
+    if backend == "numpy":
+        return lambda func, x, y: case["functions"][func](x, y)
+    module = load_module(codes_dir)
+    def evaluate(func, x, y):
+        args = [case["constants"][arg] for arg in case["arguments"][func]]
+        return [getattr(module, func)(xi, yi, *args) for xi, yi in zip(x.tolist(), y.tolist())]
+    return evaluate
+
+#============================================
+# BENCHMARK
+#============================================
+
+# maximum difference
+def max_difference(values, reference):
+    """
+    Return the maximum absolute difference of two arrays over the points where
+    both are finite (NaN when there are none).
+    """
+    finite = np.isfinite(values) & np.isfinite(reference)
+    return float(np.abs(values[finite] - reference[finite]).max()) if finite.any() else float("nan")
+
+# benchmark points of a mesh
+def mesh_points(mesh):
+    """
+    Return the nodes of a mesh used by its cells (excluding, e.g., the centres
+    of circles kept by Gmsh).
+    """
+    nodes = np.asarray(mesh["nodes"], dtype=np.float64)
+    return nodes[np.unique(np.asarray(mesh["cells"]))]
+
+# benchmark backends on meshes
+def run_benchmarks(paths, codes_dir="../codes", backends=None, repeats=REPEATS, params=None):
+    """
+    Benchmark the generated functions of a case on the nodes of the given
+    meshes and return a history record with, for each mesh, backend and
+    function, the best time, points per second, nanoseconds per point and
+    maximum difference to the reference backend (or an error message).
+    Parameters (e.g. `t`) are passed to `fields.load_case`, with the
+    arguments not given bound to `fields.DEFAULT_ARGUMENTS`.
+    """
+    case = load_bound_case(codes_dir, params)
+    params = case["params"]
+    name = case["name"]
+    backends, missing = available_backends(codes_dir, backends)
+    meshes = [(path, mesh_points(load_mesh(path))) for path in paths]
+    functions, failed = case_functions(case, meshes[0][1][:, 0], meshes[0][1][:, 1])
+    record = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "case": name, "host": platform.node(),
+        "machine": platform.machine(), "repeats": repeats, "params": dict(params or {}),
+        "code_hashes": {os.path.basename(path): file_hash(path)
+                        for path in sorted(glob.glob(os.path.join(codes_dir, name + ".*")))},
+        "versions": {backend: tool_version(backend) for backend in backends},
+        "skipped": dict(missing, **{f"function {func}": error for func, error in failed.items()}),
+        "meshes": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="benchmarks_") as builddir:
+        runners = {}
+        for backend in backends:
+            if backend in TOOLS:
+                try:
+                    command = build_driver(backend, codes_dir, name, functions, builddir)
+                except subprocess.CalledProcessError as e:
+                    record["skipped"][backend] = "build failed: " + "\n".join((e.stderr or "").splitlines()[:8])
+                    continue
+                runners[backend] = lambda x, y, command=command: run_driver(command, x, y, functions, repeats,
+                                                                            builddir)
+            else:
+                evaluate = python_evaluator(backend, case, codes_dir)
+                runners[backend] = lambda x, y, evaluate=evaluate: run_python(evaluate, x, y, functions, repeats)
+        for path, nodes in meshes:
+            x, y = nodes[:, 0].copy(), nodes[:, 1].copy()
+            results, values = {}, {}
+            for backend, runner in runners.items():
+                try:
+                    times, values[backend] = runner(x, y)
+                except (subprocess.CalledProcessError, OSError, ValueError, ArithmeticError) as e:
+                    results[backend] = {"error": str(e)}
+                    continue
+                results[backend] = {func: {"seconds": times[func], "points_per_second": len(x)/times[func],
+                                           "ns_per_point": 1.0e9*times[func]/len(x)}
+                                    for func, _, _ in functions if func in times}
+            reference = REFERENCE_BACKEND if REFERENCE_BACKEND in values else next(iter(values), None)
+            for backend, vals in values.items():
+                for func, entry in results[backend].items():
+                    entry["max_difference"] = max_difference(vals[func], values[reference][func])
+            record["meshes"][os.path.basename(path)] = {"points": len(x), "reference": reference,
+                                                        "backends": results}
+    return record
+
+#============================================
+# HISTORY
+#============================================
+
+# read history
+def read_history(path):
+    """
+    Return the records of a JSON history file (empty when not found).
+    """
+    if not os.path.isfile(path):
+        return []
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+# append to history
+def append_history(path, record):
+    """
+    Append a record to a JSON history file (rewritten and renamed into place).
+    """
+    history = read_history(path) + [record]
+    fd, tmpfile = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp_", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(history, fh, indent=2)
+    os.replace(tmpfile, path)
+
+# print benchmark results
+def print_benchmarks(record):
+    """
+    Print the results of a benchmark record as a table per mesh.
+    """
+    for reason in record["skipped"].items():
+        print("Skipped %s: %s" % reason)
+    if record.get("params"):
+        print("Arguments:", ", ".join(f"{key} = {value}" for key, value in record["params"].items()))
+    for mesh, res in record["meshes"].items():
+        print(f"\n{mesh} ({res['points']} points, differences to {res['reference']})")
+        print(f"{'backend':>10s} {'function':>12s} {'points/s':>12s} {'ns/point':>10s} {'max diff':>10s}")
+        for backend, funcs in res["backends"].items():
+            if "error" in funcs:
+                print(f"{backend:>10s} {'error: ' + funcs['error']}")
+                continue
+            for func, entry in funcs.items():
+                print(f"{backend:>10s} {func:>12s} {entry['points_per_second']:12.4e} {entry['ns_per_point']:10.2f} "
+                      f"{entry['max_difference']:10.2e}")
+
+#============================================
+# MAIN
+#============================================
+
+# run benchmarks from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the generated code across languages.")
+    parser.add_argument("files", nargs="+", help="mesh files in MSH format (functions evaluated at the nodes)")
+    parser.add_argument("--backends", nargs="*", choices=BACKENDS, help="backends (default: all available)")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="timed repetitions")
+    parser.add_argument("--time", type=float, help="time of unsteady cases (argument `t` of the functions, "
+                        f"default {DEFAULT_ARGUMENTS['t']})")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    parser.add_argument("--history", help="append the results to this JSON history file")
+    args = parser.parse_args(argv)
+    params = {"t": args.time} if args.time is not None else None
+    try:
+        record = run_benchmarks(args.files, args.codes, args.backends, args.repeats, params)
+    except ValueError as e:
+        parser.error(str(e))
+    print_benchmarks(record)
+    if args.history:
+        append_history(args.history, record)
+        print("\nAppended to", args.history)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
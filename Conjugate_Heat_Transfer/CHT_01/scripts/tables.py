@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | TABLES
+===============================================================================
+
+DESCRIPTION:
+------------
+Optional tabulation layer for the generated functions of a case that depend
+only on the polar angle theta (e.g. the radii and normals of the curved
+boundaries and interfaces, `RAB` and `nAB`), detected symbolically by the
+code generator (`DEPENDENCIES` of `codes/<name>_factors.py`). At load time
+each angular function is sampled on a uniform periodic grid of theta, and is
+then evaluated by local Lagrange interpolation of degree TABLE_DEGREE on the
+periodic samples, stored as the polynomial coefficients of every interval,
+so that an evaluation costs one atan2, a table lookup and a Horner
+evaluation instead of the square roots and trigonometric functions of the
+generated code.
+The grid is doubled until an error bound of the interpolation is below the
+tolerance. The bound combines the interpolation error of the trigonometric
+interpolant of the samples (from the Fourier coefficients of the samples,
+bounding its derivative of order TABLE_DEGREE + 1) with the aliasing error
+estimated from the trailing half of the spectrum, amplified by the Lebesgue
+constant of the local interpolation. The bound is checked against the
+measured error at the midpoints and quasi-random points of every interval,
+and functions that are not resolved (e.g. not periodic) below TABLE_MAX_SIZE
+samples keep the generated code.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python tables.py --tol 1e-12
+python tables.py --points 1000000 --codes ../codes
+
+===============================================================================
+"""
+
+# import modules
+import sys
+import time
+import math
+import argparse
+import numpy as np
+from fields import load_bound_case, vectorize
+
+#============================================
+# PARAMETERS
+#============================================
+
+# degree of the local interpolation (odd, centred stencil of TABLE_DEGREE + 1 samples)
+TABLE_DEGREE = 5
+
+# relative tolerance of the error bound (to the largest value)
+TABLE_TOLERANCE = 1.0e-12
+
+# initial and largest number of samples per period (powers of 2)
+TABLE_MIN_SIZE = 64
+TABLE_MAX_SIZE = 1 << 20
+
+# check points per interval (midpoint and quasi-random points)
+TABLE_CHECKS = 3
+
+# coordinate of the tabulated functions
+ANGULAR_COORDINATE = "theta"
+
+#============================================
+# INTERPOLATION
+#============================================
+
+# local interpolation matrix
+def stencil_matrix(degree=TABLE_DEGREE):
+    """
+    Return the offsets of the samples of the stencil of an interval (from -m+1
+    to m, with m = (degree + 1)/2) and the matrix mapping them to the
+    coefficients of the interpolating polynomial in the local coordinate s in
+    [0, 1] of the interval.
+    """
+    if degree % 2 == 0:
+        raise ValueError(f"The degree of the interpolation must be odd (got {degree}).")
+    offsets = np.arange(-(degree - 1)//2, (degree + 1)//2 + 1)
+    return offsets, np.linalg.inv(np.vander(offsets.astype(np.float64), increasing=True))
+
+# constants of the local interpolation error
+def stencil_constants(degree=TABLE_DEGREE, samples=2001):
+    """
+    Return the maximum over [0, 1] of |prod(s - offsets)|/(degree + 1)! (the
+    factor of h^(degree+1) max|f^(degree+1)| in the interpolation error) and
+    the Lebesgue constant of the local interpolation.
+    """
+    offsets, matrix = stencil_matrix(degree)
+    s = np.linspace(0.0, 1.0, samples)
+    node = np.abs(np.prod(s[:, None] - offsets[None, :], axis=1)).max()/math.factorial(degree + 1)
+    lebesgue = np.abs(np.vander(s, degree + 1, increasing=True) @ matrix).sum(axis=1).max()
+    return float(node), float(lebesgue)
+
+# coefficients of the interval polynomials
+def table_coefficients(samples, degree=TABLE_DEGREE):
+    """
+    Return the coefficients (degree + 1, d, n) of the polynomials of the n
+    intervals of periodic samples (n, d), in increasing powers of the local
+    coordinate (contiguous by power and component for the lookups).
+    """
+    offsets, matrix = stencil_matrix(degree)
+    n = len(samples)
+    stencils = samples[(np.arange(n)[:, None] + offsets[None, :]) % n]
+    return np.ascontiguousarray(np.einsum("kj,njd->kdn", matrix, stencils))
+
+# evaluate interval polynomials
+def table_evaluate(coefficients, theta):
+    """
+    Evaluate the periodic table of coefficients (degree + 1, d, n), n a power
+    of 2, at angles theta in [-pi, pi], returning a list of d arrays of the
+    shape of theta.
+    """
+    ncoef, dim, n = coefficients.shape
+    u = np.asarray(theta, dtype=np.float64)*(n/(2.0*np.pi))
+    u += n
+    index = u.astype(np.intp)
+    s = u - index
+    index &= n - 1
+    res = []
+    for j in range(dim):
+        comp = coefficients[-1, j].take(index)
+        for k in range(ncoef - 2, -1, -1):
+            comp *= s
+            comp += coefficients[k, j].take(index)
+        res.append(comp)
+    return res
+
+# error bound of a table
+def error_bound(samples, degree=TABLE_DEGREE):
+    """
+    Return a bound of the interpolation error of a table of periodic samples
+    (n, d): the interpolation error of their trigonometric interpolant, with
+    the derivative of order degree + 1 bounded by its Fourier coefficients,
+    plus the aliasing error estimated from the trailing half of the spectrum
+    amplified by the Lebesgue constant, and the rounding errors of the
+    coefficients and of their evaluation.
+    """
+    n = len(samples)
+    coeffs = np.abs(np.fft.fft(samples, axis=0))/n
+    k = np.abs(np.fft.fftfreq(n, 1.0/n))
+    derivative = ((k**(degree + 1))[:, None]*coeffs).sum(axis=0)
+    node, lebesgue = stencil_constants(degree)
+    interpolation = node*(2.0*np.pi/n)**(degree + 1)*derivative
+    aliasing = 2.0*coeffs[k > n//4].sum(axis=0)
+    coefficients = np.abs(table_coefficients(samples, degree)).sum(axis=0).max(axis=-1)
+    rounding = 2.0*(degree + 1)*np.finfo(np.float64).eps*(coefficients + lebesgue*np.abs(samples).max(axis=0))
+    return float((interpolation + (1.0 + lebesgue)*aliasing + rounding).max())
+
+#============================================
+# TABLES
+#============================================
+
+# angular functions of a case
+def angular_functions(case):
+    """
+    Return the names of the generated functions that depend only on theta
+    (among the coordinates), from the dependencies found by the code
+    generator.
+    """
+    return [name for name, deps in case.get("dependencies", {}).items()
+            if list(deps) == [ANGULAR_COORDINATE] and name in case["functions"]]
+
+# tabulate a function of theta
+def tabulate(func, tol=TABLE_TOLERANCE, degree=TABLE_DEGREE, min_size=TABLE_MIN_SIZE, max_size=TABLE_MAX_SIZE):
+    """
+    Tabulate a vectorised function of the points (x, y) depending only on
+    their polar angle, doubling the samples until the error bound is below
+    tol*max(1, max|f|) and the errors measured at the check points are below
+    the bound. Returns the table {"coefficients", "size", "bound",
+    "measured", "dim"}, or None when not resolved with max_size samples.
+    """
+    n = min_size
+    while n <= max_size:
+        theta = 2.0*np.pi*np.arange(n)/n
+        values = np.asarray(func(np.cos(theta), np.sin(theta)))
+        samples = values.reshape(n, -1)
+        if not np.isfinite(samples).all():
+            return None
+        bound = error_bound(samples, degree)
+        scale = max(1.0, float(np.abs(samples).max()))
+        if bound <= tol*scale:
+            coefficients = table_coefficients(samples, degree)
+            offsets = (np.arange(TABLE_CHECKS) + 0.5)/TABLE_CHECKS
+            offsets[1:] = (offsets[1:] + 0.6180339887498949*np.arange(1, TABLE_CHECKS)) % 1.0
+            check = (2.0*np.pi/n)*(np.arange(n)[:, None] + offsets[None, :]).ravel() - np.pi
+            exact = np.asarray(func(np.cos(check), np.sin(check))).reshape(len(check), -1)
+            measured = float(np.abs(np.stack(table_evaluate(coefficients, check), axis=-1) - exact).max())
+            if measured <= bound:
+                return {"coefficients": coefficients, "size": n, "bound": bound, "measured": measured,
+                        "dim": values.shape[1:]}
+        n *= 2
+    return None
+
+# tabulated function
+def table_function(table, name):
+    """
+    Return a vectorised function of the points (x, y) evaluating a table at
+    their polar angle, with the shape of the generated function.
+    """
+    coefficients, dim = table["coefficients"], table["dim"]
+    def func(x, y):
+        values = table_evaluate(coefficients, np.arctan2(y, x))
+        return values if dim else values[0]
+    func.__name__ = name
+    return vectorize(func)
+
+# tabulate the angular functions of a case
+def tabulate_case(case, names=None, tol=TABLE_TOLERANCE, degree=TABLE_DEGREE, max_size=TABLE_MAX_SIZE):
+    """
+    Return a copy of a case (see `fields.load_case`) with the angular
+    functions (all by default) replaced by their tables, and the tables
+    {name: table} of the tabulated functions (functions not resolved keep the
+    generated code).
+    """
+    funcs = dict(case["functions"])
+    tables = {}
+    for name in angular_functions(case) if names is None else names:
+        table = tabulate(case["functions"][name], tol, degree, max_size=max_size)
+        if table is not None:
+            tables[name] = table
+            funcs[name] = table_function(table, name)
+    return dict(case, functions=funcs, tables=tables)
+
+#============================================
+# MAIN
+#============================================
+
+# tabulate and time the angular functions from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tabulate the angular functions of a case.")
+    parser.add_argument("--tol", type=float, default=TABLE_TOLERANCE, help="relative tolerance of the error bound")
+    parser.add_argument("--degree", type=int, default=TABLE_DEGREE, help="degree of the local interpolation (odd)")
+    parser.add_argument("--points", type=int, default=100000, help="boundary points timed (0 to skip)")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    args = parser.parse_args(argv)
+    case = load_bound_case(args.codes)
+    names = angular_functions(case)
+    if not names:
+        print("No angular functions in", case["path"])
+        return 0
+    start = time.perf_counter()
+    tabulated = tabulate_case(case, names, args.tol, args.degree)
+    print(f"Tabulated in {time.perf_counter() - start:.3f} s")
+    theta = np.random.default_rng(0).uniform(-np.pi, np.pi, args.points)
+    x, y = np.cos(theta), np.sin(theta)
+    print(f"{'function':>12s} {'samples':>9s} {'bound':>10s} {'measured':>10s} {'exact ns':>9s} {'table ns':>9s}")
+    for name in names:
+        table = tabulated["tables"].get(name)
+        if table is None:
+            print(f"{name:>12s} not resolved (generated code kept)")
+            continue
+        times = []
+        for funcs in (case["functions"], tabulated["functions"]):
+            start = time.perf_counter()
+            funcs[name](x, y)
+            times.append(1.0e9*(time.perf_counter() - start)/max(args.points, 1))
+        print(f"{name:>12s} {table['size']:9d} {table['bound']:10.2e} {table['measured']:10.2e} "
+              f"{times[0]:9.2f} {times[1]:9.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
@@ -6,7 +6,7 @@ implicit none
 
 ! Global constants
 real(8), parameter :: rA = 1.0
-real(8), parameter :: rAB = 0.75
+real(8), parameter :: const_rAB = 0.75
 real(8), parameter :: rB = 0.5
 real(8), parameter :: betaAB_1 = 0.04
 real(8), parameter :: betaAB_2 = 8.0
@@ -26,7 +26,7 @@ function RAB(x, y) result(res)
     real(8) :: theta
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    res = rAB*(betaAB_1*cos(betaAB_2*theta) + 1)
+    res = const_rAB*(betaAB_1*cos(betaAB_2*theta) + 1)
 end function RAB
 
 ! Subroutine nAB
@@ -59,10 +59,12 @@ subroutine uA(x, y, res)
     real(8) :: theta
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    res(1) = -r*wA*sin(theta) + (-betaAB_1*betaAB_2*r**2*rAB*wA*sin(betaAB_2*theta) + betaAB_1*betaAB_2 &
-        *r*rA*rAB*wA*sin(betaAB_2*theta))*cos(theta)/( betaAB_1*rAB*cos(betaAB_2*theta) - rA + rAB)
-    res(2) = r*wA*cos(theta) + (-betaAB_1*betaAB_2*r**2*rAB*wA*sin(betaAB_2*theta) + betaAB_1*betaAB_2 &
-        *r*rA*rAB*wA*sin(betaAB_2*theta))*sin(theta)/( betaAB_1*rAB*cos(betaAB_2*theta) - rA + rAB)
+    res(1) = -r*wA*sin(theta) + (-betaAB_1*betaAB_2*r**2*const_rAB*wA*sin(betaAB_2*theta) + betaAB_1 &
+        *betaAB_2*r*rA*const_rAB*wA*sin(betaAB_2*theta))*cos(theta)/( betaAB_1*const_rAB*cos(betaAB_2 &
+        *theta) - rA + const_rAB)
+    res(2) = r*wA*cos(theta) + (-betaAB_1*betaAB_2*r**2*const_rAB*wA*sin(betaAB_2*theta) + betaAB_1 &
+        *betaAB_2*r*rA*const_rAB*wA*sin(betaAB_2*theta))*sin(theta)/( betaAB_1*const_rAB*cos(betaAB_2 &
+        *theta) - rA + const_rAB)
 end subroutine uA
 
 ! Subroutine uB
@@ -74,10 +76,12 @@ subroutine uB(x, y, res)
     real(8) :: theta
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    res(1) = -r*wB*sin(theta) + (-betaAB_1*betaAB_2*r**2*rAB*wB*sin(betaAB_2*theta) + betaAB_1*betaAB_2 &
-        *r*rAB*rB*wB*sin(betaAB_2*theta))*cos(theta)/( betaAB_1*rAB*cos(betaAB_2*theta) + rAB - rB)
-    res(2) = r*wB*cos(theta) + (-betaAB_1*betaAB_2*r**2*rAB*wB*sin(betaAB_2*theta) + betaAB_1*betaAB_2 &
-        *r*rAB*rB*wB*sin(betaAB_2*theta))*sin(theta)/( betaAB_1*rAB*cos(betaAB_2*theta) + rAB - rB)
+    res(1) = -r*wB*sin(theta) + (-betaAB_1*betaAB_2*r**2*const_rAB*wB*sin(betaAB_2*theta) + betaAB_1 &
+        *betaAB_2*r*const_rAB*rB*wB*sin(betaAB_2*theta))*cos(theta)/( betaAB_1*const_rAB*cos(betaAB_2 &
+        *theta) + const_rAB - rB)
+    res(2) = r*wB*cos(theta) + (-betaAB_1*betaAB_2*r**2*const_rAB*wB*sin(betaAB_2*theta) + betaAB_1 &
+        *betaAB_2*r*const_rAB*rB*wB*sin(betaAB_2*theta))*sin(theta)/( betaAB_1*const_rAB*cos(betaAB_2 &
+        *theta) + const_rAB - rB)
 end subroutine uB
 
 ! Function phiA
@@ -91,14 +95,16 @@ function phiA(x, y) result(res)
     real(8) :: bA
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    aA = alphaB/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( rAB))
-    bA = (alphaA*log(rAB) - alphaA*log(rB) - alphaB*log(rAB))/(alphaA*log(rAB) - alphaA*log(rB) &
-        + alphaB*log(rA) - alphaB*log(rAB))
-    res = aA*log((betaAB_1**2*r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB* cos(betaAB_2*theta) &
-        + 2.0d0*betaAB_1*r*rAB**2*cos(betaAB_2*theta ) - betaAB_1*rA*rAB*rB*cos(betaAB_2 &
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2 &
-        *theta)**2 - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2.0d0*betaAB_1*rAB**2*cos( betaAB_2 &
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bA
+    aA = alphaB/(alphaA*log(const_rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( const_rAB))
+    bA = (alphaA*log(const_rAB) - alphaA*log(rB) - alphaB*log(const_rAB))/(alphaA*log(const_rAB) &
+        - alphaA*log(rB) + alphaB*log(rA) - alphaB*log(const_rAB))
+    res = aA*log((betaAB_1**2*r*const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB &
+        * cos(betaAB_2*theta) + 2.0d0*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta ) &
+        - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r &
+        *const_rAB**2 - r*const_rAB*rB)/(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) + 2.0d0*betaAB_1*const_rAB**2 &
+        *cos( betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB &
+        + rA*rB + const_rAB**2 - const_rAB*rB)) + bA
 end function phiA
 
 ! Function phiB
@@ -112,13 +118,16 @@ function phiB(x, y) result(res)
     real(8) :: bB
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    aB = alphaA/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( rAB))
-    bB = -alphaA*log(rB)/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log(rAB))
-    res = aB*log((betaAB_1**2*r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB* cos(betaAB_2*theta) &
-        + 2.0d0*betaAB_1*r*rAB**2*cos(betaAB_2*theta ) - betaAB_1*rA*rAB*rB*cos(betaAB_2 &
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2 &
-        *theta)**2 - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2.0d0*betaAB_1*rAB**2*cos( betaAB_2 &
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bB
+    aB = alphaA/(alphaA*log(const_rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( const_rAB))
+    bB = -alphaA*log(rB)/(alphaA*log(const_rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB &
+        *log(const_rAB))
+    res = aB*log((betaAB_1**2*r*const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB &
+        * cos(betaAB_2*theta) + 2.0d0*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta ) &
+        - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r &
+        *const_rAB**2 - r*const_rAB*rB)/(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) + 2.0d0*betaAB_1*const_rAB**2 &
+        *cos( betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB &
+        + rA*rB + const_rAB**2 - const_rAB*rB)) + bB
 end function phiB
 
 ! Function fA
@@ -132,162 +141,195 @@ function fA(x, y) result(res)
     real(8) :: bA
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    aA = alphaB/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( rAB))
-    bA = (alphaA*log(rAB) - alphaA*log(rB) - alphaB*log(rAB))/(alphaA*log(rAB) - alphaA*log(rB) &
-        + alphaB*log(rA) - alphaB*log(rAB))
-    res = -alphaA*((-2*aA*betaAB_1*r*rAB*cos(betaAB_2*theta)/(betaAB_1**2*r*rAB**2 *cos(betaAB_2*theta) &
-        **2 - betaAB_1*r**2*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rA*rAB*rB*cos( betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) &
-        + aA* r*(-betaAB_1**2*rAB**2*cos(betaAB_2*theta)**2 + 2*betaAB_1*r*rAB* cos(betaAB_2 &
-        *theta) - 2*betaAB_1*rAB**2*cos(betaAB_2*theta) + rA* rAB - rA*rB - rAB**2 + rAB*rB) &
-        *(betaAB_1**2*rAB**2*cos(betaAB_2* theta)**2 - 2*betaAB_1*r*rAB*cos(betaAB_2*theta) + 2 &
-        *betaAB_1*rAB **2*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/( betaAB_1**2 &
-        *r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB* cos(betaAB_2*theta) + 2*betaAB_1 &
-        *r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r &
-        *rA*rB + r* rAB**2 - r*rAB*rB)**2 + aA*(betaAB_1**2*rAB**2*cos(betaAB_2*theta )**2 - 2 &
-        *betaAB_1*r*rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2* cos(betaAB_2*theta) - rA*rAB &
-        + rA*rB + rAB**2 - rAB*rB)/(betaAB_1 **2*r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r* &
-        *2*rAB*cos( betaAB_2*theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB &
-        *rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r* rAB**2 - r*rAB*rB))/r + (aA*((2 &
-        *betaAB_1**2*betaAB_2*rAB**2*sin( betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*rA*rAB* sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*sin(betaAB_2 &
-        * theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(betaAB_1 **2*r*rAB**2 &
-        *cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*cos( betaAB_2*theta) + 2*betaAB_1*r*rAB**2 &
-        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r &
-        * rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB &
-        *cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos( betaAB_2*theta) - betaAB_1*rAB*rB &
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2*betaAB_2 &
-        *r*rAB**2* sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*r**2* rAB &
-        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*rAB**2*sin( betaAB_2*theta) + betaAB_1 &
-        *betaAB_2*rA*rAB*rB*sin(betaAB_2*theta ))/(betaAB_1**2*rAB**2*cos(betaAB_2*theta)**2 &
-        - betaAB_1*rA*rAB* cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2*betaAB_1 &
-        **2*betaAB_2*rAB**2*sin(betaAB_2*theta)*cos( betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB &
-        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2*sin(betaAB_2*theta) + betaAB_1 &
-        * betaAB_2*rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2*r*rAB**2*cos( betaAB_2*theta)**2 &
-        - betaAB_1*r**2*rAB*cos(betaAB_2*theta) + 2* betaAB_1*r*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rA*rAB*rB*cos( betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) &
-        + aA* ((2*betaAB_1**2*betaAB_2*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2* theta) &
-        - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2* betaAB_1*betaAB_2*rAB**2 &
-        *sin(betaAB_2*theta) - betaAB_1*betaAB_2* rAB*rB*sin(betaAB_2*theta))*(betaAB_1**2*r &
-        *rAB**2*cos(betaAB_2* theta)**2 - betaAB_1*r**2*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r &
-        * rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2* theta) - r*rA*rAB + r &
-        *rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2* rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*rA &
-        *rAB*cos(betaAB_2* theta) + 2*betaAB_1*rAB**2*cos(betaAB_2*theta) - betaAB_1*rAB*rB &
-        * cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2* betaAB_1**2 &
-        *betaAB_2*r*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2* theta) + betaAB_1*betaAB_2*r**2 &
-        *rAB*sin(betaAB_2*theta) - 2* betaAB_1*betaAB_2*r*rAB**2*sin(betaAB_2*theta) + betaAB_1 &
-        * betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2*rAB**2*cos( betaAB_2*theta)**2 &
-        - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2* betaAB_1*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rAB*rB*cos( betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2 &
-        *betaAB_1 **2*betaAB_2*r*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*r**2*rAB*sin(betaAB_2*theta) + 2*betaAB_1* betaAB_2*r*rAB**2*sin(betaAB_2 &
-        *theta) - betaAB_1*betaAB_2*rA*rAB* rB*sin(betaAB_2*theta))*(betaAB_1**2*rAB**2 &
-        *cos(betaAB_2*theta)** 2 - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 &
-        *cos( betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 &
-        - rAB*rB)/(betaAB_1**2*r*rAB**2*cos(betaAB_2*theta )**2 - betaAB_1*r**2*rAB &
-        *cos(betaAB_2*theta) + 2*betaAB_1*r*rAB** 2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB &
-        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*((2*betaAB_1* &
-        *2 *betaAB_2*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB &
-        *sin(betaAB_2*theta) + 2*betaAB_1* betaAB_2*rAB**2*sin(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*rAB*rB* sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*rAB**2*sin(betaAB_2 &
-        * theta)*cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB*sin( betaAB_2*theta) + 4 &
-        *betaAB_1*betaAB_2*rAB**2*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2 &
-        *theta))*(betaAB_1**2*r* rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*cos(betaAB_2 &
-        * theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA* rAB*rB*cos(betaAB_2 &
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r* rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2 &
-        *theta)**2 - betaAB_1*rA* rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos(betaAB_2 &
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**3 &
-        + 2*(2*betaAB_1**2*betaAB_2*rAB**2*sin(betaAB_2*theta) *cos(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*rA*rAB*sin(betaAB_2* theta) + 2*betaAB_1*betaAB_2*rAB**2*sin(betaAB_2*theta) &
-        - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(-2*betaAB_1**2* betaAB_2*r*rAB**2 &
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*r**2*rAB*sin(betaAB_2 &
-        *theta) - 2*betaAB_1* betaAB_2*r*rAB**2*sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB &
-        * rB*sin(betaAB_2*theta))/(betaAB_1**2*rAB**2*cos(betaAB_2*theta)** 2 - betaAB_1*rA*rAB &
-        *cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos( betaAB_2*theta) - betaAB_1*rAB*rB &
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2*betaAB_2* &
-        *2*rAB**2* sin(betaAB_2*theta)**2 + 2*betaAB_1**2*betaAB_2**2*rAB**2*cos( betaAB_2 &
-        *theta)**2 - betaAB_1*betaAB_2**2*rA*rAB*cos(betaAB_2* theta) + 2*betaAB_1*betaAB_2**2 &
-        *rAB**2*cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*rAB*rB*cos(betaAB_2*theta)) &
-        *(betaAB_1**2*r* rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*cos(betaAB_2 &
-        * theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA* rAB*rB*cos(betaAB_2 &
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r* rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2 &
-        *theta)**2 - betaAB_1*rA* rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos(betaAB_2 &
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 &
-        + (2*betaAB_1**2*betaAB_2**2*r*rAB**2*sin(betaAB_2* theta)**2 - 2*betaAB_1**2*betaAB_2* &
-        *2*r*rAB**2*cos(betaAB_2*theta )**2 + betaAB_1*betaAB_2**2*r**2*rAB*cos(betaAB_2 &
-        *theta) - 2* betaAB_1*betaAB_2**2*r*rAB**2*cos(betaAB_2*theta) + betaAB_1* betaAB_2**2 &
-        *rA*rAB*rB*cos(betaAB_2*theta))/(betaAB_1**2*rAB**2* cos(betaAB_2*theta)**2 - betaAB_1 &
-        *rA*rAB*cos(betaAB_2*theta) + 2* betaAB_1*rAB**2*cos(betaAB_2*theta) - betaAB_1*rAB*rB &
-        *cos( betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(betaAB_1**2 *rAB**2 &
-        *cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*cos(betaAB_2* theta) + 2*betaAB_1*rAB**2 &
-        *cos(betaAB_2*theta) - betaAB_1*rAB*rB* cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 &
-        - rAB*rB)/(betaAB_1 **2*r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB &
-        *cos( betaAB_2*theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB &
-        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r* rAB**2 - r*rAB*rB))/r**2) + (aA*betaAB_1 &
-        **4*betaAB_2*r**2*rAB**4* wA*sin(betaAB_2*theta)*cos(betaAB_2*theta)**3 - aA*betaAB_1* &
-        *4* betaAB_2*r*rA*rAB**4*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta)** 3 - 2*aA*betaAB_1 &
-        **3*betaAB_2*r**3*rAB**3*wA*sin(betaAB_2*theta)* cos(betaAB_2*theta)**2 + 2*aA*betaAB_1 &
-        **3*betaAB_2*r**2*rA*rAB**3 *wA*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 + 3*aA &
-        *betaAB_1**3 *betaAB_2*r**2*rAB**4*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) **2 - aA &
-        *betaAB_1**3*betaAB_2*r**2*rAB**3*rB*wA*sin(betaAB_2* theta)*cos(betaAB_2*theta)**2 &
-        + aA*betaAB_1**3*betaAB_2*r**2*rAB **3*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 &
-        - 3*aA*betaAB_1 **3*betaAB_2*r*rA*rAB**4*wA*sin(betaAB_2*theta)*cos(betaAB_2* theta)* &
-        *2 + aA*betaAB_1**3*betaAB_2*r*rA*rAB**3*rB*wA*sin( betaAB_2*theta)*cos(betaAB_2*theta) &
-        **2 - aA*betaAB_1**3*betaAB_2* r*rA*rAB**3*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta)* &
-        *2 - aA* betaAB_1**3*betaAB_2*r*rAB**3*rB*wA*sin(betaAB_2*theta)*cos( betaAB_2*theta)* &
-        *2 + aA*betaAB_1**3*betaAB_2*rA*rAB**3*rB*wA*sin( betaAB_2*theta)*cos(betaAB_2*theta)* &
-        *2 - 2*aA*betaAB_1**2* betaAB_2*r**3*rAB**3*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) &
-        + 2*aA*betaAB_1**2*betaAB_2*r**3*rAB**2*rB*wA*sin(betaAB_2*theta)* cos(betaAB_2*theta) &
-        + aA*betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wA* sin(betaAB_2*theta)*cos(betaAB_2*theta) &
-        - aA*betaAB_1**2*betaAB_2 *r**2*rA*rAB**2*rB*wA*sin(betaAB_2*theta)*cos(betaAB_2 &
-        *theta) + 3 *aA*betaAB_1**2*betaAB_2*r**2*rAB**4*wA*sin(betaAB_2*theta)*cos( betaAB_2 &
-        *theta) - 3*aA*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wA*sin (betaAB_2*theta)*cos(betaAB_2 &
-        *theta) + aA*betaAB_1**2*betaAB_2*r* rA**2*rAB**3*wA*sin(betaAB_2*theta)*cos(betaAB_2 &
-        *theta) - aA* betaAB_1**2*betaAB_2*r*rA**2*rAB**2*rB*wA*sin(betaAB_2*theta) &
-        *cos (betaAB_2*theta) - 3*aA*betaAB_1**2*betaAB_2*r*rA*rAB**4*wA*sin( betaAB_2*theta) &
-        *cos(betaAB_2*theta) + 3*aA*betaAB_1**2*betaAB_2*r *rA*rAB**3*rB*wA*sin(betaAB_2*theta) &
-        *cos(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r**2*rA*rAB**3*wA*sin(betaAB_2*theta) + 2 &
-        *aA* betaAB_1*betaAB_2*r**2*rA*rAB**2*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2 &
-        *r**2*rA*rAB**2*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r**2*rA*rAB*rB**2*wA &
-        *sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r**2*rA*rAB*rB*wA*sin(betaAB_2*theta) + aA &
-        * betaAB_1*betaAB_2*r**2*rAB**4*wA*sin(betaAB_2*theta) - 2*aA* betaAB_1*betaAB_2*r**2 &
-        *rAB**3*rB*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r**2*rAB**3*wA*sin(betaAB_2 &
-        *theta) + aA* betaAB_1*betaAB_2*r**2*rAB**2*rB**2*wA*sin(betaAB_2*theta) + aA* betaAB_1 &
-        *betaAB_2*r**2*rAB**2*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r*rA**2*rAB**3 &
-        *wA*sin(betaAB_2*theta) - 2*aA* betaAB_1*betaAB_2*r*rA**2*rAB**2*rB*wA*sin(betaAB_2 &
-        *theta) - aA* betaAB_1*betaAB_2*r*rA**2*rAB**2*wA*sin(betaAB_2*theta) + aA* betaAB_1 &
-        *betaAB_2*r*rA**2*rAB*rB**2*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r*rA**2*rAB &
-        *rB*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r*rA*rAB**4*wA*sin(betaAB_2*theta) &
-        + 2*aA* betaAB_1*betaAB_2*r*rA*rAB**3*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2 &
-        *r*rA*rAB**3*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r*rA*rAB**2*rB**2*wA &
-        *sin(betaAB_2*theta) - 2*aA *betaAB_1*betaAB_2*r*rA*rAB**2*rB*wA*sin(betaAB_2*theta) &
-        + aA* betaAB_1*betaAB_2*r*rA*rAB*rB**2*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r &
-        *rAB**3*rB*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r*rAB**2*rB**2*wA &
-        *sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*rA**2*rAB**2*rB*wA*sin(betaAB_2*theta) &
-        - aA* betaAB_1*betaAB_2*rA**2*rAB*rB**2*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2 &
-        *rA*rAB**3*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*rA*rAB**2*rB**2*wA &
-        *sin(betaAB_2*theta))/( -betaAB_1**4*r*rAB**4*cos(betaAB_2*theta)**4 + betaAB_1**3*r**2 &
-        * rAB**3*cos(betaAB_2*theta)**3 + betaAB_1**3*r*rA*rAB**3*cos( betaAB_2*theta)**3 - 4 &
-        *betaAB_1**3*r*rAB**4*cos(betaAB_2*theta)** 3 + betaAB_1**3*r*rAB**3*rB*cos(betaAB_2 &
-        *theta)**3 + betaAB_1**3* rA*rAB**3*rB*cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB &
-        **2* cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2*rAB**3*cos(betaAB_2* theta)**2 &
-        - betaAB_1**2*r**2*rAB**2*rB*cos(betaAB_2*theta)**2 + 4 *betaAB_1**2*r*rA*rAB**3 &
-        *cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r *rA*rAB**2*rB*cos(betaAB_2*theta)**2 - 6 &
-        *betaAB_1**2*r*rAB**4*cos (betaAB_2*theta)**2 + 4*betaAB_1**2*r*rAB**3*rB*cos(betaAB_2 &
-        * theta)**2 - betaAB_1**2*rA**2*rAB**2*rB*cos(betaAB_2*theta)**2 + 2*betaAB_1**2*rA*rAB &
-        **3*rB*cos(betaAB_2*theta)**2 - betaAB_1**2* rA*rAB**2*rB**2*cos(betaAB_2*theta)**2 &
-        - betaAB_1*r**2*rA*rAB**2* cos(betaAB_2*theta) + betaAB_1*r**2*rA*rAB*rB*cos(betaAB_2 &
-        *theta ) + betaAB_1*r**2*rAB**3*cos(betaAB_2*theta) - betaAB_1*r**2*rAB **2*rB &
-        *cos(betaAB_2*theta) - betaAB_1*r*rA**2*rAB**2*cos(betaAB_2 *theta) + betaAB_1*r*rA**2 &
-        *rAB*rB*cos(betaAB_2*theta) + 5* betaAB_1*r*rA*rAB**3*cos(betaAB_2*theta) - 6*betaAB_1 &
-        *r*rA*rAB**2 *rB*cos(betaAB_2*theta) + betaAB_1*r*rA*rAB*rB**2*cos(betaAB_2* theta) - 4 &
-        *betaAB_1*r*rAB**4*cos(betaAB_2*theta) + 5*betaAB_1*r* rAB**3*rB*cos(betaAB_2*theta) &
-        - betaAB_1*r*rAB**2*rB**2*cos( betaAB_2*theta) - betaAB_1*rA**2*rAB**2*rB*cos(betaAB_2 &
-        *theta) + betaAB_1*rA**2*rAB*rB**2*cos(betaAB_2*theta) + betaAB_1*rA*rAB**3 *rB &
-        *cos(betaAB_2*theta) - betaAB_1*rA*rAB**2*rB**2*cos(betaAB_2* theta) - r*rA**2*rAB**2 &
-        + 2*r*rA**2*rAB*rB - r*rA**2*rB**2 + 2*r* rA*rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB* &
-        *2 - r*rAB**4 + 2*r* rAB**3*rB - r*rAB**2*rB**2)
+    aA = alphaB/(alphaA*log(const_rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( const_rAB))
+    bA = (alphaA*log(const_rAB) - alphaA*log(rB) - alphaB*log(const_rAB))/(alphaA*log(const_rAB) &
+        - alphaA*log(rB) + alphaB*log(rA) - alphaB*log(const_rAB))
+    res = -alphaA*((-2*aA*betaAB_1*r*const_rAB*cos(betaAB_2*theta)/(betaAB_1**2*r*const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *r*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos( betaAB_2 &
+        *theta) - r*rA*const_rAB + r*rA*rB + r*const_rAB**2 - r*const_rAB*rB) + aA* r*( &
+        -betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)**2 + 2*betaAB_1*r*const_rAB &
+        * cos(betaAB_2*theta) - 2*betaAB_1*const_rAB**2*cos(betaAB_2*theta) + rA &
+        * const_rAB - rA*rB - const_rAB**2 + const_rAB*rB)*(betaAB_1**2*const_rAB**2 &
+        *cos(betaAB_2* theta)**2 - 2*betaAB_1*r*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *const_rAB **2*cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 &
+        - const_rAB*rB)/( betaAB_1**2*r*const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2 &
+        *const_rAB* cos(betaAB_2*theta) + 2*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) &
+        - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r &
+        * const_rAB**2 - r*const_rAB*rB)**2 + aA*(betaAB_1**2*const_rAB**2*cos(betaAB_2 &
+        *theta )**2 - 2*betaAB_1*r*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2 &
+        * cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB*rB) &
+        /(betaAB_1 **2*r*const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB &
+        *cos( betaAB_2*theta) + 2*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA &
+        *const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r* const_rAB**2 - r &
+        *const_rAB*rB))/r + (aA*((2*betaAB_1**2*betaAB_2*const_rAB**2*sin( betaAB_2*theta) &
+        *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*const_rAB* sin(betaAB_2*theta) + 2 &
+        *betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2* theta) - betaAB_1*betaAB_2*const_rAB &
+        *rB*sin(betaAB_2*theta))*(betaAB_1 **2*r*const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*r**2*const_rAB*cos( betaAB_2*theta) + 2*betaAB_1*r*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) - r*rA &
+        *const_rAB + r*rA*rB + r* const_rAB**2 - r*const_rAB*rB)/(betaAB_1**2*const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *const_rAB**2*cos( betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA &
+        *const_rAB + rA*rB + const_rAB**2 - const_rAB*rB)**2 + (-2*betaAB_1**2*betaAB_2*r &
+        *const_rAB**2* sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*r**2 &
+        * const_rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*const_rAB**2*sin( betaAB_2 &
+        *theta) + betaAB_1*betaAB_2*rA*const_rAB*rB*sin(betaAB_2*theta ))/(betaAB_1**2 &
+        *const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*rA*const_rAB* cos(betaAB_2*theta) &
+        + 2*betaAB_1*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2 &
+        *theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB*rB))*(-2*betaAB_1**2 &
+        *betaAB_2*const_rAB**2*sin(betaAB_2*theta)*cos( betaAB_2*theta) + betaAB_1*betaAB_2 &
+        *rA*const_rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2 &
+        *theta) + betaAB_1* betaAB_2*const_rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2*r &
+        *const_rAB**2*cos( betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB*cos(betaAB_2 &
+        *theta) + 2* betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB &
+        *cos( betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r*const_rAB**2 - r*const_rAB &
+        *rB) + aA* ((2*betaAB_1**2*betaAB_2*const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2 &
+        * theta) - betaAB_1*betaAB_2*rA*const_rAB*sin(betaAB_2*theta) + 2* betaAB_1 &
+        *betaAB_2*const_rAB**2*sin(betaAB_2*theta) - betaAB_1*betaAB_2* const_rAB*rB &
+        *sin(betaAB_2*theta))*(betaAB_1**2*r*const_rAB**2*cos(betaAB_2* theta)**2 &
+        - betaAB_1*r**2*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1*r* const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos(betaAB_2* theta) - r*rA &
+        *const_rAB + r*rA*rB + r*const_rAB**2 - r*const_rAB*rB)/(betaAB_1**2* const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1 &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB* cos(betaAB_2*theta) - rA &
+        *const_rAB + rA*rB + const_rAB**2 - const_rAB*rB)**2 + (-2* betaAB_1**2*betaAB_2*r &
+        *const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2* theta) + betaAB_1*betaAB_2*r**2 &
+        *const_rAB*sin(betaAB_2*theta) - 2* betaAB_1*betaAB_2*r*const_rAB**2*sin(betaAB_2 &
+        *theta) + betaAB_1* betaAB_2*rA*const_rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2 &
+        *const_rAB**2*cos( betaAB_2*theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) &
+        + 2* betaAB_1*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB &
+        *cos( betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB*rB))*(2 &
+        *betaAB_1 **2*betaAB_2*r*const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) &
+        - betaAB_1*betaAB_2*r**2*const_rAB*sin(betaAB_2*theta) + 2*betaAB_1* betaAB_2*r &
+        *const_rAB**2*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*const_rAB* rB*sin(betaAB_2 &
+        *theta))*(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)** 2 - betaAB_1*rA*const_rAB &
+        *cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2*cos( betaAB_2*theta) - betaAB_1 &
+        *const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB &
+        *rB)/(betaAB_1**2*r*const_rAB**2*cos(betaAB_2*theta )**2 - betaAB_1*r**2*const_rAB &
+        *cos(betaAB_2*theta) + 2*betaAB_1*r*const_rAB** 2*cos(betaAB_2*theta) - betaAB_1*rA &
+        *const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r*const_rAB**2 - r &
+        *const_rAB*rB)**2 + aA*((2*betaAB_1**2 *betaAB_2*const_rAB**2*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*const_rAB*sin(betaAB_2*theta) + 2 &
+        *betaAB_1* betaAB_2*const_rAB**2*sin(betaAB_2*theta) - betaAB_1*betaAB_2*const_rAB &
+        *rB* sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*const_rAB**2*sin(betaAB_2* theta) &
+        *cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*const_rAB*sin( betaAB_2*theta) + 4 &
+        *betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*const_rAB &
+        *rB*sin(betaAB_2*theta))*(betaAB_1**2*r* const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*r**2*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*r*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*rA* const_rAB*rB*cos(betaAB_2*theta) - r*rA &
+        *const_rAB + r*rA*rB + r*const_rAB**2 - r* const_rAB*rB)/(betaAB_1**2*const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*rA* const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA &
+        *const_rAB + rA*rB + const_rAB**2 - const_rAB*rB)**3 + 2*(2*betaAB_1**2*betaAB_2 &
+        *const_rAB**2*sin(betaAB_2*theta) *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA &
+        *const_rAB*sin(betaAB_2* theta) + 2*betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2 &
+        *theta) - betaAB_1*betaAB_2*const_rAB*rB*sin(betaAB_2*theta))*(-2*betaAB_1**2 &
+        * betaAB_2*r*const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1 &
+        *betaAB_2*r**2*const_rAB*sin(betaAB_2*theta) - 2*betaAB_1* betaAB_2*r*const_rAB**2 &
+        *sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*const_rAB* rB*sin(betaAB_2*theta)) &
+        /(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)** 2 - betaAB_1*rA*const_rAB &
+        *cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2*cos( betaAB_2*theta) - betaAB_1 &
+        *const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB &
+        *rB)**2 + (-2*betaAB_1**2*betaAB_2**2*const_rAB**2* sin(betaAB_2*theta)**2 + 2 &
+        *betaAB_1**2*betaAB_2**2*const_rAB**2*cos( betaAB_2*theta)**2 - betaAB_1 &
+        *betaAB_2**2*rA*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*betaAB_2**2 &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*const_rAB*rB*cos(betaAB_2 &
+        *theta))*(betaAB_1**2*r* const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2 &
+        *const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) &
+        - betaAB_1*rA* const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r &
+        *const_rAB**2 - r* const_rAB*rB)/(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*rA* const_rAB*cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2*cos(betaAB_2 &
+        *theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB + rA*rB &
+        + const_rAB**2 - const_rAB*rB)**2 + (2*betaAB_1**2*betaAB_2**2*r*const_rAB**2 &
+        *sin(betaAB_2* theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*const_rAB**2*cos(betaAB_2 &
+        *theta )**2 + betaAB_1*betaAB_2**2*r**2*const_rAB*cos(betaAB_2*theta) - 2* betaAB_1 &
+        *betaAB_2**2*r*const_rAB**2*cos(betaAB_2*theta) + betaAB_1* betaAB_2**2*rA &
+        *const_rAB*rB*cos(betaAB_2*theta))/(betaAB_1**2*const_rAB**2* cos(betaAB_2 &
+        *theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) + 2* betaAB_1*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*const_rAB*rB*cos( betaAB_2*theta) - rA*const_rAB &
+        + rA*rB + const_rAB**2 - const_rAB*rB))*(betaAB_1**2 *const_rAB**2*cos(betaAB_2 &
+        *theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*const_rAB*rB* cos(betaAB_2*theta) - rA*const_rAB &
+        + rA*rB + const_rAB**2 - const_rAB*rB)/(betaAB_1 **2*r*const_rAB**2*cos(betaAB_2 &
+        *theta)**2 - betaAB_1*r**2*const_rAB*cos( betaAB_2*theta) + 2*betaAB_1*r &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) &
+        - r*rA*const_rAB + r*rA*rB + r* const_rAB**2 - r*const_rAB*rB))/r**2) + (aA &
+        *betaAB_1**4*betaAB_2*r**2*const_rAB**4* wA*sin(betaAB_2*theta)*cos(betaAB_2 &
+        *theta)**3 - aA*betaAB_1**4* betaAB_2*r*rA*const_rAB**4*wA*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta)** 3 - 2*aA*betaAB_1**3*betaAB_2*r**3*const_rAB**3*wA &
+        *sin(betaAB_2*theta)* cos(betaAB_2*theta)**2 + 2*aA*betaAB_1**3*betaAB_2*r**2*rA &
+        *const_rAB**3 *wA*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 + 3*aA*betaAB_1**3 &
+        *betaAB_2*r**2*const_rAB**4*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) **2 - aA &
+        *betaAB_1**3*betaAB_2*r**2*const_rAB**3*rB*wA*sin(betaAB_2* theta)*cos(betaAB_2 &
+        *theta)**2 + aA*betaAB_1**3*betaAB_2*r**2*const_rAB **3*wA*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta)**2 - 3*aA*betaAB_1 **3*betaAB_2*r*rA*const_rAB**4*wA &
+        *sin(betaAB_2*theta)*cos(betaAB_2* theta)**2 + aA*betaAB_1**3*betaAB_2*r*rA &
+        *const_rAB**3*rB*wA*sin( betaAB_2*theta)*cos(betaAB_2*theta)**2 - aA*betaAB_1**3 &
+        *betaAB_2* r*rA*const_rAB**3*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 - aA &
+        * betaAB_1**3*betaAB_2*r*const_rAB**3*rB*wA*sin(betaAB_2*theta)*cos( betaAB_2 &
+        *theta)**2 + aA*betaAB_1**3*betaAB_2*rA*const_rAB**3*rB*wA*sin( betaAB_2*theta) &
+        *cos(betaAB_2*theta)**2 - 2*aA*betaAB_1**2* betaAB_2*r**3*const_rAB**3*wA &
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + 2*aA*betaAB_1**2*betaAB_2*r**3 &
+        *const_rAB**2*rB*wA*sin(betaAB_2*theta)* cos(betaAB_2*theta) + aA*betaAB_1**2 &
+        *betaAB_2*r**2*rA*const_rAB**3*wA* sin(betaAB_2*theta)*cos(betaAB_2*theta) - aA &
+        *betaAB_1**2*betaAB_2 *r**2*rA*const_rAB**2*rB*wA*sin(betaAB_2*theta)*cos(betaAB_2 &
+        *theta) + 3 *aA*betaAB_1**2*betaAB_2*r**2*const_rAB**4*wA*sin(betaAB_2*theta) &
+        *cos( betaAB_2*theta) - 3*aA*betaAB_1**2*betaAB_2*r**2*const_rAB**3*rB*wA &
+        *sin (betaAB_2*theta)*cos(betaAB_2*theta) + aA*betaAB_1**2*betaAB_2*r* rA**2 &
+        *const_rAB**3*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aA* betaAB_1**2*betaAB_2 &
+        *r*rA**2*const_rAB**2*rB*wA*sin(betaAB_2*theta)*cos (betaAB_2*theta) - 3*aA &
+        *betaAB_1**2*betaAB_2*r*rA*const_rAB**4*wA*sin( betaAB_2*theta)*cos(betaAB_2 &
+        *theta) + 3*aA*betaAB_1**2*betaAB_2*r *rA*const_rAB**3*rB*wA*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r**2*rA*const_rAB**3*wA*sin(betaAB_2 &
+        *theta) + 2*aA* betaAB_1*betaAB_2*r**2*rA*const_rAB**2*rB*wA*sin(betaAB_2*theta) &
+        + aA* betaAB_1*betaAB_2*r**2*rA*const_rAB**2*wA*sin(betaAB_2*theta) - aA* betaAB_1 &
+        *betaAB_2*r**2*rA*const_rAB*rB**2*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2 &
+        *r**2*rA*const_rAB*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r**2 &
+        *const_rAB**4*wA*sin(betaAB_2*theta) - 2*aA* betaAB_1*betaAB_2*r**2*const_rAB**3*rB &
+        *wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r**2*const_rAB**3*wA*sin(betaAB_2 &
+        *theta) + aA* betaAB_1*betaAB_2*r**2*const_rAB**2*rB**2*wA*sin(betaAB_2*theta) + aA &
+        * betaAB_1*betaAB_2*r**2*const_rAB**2*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1 &
+        *betaAB_2*r*rA**2*const_rAB**3*wA*sin(betaAB_2*theta) - 2*aA* betaAB_1*betaAB_2*r &
+        *rA**2*const_rAB**2*rB*wA*sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r*rA**2 &
+        *const_rAB**2*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r*rA**2*const_rAB &
+        *rB**2*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r*rA**2*const_rAB*rB*wA &
+        *sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r*rA*const_rAB**4*wA*sin(betaAB_2 &
+        *theta) + 2*aA* betaAB_1*betaAB_2*r*rA*const_rAB**3*rB*wA*sin(betaAB_2*theta) + aA &
+        * betaAB_1*betaAB_2*r*rA*const_rAB**3*wA*sin(betaAB_2*theta) - aA* betaAB_1 &
+        *betaAB_2*r*rA*const_rAB**2*rB**2*wA*sin(betaAB_2*theta) - 2*aA *betaAB_1*betaAB_2 &
+        *r*rA*const_rAB**2*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r*rA*const_rAB &
+        *rB**2*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*r*const_rAB**3*rB*wA &
+        *sin(betaAB_2*theta) - aA* betaAB_1*betaAB_2*r*const_rAB**2*rB**2*wA*sin(betaAB_2 &
+        *theta) + aA* betaAB_1*betaAB_2*rA**2*const_rAB**2*rB*wA*sin(betaAB_2*theta) - aA &
+        * betaAB_1*betaAB_2*rA**2*const_rAB*rB**2*wA*sin(betaAB_2*theta) - aA* betaAB_1 &
+        *betaAB_2*rA*const_rAB**3*rB*wA*sin(betaAB_2*theta) + aA* betaAB_1*betaAB_2*rA &
+        *const_rAB**2*rB**2*wA*sin(betaAB_2*theta))/( -betaAB_1**4*r*const_rAB**4 &
+        *cos(betaAB_2*theta)**4 + betaAB_1**3*r**2* const_rAB**3*cos(betaAB_2*theta)**3 &
+        + betaAB_1**3*r*rA*const_rAB**3*cos( betaAB_2*theta)**3 - 4*betaAB_1**3*r &
+        *const_rAB**4*cos(betaAB_2*theta)** 3 + betaAB_1**3*r*const_rAB**3*rB*cos(betaAB_2 &
+        *theta)**3 + betaAB_1**3* rA*const_rAB**3*rB*cos(betaAB_2*theta)**3 - betaAB_1**2 &
+        *r**2*rA*const_rAB**2* cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2*const_rAB**3 &
+        *cos(betaAB_2* theta)**2 - betaAB_1**2*r**2*const_rAB**2*rB*cos(betaAB_2*theta)**2 &
+        + 4 *betaAB_1**2*r*rA*const_rAB**3*cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r *rA &
+        *const_rAB**2*rB*cos(betaAB_2*theta)**2 - 6*betaAB_1**2*r*const_rAB**4 &
+        *cos (betaAB_2*theta)**2 + 4*betaAB_1**2*r*const_rAB**3*rB*cos(betaAB_2* theta)**2 &
+        - betaAB_1**2*rA**2*const_rAB**2*rB*cos(betaAB_2*theta)**2 + 2*betaAB_1**2*rA &
+        *const_rAB**3*rB*cos(betaAB_2*theta)**2 - betaAB_1**2* rA*const_rAB**2*rB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*r**2*rA*const_rAB**2* cos(betaAB_2*theta) &
+        + betaAB_1*r**2*rA*const_rAB*rB*cos(betaAB_2*theta ) + betaAB_1*r**2*const_rAB**3 &
+        *cos(betaAB_2*theta) - betaAB_1*r**2*const_rAB **2*rB*cos(betaAB_2*theta) &
+        - betaAB_1*r*rA**2*const_rAB**2*cos(betaAB_2 *theta) + betaAB_1*r*rA**2*const_rAB &
+        *rB*cos(betaAB_2*theta) + 5* betaAB_1*r*rA*const_rAB**3*cos(betaAB_2*theta) - 6 &
+        *betaAB_1*r*rA*const_rAB**2 *rB*cos(betaAB_2*theta) + betaAB_1*r*rA*const_rAB*rB**2 &
+        *cos(betaAB_2* theta) - 4*betaAB_1*r*const_rAB**4*cos(betaAB_2*theta) + 5*betaAB_1 &
+        *r* const_rAB**3*rB*cos(betaAB_2*theta) - betaAB_1*r*const_rAB**2*rB**2 &
+        *cos( betaAB_2*theta) - betaAB_1*rA**2*const_rAB**2*rB*cos(betaAB_2*theta) &
+        + betaAB_1*rA**2*const_rAB*rB**2*cos(betaAB_2*theta) + betaAB_1*rA*const_rAB**3 *rB &
+        *cos(betaAB_2*theta) - betaAB_1*rA*const_rAB**2*rB**2*cos(betaAB_2* theta) - r &
+        *rA**2*const_rAB**2 + 2*r*rA**2*const_rAB*rB - r*rA**2*rB**2 + 2*r* rA &
+        *const_rAB**3 - 4*r*rA*const_rAB**2*rB + 2*r*rA*const_rAB*rB**2 - r*const_rAB**4 &
+        + 2*r* const_rAB**3*rB - r*const_rAB**2*rB**2)
 end function fA
 
 ! Function fB
@@ -301,161 +343,195 @@ function fB(x, y) result(res)
     real(8) :: bB
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    aB = alphaA/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( rAB))
-    bB = -alphaA*log(rB)/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log(rAB))
-    res = -alphaB*((-2*aB*betaAB_1*r*rAB*cos(betaAB_2*theta)/(betaAB_1**2*r*rAB**2 *cos(betaAB_2*theta) &
-        **2 - betaAB_1*r**2*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rA*rAB*rB*cos( betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) &
-        + aB* r*(-betaAB_1**2*rAB**2*cos(betaAB_2*theta)**2 + 2*betaAB_1*r*rAB* cos(betaAB_2 &
-        *theta) - 2*betaAB_1*rAB**2*cos(betaAB_2*theta) + rA* rAB - rA*rB - rAB**2 + rAB*rB) &
-        *(betaAB_1**2*rAB**2*cos(betaAB_2* theta)**2 - 2*betaAB_1*r*rAB*cos(betaAB_2*theta) + 2 &
-        *betaAB_1*rAB **2*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/( betaAB_1**2 &
-        *r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB* cos(betaAB_2*theta) + 2*betaAB_1 &
-        *r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r &
-        *rA*rB + r* rAB**2 - r*rAB*rB)**2 + aB*(betaAB_1**2*rAB**2*cos(betaAB_2*theta )**2 - 2 &
-        *betaAB_1*r*rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2* cos(betaAB_2*theta) - rA*rAB &
-        + rA*rB + rAB**2 - rAB*rB)/(betaAB_1 **2*r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r* &
-        *2*rAB*cos( betaAB_2*theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB &
-        *rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r* rAB**2 - r*rAB*rB))/r + (aB*((2 &
-        *betaAB_1**2*betaAB_2*rAB**2*sin( betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*rA*rAB* sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*sin(betaAB_2 &
-        * theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(betaAB_1 **2*r*rAB**2 &
-        *cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*cos( betaAB_2*theta) + 2*betaAB_1*r*rAB**2 &
-        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r &
-        * rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB &
-        *cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos( betaAB_2*theta) - betaAB_1*rAB*rB &
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2*betaAB_2 &
-        *r*rAB**2* sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*r**2* rAB &
-        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*rAB**2*sin( betaAB_2*theta) + betaAB_1 &
-        *betaAB_2*rA*rAB*rB*sin(betaAB_2*theta ))/(betaAB_1**2*rAB**2*cos(betaAB_2*theta)**2 &
-        - betaAB_1*rA*rAB* cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2*betaAB_1 &
-        **2*betaAB_2*rAB**2*sin(betaAB_2*theta)*cos( betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB &
-        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2*sin(betaAB_2*theta) + betaAB_1 &
-        * betaAB_2*rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2*r*rAB**2*cos( betaAB_2*theta)**2 &
-        - betaAB_1*r**2*rAB*cos(betaAB_2*theta) + 2* betaAB_1*r*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rA*rAB*rB*cos( betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) &
-        + aB* ((2*betaAB_1**2*betaAB_2*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2* theta) &
-        - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2* betaAB_1*betaAB_2*rAB**2 &
-        *sin(betaAB_2*theta) - betaAB_1*betaAB_2* rAB*rB*sin(betaAB_2*theta))*(betaAB_1**2*r &
-        *rAB**2*cos(betaAB_2* theta)**2 - betaAB_1*r**2*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r &
-        * rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2* theta) - r*rA*rAB + r &
-        *rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2* rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*rA &
-        *rAB*cos(betaAB_2* theta) + 2*betaAB_1*rAB**2*cos(betaAB_2*theta) - betaAB_1*rAB*rB &
-        * cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2* betaAB_1**2 &
-        *betaAB_2*r*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2* theta) + betaAB_1*betaAB_2*r**2 &
-        *rAB*sin(betaAB_2*theta) - 2* betaAB_1*betaAB_2*r*rAB**2*sin(betaAB_2*theta) + betaAB_1 &
-        * betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2*rAB**2*cos( betaAB_2*theta)**2 &
-        - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2* betaAB_1*rAB**2*cos(betaAB_2*theta) &
-        - betaAB_1*rAB*rB*cos( betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2 &
-        *betaAB_1 **2*betaAB_2*r*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*r**2*rAB*sin(betaAB_2*theta) + 2*betaAB_1* betaAB_2*r*rAB**2*sin(betaAB_2 &
-        *theta) - betaAB_1*betaAB_2*rA*rAB* rB*sin(betaAB_2*theta))*(betaAB_1**2*rAB**2 &
-        *cos(betaAB_2*theta)** 2 - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 &
-        *cos( betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 &
-        - rAB*rB)/(betaAB_1**2*r*rAB**2*cos(betaAB_2*theta )**2 - betaAB_1*r**2*rAB &
-        *cos(betaAB_2*theta) + 2*betaAB_1*r*rAB** 2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB &
-        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*((2*betaAB_1* &
-        *2 *betaAB_2*rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB &
-        *sin(betaAB_2*theta) + 2*betaAB_1* betaAB_2*rAB**2*sin(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*rAB*rB* sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*rAB**2*sin(betaAB_2 &
-        * theta)*cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB*sin( betaAB_2*theta) + 4 &
-        *betaAB_1*betaAB_2*rAB**2*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2 &
-        *theta))*(betaAB_1**2*r* rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*cos(betaAB_2 &
-        * theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA* rAB*rB*cos(betaAB_2 &
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r* rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2 &
-        *theta)**2 - betaAB_1*rA* rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos(betaAB_2 &
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**3 &
-        + 2*(2*betaAB_1**2*betaAB_2*rAB**2*sin(betaAB_2*theta) *cos(betaAB_2*theta) - betaAB_1 &
-        *betaAB_2*rA*rAB*sin(betaAB_2* theta) + 2*betaAB_1*betaAB_2*rAB**2*sin(betaAB_2*theta) &
-        - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(-2*betaAB_1**2* betaAB_2*r*rAB**2 &
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*r**2*rAB*sin(betaAB_2 &
-        *theta) - 2*betaAB_1* betaAB_2*r*rAB**2*sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB &
-        * rB*sin(betaAB_2*theta))/(betaAB_1**2*rAB**2*cos(betaAB_2*theta)** 2 - betaAB_1*rA*rAB &
-        *cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos( betaAB_2*theta) - betaAB_1*rAB*rB &
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2*betaAB_2* &
-        *2*rAB**2* sin(betaAB_2*theta)**2 + 2*betaAB_1**2*betaAB_2**2*rAB**2*cos( betaAB_2 &
-        *theta)**2 - betaAB_1*betaAB_2**2*rA*rAB*cos(betaAB_2* theta) + 2*betaAB_1*betaAB_2**2 &
-        *rAB**2*cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*rAB*rB*cos(betaAB_2*theta)) &
-        *(betaAB_1**2*r* rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*cos(betaAB_2 &
-        * theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA* rAB*rB*cos(betaAB_2 &
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r* rAB*rB)/(betaAB_1**2*rAB**2*cos(betaAB_2 &
-        *theta)**2 - betaAB_1*rA* rAB*cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*cos(betaAB_2 &
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 &
-        + (2*betaAB_1**2*betaAB_2**2*r*rAB**2*sin(betaAB_2* theta)**2 - 2*betaAB_1**2*betaAB_2* &
-        *2*r*rAB**2*cos(betaAB_2*theta )**2 + betaAB_1*betaAB_2**2*r**2*rAB*cos(betaAB_2 &
-        *theta) - 2* betaAB_1*betaAB_2**2*r*rAB**2*cos(betaAB_2*theta) + betaAB_1* betaAB_2**2 &
-        *rA*rAB*rB*cos(betaAB_2*theta))/(betaAB_1**2*rAB**2* cos(betaAB_2*theta)**2 - betaAB_1 &
-        *rA*rAB*cos(betaAB_2*theta) + 2* betaAB_1*rAB**2*cos(betaAB_2*theta) - betaAB_1*rAB*rB &
-        *cos( betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(betaAB_1**2 *rAB**2 &
-        *cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*cos(betaAB_2* theta) + 2*betaAB_1*rAB**2 &
-        *cos(betaAB_2*theta) - betaAB_1*rAB*rB* cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 &
-        - rAB*rB)/(betaAB_1 **2*r*rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB &
-        *cos( betaAB_2*theta) + 2*betaAB_1*r*rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB &
-        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r* rAB**2 - r*rAB*rB))/r**2) + (aB*betaAB_1 &
-        **4*betaAB_2*r**2*rAB**4* wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)**3 - aB*betaAB_1* &
-        *4* betaAB_2*r*rAB**4*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)** 3 - 2*aB*betaAB_1 &
-        **3*betaAB_2*r**3*rAB**3*wB*sin(betaAB_2*theta)* cos(betaAB_2*theta)**2 - aB*betaAB_1* &
-        *3*betaAB_2*r**2*rA*rAB**3* wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 + 3*aB &
-        *betaAB_1**3* betaAB_2*r**2*rAB**4*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)** 2 + 2 &
-        *aB*betaAB_1**3*betaAB_2*r**2*rAB**3*rB*wB*sin(betaAB_2* theta)*cos(betaAB_2*theta)**2 &
-        + aB*betaAB_1**3*betaAB_2*r**2*rAB **3*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 &
-        + aB*betaAB_1** 3*betaAB_2*r*rA*rAB**3*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2* theta)* &
-        *2 - aB*betaAB_1**3*betaAB_2*r*rA*rAB**3*wB*sin(betaAB_2* theta)*cos(betaAB_2*theta)* &
-        *2 - 3*aB*betaAB_1**3*betaAB_2*r*rAB** 4*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)* &
-        *2 - aB*betaAB_1 **3*betaAB_2*r*rAB**3*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2* theta)* &
-        *2 + aB*betaAB_1**3*betaAB_2*rA*rAB**3*rB*wB*sin(betaAB_2* theta)*cos(betaAB_2*theta)* &
-        *2 + 2*aB*betaAB_1**2*betaAB_2*r**3*rA *rAB**2*wB*sin(betaAB_2*theta)*cos(betaAB_2 &
-        *theta) - 2*aB* betaAB_1**2*betaAB_2*r**3*rAB**3*wB*sin(betaAB_2*theta)*cos( betaAB_2 &
-        *theta) - 3*aB*betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wB*sin (betaAB_2*theta)*cos(betaAB_2 &
-        *theta) - aB*betaAB_1**2*betaAB_2*r **2*rA*rAB**2*rB*wB*sin(betaAB_2*theta) &
-        *cos(betaAB_2*theta) + 3* aB*betaAB_1**2*betaAB_2*r**2*rAB**4*wB*sin(betaAB_2*theta) &
-        *cos( betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wB*sin( betaAB_2*theta) &
-        *cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r *rA*rAB**3*rB*wB*sin(betaAB_2*theta) &
-        *cos(betaAB_2*theta) - aB* betaAB_1**2*betaAB_2*r*rA*rAB**2*rB**2*wB*sin(betaAB_2 &
-        *theta)*cos (betaAB_2*theta) - 3*aB*betaAB_1**2*betaAB_2*r*rAB**4*rB*wB*sin( betaAB_2 &
-        *theta)*cos(betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r* rAB**3*rB**2*wB*sin(betaAB_2 &
-        *theta)*cos(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r**2*rA**2*rAB**2*wB*sin(betaAB_2 &
-        *theta) - aB* betaAB_1*betaAB_2*r**2*rA**2*rAB*rB*wB*sin(betaAB_2*theta) - 2*aB &
-        *betaAB_1*betaAB_2*r**2*rA*rAB**3*wB*sin(betaAB_2*theta) + 2*aB* betaAB_1*betaAB_2*r**2 &
-        *rA*rAB**2*rB*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r**2*rA*rAB**2*wB &
-        *sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r**2*rA*rAB*rB*wB*sin(betaAB_2*theta) + aB &
-        * betaAB_1*betaAB_2*r**2*rAB**4*wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r**2*rAB &
-        **3*rB*wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r**2*rAB**3*wB*sin(betaAB_2 &
-        *theta) + aB* betaAB_1*betaAB_2*r**2*rAB**2*rB*wB*sin(betaAB_2*theta) - aB* betaAB_1 &
-        *betaAB_2*r*rA**2*rAB**2*rB*wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r*rA**2*rAB* &
-        *2*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r*rA**2*rAB*rB**2*wB*sin(betaAB_2 &
-        *theta) + aB* betaAB_1*betaAB_2*r*rA**2*rAB*rB*wB*sin(betaAB_2*theta) + 2*aB* betaAB_1 &
-        *betaAB_2*r*rA*rAB**3*rB*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r*rA*rAB**3*wB &
-        *sin(betaAB_2*theta) - 2*aB* betaAB_1*betaAB_2*r*rA*rAB**2*rB**2*wB*sin(betaAB_2 &
-        *theta) - 2*aB *betaAB_1*betaAB_2*r*rA*rAB**2*rB*wB*sin(betaAB_2*theta) + aB* betaAB_1 &
-        *betaAB_2*r*rA*rAB*rB**2*wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r*rAB**4*rB*wB &
-        *sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r*rAB**3*rB**2*wB*sin(betaAB_2*theta) + aB &
-        * betaAB_1*betaAB_2*r*rAB**3*rB*wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r*rAB**2 &
-        *rB**2*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*rA**2*rAB**2*rB*wB*sin(betaAB_2 &
-        *theta) - aB* betaAB_1*betaAB_2*rA**2*rAB*rB**2*wB*sin(betaAB_2*theta) - aB* betaAB_1 &
-        *betaAB_2*rA*rAB**3*rB*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*rA*rAB**2*rB**2 &
-        *wB*sin(betaAB_2*theta))/( -betaAB_1**4*r*rAB**4*cos(betaAB_2*theta)**4 + betaAB_1**3*r &
-        **2* rAB**3*cos(betaAB_2*theta)**3 + betaAB_1**3*r*rA*rAB**3*cos( betaAB_2*theta)**3 &
-        - 4*betaAB_1**3*r*rAB**4*cos(betaAB_2*theta)** 3 + betaAB_1**3*r*rAB**3*rB*cos(betaAB_2 &
-        *theta)**3 + betaAB_1**3* rA*rAB**3*rB*cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB &
-        **2* cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2*rAB**3*cos(betaAB_2* theta)**2 &
-        - betaAB_1**2*r**2*rAB**2*rB*cos(betaAB_2*theta)**2 + 4 *betaAB_1**2*r*rA*rAB**3 &
-        *cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r *rA*rAB**2*rB*cos(betaAB_2*theta)**2 - 6 &
-        *betaAB_1**2*r*rAB**4*cos (betaAB_2*theta)**2 + 4*betaAB_1**2*r*rAB**3*rB*cos(betaAB_2 &
-        * theta)**2 - betaAB_1**2*rA**2*rAB**2*rB*cos(betaAB_2*theta)**2 + 2*betaAB_1**2*rA*rAB &
-        **3*rB*cos(betaAB_2*theta)**2 - betaAB_1**2* rA*rAB**2*rB**2*cos(betaAB_2*theta)**2 &
-        - betaAB_1*r**2*rA*rAB**2* cos(betaAB_2*theta) + betaAB_1*r**2*rA*rAB*rB*cos(betaAB_2 &
-        *theta ) + betaAB_1*r**2*rAB**3*cos(betaAB_2*theta) - betaAB_1*r**2*rAB **2*rB &
-        *cos(betaAB_2*theta) - betaAB_1*r*rA**2*rAB**2*cos(betaAB_2 *theta) + betaAB_1*r*rA**2 &
-        *rAB*rB*cos(betaAB_2*theta) + 5* betaAB_1*r*rA*rAB**3*cos(betaAB_2*theta) - 6*betaAB_1 &
-        *r*rA*rAB**2 *rB*cos(betaAB_2*theta) + betaAB_1*r*rA*rAB*rB**2*cos(betaAB_2* theta) - 4 &
-        *betaAB_1*r*rAB**4*cos(betaAB_2*theta) + 5*betaAB_1*r* rAB**3*rB*cos(betaAB_2*theta) &
-        - betaAB_1*r*rAB**2*rB**2*cos( betaAB_2*theta) - betaAB_1*rA**2*rAB**2*rB*cos(betaAB_2 &
-        *theta) + betaAB_1*rA**2*rAB*rB**2*cos(betaAB_2*theta) + betaAB_1*rA*rAB**3 *rB &
-        *cos(betaAB_2*theta) - betaAB_1*rA*rAB**2*rB**2*cos(betaAB_2* theta) - r*rA**2*rAB**2 &
-        + 2*r*rA**2*rAB*rB - r*rA**2*rB**2 + 2*r* rA*rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB* &
-        *2 - r*rAB**4 + 2*r* rAB**3*rB - r*rAB**2*rB**2)
+    aB = alphaA/(alphaA*log(const_rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log( const_rAB))
+    bB = -alphaA*log(rB)/(alphaA*log(const_rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB &
+        *log(const_rAB))
+    res = -alphaB*((-2*aB*betaAB_1*r*const_rAB*cos(betaAB_2*theta)/(betaAB_1**2*r*const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *r*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos( betaAB_2 &
+        *theta) - r*rA*const_rAB + r*rA*rB + r*const_rAB**2 - r*const_rAB*rB) + aB* r*( &
+        -betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)**2 + 2*betaAB_1*r*const_rAB &
+        * cos(betaAB_2*theta) - 2*betaAB_1*const_rAB**2*cos(betaAB_2*theta) + rA &
+        * const_rAB - rA*rB - const_rAB**2 + const_rAB*rB)*(betaAB_1**2*const_rAB**2 &
+        *cos(betaAB_2* theta)**2 - 2*betaAB_1*r*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *const_rAB **2*cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 &
+        - const_rAB*rB)/( betaAB_1**2*r*const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2 &
+        *const_rAB* cos(betaAB_2*theta) + 2*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) &
+        - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r &
+        * const_rAB**2 - r*const_rAB*rB)**2 + aB*(betaAB_1**2*const_rAB**2*cos(betaAB_2 &
+        *theta )**2 - 2*betaAB_1*r*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2 &
+        * cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB*rB) &
+        /(betaAB_1 **2*r*const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB &
+        *cos( betaAB_2*theta) + 2*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA &
+        *const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r* const_rAB**2 - r &
+        *const_rAB*rB))/r + (aB*((2*betaAB_1**2*betaAB_2*const_rAB**2*sin( betaAB_2*theta) &
+        *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*const_rAB* sin(betaAB_2*theta) + 2 &
+        *betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2* theta) - betaAB_1*betaAB_2*const_rAB &
+        *rB*sin(betaAB_2*theta))*(betaAB_1 **2*r*const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*r**2*const_rAB*cos( betaAB_2*theta) + 2*betaAB_1*r*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) - r*rA &
+        *const_rAB + r*rA*rB + r* const_rAB**2 - r*const_rAB*rB)/(betaAB_1**2*const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *const_rAB**2*cos( betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA &
+        *const_rAB + rA*rB + const_rAB**2 - const_rAB*rB)**2 + (-2*betaAB_1**2*betaAB_2*r &
+        *const_rAB**2* sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*r**2 &
+        * const_rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*const_rAB**2*sin( betaAB_2 &
+        *theta) + betaAB_1*betaAB_2*rA*const_rAB*rB*sin(betaAB_2*theta ))/(betaAB_1**2 &
+        *const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*rA*const_rAB* cos(betaAB_2*theta) &
+        + 2*betaAB_1*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2 &
+        *theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB*rB))*(-2*betaAB_1**2 &
+        *betaAB_2*const_rAB**2*sin(betaAB_2*theta)*cos( betaAB_2*theta) + betaAB_1*betaAB_2 &
+        *rA*const_rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2 &
+        *theta) + betaAB_1* betaAB_2*const_rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2*r &
+        *const_rAB**2*cos( betaAB_2*theta)**2 - betaAB_1*r**2*const_rAB*cos(betaAB_2 &
+        *theta) + 2* betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB &
+        *cos( betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r*const_rAB**2 - r*const_rAB &
+        *rB) + aB* ((2*betaAB_1**2*betaAB_2*const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2 &
+        * theta) - betaAB_1*betaAB_2*rA*const_rAB*sin(betaAB_2*theta) + 2* betaAB_1 &
+        *betaAB_2*const_rAB**2*sin(betaAB_2*theta) - betaAB_1*betaAB_2* const_rAB*rB &
+        *sin(betaAB_2*theta))*(betaAB_1**2*r*const_rAB**2*cos(betaAB_2* theta)**2 &
+        - betaAB_1*r**2*const_rAB*cos(betaAB_2*theta) + 2*betaAB_1*r* const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos(betaAB_2* theta) - r*rA &
+        *const_rAB + r*rA*rB + r*const_rAB**2 - r*const_rAB*rB)/(betaAB_1**2* const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1 &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB* cos(betaAB_2*theta) - rA &
+        *const_rAB + rA*rB + const_rAB**2 - const_rAB*rB)**2 + (-2* betaAB_1**2*betaAB_2*r &
+        *const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2* theta) + betaAB_1*betaAB_2*r**2 &
+        *const_rAB*sin(betaAB_2*theta) - 2* betaAB_1*betaAB_2*r*const_rAB**2*sin(betaAB_2 &
+        *theta) + betaAB_1* betaAB_2*rA*const_rAB*rB*sin(betaAB_2*theta))/(betaAB_1**2 &
+        *const_rAB**2*cos( betaAB_2*theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) &
+        + 2* betaAB_1*const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB &
+        *cos( betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB*rB))*(2 &
+        *betaAB_1 **2*betaAB_2*r*const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) &
+        - betaAB_1*betaAB_2*r**2*const_rAB*sin(betaAB_2*theta) + 2*betaAB_1* betaAB_2*r &
+        *const_rAB**2*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*const_rAB* rB*sin(betaAB_2 &
+        *theta))*(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)** 2 - betaAB_1*rA*const_rAB &
+        *cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2*cos( betaAB_2*theta) - betaAB_1 &
+        *const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB &
+        *rB)/(betaAB_1**2*r*const_rAB**2*cos(betaAB_2*theta )**2 - betaAB_1*r**2*const_rAB &
+        *cos(betaAB_2*theta) + 2*betaAB_1*r*const_rAB** 2*cos(betaAB_2*theta) - betaAB_1*rA &
+        *const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r*const_rAB**2 - r &
+        *const_rAB*rB)**2 + aB*((2*betaAB_1**2 *betaAB_2*const_rAB**2*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*const_rAB*sin(betaAB_2*theta) + 2 &
+        *betaAB_1* betaAB_2*const_rAB**2*sin(betaAB_2*theta) - betaAB_1*betaAB_2*const_rAB &
+        *rB* sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*const_rAB**2*sin(betaAB_2* theta) &
+        *cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*const_rAB*sin( betaAB_2*theta) + 4 &
+        *betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*const_rAB &
+        *rB*sin(betaAB_2*theta))*(betaAB_1**2*r* const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*r**2*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*r*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*rA* const_rAB*rB*cos(betaAB_2*theta) - r*rA &
+        *const_rAB + r*rA*rB + r*const_rAB**2 - r* const_rAB*rB)/(betaAB_1**2*const_rAB**2 &
+        *cos(betaAB_2*theta)**2 - betaAB_1*rA* const_rAB*cos(betaAB_2*theta) + 2*betaAB_1 &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA &
+        *const_rAB + rA*rB + const_rAB**2 - const_rAB*rB)**3 + 2*(2*betaAB_1**2*betaAB_2 &
+        *const_rAB**2*sin(betaAB_2*theta) *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA &
+        *const_rAB*sin(betaAB_2* theta) + 2*betaAB_1*betaAB_2*const_rAB**2*sin(betaAB_2 &
+        *theta) - betaAB_1*betaAB_2*const_rAB*rB*sin(betaAB_2*theta))*(-2*betaAB_1**2 &
+        * betaAB_2*r*const_rAB**2*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1 &
+        *betaAB_2*r**2*const_rAB*sin(betaAB_2*theta) - 2*betaAB_1* betaAB_2*r*const_rAB**2 &
+        *sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*const_rAB* rB*sin(betaAB_2*theta)) &
+        /(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)** 2 - betaAB_1*rA*const_rAB &
+        *cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2*cos( betaAB_2*theta) - betaAB_1 &
+        *const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB + rA*rB + const_rAB**2 - const_rAB &
+        *rB)**2 + (-2*betaAB_1**2*betaAB_2**2*const_rAB**2* sin(betaAB_2*theta)**2 + 2 &
+        *betaAB_1**2*betaAB_2**2*const_rAB**2*cos( betaAB_2*theta)**2 - betaAB_1 &
+        *betaAB_2**2*rA*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*betaAB_2**2 &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*const_rAB*rB*cos(betaAB_2 &
+        *theta))*(betaAB_1**2*r* const_rAB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2 &
+        *const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*r*const_rAB**2*cos(betaAB_2*theta) &
+        - betaAB_1*rA* const_rAB*rB*cos(betaAB_2*theta) - r*rA*const_rAB + r*rA*rB + r &
+        *const_rAB**2 - r* const_rAB*rB)/(betaAB_1**2*const_rAB**2*cos(betaAB_2*theta)**2 &
+        - betaAB_1*rA* const_rAB*cos(betaAB_2*theta) + 2*betaAB_1*const_rAB**2*cos(betaAB_2 &
+        *theta) - betaAB_1*const_rAB*rB*cos(betaAB_2*theta) - rA*const_rAB + rA*rB &
+        + const_rAB**2 - const_rAB*rB)**2 + (2*betaAB_1**2*betaAB_2**2*r*const_rAB**2 &
+        *sin(betaAB_2* theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*const_rAB**2*cos(betaAB_2 &
+        *theta )**2 + betaAB_1*betaAB_2**2*r**2*const_rAB*cos(betaAB_2*theta) - 2* betaAB_1 &
+        *betaAB_2**2*r*const_rAB**2*cos(betaAB_2*theta) + betaAB_1* betaAB_2**2*rA &
+        *const_rAB*rB*cos(betaAB_2*theta))/(betaAB_1**2*const_rAB**2* cos(betaAB_2 &
+        *theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2*theta) + 2* betaAB_1*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*const_rAB*rB*cos( betaAB_2*theta) - rA*const_rAB &
+        + rA*rB + const_rAB**2 - const_rAB*rB))*(betaAB_1**2 *const_rAB**2*cos(betaAB_2 &
+        *theta)**2 - betaAB_1*rA*const_rAB*cos(betaAB_2* theta) + 2*betaAB_1*const_rAB**2 &
+        *cos(betaAB_2*theta) - betaAB_1*const_rAB*rB* cos(betaAB_2*theta) - rA*const_rAB &
+        + rA*rB + const_rAB**2 - const_rAB*rB)/(betaAB_1 **2*r*const_rAB**2*cos(betaAB_2 &
+        *theta)**2 - betaAB_1*r**2*const_rAB*cos( betaAB_2*theta) + 2*betaAB_1*r &
+        *const_rAB**2*cos(betaAB_2*theta) - betaAB_1*rA*const_rAB*rB*cos(betaAB_2*theta) &
+        - r*rA*const_rAB + r*rA*rB + r* const_rAB**2 - r*const_rAB*rB))/r**2) + (aB &
+        *betaAB_1**4*betaAB_2*r**2*const_rAB**4* wB*sin(betaAB_2*theta)*cos(betaAB_2 &
+        *theta)**3 - aB*betaAB_1**4* betaAB_2*r*const_rAB**4*rB*wB*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta)** 3 - 2*aB*betaAB_1**3*betaAB_2*r**3*const_rAB**3*wB &
+        *sin(betaAB_2*theta)* cos(betaAB_2*theta)**2 - aB*betaAB_1**3*betaAB_2*r**2*rA &
+        *const_rAB**3* wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 + 3*aB*betaAB_1**3 &
+        * betaAB_2*r**2*const_rAB**4*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)** 2 + 2*aB &
+        *betaAB_1**3*betaAB_2*r**2*const_rAB**3*rB*wB*sin(betaAB_2* theta)*cos(betaAB_2 &
+        *theta)**2 + aB*betaAB_1**3*betaAB_2*r**2*const_rAB **3*wB*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta)**2 + aB*betaAB_1** 3*betaAB_2*r*rA*const_rAB**3*rB*wB &
+        *sin(betaAB_2*theta)*cos(betaAB_2* theta)**2 - aB*betaAB_1**3*betaAB_2*r*rA &
+        *const_rAB**3*wB*sin(betaAB_2* theta)*cos(betaAB_2*theta)**2 - 3*aB*betaAB_1**3 &
+        *betaAB_2*r*const_rAB** 4*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta)**2 - aB &
+        *betaAB_1 **3*betaAB_2*r*const_rAB**3*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2 &
+        * theta)**2 + aB*betaAB_1**3*betaAB_2*rA*const_rAB**3*rB*wB*sin(betaAB_2* theta) &
+        *cos(betaAB_2*theta)**2 + 2*aB*betaAB_1**2*betaAB_2*r**3*rA *const_rAB**2*wB &
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - 2*aB* betaAB_1**2*betaAB_2*r**3 &
+        *const_rAB**3*wB*sin(betaAB_2*theta)*cos( betaAB_2*theta) - 3*aB*betaAB_1**2 &
+        *betaAB_2*r**2*rA*const_rAB**3*wB*sin (betaAB_2*theta)*cos(betaAB_2*theta) - aB &
+        *betaAB_1**2*betaAB_2*r **2*rA*const_rAB**2*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2 &
+        *theta) + 3* aB*betaAB_1**2*betaAB_2*r**2*const_rAB**4*wB*sin(betaAB_2*theta) &
+        *cos( betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r**2*const_rAB**3*rB*wB &
+        *sin( betaAB_2*theta)*cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r *rA &
+        *const_rAB**3*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aB* betaAB_1**2 &
+        *betaAB_2*r*rA*const_rAB**2*rB**2*wB*sin(betaAB_2*theta)*cos (betaAB_2*theta) - 3 &
+        *aB*betaAB_1**2*betaAB_2*r*const_rAB**4*rB*wB*sin( betaAB_2*theta)*cos(betaAB_2 &
+        *theta) + aB*betaAB_1**2*betaAB_2*r* const_rAB**3*rB**2*wB*sin(betaAB_2*theta) &
+        *cos(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r**2*rA**2*const_rAB**2*wB &
+        *sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r**2*rA**2*const_rAB*rB*wB &
+        *sin(betaAB_2*theta) - 2*aB *betaAB_1*betaAB_2*r**2*rA*const_rAB**3*wB*sin(betaAB_2 &
+        *theta) + 2*aB* betaAB_1*betaAB_2*r**2*rA*const_rAB**2*rB*wB*sin(betaAB_2*theta) &
+        + aB* betaAB_1*betaAB_2*r**2*rA*const_rAB**2*wB*sin(betaAB_2*theta) - aB* betaAB_1 &
+        *betaAB_2*r**2*rA*const_rAB*rB*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r**2 &
+        *const_rAB**4*wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r**2*const_rAB**3*rB &
+        *wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r**2*const_rAB**3*wB*sin(betaAB_2 &
+        *theta) + aB* betaAB_1*betaAB_2*r**2*const_rAB**2*rB*wB*sin(betaAB_2*theta) - aB &
+        * betaAB_1*betaAB_2*r*rA**2*const_rAB**2*rB*wB*sin(betaAB_2*theta) - aB* betaAB_1 &
+        *betaAB_2*r*rA**2*const_rAB**2*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r &
+        *rA**2*const_rAB*rB**2*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r*rA**2 &
+        *const_rAB*rB*wB*sin(betaAB_2*theta) + 2*aB* betaAB_1*betaAB_2*r*rA*const_rAB**3*rB &
+        *wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r*rA*const_rAB**3*wB*sin(betaAB_2 &
+        *theta) - 2*aB* betaAB_1*betaAB_2*r*rA*const_rAB**2*rB**2*wB*sin(betaAB_2*theta) &
+        - 2*aB *betaAB_1*betaAB_2*r*rA*const_rAB**2*rB*wB*sin(betaAB_2*theta) + aB &
+        * betaAB_1*betaAB_2*r*rA*const_rAB*rB**2*wB*sin(betaAB_2*theta) - aB* betaAB_1 &
+        *betaAB_2*r*const_rAB**4*rB*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r &
+        *const_rAB**3*rB**2*wB*sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*r*const_rAB**3 &
+        *rB*wB*sin(betaAB_2*theta) - aB* betaAB_1*betaAB_2*r*const_rAB**2*rB**2*wB &
+        *sin(betaAB_2*theta) + aB* betaAB_1*betaAB_2*rA**2*const_rAB**2*rB*wB*sin(betaAB_2 &
+        *theta) - aB* betaAB_1*betaAB_2*rA**2*const_rAB*rB**2*wB*sin(betaAB_2*theta) - aB &
+        * betaAB_1*betaAB_2*rA*const_rAB**3*rB*wB*sin(betaAB_2*theta) + aB* betaAB_1 &
+        *betaAB_2*rA*const_rAB**2*rB**2*wB*sin(betaAB_2*theta))/( -betaAB_1**4*r &
+        *const_rAB**4*cos(betaAB_2*theta)**4 + betaAB_1**3*r**2* const_rAB**3*cos(betaAB_2 &
+        *theta)**3 + betaAB_1**3*r*rA*const_rAB**3*cos( betaAB_2*theta)**3 - 4*betaAB_1**3 &
+        *r*const_rAB**4*cos(betaAB_2*theta)** 3 + betaAB_1**3*r*const_rAB**3*rB &
+        *cos(betaAB_2*theta)**3 + betaAB_1**3* rA*const_rAB**3*rB*cos(betaAB_2*theta)**3 &
+        - betaAB_1**2*r**2*rA*const_rAB**2* cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2 &
+        *const_rAB**3*cos(betaAB_2* theta)**2 - betaAB_1**2*r**2*const_rAB**2*rB &
+        *cos(betaAB_2*theta)**2 + 4 *betaAB_1**2*r*rA*const_rAB**3*cos(betaAB_2*theta)**2 &
+        - 2*betaAB_1**2*r *rA*const_rAB**2*rB*cos(betaAB_2*theta)**2 - 6*betaAB_1**2*r &
+        *const_rAB**4*cos (betaAB_2*theta)**2 + 4*betaAB_1**2*r*const_rAB**3*rB &
+        *cos(betaAB_2* theta)**2 - betaAB_1**2*rA**2*const_rAB**2*rB*cos(betaAB_2 &
+        *theta)**2 + 2*betaAB_1**2*rA*const_rAB**3*rB*cos(betaAB_2*theta)**2 - betaAB_1**2 &
+        * rA*const_rAB**2*rB**2*cos(betaAB_2*theta)**2 - betaAB_1*r**2*rA*const_rAB**2 &
+        * cos(betaAB_2*theta) + betaAB_1*r**2*rA*const_rAB*rB*cos(betaAB_2*theta ) &
+        + betaAB_1*r**2*const_rAB**3*cos(betaAB_2*theta) - betaAB_1*r**2*const_rAB **2*rB &
+        *cos(betaAB_2*theta) - betaAB_1*r*rA**2*const_rAB**2*cos(betaAB_2 *theta) &
+        + betaAB_1*r*rA**2*const_rAB*rB*cos(betaAB_2*theta) + 5* betaAB_1*r*rA*const_rAB**3 &
+        *cos(betaAB_2*theta) - 6*betaAB_1*r*rA*const_rAB**2 *rB*cos(betaAB_2*theta) &
+        + betaAB_1*r*rA*const_rAB*rB**2*cos(betaAB_2* theta) - 4*betaAB_1*r*const_rAB**4 &
+        *cos(betaAB_2*theta) + 5*betaAB_1*r* const_rAB**3*rB*cos(betaAB_2*theta) - betaAB_1 &
+        *r*const_rAB**2*rB**2*cos( betaAB_2*theta) - betaAB_1*rA**2*const_rAB**2*rB &
+        *cos(betaAB_2*theta) + betaAB_1*rA**2*const_rAB*rB**2*cos(betaAB_2*theta) &
+        + betaAB_1*rA*const_rAB**3 *rB*cos(betaAB_2*theta) - betaAB_1*rA*const_rAB**2*rB**2 &
+        *cos(betaAB_2* theta) - r*rA**2*const_rAB**2 + 2*r*rA**2*const_rAB*rB - r*rA**2 &
+        *rB**2 + 2*r* rA*const_rAB**3 - 4*r*rA*const_rAB**2*rB + 2*r*rA*const_rAB*rB**2 - r &
+        *const_rAB**4 + 2*r* const_rAB**3*rB - r*const_rAB**2*rB**2)
 end function fB
 
 end module cht_02
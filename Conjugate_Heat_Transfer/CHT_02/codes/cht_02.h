@@ -74,10 +74,10 @@ inline double phiA(double x, double y) {
         + alphaB*log(rA) - alphaB*log(rAB));
     double res = aA*log((pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1 \
         *pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB \
-        *rB)/(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB)) + bA;
+        - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r \
+        *rAB*rB)/(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA \
+        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB)) + bA;
     return res;
 }
 
@@ -89,10 +89,10 @@ inline double phiB(double x, double y) {
     double bB = -alphaA*log(rB)/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log(rAB));
     double res = aB*log((pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1 \
         *pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB \
-        *rB)/(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB)) + bB;
+        - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r \
+        *rAB*rB)/(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA \
+        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB)) + bB;
     return res;
 }
 
@@ -104,184 +104,191 @@ inline double fA(double x, double y) {
     double bA = (alphaA*log(rAB) - alphaA*log(rB) - alphaB*log(rAB))/(alphaA*log(rAB) - alphaA*log(rB) \
         + alphaB*log(rA) - alphaB*log(rAB));
     double res = -alphaA*((-2*aA*betaAB_1*r*rAB*cos(betaAB_2*theta)/(pow(betaAB_1, 2)*r*pow(rAB, 2) \
-        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB \
-        + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) + aA*r*(-pow(betaAB_1, 2)*pow(rAB, 2) \
-        *pow(cos(betaAB_2*theta), 2) + 2*betaAB_1*r*rAB*cos(betaAB_2*theta) - 2*betaAB_1 \
-        *pow(rAB, 2)*cos(betaAB_2*theta) + rA*rAB - rA*rB - pow(rAB, 2) + rAB*rB) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) + aA*r*(-pow(betaAB_1, 2) \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) + 2*betaAB_1*r*rAB*cos(betaAB_2*theta) - 2 \
+        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) + rA*rAB - rA*rB - pow(rAB, 2) + rAB*rB) \
         *(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - 2*betaAB_1*r*rAB \
         *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - rA*rAB + rA*rB \
-        + pow(rAB, 2) - rAB*rB)/pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) \
-        - r*rAB*rB, 2) + aA*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - 2 \
-        *betaAB_1*r*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB)/(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2 \
+        + pow(rAB, 2) - rAB*rB)/pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2 \
         *theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2) \
-        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r \
-        *pow(rAB, 2) - r*rAB*rB))/r + (aA*((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
-        *theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB \
-        *rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) \
-        - r*rAB*rB)/pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA \
-        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2) \
-        *betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *pow(r, 2)*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2) \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(-2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
-        *theta) - 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) + betaAB_1*betaAB_2*rAB \
-        *rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) \
-        - r*rAB*rB) + aA*((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) \
-        *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1 \
-        *betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2 \
-        *theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1 \
-        *pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB \
-        *rB)/pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2) \
-        *betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *pow(r, 2)*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2) \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(2*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2) \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*pow(r, 2)*rAB*sin(betaAB_2 \
-        *theta) + 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA \
-        *rAB*rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) \
-        - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB) \
-        /pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2) \
-        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA \
-        *rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB, 2) + aA \
-        *((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
+        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB \
+        + r*pow(rAB, 2) - r*rAB*rB, 2) + aA*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - 2*betaAB_1*r*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB)/(pow(betaAB_1, 2)*r \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2 \
+        *theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB))/r + (aA*((2 \
+        *pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
         - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(4 \
-        *pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) - 2 \
-        *betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta)) \
-        *(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB \
-        *rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) \
+        *sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta)) \
+        *(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2) \
+        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) \
         /pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
         *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 3) + 2*(2 \
-        *pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(-2 \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2 \
         *pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
         + betaAB_1*betaAB_2*pow(r, 2)*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *pow(rAB, 2)*sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta)) \
-        /pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
+        /(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
         *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2) \
-        *pow(betaAB_2, 2)*pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2) \
-        *pow(betaAB_2, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(betaAB_2, 2) \
-        *rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(betaAB_2, 2)*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*pow(betaAB_2, 2)*rAB*rB*cos(betaAB_2*theta))*(pow(betaAB_1, 2)*r \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) \
-        + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(-2*pow(betaAB_1, 2) \
+        *betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
+        *rA*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2)*r*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) + aA*((2*pow(betaAB_1, 2) \
+        *betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2 \
+        *rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
         *theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB)/pow(pow(betaAB_1, 2) \
         *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (2*pow(betaAB_1, 2)*pow(betaAB_2, 2)*r \
-        *pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) - 2*pow(betaAB_1, 2)*pow(betaAB_2, 2)*r \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) + betaAB_1*pow(betaAB_2, 2)*pow(r, 2)*rAB \
-        *cos(betaAB_2*theta) - 2*betaAB_1*pow(betaAB_2, 2)*r*pow(rAB, 2)*cos(betaAB_2*theta) \
-        + betaAB_1*pow(betaAB_2, 2)*rA*rAB*rB*cos(betaAB_2*theta))/(pow(betaAB_1, 2) \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
-        *theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB) \
-        /(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB \
-        *rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB))/pow(r, 2)) \
-        + (aA*pow(betaAB_1, 4)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wA*sin(betaAB_2*theta) \
-        *pow(cos(betaAB_2*theta), 3) - aA*pow(betaAB_1, 4)*betaAB_2*r*rA*pow(rAB, 4)*wA \
-        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 3) - 2*aA*pow(betaAB_1, 3)*betaAB_2 \
-        *pow(r, 3)*pow(rAB, 3)*wA*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + 2*aA \
-        *pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta) \
-        *pow(cos(betaAB_2*theta), 2) + 3*aA*pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wA \
-        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aA*pow(betaAB_1, 3)*betaAB_2 \
+        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) \
+        - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2)*betaAB_2*r \
+        *pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*pow(r, 2) \
+        *rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2)*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
+        *pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + pow(rAB, 2) - rAB*rB))*(2*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*pow(r, 2)*rAB \
+        *sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
+        *pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + pow(rAB, 2) - rAB*rB)/pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB \
+        + r*pow(rAB, 2) - r*rAB*rB, 2) + aA*((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
+        *theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2 \
+        *rAB*rB*sin(betaAB_2*theta))*(4*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2 \
+        *theta)*cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 4 \
+        *betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB \
+        *sin(betaAB_2*theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
+        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB \
+        + r*pow(rAB, 2) - r*rAB*rB)/pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB \
+        + pow(rAB, 2) - rAB*rB, 3) + 2*(2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
+        *theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2 \
+        *rAB*rB*sin(betaAB_2*theta))*(-2*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*pow(r, 2)*rAB \
+        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/pow(pow(betaAB_1, 2)*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
+        *pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2)*pow(betaAB_2, 2) \
+        *pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2)*pow(betaAB_2, 2) \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(betaAB_2, 2)*rA*rAB \
+        *cos(betaAB_2*theta) + 2*betaAB_1*pow(betaAB_2, 2)*pow(rAB, 2)*cos(betaAB_2*theta) \
+        - betaAB_1*pow(betaAB_2, 2)*rAB*rB*cos(betaAB_2*theta))*(pow(betaAB_1, 2)*r \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2 \
+        *theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) \
+        /pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
+        *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (2 \
+        *pow(betaAB_1, 2)*pow(betaAB_2, 2)*r*pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) - 2 \
+        *pow(betaAB_1, 2)*pow(betaAB_2, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
+        + betaAB_1*pow(betaAB_2, 2)*pow(r, 2)*rAB*cos(betaAB_2*theta) - 2*betaAB_1 \
+        *pow(betaAB_2, 2)*r*pow(rAB, 2)*cos(betaAB_2*theta) + betaAB_1*pow(betaAB_2, 2)*rA \
+        *rAB*rB*cos(betaAB_2*theta))/(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB \
+        + pow(rAB, 2) - rAB*rB))*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
+        - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) \
+        - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB) \
+        /(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2) \
+        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB)) \
+        /pow(r, 2)) + (aA*pow(betaAB_1, 4)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wA*sin(betaAB_2 \
+        *theta)*pow(cos(betaAB_2*theta), 3) - aA*pow(betaAB_1, 4)*betaAB_2*r*rA*pow(rAB, 4) \
+        *wA*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 3) - 2*aA*pow(betaAB_1, 3) \
+        *betaAB_2*pow(r, 3)*pow(rAB, 3)*wA*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) \
+        + 2*aA*pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta) \
+        *pow(cos(betaAB_2*theta), 2) + 3*aA*pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*pow(rAB, 4) \
+        *wA*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aA*pow(betaAB_1, 3)*betaAB_2 \
         *pow(r, 2)*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + aA \
         *pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*pow(rAB, 3)*wA*sin(betaAB_2*theta) \
         *pow(cos(betaAB_2*theta), 2) - 3*aA*pow(betaAB_1, 3)*betaAB_2*r*rA*pow(rAB, 4)*wA \
-        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + aA*pow(betaAB_1, 3)*betaAB_2*r*rA \
-        *pow(rAB, 3)*rB*wA*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aA \
+        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + aA*pow(betaAB_1, 3)*betaAB_2*r \
+        *rA*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aA \
         *pow(betaAB_1, 3)*betaAB_2*r*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta)*pow(cos(betaAB_2 \
         *theta), 2) - aA*pow(betaAB_1, 3)*betaAB_2*r*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta) \
         *pow(cos(betaAB_2*theta), 2) + aA*pow(betaAB_1, 3)*betaAB_2*rA*pow(rAB, 3)*rB*wA \
         *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - 2*aA*pow(betaAB_1, 2)*betaAB_2 \
         *pow(r, 3)*pow(rAB, 3)*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) + 2*aA \
-        *pow(betaAB_1, 2)*betaAB_2*pow(r, 3)*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta)*cos(betaAB_2 \
-        *theta) + aA*pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta) \
-        *cos(betaAB_2*theta) - aA*pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*rA*pow(rAB, 2)*rB*wA \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + 3*aA*pow(betaAB_1, 2)*betaAB_2*pow(r, 2) \
-        *pow(rAB, 4)*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) - 3*aA*pow(betaAB_1, 2) \
-        *betaAB_2*pow(r, 2)*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) + aA \
-        *pow(betaAB_1, 2)*betaAB_2*r*pow(rA, 2)*pow(rAB, 3)*wA*sin(betaAB_2*theta)*cos(betaAB_2 \
-        *theta) - aA*pow(betaAB_1, 2)*betaAB_2*r*pow(rA, 2)*pow(rAB, 2)*rB*wA*sin(betaAB_2 \
-        *theta)*cos(betaAB_2*theta) - 3*aA*pow(betaAB_1, 2)*betaAB_2*r*rA*pow(rAB, 4)*wA \
+        *pow(betaAB_1, 2)*betaAB_2*pow(r, 3)*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) \
+        *cos(betaAB_2*theta) + aA*pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wA \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - aA*pow(betaAB_1, 2)*betaAB_2*pow(r, 2) \
+        *rA*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) + 3*aA \
+        *pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wA*sin(betaAB_2*theta) \
+        *cos(betaAB_2*theta) - 3*aA*pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*pow(rAB, 3)*rB*wA \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + aA*pow(betaAB_1, 2)*betaAB_2*r \
+        *pow(rA, 2)*pow(rAB, 3)*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aA \
+        *pow(betaAB_1, 2)*betaAB_2*r*pow(rA, 2)*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) \
+        *cos(betaAB_2*theta) - 3*aA*pow(betaAB_1, 2)*betaAB_2*r*rA*pow(rAB, 4)*wA \
         *sin(betaAB_2*theta)*cos(betaAB_2*theta) + 3*aA*pow(betaAB_1, 2)*betaAB_2*r*rA \
         *pow(rAB, 3)*rB*wA*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aA*betaAB_1*betaAB_2 \
-        *pow(r, 2)*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta) + 2*aA*betaAB_1*betaAB_2*pow(r, 2)*rA \
-        *pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*pow(r, 2)*rA*pow(rAB, 2) \
-        *wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*pow(r, 2)*rA*rAB*pow(rB, 2)*wA \
-        *sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*pow(r, 2)*rA*rAB*rB*wA*sin(betaAB_2*theta) \
-        + aA*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 4)*wA*sin(betaAB_2*theta) - 2*aA*betaAB_1 \
-        *betaAB_2*pow(r, 2)*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2 \
-        *pow(r, 2)*pow(rAB, 3)*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*pow(r, 2) \
-        *pow(rAB, 2)*pow(rB, 2)*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*pow(r, 2) \
-        *pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*pow(rA, 2)*pow(rAB, 3) \
-        *wA*sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*pow(rA, 2)*pow(rAB, 2)*rB*wA \
-        *sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*pow(rA, 2)*pow(rAB, 2)*wA*sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*r*pow(rA, 2)*rAB*pow(rB, 2)*wA*sin(betaAB_2*theta) + aA \
-        *betaAB_1*betaAB_2*r*pow(rA, 2)*rAB*rB*wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r \
-        *rA*pow(rAB, 4)*wA*sin(betaAB_2*theta) + 2*aA*betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*rB*wA \
-        *sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta) \
-        - aA*betaAB_1*betaAB_2*r*rA*pow(rAB, 2)*pow(rB, 2)*wA*sin(betaAB_2*theta) - 2*aA \
-        *betaAB_1*betaAB_2*r*rA*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r \
-        *rA*rAB*pow(rB, 2)*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*pow(rAB, 3)*rB*wA \
-        *sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*pow(rAB, 2)*pow(rB, 2)*wA*sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*pow(rA, 2)*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) - aA \
-        *betaAB_1*betaAB_2*pow(rA, 2)*rAB*pow(rB, 2)*wA*sin(betaAB_2*theta) - aA*betaAB_1 \
-        *betaAB_2*rA*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*rA \
-        *pow(rAB, 2)*pow(rB, 2)*wA*sin(betaAB_2*theta))/(-pow(betaAB_1, 4)*r*pow(rAB, 4) \
-        *pow(cos(betaAB_2*theta), 4) + pow(betaAB_1, 3)*pow(r, 2)*pow(rAB, 3)*pow(cos(betaAB_2 \
-        *theta), 3) + pow(betaAB_1, 3)*r*rA*pow(rAB, 3)*pow(cos(betaAB_2*theta), 3) - 4 \
-        *pow(betaAB_1, 3)*r*pow(rAB, 4)*pow(cos(betaAB_2*theta), 3) + pow(betaAB_1, 3)*r \
-        *pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 3) + pow(betaAB_1, 3)*rA*pow(rAB, 3)*rB \
-        *pow(cos(betaAB_2*theta), 3) - pow(betaAB_1, 2)*pow(r, 2)*rA*pow(rAB, 2) \
-        *pow(cos(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2)*pow(r, 2)*pow(rAB, 3) \
+        *pow(r, 2)*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta) + 2*aA*betaAB_1*betaAB_2*pow(r, 2) \
+        *rA*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*pow(r, 2)*rA \
+        *pow(rAB, 2)*wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*pow(r, 2)*rA*rAB \
+        *pow(rB, 2)*wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*pow(r, 2)*rA*rAB*rB*wA \
+        *sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 4)*wA*sin(betaAB_2 \
+        *theta) - 2*aA*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta) \
+        - aA*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 3)*wA*sin(betaAB_2*theta) + aA*betaAB_1 \
+        *betaAB_2*pow(r, 2)*pow(rAB, 2)*pow(rB, 2)*wA*sin(betaAB_2*theta) + aA*betaAB_1 \
+        *betaAB_2*pow(r, 2)*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r \
+        *pow(rA, 2)*pow(rAB, 3)*wA*sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r \
+        *pow(rA, 2)*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r \
+        *pow(rA, 2)*pow(rAB, 2)*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*pow(rA, 2) \
+        *rAB*pow(rB, 2)*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*pow(rA, 2)*rAB*rB \
+        *wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rA*pow(rAB, 4)*wA*sin(betaAB_2 \
+        *theta) + 2*aA*betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta) + aA \
+        *betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r \
+        *rA*pow(rAB, 2)*pow(rB, 2)*wA*sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*rA \
+        *pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA*rAB*pow(rB, 2) \
+        *wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*pow(rAB, 3)*rB*wA*sin(betaAB_2 \
+        *theta) - aA*betaAB_1*betaAB_2*r*pow(rAB, 2)*pow(rB, 2)*wA*sin(betaAB_2*theta) + aA \
+        *betaAB_1*betaAB_2*pow(rA, 2)*pow(rAB, 2)*rB*wA*sin(betaAB_2*theta) - aA*betaAB_1 \
+        *betaAB_2*pow(rA, 2)*rAB*pow(rB, 2)*wA*sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2 \
+        *rA*pow(rAB, 3)*rB*wA*sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*rA*pow(rAB, 2) \
+        *pow(rB, 2)*wA*sin(betaAB_2*theta))/(-pow(betaAB_1, 4)*r*pow(rAB, 4) \
+        *pow(cos(betaAB_2*theta), 4) + pow(betaAB_1, 3)*pow(r, 2)*pow(rAB, 3) \
+        *pow(cos(betaAB_2*theta), 3) + pow(betaAB_1, 3)*r*rA*pow(rAB, 3)*pow(cos(betaAB_2 \
+        *theta), 3) - 4*pow(betaAB_1, 3)*r*pow(rAB, 4)*pow(cos(betaAB_2*theta), 3) \
+        + pow(betaAB_1, 3)*r*pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 3) + pow(betaAB_1, 3) \
+        *rA*pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 3) - pow(betaAB_1, 2)*pow(r, 2)*rA \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2)*pow(r, 2)*pow(rAB, 3) \
         *pow(cos(betaAB_2*theta), 2) - pow(betaAB_1, 2)*pow(r, 2)*pow(rAB, 2)*rB \
         *pow(cos(betaAB_2*theta), 2) + 4*pow(betaAB_1, 2)*r*rA*pow(rAB, 3)*pow(cos(betaAB_2 \
-        *theta), 2) - 2*pow(betaAB_1, 2)*r*rA*pow(rAB, 2)*rB*pow(cos(betaAB_2*theta), 2) - 6 \
-        *pow(betaAB_1, 2)*r*pow(rAB, 4)*pow(cos(betaAB_2*theta), 2) + 4*pow(betaAB_1, 2)*r \
-        *pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 2) - pow(betaAB_1, 2)*pow(rA, 2)*pow(rAB, 2) \
-        *rB*pow(cos(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2)*rA*pow(rAB, 3)*rB*pow(cos(betaAB_2 \
-        *theta), 2) - pow(betaAB_1, 2)*rA*pow(rAB, 2)*pow(rB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*pow(r, 2)*rA*pow(rAB, 2)*cos(betaAB_2*theta) + betaAB_1*pow(r, 2)*rA*rAB*rB \
-        *cos(betaAB_2*theta) + betaAB_1*pow(r, 2)*pow(rAB, 3)*cos(betaAB_2*theta) - betaAB_1 \
-        *pow(r, 2)*pow(rAB, 2)*rB*cos(betaAB_2*theta) - betaAB_1*r*pow(rA, 2)*pow(rAB, 2) \
-        *cos(betaAB_2*theta) + betaAB_1*r*pow(rA, 2)*rAB*rB*cos(betaAB_2*theta) + 5*betaAB_1*r \
-        *rA*pow(rAB, 3)*cos(betaAB_2*theta) - 6*betaAB_1*r*rA*pow(rAB, 2)*rB*cos(betaAB_2 \
-        *theta) + betaAB_1*r*rA*rAB*pow(rB, 2)*cos(betaAB_2*theta) - 4*betaAB_1*r*pow(rAB, 4) \
-        *cos(betaAB_2*theta) + 5*betaAB_1*r*pow(rAB, 3)*rB*cos(betaAB_2*theta) - betaAB_1*r \
-        *pow(rAB, 2)*pow(rB, 2)*cos(betaAB_2*theta) - betaAB_1*pow(rA, 2)*pow(rAB, 2)*rB \
-        *cos(betaAB_2*theta) + betaAB_1*pow(rA, 2)*rAB*pow(rB, 2)*cos(betaAB_2*theta) \
-        + betaAB_1*rA*pow(rAB, 3)*rB*cos(betaAB_2*theta) - betaAB_1*rA*pow(rAB, 2)*pow(rB, 2) \
-        *cos(betaAB_2*theta) - r*pow(rA, 2)*pow(rAB, 2) + 2*r*pow(rA, 2)*rAB*rB - r*pow(rA, 2) \
-        *pow(rB, 2) + 2*r*rA*pow(rAB, 3) - 4*r*rA*pow(rAB, 2)*rB + 2*r*rA*rAB*pow(rB, 2) - r \
-        *pow(rAB, 4) + 2*r*pow(rAB, 3)*rB - r*pow(rAB, 2)*pow(rB, 2));
+        *theta), 2) - 2*pow(betaAB_1, 2)*r*rA*pow(rAB, 2)*rB*pow(cos(betaAB_2*theta), 2) \
+        - 6*pow(betaAB_1, 2)*r*pow(rAB, 4)*pow(cos(betaAB_2*theta), 2) + 4*pow(betaAB_1, 2) \
+        *r*pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 2) - pow(betaAB_1, 2)*pow(rA, 2) \
+        *pow(rAB, 2)*rB*pow(cos(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2)*rA*pow(rAB, 3)*rB \
+        *pow(cos(betaAB_2*theta), 2) - pow(betaAB_1, 2)*rA*pow(rAB, 2)*pow(rB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rA*pow(rAB, 2)*cos(betaAB_2 \
+        *theta) + betaAB_1*pow(r, 2)*rA*rAB*rB*cos(betaAB_2*theta) + betaAB_1*pow(r, 2) \
+        *pow(rAB, 3)*cos(betaAB_2*theta) - betaAB_1*pow(r, 2)*pow(rAB, 2)*rB*cos(betaAB_2 \
+        *theta) - betaAB_1*r*pow(rA, 2)*pow(rAB, 2)*cos(betaAB_2*theta) + betaAB_1*r \
+        *pow(rA, 2)*rAB*rB*cos(betaAB_2*theta) + 5*betaAB_1*r*rA*pow(rAB, 3)*cos(betaAB_2 \
+        *theta) - 6*betaAB_1*r*rA*pow(rAB, 2)*rB*cos(betaAB_2*theta) + betaAB_1*r*rA*rAB \
+        *pow(rB, 2)*cos(betaAB_2*theta) - 4*betaAB_1*r*pow(rAB, 4)*cos(betaAB_2*theta) + 5 \
+        *betaAB_1*r*pow(rAB, 3)*rB*cos(betaAB_2*theta) - betaAB_1*r*pow(rAB, 2)*pow(rB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*pow(rA, 2)*pow(rAB, 2)*rB*cos(betaAB_2*theta) \
+        + betaAB_1*pow(rA, 2)*rAB*pow(rB, 2)*cos(betaAB_2*theta) + betaAB_1*rA*pow(rAB, 3) \
+        *rB*cos(betaAB_2*theta) - betaAB_1*rA*pow(rAB, 2)*pow(rB, 2)*cos(betaAB_2*theta) \
+        - r*pow(rA, 2)*pow(rAB, 2) + 2*r*pow(rA, 2)*rAB*rB - r*pow(rA, 2)*pow(rB, 2) + 2*r \
+        *rA*pow(rAB, 3) - 4*r*rA*pow(rAB, 2)*rB + 2*r*rA*rAB*pow(rB, 2) - r*pow(rAB, 4) + 2 \
+        *r*pow(rAB, 3)*rB - r*pow(rAB, 2)*pow(rB, 2));
     return res;
 }
 
@@ -292,182 +299,190 @@ inline double fB(double x, double y) {
     double aB = alphaA/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log(rAB));
     double bB = -alphaA*log(rB)/(alphaA*log(rAB) - alphaA*log(rB) + alphaB*log(rA) - alphaB*log(rAB));
     double res = -alphaB*((-2*aB*betaAB_1*r*rAB*cos(betaAB_2*theta)/(pow(betaAB_1, 2)*r*pow(rAB, 2) \
-        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB \
-        + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) + aB*r*(-pow(betaAB_1, 2)*pow(rAB, 2) \
-        *pow(cos(betaAB_2*theta), 2) + 2*betaAB_1*r*rAB*cos(betaAB_2*theta) - 2*betaAB_1 \
-        *pow(rAB, 2)*cos(betaAB_2*theta) + rA*rAB - rA*rB - pow(rAB, 2) + rAB*rB) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) + aB*r*(-pow(betaAB_1, 2) \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) + 2*betaAB_1*r*rAB*cos(betaAB_2*theta) - 2 \
+        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) + rA*rAB - rA*rB - pow(rAB, 2) + rAB*rB) \
         *(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - 2*betaAB_1*r*rAB \
         *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - rA*rAB + rA*rB \
-        + pow(rAB, 2) - rAB*rB)/pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) \
-        - r*rAB*rB, 2) + aB*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - 2 \
-        *betaAB_1*r*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB)/(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2 \
+        + pow(rAB, 2) - rAB*rB)/pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2 \
         *theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2) \
-        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r \
-        *pow(rAB, 2) - r*rAB*rB))/r + (aB*((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
-        *theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB \
-        *rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) \
-        - r*rAB*rB)/pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA \
-        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2) \
-        *betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *pow(r, 2)*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2) \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(-2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
-        *theta) - 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) + betaAB_1*betaAB_2*rAB \
-        *rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) \
-        - r*rAB*rB) + aB*((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) \
-        *cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1 \
-        *betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2 \
-        *theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1 \
-        *pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB \
-        *rB)/pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2) \
-        *betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *pow(r, 2)*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2) \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(2*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2) \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*pow(r, 2)*rAB*sin(betaAB_2 \
-        *theta) + 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA \
-        *rAB*rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
-        - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) \
-        - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB) \
-        /pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2) \
-        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA \
-        *rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB, 2) + aB \
-        *((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
+        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB \
+        + r*pow(rAB, 2) - r*rAB*rB, 2) + aB*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - 2*betaAB_1*r*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB)/(pow(betaAB_1, 2)*r \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2 \
+        *theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB))/r + (aB*((2 \
+        *pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
         - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(4 \
-        *pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) - 2 \
-        *betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta)) \
-        *(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB \
-        *rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) \
+        *sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta)) \
+        *(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2) \
+        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) \
         /pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
         *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 3) + 2*(2 \
-        *pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2) \
-        *sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(-2 \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2 \
         *pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
         + betaAB_1*betaAB_2*pow(r, 2)*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *pow(rAB, 2)*sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta)) \
-        /pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
+        /(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
         *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2) \
-        *pow(betaAB_2, 2)*pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2) \
-        *pow(betaAB_2, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(betaAB_2, 2) \
-        *rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(betaAB_2, 2)*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*pow(betaAB_2, 2)*rAB*rB*cos(betaAB_2*theta))*(pow(betaAB_1, 2)*r \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) \
-        + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(-2*pow(betaAB_1, 2) \
+        *betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
+        *rA*rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2)*r*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) + aB*((2*pow(betaAB_1, 2) \
+        *betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2 \
+        *rA*rAB*sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rAB*rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2 \
         *theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB)/pow(pow(betaAB_1, 2) \
         *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (2*pow(betaAB_1, 2)*pow(betaAB_2, 2)*r \
-        *pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) - 2*pow(betaAB_1, 2)*pow(betaAB_2, 2)*r \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) + betaAB_1*pow(betaAB_2, 2)*pow(r, 2)*rAB \
-        *cos(betaAB_2*theta) - 2*betaAB_1*pow(betaAB_2, 2)*r*pow(rAB, 2)*cos(betaAB_2*theta) \
-        + betaAB_1*pow(betaAB_2, 2)*rA*rAB*rB*cos(betaAB_2*theta))/(pow(betaAB_1, 2) \
-        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2 \
-        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA \
-        *rAB + rA*rB + pow(rAB, 2) - rAB*rB))*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
-        *theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB) \
-        /(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB \
-        *cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB \
-        *rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB))/pow(r, 2)) \
-        + (aB*pow(betaAB_1, 4)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wB*sin(betaAB_2*theta) \
-        *pow(cos(betaAB_2*theta), 3) - aB*pow(betaAB_1, 4)*betaAB_2*r*pow(rAB, 4)*rB*wB \
-        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 3) - 2*aB*pow(betaAB_1, 3)*betaAB_2 \
-        *pow(r, 3)*pow(rAB, 3)*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aB \
-        *pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wB*sin(betaAB_2*theta) \
-        *pow(cos(betaAB_2*theta), 2) + 3*aB*pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wB \
-        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + 2*aB*pow(betaAB_1, 3)*betaAB_2 \
-        *pow(r, 2)*pow(rAB, 3)*rB*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + aB \
-        *pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*pow(rAB, 3)*wB*sin(betaAB_2*theta) \
-        *pow(cos(betaAB_2*theta), 2) + aB*pow(betaAB_1, 3)*betaAB_2*r*rA*pow(rAB, 3)*rB*wB \
-        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aB*pow(betaAB_1, 3)*betaAB_2*r*rA \
-        *pow(rAB, 3)*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - 3*aB*pow(betaAB_1, 3) \
-        *betaAB_2*r*pow(rAB, 4)*rB*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aB \
-        *pow(betaAB_1, 3)*betaAB_2*r*pow(rAB, 3)*rB*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2 \
-        *theta), 2) + aB*pow(betaAB_1, 3)*betaAB_2*rA*pow(rAB, 3)*rB*wB*sin(betaAB_2*theta) \
-        *pow(cos(betaAB_2*theta), 2) + 2*aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 3)*rA*pow(rAB, 2) \
-        *wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) - 2*aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 3) \
-        *pow(rAB, 3)*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) - 3*aB*pow(betaAB_1, 2) \
-        *betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aB \
-        *pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*rA*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) \
-        *cos(betaAB_2*theta) + 3*aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wB \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 2) \
-        *pow(rAB, 3)*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) + 3*aB*pow(betaAB_1, 2) \
-        *betaAB_2*r*rA*pow(rAB, 3)*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aB \
-        *pow(betaAB_1, 2)*betaAB_2*r*rA*pow(rAB, 2)*pow(rB, 2)*wB*sin(betaAB_2*theta) \
-        *cos(betaAB_2*theta) - 3*aB*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 4)*rB*wB*sin(betaAB_2 \
-        *theta)*cos(betaAB_2*theta) + aB*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 3)*pow(rB, 2)*wB \
-        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + aB*betaAB_1*betaAB_2*pow(r, 2)*pow(rA, 2) \
-        *pow(rAB, 2)*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*pow(r, 2)*pow(rA, 2)*rAB*rB \
-        *wB*sin(betaAB_2*theta) - 2*aB*betaAB_1*betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wB \
-        *sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*pow(r, 2)*rA*pow(rAB, 2)*rB*wB \
-        *sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*pow(r, 2)*rA*pow(rAB, 2)*wB*sin(betaAB_2 \
-        *theta) - aB*betaAB_1*betaAB_2*pow(r, 2)*rA*rAB*rB*wB*sin(betaAB_2*theta) + aB*betaAB_1 \
-        *betaAB_2*pow(r, 2)*pow(rAB, 4)*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*pow(r, 2) \
-        *pow(rAB, 3)*rB*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 3)*wB \
-        *sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 2)*rB*wB*sin(betaAB_2 \
-        *theta) - aB*betaAB_1*betaAB_2*r*pow(rA, 2)*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) - aB \
-        *betaAB_1*betaAB_2*r*pow(rA, 2)*pow(rAB, 2)*wB*sin(betaAB_2*theta) + aB*betaAB_1 \
-        *betaAB_2*r*pow(rA, 2)*rAB*pow(rB, 2)*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r \
-        *pow(rA, 2)*rAB*rB*wB*sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*rB \
-        *wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*wB*sin(betaAB_2*theta) \
-        - 2*aB*betaAB_1*betaAB_2*r*rA*pow(rAB, 2)*pow(rB, 2)*wB*sin(betaAB_2*theta) - 2*aB \
-        *betaAB_1*betaAB_2*r*rA*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r \
-        *rA*rAB*pow(rB, 2)*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*pow(rAB, 4)*rB*wB \
-        *sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*pow(rAB, 3)*pow(rB, 2)*wB*sin(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r*pow(rAB, 3)*rB*wB*sin(betaAB_2*theta) - aB*betaAB_1 \
-        *betaAB_2*r*pow(rAB, 2)*pow(rB, 2)*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2 \
-        *pow(rA, 2)*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*pow(rA, 2)*rAB \
-        *pow(rB, 2)*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*rA*pow(rAB, 3)*rB*wB \
-        *sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*rA*pow(rAB, 2)*pow(rB, 2)*wB*sin(betaAB_2 \
-        *theta))/(-pow(betaAB_1, 4)*r*pow(rAB, 4)*pow(cos(betaAB_2*theta), 4) \
-        + pow(betaAB_1, 3)*pow(r, 2)*pow(rAB, 3)*pow(cos(betaAB_2*theta), 3) + pow(betaAB_1, 3) \
-        *r*rA*pow(rAB, 3)*pow(cos(betaAB_2*theta), 3) - 4*pow(betaAB_1, 3)*r*pow(rAB, 4) \
+        *betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) \
+        - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2)*betaAB_2*r \
+        *pow(rAB, 2)*sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*pow(r, 2) \
+        *rAB*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/(pow(betaAB_1, 2)*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
+        *pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + pow(rAB, 2) - rAB*rB))*(2*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*pow(r, 2)*rAB \
+        *sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))*(pow(betaAB_1, 2)*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
+        *pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + pow(rAB, 2) - rAB*rB)/pow(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB \
+        + r*pow(rAB, 2) - r*rAB*rB, 2) + aB*((2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
+        *theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2 \
+        *rAB*rB*sin(betaAB_2*theta))*(4*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2)*sin(betaAB_2 \
+        *theta)*cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2*theta) + 4 \
+        *betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB \
+        *sin(betaAB_2*theta))*(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
+        - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB \
+        + r*pow(rAB, 2) - r*rAB*rB)/pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB \
+        + pow(rAB, 2) - rAB*rB, 3) + 2*(2*pow(betaAB_1, 2)*betaAB_2*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*sin(betaAB_2 \
+        *theta) + 2*betaAB_1*betaAB_2*pow(rAB, 2)*sin(betaAB_2*theta) - betaAB_1*betaAB_2 \
+        *rAB*rB*sin(betaAB_2*theta))*(-2*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 2) \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + betaAB_1*betaAB_2*pow(r, 2)*rAB \
+        *sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*pow(rAB, 2)*sin(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*rB*sin(betaAB_2*theta))/pow(pow(betaAB_1, 2)*pow(rAB, 2) \
+        *pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1 \
+        *pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (-2*pow(betaAB_1, 2)*pow(betaAB_2, 2) \
+        *pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) + 2*pow(betaAB_1, 2)*pow(betaAB_2, 2) \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(betaAB_2, 2)*rA*rAB \
+        *cos(betaAB_2*theta) + 2*betaAB_1*pow(betaAB_2, 2)*pow(rAB, 2)*cos(betaAB_2*theta) \
+        - betaAB_1*pow(betaAB_2, 2)*rAB*rB*cos(betaAB_2*theta))*(pow(betaAB_1, 2)*r \
+        *pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rAB*cos(betaAB_2 \
+        *theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB) \
+        /pow(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*rA*rAB \
+        *cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1*rAB*rB \
+        *cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB, 2) + (2 \
+        *pow(betaAB_1, 2)*pow(betaAB_2, 2)*r*pow(rAB, 2)*pow(sin(betaAB_2*theta), 2) - 2 \
+        *pow(betaAB_1, 2)*pow(betaAB_2, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
+        + betaAB_1*pow(betaAB_2, 2)*pow(r, 2)*rAB*cos(betaAB_2*theta) - 2*betaAB_1 \
+        *pow(betaAB_2, 2)*r*pow(rAB, 2)*cos(betaAB_2*theta) + betaAB_1*pow(betaAB_2, 2)*rA \
+        *rAB*rB*cos(betaAB_2*theta))/(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2 \
+        *theta), 2) - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2) \
+        *cos(betaAB_2*theta) - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB \
+        + pow(rAB, 2) - rAB*rB))*(pow(betaAB_1, 2)*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) \
+        - betaAB_1*rA*rAB*cos(betaAB_2*theta) + 2*betaAB_1*pow(rAB, 2)*cos(betaAB_2*theta) \
+        - betaAB_1*rAB*rB*cos(betaAB_2*theta) - rA*rAB + rA*rB + pow(rAB, 2) - rAB*rB) \
+        /(pow(betaAB_1, 2)*r*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2) \
+        *rAB*cos(betaAB_2*theta) + 2*betaAB_1*r*pow(rAB, 2)*cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*pow(rAB, 2) - r*rAB*rB)) \
+        /pow(r, 2)) + (aB*pow(betaAB_1, 4)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wB*sin(betaAB_2 \
+        *theta)*pow(cos(betaAB_2*theta), 3) - aB*pow(betaAB_1, 4)*betaAB_2*r*pow(rAB, 4)*rB \
+        *wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 3) - 2*aB*pow(betaAB_1, 3) \
+        *betaAB_2*pow(r, 3)*pow(rAB, 3)*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) \
+        - aB*pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*rA*pow(rAB, 3)*wB*sin(betaAB_2*theta) \
+        *pow(cos(betaAB_2*theta), 2) + 3*aB*pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*pow(rAB, 4) \
+        *wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + 2*aB*pow(betaAB_1, 3) \
+        *betaAB_2*pow(r, 2)*pow(rAB, 3)*rB*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2 \
+        *theta), 2) + aB*pow(betaAB_1, 3)*betaAB_2*pow(r, 2)*pow(rAB, 3)*wB*sin(betaAB_2 \
+        *theta)*pow(cos(betaAB_2*theta), 2) + aB*pow(betaAB_1, 3)*betaAB_2*r*rA*pow(rAB, 3) \
+        *rB*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - aB*pow(betaAB_1, 3) \
+        *betaAB_2*r*rA*pow(rAB, 3)*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) - 3 \
+        *aB*pow(betaAB_1, 3)*betaAB_2*r*pow(rAB, 4)*rB*wB*sin(betaAB_2*theta) \
+        *pow(cos(betaAB_2*theta), 2) - aB*pow(betaAB_1, 3)*betaAB_2*r*pow(rAB, 3)*rB*wB \
+        *sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + aB*pow(betaAB_1, 3)*betaAB_2*rA \
+        *pow(rAB, 3)*rB*wB*sin(betaAB_2*theta)*pow(cos(betaAB_2*theta), 2) + 2*aB \
+        *pow(betaAB_1, 2)*betaAB_2*pow(r, 3)*rA*pow(rAB, 2)*wB*sin(betaAB_2*theta) \
+        *cos(betaAB_2*theta) - 2*aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 3)*pow(rAB, 3)*wB \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) - 3*aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 2) \
+        *rA*pow(rAB, 3)*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aB*pow(betaAB_1, 2) \
+        *betaAB_2*pow(r, 2)*rA*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
+        + 3*aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*pow(rAB, 4)*wB*sin(betaAB_2*theta) \
+        *cos(betaAB_2*theta) + aB*pow(betaAB_1, 2)*betaAB_2*pow(r, 2)*pow(rAB, 3)*rB*wB \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + 3*aB*pow(betaAB_1, 2)*betaAB_2*r*rA \
+        *pow(rAB, 3)*rB*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) - aB*pow(betaAB_1, 2) \
+        *betaAB_2*r*rA*pow(rAB, 2)*pow(rB, 2)*wB*sin(betaAB_2*theta)*cos(betaAB_2*theta) \
+        - 3*aB*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 4)*rB*wB*sin(betaAB_2*theta) \
+        *cos(betaAB_2*theta) + aB*pow(betaAB_1, 2)*betaAB_2*r*pow(rAB, 3)*pow(rB, 2)*wB \
+        *sin(betaAB_2*theta)*cos(betaAB_2*theta) + aB*betaAB_1*betaAB_2*pow(r, 2) \
+        *pow(rA, 2)*pow(rAB, 2)*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*pow(r, 2) \
+        *pow(rA, 2)*rAB*rB*wB*sin(betaAB_2*theta) - 2*aB*betaAB_1*betaAB_2*pow(r, 2)*rA \
+        *pow(rAB, 3)*wB*sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*pow(r, 2)*rA \
+        *pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*pow(r, 2)*rA \
+        *pow(rAB, 2)*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*pow(r, 2)*rA*rAB*rB*wB \
+        *sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 4)*wB*sin(betaAB_2 \
+        *theta) - aB*betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 3)*rB*wB*sin(betaAB_2*theta) - aB \
+        *betaAB_1*betaAB_2*pow(r, 2)*pow(rAB, 3)*wB*sin(betaAB_2*theta) + aB*betaAB_1 \
+        *betaAB_2*pow(r, 2)*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r \
+        *pow(rA, 2)*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r \
+        *pow(rA, 2)*pow(rAB, 2)*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*pow(rA, 2) \
+        *rAB*pow(rB, 2)*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*pow(rA, 2)*rAB*rB \
+        *wB*sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*rB*wB \
+        *sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA*pow(rAB, 3)*wB*sin(betaAB_2 \
+        *theta) - 2*aB*betaAB_1*betaAB_2*r*rA*pow(rAB, 2)*pow(rB, 2)*wB*sin(betaAB_2 \
+        *theta) - 2*aB*betaAB_1*betaAB_2*r*rA*pow(rAB, 2)*rB*wB*sin(betaAB_2*theta) + aB \
+        *betaAB_1*betaAB_2*r*rA*rAB*pow(rB, 2)*wB*sin(betaAB_2*theta) - aB*betaAB_1 \
+        *betaAB_2*r*pow(rAB, 4)*rB*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r \
+        *pow(rAB, 3)*pow(rB, 2)*wB*sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*pow(rAB, 3) \
+        *rB*wB*sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*pow(rAB, 2)*pow(rB, 2)*wB \
+        *sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*pow(rA, 2)*pow(rAB, 2)*rB*wB \
+        *sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*pow(rA, 2)*rAB*pow(rB, 2)*wB \
+        *sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*rA*pow(rAB, 3)*rB*wB*sin(betaAB_2 \
+        *theta) + aB*betaAB_1*betaAB_2*rA*pow(rAB, 2)*pow(rB, 2)*wB*sin(betaAB_2*theta))/( \
+        -pow(betaAB_1, 4)*r*pow(rAB, 4)*pow(cos(betaAB_2*theta), 4) + pow(betaAB_1, 3) \
+        *pow(r, 2)*pow(rAB, 3)*pow(cos(betaAB_2*theta), 3) + pow(betaAB_1, 3)*r*rA \
+        *pow(rAB, 3)*pow(cos(betaAB_2*theta), 3) - 4*pow(betaAB_1, 3)*r*pow(rAB, 4) \
         *pow(cos(betaAB_2*theta), 3) + pow(betaAB_1, 3)*r*pow(rAB, 3)*rB*pow(cos(betaAB_2 \
         *theta), 3) + pow(betaAB_1, 3)*rA*pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 3) \
         - pow(betaAB_1, 2)*pow(r, 2)*rA*pow(rAB, 2)*pow(cos(betaAB_2*theta), 2) + 2 \
-        *pow(betaAB_1, 2)*pow(r, 2)*pow(rAB, 3)*pow(cos(betaAB_2*theta), 2) - pow(betaAB_1, 2) \
-        *pow(r, 2)*pow(rAB, 2)*rB*pow(cos(betaAB_2*theta), 2) + 4*pow(betaAB_1, 2)*r*rA \
-        *pow(rAB, 3)*pow(cos(betaAB_2*theta), 2) - 2*pow(betaAB_1, 2)*r*rA*pow(rAB, 2)*rB \
-        *pow(cos(betaAB_2*theta), 2) - 6*pow(betaAB_1, 2)*r*pow(rAB, 4)*pow(cos(betaAB_2 \
-        *theta), 2) + 4*pow(betaAB_1, 2)*r*pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 2) \
-        - pow(betaAB_1, 2)*pow(rA, 2)*pow(rAB, 2)*rB*pow(cos(betaAB_2*theta), 2) + 2 \
-        *pow(betaAB_1, 2)*rA*pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 2) - pow(betaAB_1, 2)*rA \
-        *pow(rAB, 2)*pow(rB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1*pow(r, 2)*rA*pow(rAB, 2) \
-        *cos(betaAB_2*theta) + betaAB_1*pow(r, 2)*rA*rAB*rB*cos(betaAB_2*theta) + betaAB_1 \
-        *pow(r, 2)*pow(rAB, 3)*cos(betaAB_2*theta) - betaAB_1*pow(r, 2)*pow(rAB, 2)*rB \
-        *cos(betaAB_2*theta) - betaAB_1*r*pow(rA, 2)*pow(rAB, 2)*cos(betaAB_2*theta) + betaAB_1 \
-        *r*pow(rA, 2)*rAB*rB*cos(betaAB_2*theta) + 5*betaAB_1*r*rA*pow(rAB, 3)*cos(betaAB_2 \
-        *theta) - 6*betaAB_1*r*rA*pow(rAB, 2)*rB*cos(betaAB_2*theta) + betaAB_1*r*rA*rAB \
-        *pow(rB, 2)*cos(betaAB_2*theta) - 4*betaAB_1*r*pow(rAB, 4)*cos(betaAB_2*theta) + 5 \
-        *betaAB_1*r*pow(rAB, 3)*rB*cos(betaAB_2*theta) - betaAB_1*r*pow(rAB, 2)*pow(rB, 2) \
-        *cos(betaAB_2*theta) - betaAB_1*pow(rA, 2)*pow(rAB, 2)*rB*cos(betaAB_2*theta) \
-        + betaAB_1*pow(rA, 2)*rAB*pow(rB, 2)*cos(betaAB_2*theta) + betaAB_1*rA*pow(rAB, 3)*rB \
-        *cos(betaAB_2*theta) - betaAB_1*rA*pow(rAB, 2)*pow(rB, 2)*cos(betaAB_2*theta) - r \
-        *pow(rA, 2)*pow(rAB, 2) + 2*r*pow(rA, 2)*rAB*rB - r*pow(rA, 2)*pow(rB, 2) + 2*r*rA \
+        *pow(betaAB_1, 2)*pow(r, 2)*pow(rAB, 3)*pow(cos(betaAB_2*theta), 2) \
+        - pow(betaAB_1, 2)*pow(r, 2)*pow(rAB, 2)*rB*pow(cos(betaAB_2*theta), 2) + 4 \
+        *pow(betaAB_1, 2)*r*rA*pow(rAB, 3)*pow(cos(betaAB_2*theta), 2) - 2*pow(betaAB_1, 2) \
+        *r*rA*pow(rAB, 2)*rB*pow(cos(betaAB_2*theta), 2) - 6*pow(betaAB_1, 2)*r*pow(rAB, 4) \
+        *pow(cos(betaAB_2*theta), 2) + 4*pow(betaAB_1, 2)*r*pow(rAB, 3)*rB*pow(cos(betaAB_2 \
+        *theta), 2) - pow(betaAB_1, 2)*pow(rA, 2)*pow(rAB, 2)*rB*pow(cos(betaAB_2 \
+        *theta), 2) + 2*pow(betaAB_1, 2)*rA*pow(rAB, 3)*rB*pow(cos(betaAB_2*theta), 2) \
+        - pow(betaAB_1, 2)*rA*pow(rAB, 2)*pow(rB, 2)*pow(cos(betaAB_2*theta), 2) - betaAB_1 \
+        *pow(r, 2)*rA*pow(rAB, 2)*cos(betaAB_2*theta) + betaAB_1*pow(r, 2)*rA*rAB*rB \
+        *cos(betaAB_2*theta) + betaAB_1*pow(r, 2)*pow(rAB, 3)*cos(betaAB_2*theta) \
+        - betaAB_1*pow(r, 2)*pow(rAB, 2)*rB*cos(betaAB_2*theta) - betaAB_1*r*pow(rA, 2) \
+        *pow(rAB, 2)*cos(betaAB_2*theta) + betaAB_1*r*pow(rA, 2)*rAB*rB*cos(betaAB_2 \
+        *theta) + 5*betaAB_1*r*rA*pow(rAB, 3)*cos(betaAB_2*theta) - 6*betaAB_1*r*rA \
+        *pow(rAB, 2)*rB*cos(betaAB_2*theta) + betaAB_1*r*rA*rAB*pow(rB, 2)*cos(betaAB_2 \
+        *theta) - 4*betaAB_1*r*pow(rAB, 4)*cos(betaAB_2*theta) + 5*betaAB_1*r*pow(rAB, 3) \
+        *rB*cos(betaAB_2*theta) - betaAB_1*r*pow(rAB, 2)*pow(rB, 2)*cos(betaAB_2*theta) \
+        - betaAB_1*pow(rA, 2)*pow(rAB, 2)*rB*cos(betaAB_2*theta) + betaAB_1*pow(rA, 2)*rAB \
+        *pow(rB, 2)*cos(betaAB_2*theta) + betaAB_1*rA*pow(rAB, 3)*rB*cos(betaAB_2*theta) \
+        - betaAB_1*rA*pow(rAB, 2)*pow(rB, 2)*cos(betaAB_2*theta) - r*pow(rA, 2) \
+        *pow(rAB, 2) + 2*r*pow(rA, 2)*rAB*rB - r*pow(rA, 2)*pow(rB, 2) + 2*r*rA \
         *pow(rAB, 3) - 4*r*rA*pow(rAB, 2)*rB + 2*r*rA*rAB*pow(rB, 2) - r*pow(rAB, 4) + 2*r \
         *pow(rAB, 3)*rB - r*pow(rAB, 2)*pow(rB, 2));
     return res;
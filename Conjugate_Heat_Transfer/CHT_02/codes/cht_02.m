@@ -115,10 +115,10 @@ function res = phiA(x, y)
         + alphaB.*log(rA) - alphaB.*log(rAB));
     res = aA.*log((betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
         *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bA;
+        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bA;
 end
 
 % Function phiB
@@ -138,10 +138,10 @@ function res = phiB(x, y)
     bB = -alphaA.*log(rB)./(alphaA.*log(rAB) - alphaA.*log(rB) + alphaB.*log(rA) - alphaB.*log(rAB));
     res = aB.*log((betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
         *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bB;
+        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bB;
 end
 
 % Function fA
@@ -161,176 +161,183 @@ function res = fA(x, y)
     bA = (alphaA.*log(rAB) - alphaA.*log(rB) - alphaB.*log(rAB))./(alphaA.*log(rAB) - alphaA.*log(rB) ...
         + alphaB.*log(rA) - alphaB.*log(rAB));
     res = -alphaA.*((-2*aA.*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta)./(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aA.*r.*(-betaAB_1.^2.*rAB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
+        *r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r. ...
+        *rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aA.*r.*(-betaAB_1.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 + 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1. ...
         *rAB.^2.*cos(betaAB_2.*theta) + rA.*rAB - rA.*rB - rAB.^2 + rAB.*rB).*(betaAB_1.^2. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB). ...
-        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aA. ...
-        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
-        *rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r ...
-        + (aA.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB. ...
+        *rB).^2 + aA.*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
+        *rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB))./r + (aA.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) ...
+        + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB. ...
+        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
+        *sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)). ...
+        *(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aA. ...
-        *((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
-        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) ...
+        + aA.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2. ...
+        *rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aA.*((2*betaAB_1.^2. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA. ...
-        *rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4*betaAB_1.^2.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rA.*rAB. ...
-        *sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - 2 ...
-        *betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta)).*(-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2. ...
-        *r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aA.*((2 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2 ...
+        *betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2. ...
+        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2. ...
+        *rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
         *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
         *betaAB_2.^2.*rAB.^2.*sin(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*betaAB_2.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 - betaAB_1.*betaAB_2.^2.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB.*rB. ...
-        *cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
-        *r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) ...
-        - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r. ...
-        *rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (2*betaAB_1.^2. ...
-        *betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*betaAB_2.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1.*betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1. ...
-        *betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aA.*betaAB_1.^4. ...
-        *betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aA. ...
-        *betaAB_1.^4.*betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^3 - 2*aA.*betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 + 2*aA.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 3*aA.*betaAB_1.^3.*betaAB_2.*r.^2. ...
-        *rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2. ...
-        *r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3. ...
+        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB. ...
+        *rB.*cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (2*betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2 ...
+        *betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1. ...
+        *betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(betaAB_1.^2. ...
+        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
+        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) ...
+        - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB ...
+        + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aA.*betaAB_1.^4.*betaAB_2.*r.^2. ...
+        *rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aA.*betaAB_1.^4. ...
+        *betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - 2*aA. ...
+        *betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta).^2 + 2*aA.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta).^2 + 3*aA.*betaAB_1.^3.*betaAB_2.*r.^2.*rAB.^4.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.^2. ...
+        *rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3. ...
         *betaAB_2.*r.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - 3*aA. ...
         *betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^2 + aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wA.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.*rAB.^3.*rB.*wA. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3.*betaAB_2.*rA.*rAB.^3. ...
-        *rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - 2*aA.*betaAB_1.^2.*betaAB_2. ...
-        *r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 2*aA.*betaAB_1.^2. ...
-        *betaAB_2.*r.^3.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aA. ...
-        *betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) - aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + 3*aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta) - 3*aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aA.*betaAB_1.^2.*betaAB_2.*r.*rA.^2. ...
-        *rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aA.*betaAB_1.^2.*betaAB_2.*r. ...
-        *rA.^2.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aA.*betaAB_1.^2. ...
-        *betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aA. ...
-        *betaAB_1.^2.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta) + 2*aA. ...
-        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1. ...
-        *betaAB_2.*r.^2.*rA.*rAB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2. ...
-        *rA.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.*rB. ...
+        *theta).^2 + aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r. ...
+        *rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3. ...
+        *betaAB_2.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - 2 ...
+        *aA.*betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + 2*aA.*betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) + aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rA. ...
+        *rAB.^2.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aA.*betaAB_1.^2. ...
+        *betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aA. ...
+        *betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + aA.*betaAB_1.^2.*betaAB_2.*r.*rA.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) - aA.*betaAB_1.^2.*betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aA.*betaAB_1.^2.*betaAB_2.*r.*rA. ...
+        *rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aA.*betaAB_1.^2. ...
+        *betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aA. ...
+        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta) + 2*aA.*betaAB_1. ...
+        *betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2. ...
+        *r.^2.*rA.*rAB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA. ...
+        *rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.*rB. ...
         *wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2. ...
-        *theta) - 2*aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) - aA. ...
-        *betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2. ...
-        *r.^2.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^2. ...
-        *rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^3.*wA. ...
-        *sin(betaAB_2.*theta) - 2*aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wA. ...
-        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*wA.*sin(betaAB_2. ...
-        *theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA. ...
-        *betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1. ...
-        *betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta) + 2*aA.*betaAB_1.*betaAB_2.*r.*rA. ...
-        *rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wA. ...
-        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2. ...
-        *theta) - 2*aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA. ...
-        *betaAB_1.*betaAB_2.*r.*rA.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1. ...
-        *betaAB_2.*r.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
-        *rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.^2.*rB.*wA. ...
-        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.*rB.^2.*wA.*sin(betaAB_2. ...
-        *theta) - aA.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) + aA. ...
-        *betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta))./(-betaAB_1.^4.*r. ...
-        *rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2.*rAB.^3.*cos(betaAB_2.*theta).^3 ...
-        + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 - 4*betaAB_1.^3.*r.*rAB.^4. ...
-        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 ...
-        + betaAB_1.^3.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 - betaAB_1.^2.*r.^2.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2.*rAB.^3.*cos(betaAB_2.*theta).^2 ...
-        - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r.*rA. ...
-        *rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*r.*rA.*rAB.^2.*rB.*cos(betaAB_2. ...
-        *theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4.*cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r. ...
-        *rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2. ...
-        *theta).^2 + 2*betaAB_1.^2.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA. ...
-        *rAB.^2.*rB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2.*cos(betaAB_2. ...
-        *theta) + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rAB.^3. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) - betaAB_1.*r. ...
-        *rA.^2.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.^2.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6*betaAB_1.*r.*rA.*rAB.^2. ...
-        *rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2.*cos(betaAB_2.*theta) - 4 ...
-        *betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rAB.^3.*rB.*cos(betaAB_2. ...
-        *theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.^2.*rAB.^2. ...
-        *rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB.*rB.^2.*cos(betaAB_2.*theta) ...
-        + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.^2.*rB.^2. ...
-        *cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r.*rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r. ...
-        *rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r.*rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB ...
-        - r.*rAB.^2.*rB.^2);
+        *theta) - 2*aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) ...
+        - aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2. ...
+        *r.^2.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2. ...
+        *rAB.^3.*wA.*sin(betaAB_2.*theta) - 2*aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*rB. ...
+        *wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*wA. ...
+        *sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.^2.*wA. ...
+        *sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.*wA. ...
+        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2. ...
+        *theta) + 2*aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) ...
+        + aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1. ...
+        *betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta) - 2*aA.*betaAB_1. ...
+        *betaAB_2.*r.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r. ...
+        *rA.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB. ...
+        *wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rAB.^2.*rB.^2.*wA. ...
+        *sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.^2.*rB.*wA. ...
+        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.*rB.^2.*wA. ...
+        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2. ...
+        *theta) + aA.*betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta))./( ...
+        -betaAB_1.^4.*r.*rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 - 4 ...
+        *betaAB_1.^3.*r.*rAB.^4.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB. ...
+        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 ...
+        - betaAB_1.^2.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2. ...
+        *rAB.^3.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2. ...
+        *theta).^2 + 4*betaAB_1.^2.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2. ...
+        *r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4. ...
+        *cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.^2.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*rA. ...
+        *rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.*rAB.^2.*rB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta) ...
+        + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*r.*rA.^2.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.^2.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6 ...
+        *betaAB_1.*r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2. ...
+        *cos(betaAB_2.*theta) - 4*betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1. ...
+        *r.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB. ...
+        *rB.^2.*cos(betaAB_2.*theta) + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rA.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r. ...
+        *rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r.*rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r. ...
+        *rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB - r.*rAB.^2.*rB.^2);
 end
 
 % Function fB
@@ -349,174 +356,181 @@ function res = fB(x, y)
     aB = alphaA./(alphaA.*log(rAB) - alphaA.*log(rB) + alphaB.*log(rA) - alphaB.*log(rAB));
     bB = -alphaA.*log(rB)./(alphaA.*log(rAB) - alphaA.*log(rB) + alphaB.*log(rA) - alphaB.*log(rAB));
     res = -alphaB.*((-2*aB.*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta)./(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aB.*r.*(-betaAB_1.^2.*rAB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
+        *r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r. ...
+        *rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aB.*r.*(-betaAB_1.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 + 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1. ...
         *rAB.^2.*cos(betaAB_2.*theta) + rA.*rAB - rA.*rB - rAB.^2 + rAB.*rB).*(betaAB_1.^2. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB). ...
-        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aB. ...
-        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
-        *rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r ...
-        + (aB.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB. ...
+        *rB).^2 + aB.*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
+        *rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB))./r + (aB.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) ...
+        + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB. ...
+        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
+        *sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)). ...
+        *(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aB. ...
-        *((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
-        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) ...
+        + aB.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2. ...
+        *rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aB.*((2*betaAB_1.^2. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA. ...
-        *rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4*betaAB_1.^2.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rA.*rAB. ...
-        *sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - 2 ...
-        *betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta)).*(-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2. ...
-        *r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aB.*((2 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2 ...
+        *betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2. ...
+        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2. ...
+        *rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
         *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
         *betaAB_2.^2.*rAB.^2.*sin(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*betaAB_2.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 - betaAB_1.*betaAB_2.^2.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB.*rB. ...
-        *cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
-        *r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) ...
-        - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r. ...
-        *rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (2*betaAB_1.^2. ...
-        *betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*betaAB_2.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1.*betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1. ...
-        *betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aB.*betaAB_1.^4. ...
-        *betaAB_2.*r.^2.*rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aB. ...
-        *betaAB_1.^4.*betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^3 - 2*aB.*betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 3*aB.*betaAB_1.^3.*betaAB_2.*r.^2. ...
-        *rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2*aB.*betaAB_1.^3. ...
-        *betaAB_2.*r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB. ...
-        *betaAB_1.^3.*betaAB_2.*r.^2.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^2 + aB.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta).^2 - 3*aB.*betaAB_1.^3.*betaAB_2.*r.*rAB.^4.*rB.*wB. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.*rAB.^3. ...
-        *rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB.*betaAB_1.^3.*betaAB_2.*rA. ...
-        *rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2*aB.*betaAB_1.^2. ...
-        *betaAB_2.*r.^3.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2*aB. ...
-        *betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - 3*aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aB.*betaAB_1.^2.*betaAB_2.*r.^2. ...
-        *rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aB.*betaAB_1.^2.*betaAB_2. ...
-        *r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aB.*betaAB_1.^2. ...
-        *betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aB. ...
-        *betaAB_1.^2.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) - 3*aB.*betaAB_1.^2.*betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + aB.*betaAB_1.^2.*betaAB_2.*r.*rAB.^3.*rB.^2.*wB.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.^2.*wB. ...
-        *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.*rB.*wB.*sin(betaAB_2. ...
-        *theta) - 2*aB.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta) + 2*aB. ...
-        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1. ...
-        *betaAB_2.*r.^2.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2. ...
-        *rA.*rAB.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^4.*wB. ...
+        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB. ...
+        *rB.*cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (2*betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2 ...
+        *betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1. ...
+        *betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(betaAB_1.^2. ...
+        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
+        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) ...
+        - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB ...
+        + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aB.*betaAB_1.^4.*betaAB_2.*r.^2. ...
+        *rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aB.*betaAB_1.^4. ...
+        *betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - 2*aB. ...
+        *betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta).^2 + 3*aB.*betaAB_1.^3.*betaAB_2.*r.^2.*rAB.^4.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2*aB.*betaAB_1.^3.*betaAB_2.*r.^2. ...
+        *rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB.*betaAB_1.^3. ...
+        *betaAB_2.*r.^2.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB. ...
+        *betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta).^2 - 3*aB.*betaAB_1.^3.*betaAB_2.*r.*rAB.^4.*rB.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r. ...
+        *rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB.*betaAB_1.^3. ...
+        *betaAB_2.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2 ...
+        *aB.*betaAB_1.^2.*betaAB_2.*r.^3.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) - 2*aB.*betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^3.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aB.*betaAB_1.^2.*betaAB_2.*r.^2. ...
+        *rA.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aB.*betaAB_1.^2. ...
+        *betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3 ...
+        *aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) + 3*aB.*betaAB_1.^2.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aB.*betaAB_1.^2.*betaAB_2.*r.*rA. ...
+        *rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aB.*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aB. ...
+        *betaAB_1.^2.*betaAB_2.*r.*rAB.^3.*rB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.^2.*wB.*sin(betaAB_2.*theta) ...
+        - aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.*rB.*wB.*sin(betaAB_2.*theta) - 2*aB. ...
+        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta) + 2*aB.*betaAB_1. ...
+        *betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2. ...
+        *r.^2.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rA. ...
+        *rAB.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^4.*wB. ...
         *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2. ...
         *theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*wB.*sin(betaAB_2.*theta) + aB. ...
         *betaAB_1.*betaAB_2.*r.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1. ...
-        *betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r. ...
-        *rA.^2.*rAB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB. ...
-        *rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.*wB. ...
-        *sin(betaAB_2.*theta) + 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2. ...
-        *theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta) - 2*aB. ...
-        *betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta) - 2*aB.*betaAB_1. ...
-        *betaAB_2.*r.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA. ...
-        *rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.*rAB.^4.*rB.*wB. ...
-        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB.^2.*wB.*sin(betaAB_2. ...
-        *theta) + aB.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta) - aB. ...
-        *betaAB_1.*betaAB_2.*r.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1. ...
-        *betaAB_2.*rA.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.^2. ...
-        *rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wB. ...
-        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2. ...
-        *theta))./(-betaAB_1.^4.*r.*rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2. ...
-        *rAB.^3.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 ...
-        - 4*betaAB_1.^3.*r.*rAB.^4.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB. ...
+        *betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2. ...
+        *r.*rA.^2.*rAB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2. ...
+        *rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB. ...
+        *wB.*sin(betaAB_2.*theta) + 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB. ...
+        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2. ...
+        *theta) - 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta) ...
+        - 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB. ...
+        *betaAB_1.*betaAB_2.*r.*rA.*rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1. ...
+        *betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r. ...
+        *rAB.^3.*rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB. ...
+        *wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.*rAB.^2.*rB.^2.*wB. ...
+        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*rA.^2.*rAB.^2.*rB.*wB. ...
+        *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.^2.*rAB.*rB.^2.*wB. ...
+        *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2. ...
+        *theta) + aB.*betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta))./( ...
+        -betaAB_1.^4.*r.*rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 - 4 ...
+        *betaAB_1.^3.*r.*rAB.^4.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB. ...
         *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 ...
-        - betaAB_1.^2.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2.*rAB.^3. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 4 ...
-        *betaAB_1.^2.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*r.*rA.*rAB.^2. ...
-        *rB.*cos(betaAB_2.*theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4.*cos(betaAB_2.*theta).^2 + 4 ...
-        *betaAB_1.^2.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.^2.*rAB.^2.*rB. ...
-        *cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 ...
-        - betaAB_1.^2.*rA.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1. ...
-        *r.^2.*rAB.^3.*cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.^2.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2. ...
+        *rAB.^3.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2. ...
+        *theta).^2 + 4*betaAB_1.^2.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2. ...
+        *r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4. ...
+        *cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.^2.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*rA. ...
+        *rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.*rAB.^2.*rB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta) ...
+        + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) ...
         - betaAB_1.*r.*rA.^2.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.^2.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6*betaAB_1. ...
-        *r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2.*cos(betaAB_2. ...
-        *theta) - 4*betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rAB.^3.*rB. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - betaAB_1. ...
-        *rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB.*rB.^2.*cos(betaAB_2. ...
-        *theta) + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.^2.*rB.^2. ...
-        *cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r.*rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r. ...
-        *rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r.*rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB ...
-        - r.*rAB.^2.*rB.^2);
+        *cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6 ...
+        *betaAB_1.*r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2. ...
+        *cos(betaAB_2.*theta) - 4*betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1. ...
+        *r.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB. ...
+        *rB.^2.*cos(betaAB_2.*theta) + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rA.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r. ...
+        *rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r.*rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r. ...
+        *rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB - r.*rAB.^2.*rB.^2);
 end
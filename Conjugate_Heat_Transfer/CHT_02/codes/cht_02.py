@@ -25,13 +25,13 @@ def nAB(x, y):
     r = math.sqrt(x**2 + y**2)
     theta = math.atan2(y, x)
     res = [0.0]*2
-    res[0] = betaAB_1*betaAB_2*math.sin(theta)*math.sin(betaAB_2*theta)/math.sqrt(betaAB_1**2*betaAB_2* \
-        *2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
+    res[0] = betaAB_1*betaAB_2*math.sin(theta)*math.sin(betaAB_2*theta)/math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
         *math.cos(betaAB_2*theta) + 1) + (-betaAB_1*math.cos(betaAB_2*theta) - 1)*math.cos(theta) \
         /math.sqrt(betaAB_1**2*betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2 \
         *theta)**2 + 2*betaAB_1*math.cos(betaAB_2*theta) + 1)
-    res[1] = -betaAB_1*betaAB_2*math.sin(betaAB_2*theta)*math.cos(theta)/math.sqrt(betaAB_1**2*betaAB_2 \
-        **2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
+    res[1] = -betaAB_1*betaAB_2*math.sin(betaAB_2*theta)*math.cos(theta)/math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
         *math.cos(betaAB_2*theta) + 1) + (-betaAB_1*math.cos(betaAB_2*theta) - 1)*math.sin(theta) \
         /math.sqrt(betaAB_1**2*betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2 \
         *theta)**2 + 2*betaAB_1*math.cos(betaAB_2*theta) + 1)
@@ -72,11 +72,11 @@ def phiA(x, y):
     bA = (alphaA*math.log(rAB) - alphaA*math.log(rB) - alphaB*math.log(rAB))/(alphaA*math.log(rAB) \
         - alphaA*math.log(rB) + alphaB*math.log(rA) - alphaB*math.log(rAB))
     res = aA*math.log((betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA \
-        *rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1* \
-        *2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) \
-        - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bA
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bA
     return res
 
 # Function phiB
@@ -88,11 +88,11 @@ def phiB(x, y):
     bB = -alphaA*math.log(rB)/(alphaA*math.log(rAB) - alphaA*math.log(rB) + alphaB*math.log(rA) \
         - alphaB*math.log(rAB))
     res = aB*math.log((betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA \
-        *rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1* \
-        *2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) \
-        - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bB
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bB
     return res
 
 # Function fA
@@ -104,175 +104,186 @@ def fA(x, y):
     bA = (alphaA*math.log(rAB) - alphaA*math.log(rB) - alphaB*math.log(rAB))/(alphaA*math.log(rAB) \
         - alphaA*math.log(rB) + alphaB*math.log(rA) - alphaB*math.log(rAB))
     res = -alphaA*((-2*aA*betaAB_1*r*rAB*math.cos(betaAB_2*theta)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aA*r*(-betaAB_1**2*rAB**2*math.cos(betaAB_2 \
-        *theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2*betaAB_1*rAB**2 \
-        *math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB)*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aA*r*(-betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB) \
+        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 \
+        - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB \
+        + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aA*((2*betaAB_1**2*betaAB_2 \
-        *rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aA*((2*betaAB_1**2 \
+        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
+        *betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2*betaAB_1**2 \
-        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aA*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        /(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        + aA*((2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2 \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2*betaAB_1**2 \
-        *betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
-        *betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) - 2 \
-        *betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *3 + 2*(2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB* \
-        *2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r \
+        *rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) \
+        + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*((2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**3 + 2*(2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
         *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2 \
-        *betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2*betaAB_2**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*rAB*rB \
-        *math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2 \
+        *betaAB_2**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2**2*rAB*rB*math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2*betaAB_2**2*r \
+        *rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2 \
+        *theta) - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1 \
+        *betaAB_2**2*rA*rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA \
+        *rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
         *r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB \
-        *rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2 \
-        *betaAB_2**2*r*rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2*theta) \
-        - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2**2*rA \
-        *rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r**2) + (aA*betaAB_1**4*betaAB_2*r**2*rAB**4*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - aA*betaAB_1**4*betaAB_2*r*rA \
-        *rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aA*betaAB_1**3 \
-        *betaAB_2*r**3*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2*aA \
+        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r \
+        *rAB*rB))/r**2) + (aA*betaAB_1**4*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**3 - aA*betaAB_1**4*betaAB_2*r*rA*rAB**4*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aA*betaAB_1**3*betaAB_2 \
+        *r**3*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2*aA \
         *betaAB_1**3*betaAB_2*r**2*rA*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
         *theta)**2 + 3*aA*betaAB_1**3*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta) \
         *math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r**2*rAB**3*rB*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3*betaAB_2*r**2 \
-        *rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 3*aA*betaAB_1**3 \
-        *betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA \
-        *betaAB_1**3*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta)**2 - aA*betaAB_1**3*betaAB_2*r*rA*rAB**3*wA*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r*rAB**3*rB*wA*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3*betaAB_2*rA*rAB**3*rB*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 2*aA*betaAB_1**2*betaAB_2*r**3 \
-        *rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 2*aA*betaAB_1**2 \
-        *betaAB_2*r**3*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aA \
-        *betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - aA*betaAB_1**2*betaAB_2*r**2*rA*rAB**2*rB*wA*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta) + 3*aA*betaAB_1**2*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta) - 3*aA*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aA*betaAB_1**2*betaAB_2*r*rA**2 \
-        *rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aA*betaAB_1**2*betaAB_2 \
-        *r*rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aA*betaAB_1 \
-        **2*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aA \
-        *betaAB_1**2*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB**3*wA*math.sin(betaAB_2*theta) + 2*aA \
-        *betaAB_1*betaAB_2*r**2*rA*rAB**2*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2 \
-        *r**2*rA*rAB**2*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB**2*wA \
-        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wA*math.sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta) - 2*aA*betaAB_1 \
-        *betaAB_2*r**2*rAB**3*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rAB**3 \
-        *wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**2*rB**2*wA \
-        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**2*rB*wA*math.sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB**3*wA*math.sin(betaAB_2*theta) - 2*aA \
-        *betaAB_1*betaAB_2*r*rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2 \
-        *r*rA**2*rAB**2*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB**2*wA \
-        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wA*math.sin(betaAB_2 \
-        *theta) - aA*betaAB_1*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta) + 2*aA*betaAB_1 \
-        *betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA*rAB**3 \
-        *wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rA*rAB**2*rB**2*wA \
-        *math.sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*rA*rAB**2*rB*wA*math.sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*r*rA*rAB*rB**2*wA*math.sin(betaAB_2*theta) + aA*betaAB_1 \
-        *betaAB_2*r*rAB**3*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rAB**2*rB**2 \
-        *wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*rA**2*rAB**2*rB*wA \
-        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*rA**2*rAB*rB**2*wA*math.sin(betaAB_2 \
-        *theta) - aA*betaAB_1*betaAB_2*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1 \
-        *betaAB_2*rA*rAB**2*rB**2*wA*math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**4 + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*r*rA*rAB**3*math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*rA*rAB**3*rB*math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1**2*r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2*theta)* \
-        *2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rAB**3*rB \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 \
-        + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rA*rAB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*r**2*rA*rAB*rB*math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3 \
-        *math.cos(betaAB_2*theta) - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1 \
-        *r*rA**2*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2 \
-        *theta) + 5*betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3*betaAB_2 \
+        *r**2*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 3*aA \
+        *betaAB_1**3*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta)**2 + aA*betaAB_1**3*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r*rA*rAB**3*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r \
+        *rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3 \
+        *betaAB_2*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 2 \
+        *aA*betaAB_1**2*betaAB_2*r**3*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) + 2*aA*betaAB_1**2*betaAB_2*r**3*rAB**2*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aA*betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aA*betaAB_1**2*betaAB_2*r**2 \
+        *rA*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aA \
+        *betaAB_1**2*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) - 3*aA*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aA*betaAB_1**2*betaAB_2*r*rA**2*rAB**3*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aA*betaAB_1**2*betaAB_2*r \
+        *rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aA \
+        *betaAB_1**2*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) + 3*aA*betaAB_1**2*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB**3*wA \
+        *math.sin(betaAB_2*theta) + 2*aA*betaAB_1*betaAB_2*r**2*rA*rAB**2*rB*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rA*rAB**2*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB**2*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2 \
+        *theta) - 2*aA*betaAB_1*betaAB_2*r**2*rAB**3*rB*wA*math.sin(betaAB_2*theta) - aA \
+        *betaAB_1*betaAB_2*r**2*rAB**3*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2 \
+        *r**2*rAB**2*rB**2*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**2 \
+        *rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB**3*wA \
+        *math.sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*rA**2*rAB**2*rB*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rA**2*rAB**2*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB**2*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2 \
+        *theta) + 2*aA*betaAB_1*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA \
+        *betaAB_1*betaAB_2*r*rA*rAB**3*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r \
+        *rA*rAB**2*rB**2*wA*math.sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*rA*rAB**2 \
+        *rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA*rAB*rB**2*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rAB**3*rB*wA*math.sin(betaAB_2 \
+        *theta) - aA*betaAB_1*betaAB_2*r*rAB**2*rB**2*wA*math.sin(betaAB_2*theta) + aA \
+        *betaAB_1*betaAB_2*rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1 \
+        *betaAB_2*rA**2*rAB*rB**2*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*rA \
+        *rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*rA*rAB**2*rB**2*wA \
+        *math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4*math.cos(betaAB_2*theta)**4 \
+        + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4*math.cos(betaAB_2*theta)**3 \
+        + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 + betaAB_1**3*rA*rAB**3*rB \
+        *math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 - betaAB_1**2 \
+        *r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2 \
+        *theta)**2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r \
+        *rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1**2*rA*rAB**2*rB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        *r**2*rA*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r**2*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3*math.cos(betaAB_2*theta) \
+        - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1*r*rA**2*rAB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2*theta) + 5 \
+        *betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
         *math.cos(betaAB_2*theta) + betaAB_1*r*rA*rAB*rB**2*math.cos(betaAB_2*theta) - 4 \
-        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB*math.cos(betaAB_2 \
-        *theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) - betaAB_1*rA**2*rAB**2*rB \
-        *math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2*rAB*rB - r*rA**2*rB**2 + 2*r*rA \
-        *rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r*rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB* \
-        *2)
+        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB \
+        *math.cos(betaAB_2*theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA**2*rAB**2*rB*math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA*rAB**2*rB**2*math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2 \
+        *rAB*rB - r*rA**2*rB**2 + 2*r*rA*rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r \
+        *rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB**2)
     return res
 
 # Function fB
@@ -284,173 +295,184 @@ def fB(x, y):
     bB = -alphaA*math.log(rB)/(alphaA*math.log(rAB) - alphaA*math.log(rB) + alphaB*math.log(rA) \
         - alphaB*math.log(rAB))
     res = -alphaB*((-2*aB*betaAB_1*r*rAB*math.cos(betaAB_2*theta)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aB*r*(-betaAB_1**2*rAB**2*math.cos(betaAB_2 \
-        *theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2*betaAB_1*rAB**2 \
-        *math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB)*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aB*r*(-betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB) \
+        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 \
+        - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB \
+        + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aB*((2*betaAB_1**2*betaAB_2 \
-        *rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aB*((2*betaAB_1**2 \
+        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
+        *betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2*betaAB_1**2 \
-        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aB*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        /(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        + aB*((2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2 \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2*betaAB_1**2 \
-        *betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
-        *betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) - 2 \
-        *betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *3 + 2*(2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB* \
-        *2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r \
+        *rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) \
+        + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*((2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**3 + 2*(2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
         *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2 \
-        *betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2*betaAB_2**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*rAB*rB \
-        *math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2 \
+        *betaAB_2**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2**2*rAB*rB*math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2*betaAB_2**2*r \
+        *rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2 \
+        *theta) - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1 \
+        *betaAB_2**2*rA*rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA \
+        *rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
         *r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB \
-        *rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2 \
-        *betaAB_2**2*r*rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2*theta) \
-        - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2**2*rA \
-        *rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r**2) + (aB*betaAB_1**4*betaAB_2*r**2*rAB**4*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - aB*betaAB_1**4*betaAB_2*r*rAB* \
-        *4*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aB*betaAB_1**3 \
-        *betaAB_2*r**3*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB \
+        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r \
+        *rAB*rB))/r**2) + (aB*betaAB_1**4*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**3 - aB*betaAB_1**4*betaAB_2*r*rAB**4*rB*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aB*betaAB_1**3*betaAB_2 \
+        *r**3*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB \
         *betaAB_1**3*betaAB_2*r**2*rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
         *theta)**2 + 3*aB*betaAB_1**3*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) \
         *math.cos(betaAB_2*theta)**2 + 2*aB*betaAB_1**3*betaAB_2*r**2*rAB**3*rB*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3*betaAB_2*r**2 \
-        *rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3 \
-        *betaAB_2*r*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB \
-        *betaAB_1**3*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)* \
-        *2 - 3*aB*betaAB_1**3*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta)**2 - aB*betaAB_1**3*betaAB_2*r*rAB**3*rB*wB*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3*betaAB_2*rA*rAB**3*rB*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2*aB*betaAB_1**2*betaAB_2*r**3 \
-        *rA*rAB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2*aB*betaAB_1**2 \
-        *betaAB_2*r**3*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aB \
-        *betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - aB*betaAB_1**2*betaAB_2*r**2*rA*rAB**2*rB*wB*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r*rA*rAB \
-        **3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aB*betaAB_1**2*betaAB_2*r \
-        *rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aB*betaAB_1* \
-        *2*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aB \
-        *betaAB_1**2*betaAB_2*r*rAB**3*rB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r**2*rA**2*rAB**2*wB*math.sin(betaAB_2*theta) - aB \
-        *betaAB_1*betaAB_2*r**2*rA**2*rAB*rB*wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1 \
-        *betaAB_2*r**2*rA*rAB**3*wB*math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r**2*rA \
-        *rAB**2*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rA*rAB**2*wB \
-        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wB*math.sin(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) - aB*betaAB_1 \
-        *betaAB_2*r**2*rAB**3*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rAB**3 \
-        *wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rAB**2*rB*wB*math.sin(betaAB_2 \
-        *theta) - aB*betaAB_1*betaAB_2*r*rA**2*rAB**2*rB*wB*math.sin(betaAB_2*theta) - aB \
-        *betaAB_1*betaAB_2*r*rA**2*rAB**2*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r \
-        *rA**2*rAB*rB**2*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wB \
-        *math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r*rA*rAB**3*rB*wB*math.sin(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1 \
-        *betaAB_2*r*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1*betaAB_2*r*rA \
-        *rAB**2*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA*rAB*rB**2*wB \
-        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r*rAB**3*rB**2*wB*math.sin(betaAB_2*theta) + aB*betaAB_1 \
-        *betaAB_2*r*rAB**3*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rAB**2*rB**2 \
-        *wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*rA**2*rAB**2*rB*wB \
-        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*rA**2*rAB*rB**2*wB*math.sin(betaAB_2 \
-        *theta) - aB*betaAB_1*betaAB_2*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1 \
-        *betaAB_2*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**4 + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*r*rA*rAB**3*math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*rA*rAB**3*rB*math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1**2*r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2*theta)* \
-        *2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rAB**3*rB \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 \
-        + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rA*rAB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*r**2*rA*rAB*rB*math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3 \
-        *math.cos(betaAB_2*theta) - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1 \
-        *r*rA**2*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2 \
-        *theta) + 5*betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3*betaAB_2 \
+        *r**2*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB \
+        *betaAB_1**3*betaAB_2*r*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta)**2 - aB*betaAB_1**3*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**2 - 3*aB*betaAB_1**3*betaAB_2*r*rAB**4*rB*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB*betaAB_1**3*betaAB_2*r \
+        *rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3 \
+        *betaAB_2*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2 \
+        *aB*betaAB_1**2*betaAB_2*r**3*rA*rAB**2*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) - 2*aB*betaAB_1**2*betaAB_2*r**3*rAB**3*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aB*betaAB_1**2*betaAB_2*r**2 \
+        *rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aB*betaAB_1**2 \
+        *betaAB_2*r**2*rA*rAB**2*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + 3*aB*betaAB_1**2*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r*rA \
+        *rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aB*betaAB_1**2 \
+        *betaAB_2*r*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - 3*aB*betaAB_1**2*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r*rAB**3*rB**2*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2 \
+        *rA**2*rAB**2*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rA**2*rAB*rB \
+        *wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1*betaAB_2*r**2*rA*rAB**3*wB \
+        *math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r**2*rA*rAB**2*rB*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rA*rAB**2*wB \
+        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2 \
+        *theta) - aB*betaAB_1*betaAB_2*r**2*rAB**3*rB*wB*math.sin(betaAB_2*theta) - aB \
+        *betaAB_1*betaAB_2*r**2*rAB**3*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2 \
+        *r**2*rAB**2*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rA**2*rAB**2 \
+        *rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rA**2*rAB**2*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA**2*rAB*rB**2*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wB \
+        *math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r*rA*rAB**3*rB*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2 \
+        *theta) - 2*aB*betaAB_1*betaAB_2*r*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta) - 2 \
+        *aB*betaAB_1*betaAB_2*r*rA*rAB**2*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1 \
+        *betaAB_2*r*rA*rAB*rB**2*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r \
+        *rAB**4*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rAB**3*rB**2*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rAB**3*rB*wB*math.sin(betaAB_2 \
+        *theta) - aB*betaAB_1*betaAB_2*r*rAB**2*rB**2*wB*math.sin(betaAB_2*theta) + aB \
+        *betaAB_1*betaAB_2*rA**2*rAB**2*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1 \
+        *betaAB_2*rA**2*rAB*rB**2*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*rA \
+        *rAB**3*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*rA*rAB**2*rB**2*wB \
+        *math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4*math.cos(betaAB_2*theta)**4 \
+        + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4*math.cos(betaAB_2*theta)**3 \
+        + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 + betaAB_1**3*rA*rAB**3*rB \
+        *math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 - betaAB_1**2 \
+        *r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2 \
+        *theta)**2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r \
+        *rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1**2*rA*rAB**2*rB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        *r**2*rA*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r**2*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3*math.cos(betaAB_2*theta) \
+        - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1*r*rA**2*rAB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2*theta) + 5 \
+        *betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
         *math.cos(betaAB_2*theta) + betaAB_1*r*rA*rAB*rB**2*math.cos(betaAB_2*theta) - 4 \
-        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB*math.cos(betaAB_2 \
-        *theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) - betaAB_1*rA**2*rAB**2*rB \
-        *math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2*rAB*rB - r*rA**2*rB**2 + 2*r*rA \
-        *rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r*rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB* \
-        *2)
+        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB \
+        *math.cos(betaAB_2*theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA**2*rAB**2*rB*math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA*rAB**2*rB**2*math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2 \
+        *rAB*rB - r*rA**2*rB**2 + 2*r*rA*rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r \
+        *rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB**2)
     return res
@@ -0,0 +1,87 @@
+# Auto-generated by generate_code.py
+
+import math
+
+# Global constants
+rA = 1.0
+rAB = 0.75
+rB = 0.5
+betaAB_1 = 0.04
+betaAB_2 = 8.0
+alphaA = 2.0
+alphaB = 1.0
+wA = 1.0
+wB = -1.0
+
+# Coordinates of the factored kernels
+COORDINATES = {
+    "RAB": ("r", "theta"),
+    "nAB": ("r", "theta"),
+    "uA": ("r", "theta"),
+    "uB": ("r", "theta"),
+}
+
+# Coordinates the functions depend on
+DEPENDENCIES = {
+    "RAB": ("theta",),
+    "nAB": ("theta",),
+    "uA": ("r", "theta"),
+    "uB": ("r", "theta"),
+    "phiA": ("r", "theta"),
+    "phiB": ("r", "theta"),
+    "fA": ("r", "theta"),
+    "fB": ("r", "theta"),
+}
+
+# Function RAB (factors of r, theta)
+def RAB(r, theta):
+    theta_f0 = betaAB_1*math.cos(betaAB_2*theta) + 1
+    res = rAB*theta_f0
+    return res
+
+# Function nAB (factors of r, theta)
+def nAB(r, theta):
+    theta_f0 = (betaAB_1*betaAB_2*math.sin(theta)*math.sin(betaAB_2*theta) - betaAB_1*math.cos(theta) \
+        *math.cos(betaAB_2*theta) - math.cos(theta))/math.sqrt(betaAB_1**2*betaAB_2**2 \
+        *math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
+        *math.cos(betaAB_2*theta) + 1)
+    theta_f1 = (betaAB_1*betaAB_2*math.sin(betaAB_2*theta)*math.cos(theta) + betaAB_1*math.sin(theta) \
+        *math.cos(betaAB_2*theta) + math.sin(theta))/math.sqrt(betaAB_1**2*betaAB_2**2 \
+        *math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
+        *math.cos(betaAB_2*theta) + 1)
+    res = [0.0]*2
+    res[0] = theta_f0
+    res[1] = -theta_f1
+    return res
+
+# Function uA (factors of r, theta)
+def uA(r, theta):
+    r_f0 = -r*wA
+    theta_f0 = math.sin(theta)
+    r_f1 = -betaAB_1*betaAB_2*r**2*rAB*wA + betaAB_1*betaAB_2*r*rA*rAB*wA
+    theta_f1 = math.sin(betaAB_2*theta)*math.cos(theta)/(betaAB_1*rAB*math.cos(betaAB_2*theta) - rA \
+        + rAB)
+    r_f2 = r*wA
+    theta_f2 = math.cos(theta)
+    theta_f3 = math.sin(theta)*math.sin(betaAB_2*theta)/(betaAB_1*rAB*math.cos(betaAB_2*theta) - rA \
+        + rAB)
+    res = [0.0]*2
+    res[0] = r_f0*theta_f0 + r_f1*theta_f1
+    res[1] = r_f2*theta_f2 + r_f1*theta_f3
+    return res
+
+# Function uB (factors of r, theta)
+def uB(r, theta):
+    r_f0 = -r*wB
+    theta_f0 = math.sin(theta)
+    r_f1 = -betaAB_1*betaAB_2*r**2*rAB*wB + betaAB_1*betaAB_2*r*rAB*rB*wB
+    theta_f1 = math.sin(betaAB_2*theta)*math.cos(theta)/(betaAB_1*rAB*math.cos(betaAB_2*theta) + rAB \
+        - rB)
+    r_f2 = r*wB
+    theta_f2 = math.cos(theta)
+    theta_f3 = math.sin(theta)*math.sin(betaAB_2*theta)/(betaAB_1*rAB*math.cos(betaAB_2*theta) + rAB \
+        - rB)
+    res = [0.0]*2
+    res[0] = r_f0*theta_f0 + r_f1*theta_f1
+    res[1] = r_f2*theta_f2 + r_f1*theta_f3
+    return res
@@ -1,14 +1,201 @@
 // Test file
 
-// Compile with "gcc test.cpp -o test"
-// Run with ".\test"
+// Evaluates every function at the points of a binary file (int64 number of
+// points followed by the float64 x and y coordinates) or at quasi-random
+// points in the domain, and prints the throughput and checksum of each one
 
-#include <stdio.h>
+// Compile with "g++ -O2 -fopenmp test.cpp -o test"
+// Run with "./test [points.bin | npoints] [repeats] [threads]"
+
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <chrono>
+#include <vector>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 #include "cht_02.h"
 
-int main() {
+// load points from binary file
+static bool load_points(const char* path, std::vector<double>& x, std::vector<double>& y) {
+    FILE* fh = fopen(path, "rb");
+    if (!fh) return false;
+    long long npoints = 0;
+    bool ok = fread(&npoints, sizeof(npoints), 1, fh) == 1;
+    if (ok) {
+        x.resize(npoints);
+        y.resize(npoints);
+        ok = fread(x.data(), sizeof(double), npoints, fh) == (size_t)npoints
+            && fread(y.data(), sizeof(double), npoints, fh) == (size_t)npoints;
+    }
+    fclose(fh);
+    return ok;
+}
+
+// quasi-random points in the domain
+static void random_points(long long npoints, std::vector<double>& x, std::vector<double>& y) {
+    x.resize(npoints);
+    y.resize(npoints);
+    for (long long i = 0; i < npoints; i++) {
+        double u = (i + 1)*0.7548776662466927;
+        double v = (i + 1)*0.5698402909980532;
+        u -= floor(u);
+        v -= floor(v);
+        x[i] = sqrt(0.5*0.5 + u*(1.0*1.0 - 0.5*0.5))*cos(6.283185307179586*v);
+        y[i] = sqrt(0.5*0.5 + u*(1.0*1.0 - 0.5*0.5))*sin(6.283185307179586*v);
+    }
+}
+
+// print throughput and checksum
+static void report(const char* name, const std::vector<double>& res, long long npoints, double best) {
+    double checksum = 0.0;
+    for (size_t i = 0; i < res.size(); i++) checksum += res[i];
+    printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", name, npoints/best,
+        1.0e9*best/npoints, checksum);
+}
+
+int main(int argc, char** argv) {
+
+    std::vector<double> x, y;
+    const char* arg = argc > 1 ? argv[1] : "100000";
+    if (!load_points(arg, x, y)) random_points(atoll(arg), x, y);
+    long long npoints = x.size();
+    int repeats = argc > 2 ? atoi(argv[2]) : 5;
+    int threads = 1;
+#ifdef _OPENMP
+    threads = argc > 3 ? atoi(argv[3]) : omp_get_max_threads();
+    omp_set_num_threads(threads);
+#endif
+    printf("%lld points, %d repeats, %d threads\n", npoints, repeats, threads);
+
+    // Function RAB
+    {
+        std::vector<double> res(1*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                res[i] = RAB(x[i], y[i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("RAB", res, npoints, best);
+    }
+
+    // Function nAB
+    {
+        std::vector<double> res(2*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                nAB(x[i], y[i], &res[2*i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("nAB", res, npoints, best);
+    }
+
+    // Function uA
+    {
+        std::vector<double> res(2*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                uA(x[i], y[i], &res[2*i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("uA", res, npoints, best);
+    }
+
+    // Function uB
+    {
+        std::vector<double> res(2*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                uB(x[i], y[i], &res[2*i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("uB", res, npoints, best);
+    }
+
+    // Function phiA
+    {
+        std::vector<double> res(1*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                res[i] = phiA(x[i], y[i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("phiA", res, npoints, best);
+    }
+
+    // Function phiB
+    {
+        std::vector<double> res(1*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                res[i] = phiB(x[i], y[i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("phiB", res, npoints, best);
+    }
+
+    // Function fA
+    {
+        std::vector<double> res(1*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                res[i] = fA(x[i], y[i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("fA", res, npoints, best);
+    }
 
-    // Insert code
+    // Function fB
+    {
+        std::vector<double> res(1*npoints);
+        double best = 1.0e300;
+        for (int k = 0; k <= repeats; k++) {
+            auto start = std::chrono::steady_clock::now();
+            #pragma omp parallel for
+            for (long long i = 0; i < npoints; i++) {
+                res[i] = fB(x[i], y[i]);
+            }
+            std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+            if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+        }
+        report("fB", res, npoints, best);
+    }
 
     return 0;
 }
@@ -1,14 +1,216 @@
 ! Test file
 
-! Compile with "gfortran -cpp test.f -o test"
-! Run with ".\test"
+! Evaluates every function at the points of a binary file (int64 number of
+! points followed by the float64 x and y coordinates) or at quasi-random
+! points in the domain, and prints the throughput and checksum of each one
+
+! Compile with "gfortran -O2 -cpp -ffree-form -ffree-line-length-none -fopenmp test.f -o test"
+! Run with "./test [points.bin | npoints] [repeats] [threads]"
 
 #include "cht_02.f"
 
 program test
 
     use CHT_02
+    !$ use omp_lib
+
+    implicit none
+    integer(8) :: test_n, test_i, test_count0, test_count1, test_rate
+    integer :: test_k, test_repeats, test_threads, test_unit
+    real(8), allocatable :: test_x(:), test_y(:), test_res(:, :)
+    real(8) :: test_u, test_v, test_best
+    character(len=4096) :: test_arg
+    logical :: test_exists
+
+    ! points from binary file or quasi-random points in the domain
+    test_arg = "100000"
+    if (command_argument_count() >= 1) call get_command_argument(1, test_arg)
+    inquire(file=trim(test_arg), exist=test_exists)
+    if (test_exists) then
+        open(newunit=test_unit, file=trim(test_arg), access="stream", form="unformatted", status="old")
+        read(test_unit) test_n
+        allocate(test_x(test_n), test_y(test_n))
+        read(test_unit) test_x
+        read(test_unit) test_y
+        close(test_unit)
+    else
+        read(test_arg, *) test_n
+        allocate(test_x(test_n), test_y(test_n))
+        do test_i = 1, test_n
+            test_u = real(test_i, 8)*0.7548776662466927d0
+            test_v = real(test_i, 8)*0.5698402909980532d0
+            test_u = test_u - aint(test_u)
+            test_v = test_v - aint(test_v)
+            test_x(test_i) = sqrt(0.5d0*0.5d0 + test_u*(1.0d0*1.0d0 - 0.5d0*0.5d0))*cos(6.283185307179586d0*test_v)
+            test_y(test_i) = sqrt(0.5d0*0.5d0 + test_u*(1.0d0*1.0d0 - 0.5d0*0.5d0))*sin(6.283185307179586d0*test_v)
+        end do
+    end if
+    test_repeats = 5
+    if (command_argument_count() >= 2) then
+        call get_command_argument(2, test_arg)
+        read(test_arg, *) test_repeats
+    end if
+    test_threads = 1
+    !$ test_threads = omp_get_max_threads()
+    !$ if (command_argument_count() >= 3) call get_command_argument(3, test_arg)
+    !$ if (command_argument_count() >= 3) read(test_arg, *) test_threads
+    !$ call omp_set_num_threads(test_threads)
+    print "(i0, a, i0, a, i0, a)", test_n, " points, ", test_repeats, " repeats, ", test_threads, " threads"
+
+    ! Function RAB
+    allocate(test_res(1, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            test_res(1, test_i) = RAB(test_x(test_i), test_y(test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("RAB", test_res, test_n, test_best)
+    deallocate(test_res)
+
+    ! Function nAB
+    allocate(test_res(2, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            call nAB(test_x(test_i), test_y(test_i), test_res(:, test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("nAB", test_res, test_n, test_best)
+    deallocate(test_res)
+
+    ! Function uA
+    allocate(test_res(2, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            call uA(test_x(test_i), test_y(test_i), test_res(:, test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("uA", test_res, test_n, test_best)
+    deallocate(test_res)
+
+    ! Function uB
+    allocate(test_res(2, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            call uB(test_x(test_i), test_y(test_i), test_res(:, test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("uB", test_res, test_n, test_best)
+    deallocate(test_res)
+
+    ! Function phiA
+    allocate(test_res(1, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            test_res(1, test_i) = phiA(test_x(test_i), test_y(test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("phiA", test_res, test_n, test_best)
+    deallocate(test_res)
+
+    ! Function phiB
+    allocate(test_res(1, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            test_res(1, test_i) = phiB(test_x(test_i), test_y(test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("phiB", test_res, test_n, test_best)
+    deallocate(test_res)
+
+    ! Function fA
+    allocate(test_res(1, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            test_res(1, test_i) = fA(test_x(test_i), test_y(test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("fA", test_res, test_n, test_best)
+    deallocate(test_res)
+
+    ! Function fB
+    allocate(test_res(1, test_n))
+    test_best = huge(1.0d0)
+    do test_k = 0, test_repeats
+        call system_clock(test_count0, test_rate)
+        !$omp parallel do
+        do test_i = 1, test_n
+            test_res(1, test_i) = fB(test_x(test_i), test_y(test_i))
+        end do
+        !$omp end parallel do
+        call system_clock(test_count1)
+        if (test_k > 0 .or. test_repeats == 0) then
+            test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+        end if
+    end do
+    call report("fB", test_res, test_n, test_best)
+    deallocate(test_res)
+
+contains
 
-    ! Insert code
+    ! print throughput and checksum
+    subroutine report(name, res, npoints, best)
+        character(len=*), intent(in) :: name
+        real(8), intent(in) :: res(:, :)
+        integer(8), intent(in) :: npoints
+        real(8), intent(in) :: best
+        print "(a, t14, es12.4, a, f10.2, a, es19.12)", name, npoints/best, " points/s", &
+            1.0d9*best/npoints, " ns/point  checksum ", sum(res)
+    end subroutine report
 
 end program test
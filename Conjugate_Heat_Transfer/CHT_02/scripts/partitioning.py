@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | PARTITIONING
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for partitioning meshes loaded with `meshes.py` into k
+balanced and compact parts by recursive coordinate bisection (RCB) of the
+cell centroids: each part is split along the longest side of its bounding
+box at the quantile that balances the number of cells of the two halves, so
+any number of parts is supported. Optionally, the subdomains (cell tags 100,
+200, ...) are partitioned separately, with parts distributed in proportion
+to their sizes, so that no part crosses an interface.
+For each part, the owned cells, halo (ghost) cells of one or more layers
+(face or node neighbours) and the local-to-global maps of cells and nodes
+are provided, together with the cell permutation that stores each part as a
+contiguous block. Partitions are stored in the mesh cache.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python partitioning.py ../meshes/triamesh_4.msh -k 8 --regions --output ../meshes/partitions
+
+===============================================================================
+"""
+
+# import modules
+import os
+import sys
+import argparse
+import numpy as np
+from meshes import load_mesh, cached_stage
+from topology import load_topology, csr_invert
+
+#============================================
+# RECURSIVE COORDINATE BISECTION
+#============================================
+
+# recursive coordinate bisection
+def rcb(points, k, weights=None):
+    """
+    Return the part (0 to k-1) of each point by recursive coordinate bisection.
+    Parts are split into floor(k/2) and ceil(k/2) parts with proportional
+    total weights along the longest side of their bounding box.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    weights = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)
+    parts = np.zeros(n, dtype=np.int32)
+    stack = [(np.arange(n), 0, k)]
+    while stack:
+        index, first, count = stack.pop()
+        if count == 1 or len(index) == 0:
+            parts[index] = first
+            continue
+        left = count//2
+        sub = points[index]
+        axis = int(np.argmax(sub.max(axis=0) - sub.min(axis=0)))
+        order = index[np.argsort(sub[:, axis], kind="stable")]
+        cumulative = np.cumsum(weights[order])
+        cut = int(np.searchsorted(cumulative, cumulative[-1]*left/count))
+        stack.append((order[:cut], first, left))
+        stack.append((order[cut:], first + left, count - left))
+    return parts
+
+# partition cells
+def partition_cells(mesh, k, regions=False):
+    """
+    Return the part (0 to k-1) of each cell. With `regions=True` each
+    subdomain (cell tag) is partitioned separately into a number of parts
+    proportional to its cells (at least one per subdomain).
+    """
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    centroids = nodes[cells].mean(axis=1)
+    if not regions:
+        return rcb(centroids, k)
+    tags, counts = np.unique(np.asarray(mesh["cell_tags"]), return_counts=True)
+    if k < len(tags):
+        raise ValueError(f"At least {len(tags)} parts are required to respect the subdomains.")
+    # parts per subdomain (largest remainders)
+    share = counts*(k - len(tags))/counts.sum()
+    nparts = 1 + np.floor(share).astype(int)
+    extra = k - nparts.sum()
+    nparts[np.argsort(np.floor(share) - share, kind="stable")[:extra]] += 1
+    parts = np.empty(len(cells), dtype=np.int32)
+    first = 0
+    for tag, count in zip(tags, nparts):
+        select = np.flatnonzero(np.asarray(mesh["cell_tags"]) == tag)
+        parts[select] = first + rcb(centroids[select], count)
+        first += count
+    return parts
+
+# load partition
+def load_partition(mesh, k, regions=False):
+    """
+    Return the cell parts of a mesh, reading them from the mesh cache when
+    available and building (and caching) them otherwise.
+    """
+    key = f"partition_{k}" + ("_regions" if regions else "")
+    return cached_stage(mesh, [key], lambda mesh: {key: partition_cells(mesh, k, regions)})[key]
+
+#============================================
+# PARTS, HALOS AND LOCAL MAPS
+#============================================
+
+# cells of each part
+def part_cells(parts, k):
+    """
+    Return the cells of each part in CSR form (ptr, cells); `cells` is the
+    permutation that stores each part as a contiguous block.
+    """
+    parts = np.asarray(parts)
+    return csr_invert(parts, np.arange(len(parts)), k)
+
+# halo cells of a part
+def halo_cells(mesh, owned, layers=1, adjacency="face"):
+    """
+    Return the halo (ghost) cells of a set of owned cells: the cells within
+    `layers` layers of face neighbours (adjacency="face") or node neighbours
+    (adjacency="node"), excluding the owned cells.
+    """
+    nc = len(mesh["cells"])
+    inside = np.zeros(nc, dtype=bool)
+    inside[owned] = True
+    front = np.asarray(owned)
+    if adjacency not in ("face", "node"):
+        raise ValueError(f"Unknown adjacency '{adjacency}' (expected 'face' or 'node').")
+    topo = load_topology(mesh)
+    cells = np.asarray(mesh["cells"])
+    halo = []
+    for _ in range(layers):
+        if adjacency == "face":
+            rows, row_ptr, data = front, np.asarray(topo["cell_cells_ptr"]), np.asarray(topo["cell_cells"])
+        else:
+            rows = np.unique(cells[front])
+            row_ptr, data = np.asarray(topo["node_cells_ptr"]), np.asarray(topo["node_cells"])
+        count = row_ptr[rows + 1] - row_ptr[rows]
+        entry = np.arange(count.sum()) + np.repeat(row_ptr[rows] - np.cumsum(count) + count, count)
+        front = np.unique(data[entry])
+        front = front[~inside[front]]
+        inside[front] = True
+        halo.append(front)
+    return np.concatenate(halo).astype(np.int32) if halo else np.empty(0, dtype=np.int32)
+
+# local mesh of a part
+def local_mesh(mesh, parts, p, layers=1, adjacency="face"):
+    """
+    Return the local mesh of part p:
+      cells_l2g  (ncl,)     int32  global cells, owned first then halo
+      n_owned    int               number of owned cells
+      nodes_l2g  (nnl,)     int32  global nodes of the local cells
+      nodes      (nnl, 2)   float  local node coordinates
+      cells      (ncl, k)   int32  local cells in local node numbering
+      cell_tags  (ncl,)     int32  physical tags of the local cells
+    """
+    owned = np.flatnonzero(np.asarray(parts) == p).astype(np.int32)
+    halo = halo_cells(mesh, owned, layers, adjacency)
+    l2g = np.concatenate((owned, halo))
+    cells = np.asarray(mesh["cells"])[l2g]
+    nodes_l2g, local = np.unique(cells, return_inverse=True)
+    return {
+        "cells_l2g": l2g,
+        "n_owned": len(owned),
+        "nodes_l2g": nodes_l2g.astype(np.int32),
+        "nodes": np.asarray(mesh["nodes"])[nodes_l2g],
+        "cells": local.reshape(cells.shape).astype(np.int32),
+        "cell_tags": np.asarray(mesh["cell_tags"])[l2g],
+    }
+
+#============================================
+# QUALITY
+#============================================
+
+# partition quality
+def partition_quality(mesh, parts, k):
+    """
+    Return the load imbalance (max/mean cells per part) and the number of
+    interior faces between different parts (edge cut).
+    """
+    counts = np.bincount(np.asarray(parts), minlength=k)
+    fc = np.asarray(load_topology(mesh)["face_cells"])
+    fc = fc[fc[:, 1] >= 0]
+    parts = np.asarray(parts)
+    return {"imbalance": float(counts.max()/counts.mean()),
+            "cut": int(np.count_nonzero(parts[fc[:, 0]] != parts[fc[:, 1]])),
+            "counts": counts}
+
+#============================================
+# MAIN
+#============================================
+
+# partition meshes from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Partition meshes by recursive coordinate bisection.")
+    parser.add_argument("file", help="mesh file in MSH format")
+    parser.add_argument("-k", type=int, required=True, help="number of parts")
+    parser.add_argument("--regions", action="store_true", help="partition each subdomain separately")
+    parser.add_argument("--layers", type=int, default=1, help="halo layers")
+    parser.add_argument("--adjacency", choices=["face", "node"], default="face", help="halo adjacency")
+    parser.add_argument("--output", help="write the local meshes of the parts to this directory")
+    args = parser.parse_args(argv)
+    mesh = load_mesh(args.file)
+    parts = load_partition(mesh, args.k, args.regions)
+    quality = partition_quality(mesh, parts, args.k)
+    print(f"Partitioned {args.file} into {args.k} parts: imbalance {quality['imbalance']:.3f}, "
+          f"cut {quality['cut']} faces")
+    if args.output:
+        name = os.path.splitext(os.path.basename(args.file))[0]
+        outdir = os.path.join(args.output, f"{name}_k{args.k}")
+        os.makedirs(outdir, exist_ok=True)
+        for p in range(args.k):
+            part = local_mesh(mesh, parts, p, args.layers, args.adjacency)
+            np.savez(os.path.join(outdir, f"part_{p}.npz"), **part)
+        print("Wrote", outdir)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
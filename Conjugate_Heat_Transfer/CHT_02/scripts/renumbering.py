@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | RENUMBERING
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for renumbering the nodes and cells of meshes loaded with
+`meshes.py` to improve memory locality when fields are assembled or evaluated
+cell by cell. Supported orderings:
+  rcm       reverse Cuthill-McKee on the node graph (cells sorted by their
+            lowest renumbered node)
+  hilbert   Hilbert curve on the cell centroids (nodes numbered by first use)
+  morton    Morton (Z-order) curve on the cell centroids (idem)
+All orderings are computed with vectorised NumPy operations; reverse
+Cuthill-McKee processes the breadth-first search one level at a time.
+Renumbered meshes can be loaded directly (`meshes.load_mesh(path,
+renumber="rcm")`, cached separately) or written in MSH format, and the
+command line benchmarks assembly and evaluation kernels before and after.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python renumbering.py ../meshes/triamesh_4.msh --method rcm --benchmark
+python renumbering.py ../meshes/triamesh_4.msh --method hilbert --output ../meshes/triamesh_4_hilbert.msh
+
+===============================================================================
+"""
+
+# import modules
+import sys
+import time
+import argparse
+import numpy as np
+from meshes import BLOCKS, read_msh, write_msh
+from topology import build_topology, csr_invert
+
+#============================================
+# PARAMETERS
+#============================================
+
+# renumbering methods
+METHODS = ["rcm", "hilbert", "morton"]
+
+# bits per coordinate of space-filling curves
+CURVE_BITS = 16
+
+# repetitions of benchmark kernels
+BENCHMARK_REPEAT = 10
+
+#============================================
+# NODE GRAPH
+#============================================
+
+# node graph
+def node_graph(mesh):
+    """
+    Return the node-to-node graph of the mesh faces in CSR form (ptr, adj).
+    """
+    faces = np.asarray(build_topology(mesh)["faces"], dtype=np.int64)
+    rows = np.concatenate((faces[:, 0], faces[:, 1]))
+    cols = np.concatenate((faces[:, 1], faces[:, 0]))
+    return csr_invert(rows, cols, len(mesh["nodes"]))
+
+# gather CSR rows
+def csr_rows(ptr, adj, rows):
+    """
+    Return the entries of the given CSR rows and the position of the row of
+    each entry in `rows`.
+    """
+    count = ptr[rows + 1] - ptr[rows]
+    entry = np.arange(count.sum()) + np.repeat(ptr[rows] - np.cumsum(count) + count, count)
+    return adj[entry], np.repeat(np.arange(len(rows)), count)
+
+# bandwidth of a numbering
+def bandwidth(ptr, adj):
+    """
+    Return the bandwidth (max |i - j|) and the mean |i - j| over the edges of a
+    graph in CSR form.
+    """
+    rows = np.repeat(np.arange(len(ptr) - 1), np.diff(ptr))
+    span = np.abs(rows - adj)
+    return int(span.max(initial=0)), float(span.mean()) if len(span) else 0.0
+
+#============================================
+# ORDERINGS
+#============================================
+
+# breadth-first levels in Cuthill-McKee order
+def cuthill_mckee_levels(ptr, adj, start, visited):
+    """
+    Return the breadth-first levels from `start` in Cuthill-McKee order: the
+    new nodes of each level are ordered by the position of their parent in the
+    previous level and then by increasing degree. Marks the nodes as visited.
+    """
+    degree = np.diff(ptr)
+    frontier = np.array([start])
+    visited[start] = True
+    levels = [frontier]
+    while len(frontier):
+        nbr, parent = csr_rows(ptr, adj, frontier)
+        keep = ~visited[nbr]
+        nbr, parent = nbr[keep], parent[keep]
+        nbr = nbr[np.lexsort((degree[nbr], parent))]
+        _, first = np.unique(nbr, return_index=True)
+        frontier = nbr[np.sort(first)]
+        visited[frontier] = True
+        if len(frontier):
+            levels.append(frontier)
+    return levels
+
+# reverse Cuthill-McKee ordering
+def rcm_order(ptr, adj):
+    """
+    Return the reverse Cuthill-McKee ordering (new -> old) of a graph in CSR
+    form. Each connected component starts from a pseudo-peripheral node (the
+    lowest-degree node of the last level from a lowest-degree node); isolated
+    nodes are numbered last.
+    """
+    nn = len(ptr) - 1
+    degree = np.diff(ptr)
+    visited = degree == 0
+    order = []
+    while not np.all(visited):
+        start = int(np.argmin(np.where(visited, np.iinfo(degree.dtype).max, degree)))
+        last = cuthill_mckee_levels(ptr, adj, start, visited.copy())[-1]
+        start = int(last[np.argmin(degree[last])])
+        order.extend(cuthill_mckee_levels(ptr, adj, start, visited))
+    order = np.concatenate(order)[::-1] if order else np.empty(0, dtype=np.int64)
+    return np.concatenate((order, np.flatnonzero(degree == 0))).astype(np.int64)[:nn]
+
+# quantise points
+def quantise(points, bits):
+    """
+    Map points to integer coordinates in [0, 2^bits) over their bounding box.
+    """
+    lo = points.min(axis=0)
+    extent = np.max(points.max(axis=0) - lo)
+    scale = ((1 << bits) - 1)/extent if extent > 0 else 0.0
+    q = np.floor((points - lo)*scale).astype(np.int64)
+    return q[:, 0], q[:, 1]
+
+# Hilbert curve index
+def hilbert_index(points, bits=CURVE_BITS):
+    """
+    Return the index along the Hilbert curve of each point.
+    """
+    x, y = quantise(np.asarray(points, dtype=np.float64), bits)
+    n = 1 << bits
+    d = np.zeros(len(x), dtype=np.int64)
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s*s*((3*rx) ^ ry)
+        # rotate the quadrant
+        flip = ~ry & rx
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(~ry, y, x), np.where(~ry, x, y)
+        s >>= 1
+    return d
+
+# Morton curve index
+def morton_index(points, bits=CURVE_BITS):
+    """
+    Return the index along the Morton (Z-order) curve of each point.
+    """
+    x, y = quantise(np.asarray(points, dtype=np.float64), bits)
+    d = np.zeros(len(x), dtype=np.int64)
+    for b in range(bits):
+        d |= ((x >> b) & 1) << (2*b)
+        d |= ((y >> b) & 1) << (2*b + 1)
+    return d
+
+# nodes in order of first use
+def first_use_order(cells, nn):
+    """
+    Return the nodes (new -> old) in order of first appearance in the cells;
+    nodes of no cell are numbered last.
+    """
+    flat = np.asarray(cells).ravel()
+    nodes, first = np.unique(flat, return_index=True)
+    used = nodes[np.argsort(first, kind="stable")]
+    unused = np.setdiff1d(np.arange(nn), used)
+    return np.concatenate((used, unused)).astype(np.int64)
+
+#============================================
+# RENUMBERING
+#============================================
+
+# renumbering permutations
+def renumbering(mesh, method="rcm"):
+    """
+    Return the node and cell permutations (new -> old) of a mesh for the
+    given method ("rcm", "hilbert", or "morton").
+    """
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    nn = len(nodes)
+    if method == "rcm":
+        node_perm = rcm_order(*node_graph(mesh))
+        inverse = np.empty(nn, dtype=np.int64)
+        inverse[node_perm] = np.arange(nn)
+        cell_perm = np.argsort(inverse[cells].min(axis=1), kind="stable")
+    elif method in ("hilbert", "morton"):
+        index = hilbert_index if method == "hilbert" else morton_index
+        cell_perm = np.argsort(index(nodes[cells].mean(axis=1)), kind="stable")
+        node_perm = first_use_order(cells[cell_perm], nn)
+    else:
+        raise ValueError(f"Unknown renumbering method '{method}' (expected one of {METHODS}).")
+    return node_perm, cell_perm.astype(np.int64)
+
+# apply renumbering
+def renumber_mesh(mesh, method="rcm"):
+    """
+    Return the renumbered mesh (base arrays only) with the node and cell
+    permutations (new -> old) as entries `node_perm` and `cell_perm`.
+    Points and lines keep their order and are renumbered.
+    """
+    node_perm, cell_perm = renumbering(mesh, method)
+    inverse = np.empty(len(node_perm), dtype=np.int64)
+    inverse[node_perm] = np.arange(len(node_perm))
+    out = {"nodes": np.asarray(mesh["nodes"])[node_perm]}
+    for block in BLOCKS:
+        perm = cell_perm if block == "cells" else slice(None)
+        out[block] = inverse[np.asarray(mesh[block])[perm]].astype(np.int32)
+        for suffix in ("_tags", "_entities"):
+            key = block.rstrip("s") + suffix
+            out[key] = np.asarray(mesh[key])[perm].astype(np.int32)
+    out["node_perm"] = node_perm
+    out["cell_perm"] = cell_perm
+    return out
+
+#============================================
+# BENCHMARK
+#============================================
+
+# time a kernel
+def timeit(kernel, repeat=BENCHMARK_REPEAT):
+    """
+    Return the best wall time of `repeat` calls of a kernel.
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        kernel()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# benchmark kernels
+def benchmark(mesh, repeat=BENCHMARK_REPEAT):
+    """
+    Time cell-wise kernels on a mesh and return their throughput (cells per
+    second) with the node graph bandwidth:
+      evaluate   gather of node coordinates and evaluation at cell centroids
+      assemble   scatter-add of cell contributions into nodes
+      matvec     product with the node graph adjacency in CSR form
+    """
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    nc = len(cells)
+    ptr, adj = node_graph(mesh)
+    rows = np.repeat(np.arange(len(nodes)), np.diff(ptr))
+    values = np.ones(cells.size)
+    u = np.random.default_rng(0).random(len(nodes))
+    def evaluate():
+        c = nodes[cells].mean(axis=1)
+        return np.sin(c[:, 0])*np.cos(c[:, 1])
+    def assemble():
+        return np.bincount(cells.ravel(), weights=values, minlength=len(nodes))
+    def matvec():
+        return np.bincount(rows, weights=u[adj], minlength=len(nodes))
+    width, span = bandwidth(ptr, adj)
+    return {
+        "cells": nc,
+        "bandwidth": width,
+        "mean_span": span,
+        "evaluate": nc/timeit(evaluate, repeat),
+        "assemble": nc/timeit(assemble, repeat),
+        "matvec": nc/timeit(matvec, repeat),
+    }
+
+#============================================
+# MAIN
+#============================================
+
+# renumber meshes from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renumber meshes for memory locality.")
+    parser.add_argument("file", help="mesh file in MSH format")
+    parser.add_argument("--method", choices=METHODS, default="rcm", help="renumbering method")
+    parser.add_argument("--output", help="write the renumbered mesh to this MSH file")
+    parser.add_argument("--benchmark", action="store_true", help="benchmark kernels before and after")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT, help="benchmark repetitions")
+    args = parser.parse_args(argv)
+    mesh = read_msh(args.file)
+    start = time.perf_counter()
+    renumbered = renumber_mesh(mesh, args.method)
+    print(f"Renumbered {args.file} ({args.method}) in {time.perf_counter() - start:.3f} s")
+    if args.output:
+        write_msh(args.output, renumbered)
+        print("Wrote", args.output)
+    if args.benchmark:
+        before = benchmark(mesh, args.repeat)
+        after = benchmark(renumbered, args.repeat)
+        print(f"{'':12s} {'original':>14s} {args.method:>14s}")
+        for key in ("bandwidth", "mean_span"):
+            print(f"{key:12s} {before[key]:14.1f} {after[key]:14.1f}")
+        for key in ("evaluate", "assemble", "matvec"):
+            print(f"{key:12s} {before[key]:14.4g} {after[key]:14.4g}  cells/s  (x{after[key]/before[key]:.2f})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
@@ -0,0 +1,102 @@
+# Auto-generated by generate_code.py
+
+import math
+
+# Global constants
+rA = 1.0
+rAB = 0.75
+rB = 0.5
+alphaA = 2.0
+alphaB = 1.0
+wA = 1.0
+wB = -1.0
+h = 1.0
+n = 4.0
+
+# Coordinates of the factored kernels
+COORDINATES = {
+    "uA": ("r", "theta"),
+    "uB": ("r", "theta"),
+    "phiA": ("r", "theta"),
+    "phiB": ("r", "theta"),
+    "fA": ("r", "theta"),
+    "fB": ("r", "theta"),
+}
+
+# Coordinates the functions depend on
+DEPENDENCIES = {
+    "uA": ("r", "theta"),
+    "uB": ("r", "theta"),
+    "phiA": ("r", "theta"),
+    "phiB": ("r", "theta"),
+    "fA": ("r", "theta"),
+    "fB": ("r", "theta"),
+}
+
+# Function uA (factors of r, theta)
+def uA(r, theta):
+    theta_f0 = math.sin(theta)
+    theta_f1 = math.cos(theta)
+    res = [0.0]*2
+    res[0] = -wA*r*theta_f0
+    res[1] = wA*r*theta_f1
+    return res
+
+# Function uB (factors of r, theta)
+def uB(r, theta):
+    theta_f0 = math.sin(theta)
+    theta_f1 = math.cos(theta)
+    res = [0.0]*2
+    res[0] = -wB*r*theta_f0
+    res[1] = wB*r*theta_f1
+    return res
+
+# Function phiA (factors of r, theta)
+def phiA(r, theta):
+    aA = alphaB*h*rAB/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) + alphaB \
+        *h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    bA = (alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) - alphaB*h*rAB \
+        *math.log(rAB))/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) \
+        + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    r_f0 = aA*math.log(r) + bA
+    theta_f0 = math.cos(n*theta)
+    res = r_f0*theta_f0
+    return res
+
+# Function phiB (factors of r, theta)
+def phiB(r, theta):
+    aB = alphaA*h*rAB/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) + alphaB \
+        *h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    bB = -alphaA*h*rAB*math.log(rB)/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB \
+        *math.log(rB) + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    r_f0 = aB*math.log(r) + bB
+    theta_f0 = math.cos(n*theta)
+    res = r_f0*theta_f0
+    return res
+
+# Function fA (factors of r, theta)
+def fA(r, theta):
+    aA = alphaB*h*rAB/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) + alphaB \
+        *h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    bA = (alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) - alphaB*h*rAB \
+        *math.log(rAB))/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) \
+        + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    r_f0 = -aA*n*wA*math.log(r) - bA*n*wA
+    theta_f0 = math.sin(n*theta)
+    r_f1 = aA*alphaA*n**2*math.log(r)/r**2 + alphaA*bA*n**2/r**2
+    theta_f1 = math.cos(n*theta)
+    res = r_f0*theta_f0 + r_f1*theta_f1
+    return res
+
+# Function fB (factors of r, theta)
+def fB(r, theta):
+    aB = alphaA*h*rAB/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) + alphaB \
+        *h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    bB = -alphaA*h*rAB*math.log(rB)/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB \
+        *math.log(rB) + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
+    r_f0 = -aB*n*wB*math.log(r) - bB*n*wB
+    theta_f0 = math.sin(n*theta)
+    r_f1 = aB*alphaB*n**2*math.log(r)/r**2 + alphaB*bB*n**2/r**2
+    theta_f1 = math.cos(n*theta)
+    res = r_f0*theta_f0 + r_f1*theta_f1
+    return res
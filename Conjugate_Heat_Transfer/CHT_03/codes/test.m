@@ -1,7 +1,132 @@
 % Test file
 
-% Run with "octave cht_03.m"
+% Evaluates every function at the points of a binary file (int64 number of
+% points followed by the float64 x and y coordinates) or at quasi-random
+% points in the domain, and prints the throughput and checksum of each one
+
+% Run with "octave test.m [points.bin | npoints] [repeats]"
 
 cht_03
 
-% Insert code
+% points from binary file or quasi-random points in the domain
+test_args = argv();
+test_arg = "100000";
+if numel(test_args) >= 1
+    test_arg = test_args{1};
+end
+if exist(test_arg, "file") == 2
+    test_fh = fopen(test_arg, "r");
+    test_n = fread(test_fh, 1, "int64");
+    test_x = fread(test_fh, test_n, "double");
+    test_y = fread(test_fh, test_n, "double");
+    fclose(test_fh);
+else
+    test_n = str2double(test_arg);
+    test_u = (1:test_n)'*0.7548776662466927;
+    test_v = (1:test_n)'*0.5698402909980532;
+    test_u = test_u - floor(test_u);
+    test_v = test_v - floor(test_v);
+    test_x = sqrt(0.5.*0.5 + test_u.*(1.0.*1.0 - 0.5.*0.5)).*cos(6.283185307179586.*test_v);
+    test_y = sqrt(0.5.*0.5 + test_u.*(1.0.*1.0 - 0.5.*0.5)).*sin(6.283185307179586.*test_v);
+end
+test_repeats = 5;
+if numel(test_args) >= 2
+    test_repeats = str2double(test_args{2});
+end
+printf("%d points, %d repeats, 1 threads\n", test_n, test_repeats);
+
+% Function uA
+test_res = zeros(2, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = uA(test_x(test_i), test_y(test_i));
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "uA", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function uB
+test_res = zeros(2, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = uB(test_x(test_i), test_y(test_i));
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "uB", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function phiA
+test_res = zeros(1, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = phiA(test_x(test_i), test_y(test_i));
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "phiA", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function phiB
+test_res = zeros(1, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = phiB(test_x(test_i), test_y(test_i));
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "phiB", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function fA
+test_res = zeros(1, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = fA(test_x(test_i), test_y(test_i));
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "fA", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function fB
+test_res = zeros(1, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = fB(test_x(test_i), test_y(test_i));
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "fB", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
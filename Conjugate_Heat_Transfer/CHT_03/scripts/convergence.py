@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | CONVERGENCE
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for convergence studies of numerical solutions on a family
+of meshes (e.g. `quadmesh_1..4.msh`, `triamesh_1..4.msh`). For each mesh level
+the numerical solution is obtained from a solver callback or read from a
+directory of solution files (`<mesh>_<field>.npy` or `<mesh>.npy`), its errors
+are computed with `errors.py` and the characteristic mesh size h with
+`geometry.py`. Observed orders of convergence are computed pairwise between
+consecutive levels and by least-squares fit of log(error) against log(h),
+globally and per subdomain. Results are written as CSV and JSON, and as a
+log-log plot when Matplotlib is available.
+Levels are processed in parallel worker processes, largest mesh first, each
+using the mesh cache and the exact values of `references.py` (memory-mapped
+once stored), so a study takes about as long as its largest level.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+– Matplotlib (optional, for plots)
+
+USAGE:
+------
+python convergence.py ../meshes/triamesh_*.msh --field phi --solutions ../solutions --csv study.csv --plot study.png
+python convergence.py ../meshes/quadmesh_*.msh --field phi --solver mysolver:solve --json study.json
+
+===============================================================================
+"""
+
+# import modules
+import os
+import re
+import csv
+import sys
+import json
+import argparse
+import importlib
+import importlib.util
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from meshes import load_mesh
+from geometry import load_geometry, mesh_size
+from fields import load_bound_case, evaluate_mesh, DEFAULT_ARGUMENTS
+from errors import NORMS, LOCATIONS, ERROR_ORDER, error_norms
+from references import load_reference
+
+#============================================
+# PARAMETERS
+#============================================
+
+# level number in mesh file names (e.g. triamesh_3.msh)
+LEVEL_PATTERN = re.compile(r"_(\d+)$")
+
+# characteristic mesh sizes (see `geometry.mesh_size`)
+MESH_SIZES = ["max", "mean", "area"]
+
+#============================================
+# MESH LEVELS AND SOLUTIONS
+#============================================
+
+# level of a mesh file
+def mesh_level(path):
+    """
+    Return the refinement level of a mesh file from its name (e.g. 3 for
+    `triamesh_3.msh`), or None.
+    """
+    match = LEVEL_PATTERN.search(os.path.splitext(os.path.basename(path))[0])
+    return int(match.group(1)) if match else None
+
+# sort mesh files by level
+def sort_levels(paths):
+    """
+    Return the mesh files sorted by refinement level (then by name).
+    """
+    return sorted(paths, key=lambda path: (mesh_level(path) is None, mesh_level(path) or 0, path))
+
+# solver from its name
+def load_solver(spec):
+    """
+    Return a solver from a "module:function" string (or a callable as is).
+    The solver is called as solver(mesh, case, field) and returns the values
+    of the numerical solution at the nodes, cells or Gauss points.
+    """
+    if callable(spec):
+        return spec
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"Expected a solver as 'module:function', got '{spec}'.")
+    return getattr(importlib.import_module(module), name)
+
+# reference solver
+def centroid_solver(mesh, case, field):
+    """
+    Return the exact values at the cell centroids, a second-order
+    approximation of the cell averages used to check the study itself.
+    """
+    return evaluate_mesh(case, field, mesh)
+
+# solution file of a mesh
+def solution_file(soldir, path, field):
+    """
+    Return the solution file of a mesh in a directory: `<mesh>_<field>.npy`
+    or, failing that, `<mesh>.npy`.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for name in (f"{stem}_{field}.npy", f"{stem}.npy"):
+        if os.path.isfile(os.path.join(soldir, name)):
+            return os.path.join(soldir, name)
+    raise FileNotFoundError(f"No solution of '{field}' for {stem} in {soldir}")
+
+#============================================
+# STUDY
+#============================================
+
+# errors on one mesh level
+def study_level(path, field, codes_dir="../codes", solver=None, soldir=None, location=None,
+                order=ERROR_ORDER, size="area", params=None):
+    """
+    Return the errors of the numerical solution on one mesh: mesh name,
+    level, numbers of nodes and cells, mesh size h, global norms and norms by
+    region tag.
+    """
+    mesh = load_mesh(path)
+    case = load_bound_case(codes_dir, params)
+    if solver is not None:
+        values = load_solver(solver)(mesh, case, field)
+    elif soldir is not None:
+        values = np.load(solution_file(soldir, path, field), mmap_mode="r")
+    else:
+        raise ValueError("A solver or a directory of solution files is required.")
+    reference = load_reference(mesh, case, field, order)
+    norms = error_norms(mesh, values, reference, location)
+    return {
+        "mesh": os.path.basename(path), "level": mesh_level(path),
+        "nodes": len(mesh["nodes"]), "cells": len(mesh["cells"]),
+        "h": mesh_size(load_geometry(mesh), size),
+        "norms": {norm: norms[norm] for norm in NORMS},
+        "regions": {str(tag): value for tag, value in norms["regions"].items()},
+    }
+
+# observed orders of convergence
+def observed_orders(h, errors):
+    """
+    Return the observed orders of convergence of errors against mesh sizes:
+    pairwise between consecutive levels (None for the first level) and by
+    least-squares fit of log(error) against log(h). Missing or zero errors
+    give None.
+    """
+    h = np.asarray(h, dtype=np.float64)
+    e = np.array([np.nan if value is None else value for value in errors], dtype=np.float64)
+    valid = np.isfinite(e) & (e > 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pairwise = np.log(e[:-1]/e[1:])/np.log(h[:-1]/h[1:])
+    pairwise = [None] + [float(p) if valid[i] and valid[i + 1] and np.isfinite(p) else None
+                         for i, p in enumerate(pairwise)]
+    fit = None
+    if np.count_nonzero(valid) >= 2:
+        fit = float(np.polyfit(np.log(h[valid]), np.log(e[valid]), 1)[0])
+    return {"pairwise": pairwise, "fit": fit}
+
+# convergence study
+def convergence_study(paths, field, codes_dir="../codes", solver=None, soldir=None, location=None,
+                      order=ERROR_ORDER, size="area", workers=None, params=None):
+    """
+    Return the convergence study of a field on a family of meshes: the errors
+    of each level (see `study_level`) and the observed orders of each norm,
+    globally and by region tag. Levels are processed by `workers` processes
+    (all processors by default, serially for 1), largest mesh first.
+    """
+    paths = sort_levels(paths)
+    args = (field, codes_dir, solver, soldir, location, order, size, params)
+    if workers == 1 or len(paths) == 1:
+        levels = [study_level(path, *args) for path in paths]
+    else:
+        # submit the largest meshes first, so that the smaller ones run alongside them
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {path: pool.submit(study_level, path, *args)
+                       for path in sorted(paths, key=os.path.getsize, reverse=True)}
+            levels = [futures[path].result() for path in paths]
+    h = [level["h"] for level in levels]
+    orders = {norm: observed_orders(h, [level["norms"][norm] for level in levels]) for norm in NORMS}
+    regions = {tag: {norm: observed_orders(h, [level["regions"][tag][norm] for level in levels])
+                     for norm in NORMS} for tag in levels[0]["regions"]} if levels else {}
+    return {"field": field, "location": location, "order": order, "size": size,
+            "levels": levels, "orders": orders, "region_orders": regions}
+
+#============================================
+# OUTPUT
+#============================================
+
+# write study as CSV
+def write_csv(path, study):
+    """
+    Write a convergence study as CSV, one row per level with the global
+    norms, their pairwise orders, and the norms by region tag.
+    """
+    norms = [norm for norm in NORMS if study["orders"][norm]["fit"] is not None]
+    tags = list(study["levels"][0]["regions"]) if study["levels"] else []
+    header = ["mesh", "level", "nodes", "cells", "h"] + norms + [f"order_{norm}" for norm in norms]
+    header += [f"{norm}_{tag}" for tag in tags for norm in norms]
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        for i, level in enumerate(study["levels"]):
+            row = [level["mesh"], level["level"], level["nodes"], level["cells"], f"{level['h']:.16e}"]
+            row += [f"{level['norms'][norm]:.16e}" for norm in norms]
+            row += ["" if study["orders"][norm]["pairwise"][i] is None
+                    else f"{study['orders'][norm]['pairwise'][i]:.4f}" for norm in norms]
+            row += [f"{level['regions'][tag][norm]:.16e}" for tag in tags for norm in norms]
+            writer.writerow(row)
+
+# write study as JSON
+def write_json(path, study):
+    """
+    Write a convergence study as JSON.
+    """
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(study, fh, indent=2)
+
+# plot study
+def plot_study(path, study):
+    """
+    Plot the errors of a convergence study against the mesh size on log-log
+    axes, with the fitted orders in the legend. Requires Matplotlib.
+    """
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise ImportError("Matplotlib is required for plotting convergence studies.") from None
+    h = np.array([level["h"] for level in study["levels"]])
+    fig, ax = plt.subplots(figsize=(5.0, 4.0))
+    for norm in NORMS:
+        fit = study["orders"][norm]["fit"]
+        if fit is None:
+            continue
+        errors = [level["norms"][norm] for level in study["levels"]]
+        ax.loglog(h, errors, "o-", label=f"{norm} (order {fit:.2f})")
+    ax.set_xlabel("h")
+    ax.set_ylabel(f"error of {study['field']}")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+# print study
+def print_study(study):
+    """
+    Print the errors and observed orders of a convergence study as a table.
+    """
+    norms = [norm for norm in NORMS if study["orders"][norm]["fit"] is not None]
+    print(f"{'mesh':>16s} {'cells':>9s} {'h':>10s}" + "".join(f"{norm:>12s} {'order':>6s}" for norm in norms))
+    for i, level in enumerate(study["levels"]):
+        line = f"{level['mesh']:>16s} {level['cells']:9d} {level['h']:10.3e}"
+        for norm in norms:
+            p = study["orders"][norm]["pairwise"][i]
+            line += f"{level['norms'][norm]:12.4e} " + (f"{p:6.2f}" if p is not None else f"{'-':>6s}")
+        print(line)
+    print(f"{'fit':>37s}" + "".join(f"{'':12s} {study['orders'][norm]['fit']:6.2f}" for norm in norms))
+
+#============================================
+# MAIN
+#============================================
+
+# run convergence studies from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convergence study of numerical solutions on a mesh family.")
+    parser.add_argument("files", nargs="+", help="mesh files in MSH format (one per level)")
+    parser.add_argument("--field", required=True, help="exact field (e.g. phi, u, p)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--solver", help="solver as module:function, called as solver(mesh, case, field)")
+    source.add_argument("--solutions", help="directory of solution files (<mesh>_<field>.npy or <mesh>.npy)")
+    parser.add_argument("--location", choices=LOCATIONS, help="location of the values (default: from their number)")
+    parser.add_argument("--order", type=int, default=ERROR_ORDER, help="quadrature order")
+    parser.add_argument("--size", choices=MESH_SIZES, default="area", help="characteristic mesh size")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all processors)")
+    parser.add_argument("--time", type=float, help="time of unsteady cases (argument `t` of the functions, "
+                        f"default {DEFAULT_ARGUMENTS['t']})")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    parser.add_argument("--csv", help="write the study to this CSV file")
+    parser.add_argument("--json", help="write the study to this JSON file")
+    parser.add_argument("--plot", help="plot the study to this image file (requires Matplotlib)")
+    args = parser.parse_args(argv)
+    if args.plot and importlib.util.find_spec("matplotlib") is None:
+        parser.error("--plot requires Matplotlib")
+    params = {"t": args.time} if args.time is not None else None
+    try:
+        params = load_bound_case(args.codes, params)["params"]
+    except ValueError as e:
+        parser.error(str(e))
+    study = convergence_study(args.files, args.field, args.codes, args.solver, args.solutions, args.location,
+                              args.order, args.size, args.workers, params)
+    print_study(study)
+    for path, writer in ((args.csv, write_csv), (args.json, write_json), (args.plot, plot_study)):
+        if path:
+            writer(path, study)
+            print("Wrote", path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
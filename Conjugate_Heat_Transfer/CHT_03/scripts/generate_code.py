@@ -214,6 +214,9 @@ funcs_list = [("uA", uA, args_list, params_list),("uB", uB, args_list, params_li
                 ("phiA", phiA, args_list, paramsA_list), ("phiB", phiB, args_list, paramsB_list), \
                 ("fA", fA, args_list, paramsA_list), ("fB", fB, args_list, paramsB_list)]
 
+# test domain (random test points)
+domain = ("annulus", rB, rA)
+
 # generate code
 outdir = "../codes"
 name = "cht_03"
@@ -222,10 +225,11 @@ write_cpp_file(outdir, name, consts_list, funcs_list)
 write_fortran_file(outdir, name, consts_list, funcs_list)
 write_octave_file(outdir, name, consts_list, funcs_list)
 write_python_file(outdir, name, consts_list, funcs_list)
-write_cpp_test(outdir, name)
-write_fortran_test(outdir, name)
-write_octave_test(outdir, name)
-write_python_test(outdir, name)
+write_factors_file(outdir, name, consts_list, funcs_list)
+write_cpp_test(outdir, name, funcs_list, domain)
+write_fortran_test(outdir, name, funcs_list, domain)
+write_octave_test(outdir, name, funcs_list, domain)
+write_python_test(outdir, name, funcs_list, domain)
 print("\nGeneration complete.")
 
 # end of file
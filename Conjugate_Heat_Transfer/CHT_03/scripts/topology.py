@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | TOPOLOGY
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for building the connectivity of meshes loaded with
+`meshes.py`: faces (edges), face-to-cell, cell-to-face, cell-to-cell and
+node-to-cell tables. Faces are deduplicated by sorting integer keys of their
+node pairs, so the cost grows with the mesh size without Python loops.
+Variable-length tables are stored in CSR form (`<name>_ptr`, `<name>`).
+
+Faces are tagged with the physical line tags of the mesh: tags below 100
+mark boundaries and interfaces (1, 2, 3, ...), tags 100 and above mark
+subdomain lines and are ignored; untagged faces have tag 0.
+For meshes of two subdomains with matching nodes on the interface (Physical
+Line 2 between Physical Surfaces 100 and 200), the interface coupling is
+precomputed and cached: interface faces with their A-side and B-side cells,
+shared nodes in angular order, and the duplicated-node numbering used when
+the mesh is split into the two regions.
+For rectangular domains with periodic boundaries (INSE_01), the periodic
+master/slave pairs of nodes and faces (left/right and bottom/top) are built
+by sorting the boundary coordinates and matching them within a tolerance.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+import meshes, topology
+mesh = meshes.load_mesh("../meshes/quadmesh_1.msh")
+topo = topology.load_topology(mesh)
+
+===============================================================================
+"""
+
+# import modules
+import numpy as np
+from meshes import cached_stage
+
+#============================================
+# PARAMETERS
+#============================================
+
+# first physical tag of subdomain entities
+SUBDOMAIN_TAG = 100
+
+# topology arrays
+TOPOLOGY_KEYS = ["faces", "face_cells", "face_tags", "cell_faces_ptr", "cell_faces",
+                 "cell_cells_ptr", "cell_cells", "node_cells_ptr", "node_cells"]
+
+# physical tags of the interface and of its two sides
+INTERFACE_TAG = 2
+SIDE_TAGS = (100, 200)
+
+# interface arrays
+INTERFACE_KEYS = ["interface_faces", "interface_face_cells", "interface_nodes",
+                  "interface_twins", "split_cells"]
+
+# periodic arrays
+PERIODIC_KEYS = ["periodic_nodes", "periodic_node_dirs", "periodic_faces",
+                 "periodic_face_dirs", "periodic_master"]
+
+# relative tolerance of periodic coordinate matching
+PERIODIC_TOL = 1e-8
+
+#============================================
+# CSR HELPERS
+#============================================
+
+# build CSR pointer from counts
+def csr_pointer(counts):
+    """
+    Return the CSR pointer array (int64) of rows with the given lengths.
+    """
+    ptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=ptr[1:])
+    return ptr
+
+# invert a mapping into CSR form
+def csr_invert(rows, cols, nrows):
+    """
+    Group the entries `cols` by `rows` (values in [0, nrows)) in CSR form.
+    Entries keep their original order within each row.
+    """
+    order = np.argsort(rows, kind="stable")
+    ptr = csr_pointer(np.bincount(rows, minlength=nrows))
+    return ptr, cols[order].astype(np.int32)
+
+# edge keys
+def edge_keys(edges, nn):
+    """
+    Return an int64 key per edge that does not depend on the node order.
+    """
+    edges = np.asarray(edges, dtype=np.int64)
+    return np.minimum(edges[:, 0], edges[:, 1])*nn + np.maximum(edges[:, 0], edges[:, 1])
+
+#============================================
+# BUILD TOPOLOGY
+#============================================
+
+# build mesh topology
+def build_topology(mesh):
+    """
+    Build the face and adjacency tables of a mesh:
+      faces            (nf, 2) int32   face nodes, oriented as in the owner cell
+      face_cells       (nf, 2) int32   owner and neighbour cells (-1 on boundaries)
+      face_tags        (nf,)   int32   physical tag of the face (0 if untagged)
+      cell_faces_ptr   (nc+1,) int64   CSR pointer of cell-to-face table
+      cell_faces       (nc*k,) int32   faces of each cell, in local edge order
+      cell_cells_ptr   (nc+1,) int64   CSR pointer of cell-to-cell table
+      cell_cells       (m,)    int32   neighbours of each cell, in local edge order
+      node_cells_ptr   (nn+1,) int64   CSR pointer of node-to-cell table
+      node_cells       (nc*k,) int32   cells sharing each node
+    The owner of a face is the lowest-numbered cell containing it.
+    """
+    cells = np.asarray(mesh["cells"], dtype=np.int64)
+    nn = len(mesh["nodes"])
+    nc, k = cells.shape
+    # half-edges (cell-local edges) in cell-major order
+    half = np.stack((cells, np.roll(cells, -1, axis=1)), axis=-1).reshape(-1, 2)
+    keys = edge_keys(half, nn)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    face_of_sorted = np.cumsum(first) - 1
+    nf = int(face_of_sorted[-1]) + 1 if len(keys) else 0
+    counts = np.bincount(face_of_sorted, minlength=nf)
+    if np.any(counts > 2):
+        raise ValueError("Non-manifold mesh: faces shared by more than two cells.")
+    # face-to-cell table
+    half_cell = np.repeat(np.arange(nc), k)
+    face_cells = np.full((nf, 2), -1, dtype=np.int32)
+    face_cells[:, 0] = half_cell[order[first]]
+    second = ~first
+    face_cells[face_of_sorted[second], 1] = half_cell[order[second]]
+    faces = half[order[first]].astype(np.int32)
+    # cell-to-face table
+    cell_faces = np.empty(len(keys), dtype=np.int32)
+    cell_faces[order] = face_of_sorted
+    cell_faces_ptr = np.arange(0, nc*k + 1, k, dtype=np.int64)
+    # cell-to-cell table
+    fc = face_cells[cell_faces].reshape(nc, k, 2)
+    nbr = np.where(fc[:, :, 0] == np.arange(nc)[:, None], fc[:, :, 1], fc[:, :, 0])
+    mask = nbr >= 0
+    cell_cells_ptr = csr_pointer(mask.sum(axis=1))
+    cell_cells = nbr[mask].astype(np.int32)
+    # node-to-cell table
+    node_cells_ptr, node_cells = csr_invert(cells.ravel(), half_cell, nn)
+    # face tags from physical lines
+    face_tags = np.zeros(nf, dtype=np.int32)
+    lines = np.asarray(mesh["lines"])
+    line_tags = np.asarray(mesh["line_tags"])
+    select = line_tags < SUBDOMAIN_TAG
+    if np.any(select):
+        line_keys = edge_keys(lines[select], nn)
+        face_keys = sorted_keys[first]
+        pos = np.searchsorted(face_keys, line_keys)
+        pos = np.minimum(pos, nf - 1)
+        found = face_keys[pos] == line_keys
+        face_tags[pos[found]] = line_tags[select][found]
+    return {
+        "faces": faces,
+        "face_cells": face_cells,
+        "face_tags": face_tags,
+        "cell_faces_ptr": cell_faces_ptr,
+        "cell_faces": cell_faces,
+        "cell_cells_ptr": cell_cells_ptr,
+        "cell_cells": cell_cells,
+        "node_cells_ptr": node_cells_ptr,
+        "node_cells": node_cells,
+    }
+
+# load mesh topology
+def load_topology(mesh):
+    """
+    Return the topology arrays of a mesh, reading them from the mesh cache
+    when available and building (and caching) them otherwise.
+    """
+    return cached_stage(mesh, TOPOLOGY_KEYS, build_topology)
+
+#============================================
+# FACE SELECTION
+#============================================
+
+# boundary faces
+def boundary_faces(topo):
+    """
+    Return the indices of faces with a single adjacent cell.
+    """
+    return np.flatnonzero(topo["face_cells"][:, 1] < 0)
+
+# interface faces
+def interface_faces(topo, tag=2):
+    """
+    Return the indices of faces with two adjacent cells and the given tag.
+    """
+    return np.flatnonzero((topo["face_cells"][:, 1] >= 0) & (topo["face_tags"] == tag))
+
+# faces with tag
+def tagged_faces(topo, tag):
+    """
+    Return the indices of faces with the given physical tag.
+    """
+    return np.flatnonzero(topo["face_tags"] == tag)
+
+#============================================
+# INTERFACE COUPLING
+#============================================
+
+# build interface coupling
+def build_interface(mesh):
+    """
+    Build the coupling arrays of the interface between two subdomains with
+    matching nodes:
+      interface_faces       (ni,)    int32  interface faces in angular order
+      interface_face_cells  (ni, 2)  int32  A-side (tag 100) and B-side (tag 200) cells
+      interface_nodes       (nin,)   int32  interface nodes in angular order
+      interface_twins       (nin, 2) int32  A-side and B-side numbers of each interface
+                                            node in the split mesh (B copies numbered
+                                            from nn)
+      split_cells           (nc, k)  int32  cells of the split mesh, where B-side cells
+                                            use the B copies of the interface nodes
+    """
+    topo = load_topology(mesh)
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    cell_tags = np.asarray(mesh["cell_tags"])
+    face_cells = np.asarray(topo["face_cells"])
+    if not np.all(np.isin(SIDE_TAGS, cell_tags)):
+        raise ValueError("Mesh has no interface: cells of subdomains 100 and 200 are required.")
+    faces = interface_faces(topo, INTERFACE_TAG)
+    if len(faces) == 0 and len(tagged_faces(topo, INTERFACE_TAG)):
+        raise ValueError("Interface faces are not shared by two cells (non-matching interface nodes).")
+    # sides of each face
+    fc = face_cells[faces]
+    swap = cell_tags[fc[:, 0]] != SIDE_TAGS[0]
+    fc[swap] = fc[swap, ::-1]
+    if np.any(cell_tags[fc[:, 0]] != SIDE_TAGS[0]) or np.any(cell_tags[fc[:, 1]] != SIDE_TAGS[1]):
+        raise ValueError("Interface faces do not separate the subdomains 100 and 200.")
+    # angular order of faces and nodes
+    fn = np.asarray(topo["faces"])[faces]
+    mid = nodes[fn].mean(axis=1)
+    order = np.argsort(np.arctan2(mid[:, 1], mid[:, 0]), kind="stable")
+    faces, fc = faces[order], fc[order]
+    inodes = np.unique(fn)
+    inodes = inodes[np.argsort(np.arctan2(nodes[inodes, 1], nodes[inodes, 0]), kind="stable")]
+    # duplicated interface nodes of the B side
+    nn = len(nodes)
+    twin = np.arange(nn, dtype=np.int64)
+    twin[inodes] = nn + np.arange(len(inodes))
+    split = cells.astype(np.int64)
+    side_b = cell_tags == SIDE_TAGS[1]
+    split[side_b] = twin[split[side_b]]
+    return {
+        "interface_faces": faces.astype(np.int32),
+        "interface_face_cells": fc.astype(np.int32),
+        "interface_nodes": inodes.astype(np.int32),
+        "interface_twins": np.column_stack((inodes, twin[inodes])).astype(np.int32),
+        "split_cells": split.astype(np.int32),
+    }
+
+# load interface coupling
+def load_interface(mesh):
+    """
+    Return the interface coupling arrays of a mesh, reading them from the mesh
+    cache when available and building (and caching) them otherwise.
+    """
+    return cached_stage(mesh, INTERFACE_KEYS, build_interface)
+
+# split nodes
+def split_nodes(mesh, interface=None):
+    """
+    Return the node coordinates of the split mesh: the mesh nodes followed by
+    the B-side copies of the interface nodes.
+    """
+    if interface is None:
+        interface = load_interface(mesh)
+    nodes = np.asarray(mesh["nodes"])
+    return np.concatenate((nodes, nodes[np.asarray(interface["interface_nodes"])]))
+
+#============================================
+# PERIODIC PAIRING
+#============================================
+
+# match two sets of coordinates
+def match_sorted(master, slave, tol):
+    """
+    Match the entries of two sets of coordinates along a boundary by sorting
+    them, and return the pairs of indices (master, slave).
+    """
+    if len(master) != len(slave):
+        raise ValueError(f"Periodic boundaries do not match: {len(master)} and {len(slave)} entities.")
+    im = np.argsort(master, kind="stable")
+    js = np.argsort(slave, kind="stable")
+    if len(im) and np.max(np.abs(master[im] - slave[js])) > tol:
+        raise ValueError("Periodic boundaries do not match: coordinates differ beyond tolerance.")
+    return np.column_stack((im, js))
+
+# build periodic pairing
+def build_periodic(mesh):
+    """
+    Build the periodic pairing of the left/right (x) and bottom/top (y) sides
+    of a rectangular mesh:
+      periodic_nodes      (m, 2)  int32  master (left/bottom) and slave (right/top) nodes
+      periodic_node_dirs  (m,)    int8   direction of each node pair (0: x, 1: y)
+      periodic_faces      (p, 2)  int32  master and slave boundary faces
+      periodic_face_dirs  (p,)    int8   direction of each face pair (0: x, 1: y)
+      periodic_master     (nn,)   int32  final master of each node (itself if not a slave;
+                                         the corners map to the node at the origin corner)
+    """
+    topo = load_topology(mesh)
+    nodes = np.asarray(mesh["nodes"])
+    faces = np.asarray(topo["faces"])
+    bfaces = boundary_faces(topo)
+    bnodes = np.unique(faces[bfaces])
+    lo = nodes.min(axis=0)
+    hi = nodes.max(axis=0)
+    tol = PERIODIC_TOL*np.max(hi - lo)
+    mid = nodes[faces[bfaces]].mean(axis=1)
+    node_pairs, node_dirs, face_pairs, face_dirs = [], [], [], []
+    for d in range(2):
+        # nodes and faces on the two sides normal to direction d
+        other = 1 - d
+        left = bnodes[np.abs(nodes[bnodes, d] - lo[d]) <= tol]
+        right = bnodes[np.abs(nodes[bnodes, d] - hi[d]) <= tol]
+        pairs = match_sorted(nodes[left, other], nodes[right, other], tol)
+        node_pairs.append(np.column_stack((left[pairs[:, 0]], right[pairs[:, 1]])))
+        node_dirs.append(np.full(len(pairs), d))
+        fleft = bfaces[np.abs(mid[:, d] - lo[d]) <= tol]
+        fright = bfaces[np.abs(mid[:, d] - hi[d]) <= tol]
+        pairs = match_sorted(mid[np.searchsorted(bfaces, fleft), other],
+                             mid[np.searchsorted(bfaces, fright), other], tol)
+        face_pairs.append(np.column_stack((fleft[pairs[:, 0]], fright[pairs[:, 1]])))
+        face_dirs.append(np.full(len(pairs), d))
+    node_pairs = np.concatenate(node_pairs)
+    # resolve chains of pairs (corners are slaves in both directions)
+    master = np.arange(len(nodes), dtype=np.int64)
+    master[node_pairs[:, 1]] = node_pairs[:, 0]
+    while np.any(master[master] != master):
+        master = master[master]
+    return {
+        "periodic_nodes": node_pairs.astype(np.int32),
+        "periodic_node_dirs": np.concatenate(node_dirs).astype(np.int8),
+        "periodic_faces": np.concatenate(face_pairs).astype(np.int32),
+        "periodic_face_dirs": np.concatenate(face_dirs).astype(np.int8),
+        "periodic_master": master.astype(np.int32),
+    }
+
+# load periodic pairing
+def load_periodic(mesh):
+    """
+    Return the periodic pairing arrays of a mesh, reading them from the mesh
+    cache when available and building (and caching) them otherwise.
+    """
+    return cached_stage(mesh, PERIODIC_KEYS, build_periodic)
+
+# end of file
@@ -10,6 +10,7 @@ global alphaA = 2.0;
 global alphaB = 1.0;
 global wA = 1.0;
 global wB = -1.0;
+global h = 1.0;
 
 % Function RAB
 function res = RAB(x, y)
@@ -22,6 +23,7 @@ function res = RAB(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     res = rAB.*(betaAB_1.*cos(betaAB_2.*theta) + 1);
@@ -38,6 +40,7 @@ function res = nAB(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     res = zeros(2,1);
@@ -64,6 +67,7 @@ function res = uA(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     res = zeros(2,1);
@@ -86,6 +90,7 @@ function res = uB(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     res = zeros(2,1);
@@ -108,6 +113,7 @@ function res = phiA(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     aA = alphaB.*h.*rAB./(alphaA.*alphaB + alphaA.*h.*rAB.*log(rAB) - alphaA.*h.*rAB.*log(rB) + alphaB. ...
@@ -117,10 +123,10 @@ function res = phiA(x, y)
         *rAB.*log(rA) - alphaB.*h.*rAB.*log(rAB));
     res = aA.*log((betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
         *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bA;
+        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bA;
 end
 
 % Function phiB
@@ -134,6 +140,7 @@ function res = phiB(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     aB = alphaA.*h.*rAB./(alphaA.*alphaB + alphaA.*h.*rAB.*log(rAB) - alphaA.*h.*rAB.*log(rB) + alphaB. ...
@@ -142,10 +149,10 @@ function res = phiB(x, y)
         *log(rB) + alphaB.*h.*rAB.*log(rA) - alphaB.*h.*rAB.*log(rAB));
     res = aB.*log((betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
         *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bB;
+        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)) + bB;
 end
 
 % Function fA
@@ -159,6 +166,7 @@ function res = fA(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     aA = alphaB.*h.*rAB./(alphaA.*alphaB + alphaA.*h.*rAB.*log(rAB) - alphaA.*h.*rAB.*log(rB) + alphaB. ...
@@ -167,176 +175,183 @@ function res = fA(x, y)
         *log(rAB))./(alphaA.*alphaB + alphaA.*h.*rAB.*log(rAB) - alphaA.*h.*rAB.*log(rB) + alphaB.*h. ...
         *rAB.*log(rA) - alphaB.*h.*rAB.*log(rAB));
     res = -alphaA.*((-2*aA.*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta)./(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aA.*r.*(-betaAB_1.^2.*rAB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
+        *r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r. ...
+        *rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aA.*r.*(-betaAB_1.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 + 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1. ...
         *rAB.^2.*cos(betaAB_2.*theta) + rA.*rAB - rA.*rB - rAB.^2 + rAB.*rB).*(betaAB_1.^2. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB). ...
-        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aA. ...
-        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
-        *rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r ...
-        + (aA.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB. ...
+        *rB).^2 + aA.*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
+        *rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB))./r + (aA.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) ...
+        + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB. ...
+        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
+        *sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)). ...
+        *(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aA. ...
-        *((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
-        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) ...
+        + aA.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2. ...
+        *rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aA.*((2*betaAB_1.^2. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA. ...
-        *rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4*betaAB_1.^2.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rA.*rAB. ...
-        *sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - 2 ...
-        *betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta)).*(-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2. ...
-        *r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aA.*((2 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2 ...
+        *betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2. ...
+        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2. ...
+        *rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
         *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
         *betaAB_2.^2.*rAB.^2.*sin(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*betaAB_2.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 - betaAB_1.*betaAB_2.^2.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB.*rB. ...
-        *cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
-        *r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) ...
-        - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r. ...
-        *rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (2*betaAB_1.^2. ...
-        *betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*betaAB_2.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1.*betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1. ...
-        *betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aA.*betaAB_1.^4. ...
-        *betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aA. ...
-        *betaAB_1.^4.*betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^3 - 2*aA.*betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 + 2*aA.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 3*aA.*betaAB_1.^3.*betaAB_2.*r.^2. ...
-        *rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2. ...
-        *r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3. ...
+        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB. ...
+        *rB.*cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (2*betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2 ...
+        *betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1. ...
+        *betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(betaAB_1.^2. ...
+        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
+        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) ...
+        - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB ...
+        + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aA.*betaAB_1.^4.*betaAB_2.*r.^2. ...
+        *rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aA.*betaAB_1.^4. ...
+        *betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - 2*aA. ...
+        *betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta).^2 + 2*aA.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta).^2 + 3*aA.*betaAB_1.^3.*betaAB_2.*r.^2.*rAB.^4.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.^2. ...
+        *rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3. ...
         *betaAB_2.*r.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - 3*aA. ...
         *betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^2 + aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wA.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.*rAB.^3.*rB.*wA. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3.*betaAB_2.*rA.*rAB.^3. ...
-        *rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - 2*aA.*betaAB_1.^2.*betaAB_2. ...
-        *r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 2*aA.*betaAB_1.^2. ...
-        *betaAB_2.*r.^3.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aA. ...
-        *betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) - aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + 3*aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta) - 3*aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aA.*betaAB_1.^2.*betaAB_2.*r.*rA.^2. ...
-        *rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aA.*betaAB_1.^2.*betaAB_2.*r. ...
-        *rA.^2.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aA.*betaAB_1.^2. ...
-        *betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aA. ...
-        *betaAB_1.^2.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta) + 2*aA. ...
-        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1. ...
-        *betaAB_2.*r.^2.*rA.*rAB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2. ...
-        *rA.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.*rB. ...
+        *theta).^2 + aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^3.*betaAB_2.*r. ...
+        *rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aA.*betaAB_1.^3. ...
+        *betaAB_2.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - 2 ...
+        *aA.*betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^3.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + 2*aA.*betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) + aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aA.*betaAB_1.^2.*betaAB_2.*r.^2.*rA. ...
+        *rAB.^2.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aA.*betaAB_1.^2. ...
+        *betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aA. ...
+        *betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + aA.*betaAB_1.^2.*betaAB_2.*r.*rA.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) - aA.*betaAB_1.^2.*betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wA. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aA.*betaAB_1.^2.*betaAB_2.*r.*rA. ...
+        *rAB.^4.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aA.*betaAB_1.^2. ...
+        *betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aA. ...
+        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta) + 2*aA.*betaAB_1. ...
+        *betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2. ...
+        *r.^2.*rA.*rAB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA. ...
+        *rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.*rB. ...
         *wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^4.*wA.*sin(betaAB_2. ...
-        *theta) - 2*aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) - aA. ...
-        *betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2. ...
-        *r.^2.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^2. ...
-        *rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^3.*wA. ...
-        *sin(betaAB_2.*theta) - 2*aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wA. ...
-        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*wA.*sin(betaAB_2. ...
-        *theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA. ...
-        *betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1. ...
-        *betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2.*theta) + 2*aA.*betaAB_1.*betaAB_2.*r.*rA. ...
-        *rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wA. ...
-        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2. ...
-        *theta) - 2*aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA. ...
-        *betaAB_1.*betaAB_2.*r.*rA.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1. ...
-        *betaAB_2.*r.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
-        *rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.^2.*rB.*wA. ...
-        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.*rB.^2.*wA.*sin(betaAB_2. ...
-        *theta) - aA.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) + aA. ...
-        *betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta))./(-betaAB_1.^4.*r. ...
-        *rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2.*rAB.^3.*cos(betaAB_2.*theta).^3 ...
-        + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 - 4*betaAB_1.^3.*r.*rAB.^4. ...
-        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 ...
-        + betaAB_1.^3.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 - betaAB_1.^2.*r.^2.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2.*rAB.^3.*cos(betaAB_2.*theta).^2 ...
-        - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r.*rA. ...
-        *rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*r.*rA.*rAB.^2.*rB.*cos(betaAB_2. ...
-        *theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4.*cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r. ...
-        *rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2. ...
-        *theta).^2 + 2*betaAB_1.^2.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA. ...
-        *rAB.^2.*rB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2.*cos(betaAB_2. ...
-        *theta) + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rAB.^3. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) - betaAB_1.*r. ...
-        *rA.^2.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.^2.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6*betaAB_1.*r.*rA.*rAB.^2. ...
-        *rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2.*cos(betaAB_2.*theta) - 4 ...
-        *betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rAB.^3.*rB.*cos(betaAB_2. ...
-        *theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.^2.*rAB.^2. ...
-        *rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB.*rB.^2.*cos(betaAB_2.*theta) ...
-        + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.^2.*rB.^2. ...
-        *cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r.*rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r. ...
-        *rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r.*rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB ...
-        - r.*rAB.^2.*rB.^2);
+        *theta) - 2*aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) ...
+        - aA.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2. ...
+        *r.^2.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2. ...
+        *rAB.^3.*wA.*sin(betaAB_2.*theta) - 2*aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*rB. ...
+        *wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.^2.*wA. ...
+        *sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.^2.*wA. ...
+        *sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.*wA. ...
+        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^4.*wA.*sin(betaAB_2. ...
+        *theta) + 2*aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2.*theta) ...
+        + aA.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wA.*sin(betaAB_2.*theta) - aA.*betaAB_1. ...
+        *betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta) - 2*aA.*betaAB_1. ...
+        *betaAB_2.*r.*rA.*rAB.^2.*rB.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r. ...
+        *rA.*rAB.*rB.^2.*wA.*sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB. ...
+        *wA.*sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*r.*rAB.^2.*rB.^2.*wA. ...
+        *sin(betaAB_2.*theta) + aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.^2.*rB.*wA. ...
+        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*rA.^2.*rAB.*rB.^2.*wA. ...
+        *sin(betaAB_2.*theta) - aA.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wA.*sin(betaAB_2. ...
+        *theta) + aA.*betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wA.*sin(betaAB_2.*theta))./( ...
+        -betaAB_1.^4.*r.*rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 - 4 ...
+        *betaAB_1.^3.*r.*rAB.^4.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB. ...
+        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 ...
+        - betaAB_1.^2.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2. ...
+        *rAB.^3.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2. ...
+        *theta).^2 + 4*betaAB_1.^2.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2. ...
+        *r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4. ...
+        *cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.^2.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*rA. ...
+        *rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.*rAB.^2.*rB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta) ...
+        + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*r.*rA.^2.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.^2.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6 ...
+        *betaAB_1.*r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2. ...
+        *cos(betaAB_2.*theta) - 4*betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1. ...
+        *r.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB. ...
+        *rB.^2.*cos(betaAB_2.*theta) + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rA.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r. ...
+        *rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r.*rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r. ...
+        *rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB - r.*rAB.^2.*rB.^2);
 end
 
 % Function fB
@@ -350,6 +365,7 @@ function res = fB(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     aB = alphaA.*h.*rAB./(alphaA.*alphaB + alphaA.*h.*rAB.*log(rAB) - alphaA.*h.*rAB.*log(rB) + alphaB. ...
@@ -357,176 +373,183 @@ function res = fB(x, y)
     bB = -alphaA.*h.*rAB.*log(rB)./(alphaA.*alphaB + alphaA.*h.*rAB.*log(rAB) - alphaA.*h.*rAB. ...
         *log(rB) + alphaB.*h.*rAB.*log(rA) - alphaB.*h.*rAB.*log(rAB));
     res = -alphaB.*((-2*aB.*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta)./(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aB.*r.*(-betaAB_1.^2.*rAB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
+        *r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r. ...
+        *rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aB.*r.*(-betaAB_1.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 + 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1. ...
         *rAB.^2.*cos(betaAB_2.*theta) + rA.*rAB - rA.*rB - rAB.^2 + rAB.*rB).*(betaAB_1.^2. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB). ...
-        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aB. ...
-        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
-        *rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r ...
-        + (aB.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB. ...
+        *rB).^2 + aB.*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.*r.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
+        *rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB))./r + (aB.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) ...
+        + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB. ...
+        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
+        *sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)). ...
+        *(-2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        + betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
         *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
-        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) + aB. ...
-        *((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
-        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA. ...
-        *rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.*r.^2.*rAB. ...
-        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) ...
-        + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA. ...
-        *rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB. ...
-        *sin(betaAB_2.*theta)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB) ...
+        + aB.*((2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2. ...
+        *rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
         *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
         *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aB.*((2*betaAB_1.^2. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA. ...
-        *rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) ...
-        - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4*betaAB_1.^2.*betaAB_2.*rAB.^2. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rA.*rAB. ...
-        *sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - 2 ...
-        *betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA. ...
-        *rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1. ...
-        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2. ...
-        *theta)).*(-2*betaAB_1.^2.*betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) + betaAB_1.*betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2. ...
-        *r.*rAB.^2.*sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2. ...
-        *theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB).^2 + aB.*((2 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
+        - betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(4 ...
+        *betaAB_1.^2.*betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2 ...
+        *betaAB_1.*betaAB_2.*rA.*rAB.*sin(betaAB_2.*theta) + 4*betaAB_1.*betaAB_2.*rAB.^2. ...
+        *sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        *(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB. ...
+        *cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA. ...
+        *rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^3 + 2*(2*betaAB_1.^2. ...
+        *betaAB_2.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2. ...
+        *rA.*rAB.*sin(betaAB_2.*theta) + 2*betaAB_1.*betaAB_2.*rAB.^2.*sin(betaAB_2. ...
+        *theta) - betaAB_1.*betaAB_2.*rAB.*rB.*sin(betaAB_2.*theta)).*(-2*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^2.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + betaAB_1. ...
+        *betaAB_2.*r.^2.*rAB.*sin(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.*r.*rAB.^2. ...
+        *sin(betaAB_2.*theta) + betaAB_1.*betaAB_2.*rA.*rAB.*rB.*sin(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
         *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (-2*betaAB_1.^2. ...
         *betaAB_2.^2.*rAB.^2.*sin(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*betaAB_2.^2.*rAB.^2. ...
         *cos(betaAB_2.*theta).^2 - betaAB_1.*betaAB_2.^2.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB.*rB. ...
-        *cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
-        *r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) ...
-        - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r. ...
-        *rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB. ...
-        *cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB).^2 + (2*betaAB_1.^2. ...
-        *betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*betaAB_2.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1.*betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2. ...
-        *theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1. ...
-        *betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta))./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2. ...
-        *theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB ...
-        + rAB.^2 - rAB.*rB)).*(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA. ...
-        *rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB. ...
-        *rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r. ...
-        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2 ...
-        *betaAB_1.*r.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
-        *theta) - r.*rA.*rAB + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aB.*betaAB_1.^4. ...
-        *betaAB_2.*r.^2.*rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aB. ...
-        *betaAB_1.^4.*betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^3 - 2*aB.*betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 3*aB.*betaAB_1.^3.*betaAB_2.*r.^2. ...
-        *rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2*aB.*betaAB_1.^3. ...
-        *betaAB_2.*r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB. ...
-        *betaAB_1.^3.*betaAB_2.*r.^2.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta).^2 + aB.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta).^2 - 3*aB.*betaAB_1.^3.*betaAB_2.*r.*rAB.^4.*rB.*wB. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.*rAB.^3. ...
-        *rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB.*betaAB_1.^3.*betaAB_2.*rA. ...
-        *rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2*aB.*betaAB_1.^2. ...
-        *betaAB_2.*r.^3.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 2*aB. ...
-        *betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) ...
-        - 3*aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) - aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB. ...
-        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aB.*betaAB_1.^2.*betaAB_2.*r.^2. ...
-        *rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aB.*betaAB_1.^2.*betaAB_2. ...
-        *r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3*aB.*betaAB_1.^2. ...
-        *betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aB. ...
-        *betaAB_1.^2.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
-        *theta) - 3*aB.*betaAB_1.^2.*betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta). ...
-        *cos(betaAB_2.*theta) + aB.*betaAB_1.^2.*betaAB_2.*r.*rAB.^3.*rB.^2.*wB.*sin(betaAB_2. ...
-        *theta).*cos(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.^2.*wB. ...
-        *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.*rB.*wB.*sin(betaAB_2. ...
-        *theta) - 2*aB.*betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta) + 2*aB. ...
-        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1. ...
-        *betaAB_2.*r.^2.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2. ...
-        *rA.*rAB.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^4.*wB. ...
+        *betaAB_1.*betaAB_2.^2.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*betaAB_2.^2.*rAB. ...
+        *rB.*cos(betaAB_2.*theta)).*(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB + r.*rA.*rB + r. ...
+        *rAB.^2 - r.*rAB.*rB)./(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1. ...
+        *rA.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB. ...
+        *rB).^2 + (2*betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*sin(betaAB_2.*theta).^2 - 2 ...
+        *betaAB_1.^2.*betaAB_2.^2.*r.*rAB.^2.*cos(betaAB_2.*theta).^2 + betaAB_1. ...
+        *betaAB_2.^2.*r.^2.*rAB.*cos(betaAB_2.*theta) - 2*betaAB_1.*betaAB_2.^2.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) + betaAB_1.*betaAB_2.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta)). ...
+        /(betaAB_1.^2.*rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2. ...
+        *theta) + 2*betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB. ...
+        *cos(betaAB_2.*theta) - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)).*(betaAB_1.^2. ...
+        *rAB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*rA.*rAB.*cos(betaAB_2.*theta) + 2 ...
+        *betaAB_1.*rAB.^2.*cos(betaAB_2.*theta) - betaAB_1.*rAB.*rB.*cos(betaAB_2.*theta) ...
+        - rA.*rAB + rA.*rB + rAB.^2 - rAB.*rB)./(betaAB_1.^2.*r.*rAB.^2.*cos(betaAB_2. ...
+        *theta).^2 - betaAB_1.*r.^2.*rAB.*cos(betaAB_2.*theta) + 2*betaAB_1.*r.*rAB.^2. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - r.*rA.*rAB ...
+        + r.*rA.*rB + r.*rAB.^2 - r.*rAB.*rB))./r.^2) + (aB.*betaAB_1.^4.*betaAB_2.*r.^2. ...
+        *rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - aB.*betaAB_1.^4. ...
+        *betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^3 - 2*aB. ...
+        *betaAB_1.^3.*betaAB_2.*r.^3.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta).^2 + 3*aB.*betaAB_1.^3.*betaAB_2.*r.^2.*rAB.^4.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2*aB.*betaAB_1.^3.*betaAB_2.*r.^2. ...
+        *rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB.*betaAB_1.^3. ...
+        *betaAB_2.*r.^2.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB. ...
+        *betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta).^2 - 3*aB.*betaAB_1.^3.*betaAB_2.*r.*rAB.^4.*rB.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 - aB.*betaAB_1.^3.*betaAB_2.*r. ...
+        *rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + aB.*betaAB_1.^3. ...
+        *betaAB_2.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta).^2 + 2 ...
+        *aB.*betaAB_1.^2.*betaAB_2.*r.^3.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) - 2*aB.*betaAB_1.^2.*betaAB_2.*r.^3.*rAB.^3.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aB.*betaAB_1.^2.*betaAB_2.*r.^2. ...
+        *rA.*rAB.^3.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aB.*betaAB_1.^2. ...
+        *betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + 3 ...
+        *aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^4.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + aB.*betaAB_1.^2.*betaAB_2.*r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta). ...
+        *cos(betaAB_2.*theta) + 3*aB.*betaAB_1.^2.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB. ...
+        *sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - aB.*betaAB_1.^2.*betaAB_2.*r.*rA. ...
+        *rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) - 3*aB.*betaAB_1.^2. ...
+        *betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2.*theta) + aB. ...
+        *betaAB_1.^2.*betaAB_2.*r.*rAB.^3.*rB.^2.*wB.*sin(betaAB_2.*theta).*cos(betaAB_2. ...
+        *theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.^2.*wB.*sin(betaAB_2.*theta) ...
+        - aB.*betaAB_1.*betaAB_2.*r.^2.*rA.^2.*rAB.*rB.*wB.*sin(betaAB_2.*theta) - 2*aB. ...
+        *betaAB_1.*betaAB_2.*r.^2.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta) + 2*aB.*betaAB_1. ...
+        *betaAB_2.*r.^2.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2. ...
+        *r.^2.*rA.*rAB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rA. ...
+        *rAB.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^4.*wB. ...
         *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*rB.*wB.*sin(betaAB_2. ...
         *theta) - aB.*betaAB_1.*betaAB_2.*r.^2.*rAB.^3.*wB.*sin(betaAB_2.*theta) + aB. ...
         *betaAB_1.*betaAB_2.*r.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1. ...
-        *betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r. ...
-        *rA.^2.*rAB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB. ...
-        *rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB.*wB. ...
-        *sin(betaAB_2.*theta) + 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2. ...
-        *theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2.*theta) - 2*aB. ...
-        *betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta) - 2*aB.*betaAB_1. ...
-        *betaAB_2.*r.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA. ...
-        *rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.*rAB.^4.*rB.*wB. ...
-        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB.^2.*wB.*sin(betaAB_2. ...
-        *theta) + aB.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB.*wB.*sin(betaAB_2.*theta) - aB. ...
-        *betaAB_1.*betaAB_2.*r.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1. ...
-        *betaAB_2.*rA.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.^2. ...
-        *rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wB. ...
-        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2. ...
-        *theta))./(-betaAB_1.^4.*r.*rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2. ...
-        *rAB.^3.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 ...
-        - 4*betaAB_1.^3.*r.*rAB.^4.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB. ...
+        *betaAB_2.*r.*rA.^2.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2. ...
+        *r.*rA.^2.*rAB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2. ...
+        *rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.^2.*rAB.*rB. ...
+        *wB.*sin(betaAB_2.*theta) + 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*rB.*wB. ...
+        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^3.*wB.*sin(betaAB_2. ...
+        *theta) - 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta) ...
+        - 2*aB.*betaAB_1.*betaAB_2.*r.*rA.*rAB.^2.*rB.*wB.*sin(betaAB_2.*theta) + aB. ...
+        *betaAB_1.*betaAB_2.*r.*rA.*rAB.*rB.^2.*wB.*sin(betaAB_2.*theta) - aB.*betaAB_1. ...
+        *betaAB_2.*r.*rAB.^4.*rB.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r. ...
+        *rAB.^3.*rB.^2.*wB.*sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*r.*rAB.^3.*rB. ...
+        *wB.*sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*r.*rAB.^2.*rB.^2.*wB. ...
+        *sin(betaAB_2.*theta) + aB.*betaAB_1.*betaAB_2.*rA.^2.*rAB.^2.*rB.*wB. ...
+        *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.^2.*rAB.*rB.^2.*wB. ...
+        *sin(betaAB_2.*theta) - aB.*betaAB_1.*betaAB_2.*rA.*rAB.^3.*rB.*wB.*sin(betaAB_2. ...
+        *theta) + aB.*betaAB_1.*betaAB_2.*rA.*rAB.^2.*rB.^2.*wB.*sin(betaAB_2.*theta))./( ...
+        -betaAB_1.^4.*r.*rAB.^4.*cos(betaAB_2.*theta).^4 + betaAB_1.^3.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^3 - 4 ...
+        *betaAB_1.^3.*r.*rAB.^4.*cos(betaAB_2.*theta).^3 + betaAB_1.^3.*r.*rAB.^3.*rB. ...
         *cos(betaAB_2.*theta).^3 + betaAB_1.^3.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^3 ...
-        - betaAB_1.^2.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2.*rAB.^3. ...
-        *cos(betaAB_2.*theta).^2 - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 4 ...
-        *betaAB_1.^2.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2.*r.*rA.*rAB.^2. ...
-        *rB.*cos(betaAB_2.*theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4.*cos(betaAB_2.*theta).^2 + 4 ...
-        *betaAB_1.^2.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.^2.*rAB.^2.*rB. ...
-        *cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 ...
-        - betaAB_1.^2.*rA.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1. ...
-        *r.^2.*rAB.^3.*cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.^2.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*r.^2. ...
+        *rAB.^3.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*r.^2.*rAB.^2.*rB.*cos(betaAB_2. ...
+        *theta).^2 + 4*betaAB_1.^2.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta).^2 - 2*betaAB_1.^2. ...
+        *r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 - 6*betaAB_1.^2.*r.*rAB.^4. ...
+        *cos(betaAB_2.*theta).^2 + 4*betaAB_1.^2.*r.*rAB.^3.*rB.*cos(betaAB_2.*theta).^2 ...
+        - betaAB_1.^2.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 2*betaAB_1.^2.*rA. ...
+        *rAB.^3.*rB.*cos(betaAB_2.*theta).^2 - betaAB_1.^2.*rA.*rAB.^2.*rB.^2. ...
+        *cos(betaAB_2.*theta).^2 - betaAB_1.*r.^2.*rA.*rAB.^2.*cos(betaAB_2.*theta) ...
+        + betaAB_1.*r.^2.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.^2.*rAB.^3. ...
+        *cos(betaAB_2.*theta) - betaAB_1.*r.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) ...
         - betaAB_1.*r.*rA.^2.*rAB.^2.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.^2.*rAB.*rB. ...
-        *cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6*betaAB_1. ...
-        *r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2.*cos(betaAB_2. ...
-        *theta) - 4*betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rAB.^3.*rB. ...
-        *cos(betaAB_2.*theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - betaAB_1. ...
-        *rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB.*rB.^2.*cos(betaAB_2. ...
-        *theta) + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*rA.*rAB.^2.*rB.^2. ...
-        *cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r.*rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r. ...
-        *rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r.*rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB ...
-        - r.*rAB.^2.*rB.^2);
+        *cos(betaAB_2.*theta) + 5*betaAB_1.*r.*rA.*rAB.^3.*cos(betaAB_2.*theta) - 6 ...
+        *betaAB_1.*r.*rA.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*r.*rA.*rAB.*rB.^2. ...
+        *cos(betaAB_2.*theta) - 4*betaAB_1.*r.*rAB.^4.*cos(betaAB_2.*theta) + 5*betaAB_1. ...
+        *r.*rAB.^3.*rB.*cos(betaAB_2.*theta) - betaAB_1.*r.*rAB.^2.*rB.^2.*cos(betaAB_2. ...
+        *theta) - betaAB_1.*rA.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta) + betaAB_1.*rA.^2.*rAB. ...
+        *rB.^2.*cos(betaAB_2.*theta) + betaAB_1.*rA.*rAB.^3.*rB.*cos(betaAB_2.*theta) ...
+        - betaAB_1.*rA.*rAB.^2.*rB.^2.*cos(betaAB_2.*theta) - r.*rA.^2.*rAB.^2 + 2*r. ...
+        *rA.^2.*rAB.*rB - r.*rA.^2.*rB.^2 + 2*r.*rA.*rAB.^3 - 4*r.*rA.*rAB.^2.*rB + 2*r. ...
+        *rA.*rAB.*rB.^2 - r.*rAB.^4 + 2*r.*rAB.^3.*rB - r.*rAB.^2.*rB.^2);
 end
 
 % Function H
@@ -540,6 +563,7 @@ function res = H(x, y)
     global alphaB;
     global wA;
     global wB;
+    global h;
     r = sqrt(x.^2 + y.^2);
     theta = atan2(y, x);
     aA = alphaB.*h.*rAB./(alphaA.*alphaB + alphaA.*h.*rAB.*log(rAB) - alphaA.*h.*rAB.*log(rB) + alphaB. ...
@@ -563,29 +587,30 @@ function res = H(x, y)
         *sin(betaAB_2.*theta).^2 + betaAB_1.^2.*cos(betaAB_2.*theta).^2 + 2*betaAB_1. ...
         *cos(betaAB_2.*theta) + 1))./(aA.*betaAB_1.^3.*rAB.^3.*log(rAB).*cos(betaAB_2. ...
         *theta).^3 - aA.*betaAB_1.^2.*rA.*rAB.^2.*log(rAB).*cos(betaAB_2.*theta).^2 + 3*aA. ...
-        *betaAB_1.^2.*rAB.^3.*log(rAB).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^2.*rAB.^2.*rB. ...
-        *log(rAB).*cos(betaAB_2.*theta).^2 - 2*aA.*betaAB_1.*rA.*rAB.^2.*log(rAB). ...
-        *cos(betaAB_2.*theta) + aA.*betaAB_1.*rA.*rAB.*rB.*log(rAB).*cos(betaAB_2.*theta) + 3 ...
-        *aA.*betaAB_1.*rAB.^3.*log(rAB).*cos(betaAB_2.*theta) - 2*aA.*betaAB_1.*rAB.^2.*rB. ...
-        *log(rAB).*cos(betaAB_2.*theta) - aA.*rA.*rAB.^2.*log(rAB) + aA.*rA.*rAB.*rB.*log(rAB) ...
-        + aA.*rAB.^3.*log(rAB) - aA.*rAB.^2.*rB.*log(rAB) - aB.*betaAB_1.^3.*rAB.^3.*log(rAB). ...
-        *cos(betaAB_2.*theta).^3 + aB.*betaAB_1.^2.*rA.*rAB.^2.*log(rAB).*cos(betaAB_2. ...
-        *theta).^2 - 3*aB.*betaAB_1.^2.*rAB.^3.*log(rAB).*cos(betaAB_2.*theta).^2 + aB. ...
-        *betaAB_1.^2.*rAB.^2.*rB.*log(rAB).*cos(betaAB_2.*theta).^2 + 2*aB.*betaAB_1.*rA. ...
-        *rAB.^2.*log(rAB).*cos(betaAB_2.*theta) - aB.*betaAB_1.*rA.*rAB.*rB.*log(rAB). ...
-        *cos(betaAB_2.*theta) - 3*aB.*betaAB_1.*rAB.^3.*log(rAB).*cos(betaAB_2.*theta) + 2*aB. ...
-        *betaAB_1.*rAB.^2.*rB.*log(rAB).*cos(betaAB_2.*theta) + aB.*rA.*rAB.^2.*log(rAB) - aB. ...
-        *rA.*rAB.*rB.*log(rAB) - aB.*rAB.^3.*log(rAB) + aB.*rAB.^2.*rB.*log(rAB) + bA. ...
-        *betaAB_1.^3.*rAB.^3.*cos(betaAB_2.*theta).^3 - bA.*betaAB_1.^2.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 + 3*bA.*betaAB_1.^2.*rAB.^3.*cos(betaAB_2.*theta).^2 - bA. ...
-        *betaAB_1.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 - 2*bA.*betaAB_1.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta) + bA.*betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) + 3*bA. ...
-        *betaAB_1.*rAB.^3.*cos(betaAB_2.*theta) - 2*bA.*betaAB_1.*rAB.^2.*rB.*cos(betaAB_2. ...
-        *theta) - bA.*rA.*rAB.^2 + bA.*rA.*rAB.*rB + bA.*rAB.^3 - bA.*rAB.^2.*rB - bB. ...
-        *betaAB_1.^3.*rAB.^3.*cos(betaAB_2.*theta).^3 + bB.*betaAB_1.^2.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta).^2 - 3*bB.*betaAB_1.^2.*rAB.^3.*cos(betaAB_2.*theta).^2 + bB. ...
-        *betaAB_1.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 2*bB.*betaAB_1.*rA.*rAB.^2. ...
-        *cos(betaAB_2.*theta) - bB.*betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2.*theta) - 3*bB. ...
-        *betaAB_1.*rAB.^3.*cos(betaAB_2.*theta) + 2*bB.*betaAB_1.*rAB.^2.*rB.*cos(betaAB_2. ...
-        *theta) + bB.*rA.*rAB.^2 - bB.*rA.*rAB.*rB - bB.*rAB.^3 + bB.*rAB.^2.*rB);
+        *betaAB_1.^2.*rAB.^3.*log(rAB).*cos(betaAB_2.*theta).^2 - aA.*betaAB_1.^2.*rAB.^2. ...
+        *rB.*log(rAB).*cos(betaAB_2.*theta).^2 - 2*aA.*betaAB_1.*rA.*rAB.^2.*log(rAB). ...
+        *cos(betaAB_2.*theta) + aA.*betaAB_1.*rA.*rAB.*rB.*log(rAB).*cos(betaAB_2.*theta) ...
+        + 3*aA.*betaAB_1.*rAB.^3.*log(rAB).*cos(betaAB_2.*theta) - 2*aA.*betaAB_1.*rAB.^2. ...
+        *rB.*log(rAB).*cos(betaAB_2.*theta) - aA.*rA.*rAB.^2.*log(rAB) + aA.*rA.*rAB.*rB. ...
+        *log(rAB) + aA.*rAB.^3.*log(rAB) - aA.*rAB.^2.*rB.*log(rAB) - aB.*betaAB_1.^3. ...
+        *rAB.^3.*log(rAB).*cos(betaAB_2.*theta).^3 + aB.*betaAB_1.^2.*rA.*rAB.^2.*log(rAB). ...
+        *cos(betaAB_2.*theta).^2 - 3*aB.*betaAB_1.^2.*rAB.^3.*log(rAB).*cos(betaAB_2. ...
+        *theta).^2 + aB.*betaAB_1.^2.*rAB.^2.*rB.*log(rAB).*cos(betaAB_2.*theta).^2 + 2*aB. ...
+        *betaAB_1.*rA.*rAB.^2.*log(rAB).*cos(betaAB_2.*theta) - aB.*betaAB_1.*rA.*rAB.*rB. ...
+        *log(rAB).*cos(betaAB_2.*theta) - 3*aB.*betaAB_1.*rAB.^3.*log(rAB).*cos(betaAB_2. ...
+        *theta) + 2*aB.*betaAB_1.*rAB.^2.*rB.*log(rAB).*cos(betaAB_2.*theta) + aB.*rA. ...
+        *rAB.^2.*log(rAB) - aB.*rA.*rAB.*rB.*log(rAB) - aB.*rAB.^3.*log(rAB) + aB.*rAB.^2. ...
+        *rB.*log(rAB) + bA.*betaAB_1.^3.*rAB.^3.*cos(betaAB_2.*theta).^3 - bA.*betaAB_1.^2. ...
+        *rA.*rAB.^2.*cos(betaAB_2.*theta).^2 + 3*bA.*betaAB_1.^2.*rAB.^3.*cos(betaAB_2. ...
+        *theta).^2 - bA.*betaAB_1.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 - 2*bA.*betaAB_1. ...
+        *rA.*rAB.^2.*cos(betaAB_2.*theta) + bA.*betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
+        *theta) + 3*bA.*betaAB_1.*rAB.^3.*cos(betaAB_2.*theta) - 2*bA.*betaAB_1.*rAB.^2. ...
+        *rB.*cos(betaAB_2.*theta) - bA.*rA.*rAB.^2 + bA.*rA.*rAB.*rB + bA.*rAB.^3 - bA. ...
+        *rAB.^2.*rB - bB.*betaAB_1.^3.*rAB.^3.*cos(betaAB_2.*theta).^3 + bB.*betaAB_1.^2. ...
+        *rA.*rAB.^2.*cos(betaAB_2.*theta).^2 - 3*bB.*betaAB_1.^2.*rAB.^3.*cos(betaAB_2. ...
+        *theta).^2 + bB.*betaAB_1.^2.*rAB.^2.*rB.*cos(betaAB_2.*theta).^2 + 2*bB.*betaAB_1. ...
+        *rA.*rAB.^2.*cos(betaAB_2.*theta) - bB.*betaAB_1.*rA.*rAB.*rB.*cos(betaAB_2. ...
+        *theta) - 3*bB.*betaAB_1.*rAB.^3.*cos(betaAB_2.*theta) + 2*bB.*betaAB_1.*rAB.^2. ...
+        *rB.*cos(betaAB_2.*theta) + bB.*rA.*rAB.^2 - bB.*rA.*rAB.*rB - bB.*rAB.^3 + bB. ...
+        *rAB.^2.*rB);
 end
@@ -12,6 +12,7 @@ alphaA = 2.0
 alphaB = 1.0
 wA = 1.0
 wB = -1.0
+h = 1.0
 
 # Function RAB
 def RAB(x, y):
@@ -25,13 +26,13 @@ def nAB(x, y):
     r = math.sqrt(x**2 + y**2)
     theta = math.atan2(y, x)
     res = [0.0]*2
-    res[0] = betaAB_1*betaAB_2*math.sin(theta)*math.sin(betaAB_2*theta)/math.sqrt(betaAB_1**2*betaAB_2* \
-        *2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
+    res[0] = betaAB_1*betaAB_2*math.sin(theta)*math.sin(betaAB_2*theta)/math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
         *math.cos(betaAB_2*theta) + 1) + (-betaAB_1*math.cos(betaAB_2*theta) - 1)*math.cos(theta) \
         /math.sqrt(betaAB_1**2*betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2 \
         *theta)**2 + 2*betaAB_1*math.cos(betaAB_2*theta) + 1)
-    res[1] = -betaAB_1*betaAB_2*math.sin(betaAB_2*theta)*math.cos(theta)/math.sqrt(betaAB_1**2*betaAB_2 \
-        **2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
+    res[1] = -betaAB_1*betaAB_2*math.sin(betaAB_2*theta)*math.cos(theta)/math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
         *math.cos(betaAB_2*theta) + 1) + (-betaAB_1*math.cos(betaAB_2*theta) - 1)*math.sin(theta) \
         /math.sqrt(betaAB_1**2*betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2 \
         *theta)**2 + 2*betaAB_1*math.cos(betaAB_2*theta) + 1)
@@ -73,11 +74,11 @@ def phiA(x, y):
         *math.log(rAB))/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) \
         + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
     res = aA*math.log((betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA \
-        *rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1* \
-        *2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) \
-        - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bA
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bA
     return res
 
 # Function phiB
@@ -89,11 +90,11 @@ def phiB(x, y):
     bB = -alphaA*h*rAB*math.log(rB)/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB \
         *math.log(rB) + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
     res = aB*math.log((betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA \
-        *rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1* \
-        *2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) \
-        - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bB
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) + bB
     return res
 
 # Function fA
@@ -106,175 +107,186 @@ def fA(x, y):
         *math.log(rAB))/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB*math.log(rB) \
         + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
     res = -alphaA*((-2*aA*betaAB_1*r*rAB*math.cos(betaAB_2*theta)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aA*r*(-betaAB_1**2*rAB**2*math.cos(betaAB_2 \
-        *theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2*betaAB_1*rAB**2 \
-        *math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB)*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aA*r*(-betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB) \
+        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 \
+        - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB \
+        + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aA*((2*betaAB_1**2*betaAB_2 \
-        *rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aA*((2*betaAB_1**2 \
+        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
+        *betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2*betaAB_1**2 \
-        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aA*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        /(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        + aA*((2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2 \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2*betaAB_1**2 \
-        *betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
-        *betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) - 2 \
-        *betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *3 + 2*(2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB* \
-        *2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r \
+        *rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) \
+        + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aA*((2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**3 + 2*(2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
         *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2 \
-        *betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2*betaAB_2**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*rAB*rB \
-        *math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2 \
+        *betaAB_2**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2**2*rAB*rB*math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2*betaAB_2**2*r \
+        *rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2 \
+        *theta) - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1 \
+        *betaAB_2**2*rA*rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA \
+        *rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
         *r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB \
-        *rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2 \
-        *betaAB_2**2*r*rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2*theta) \
-        - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2**2*rA \
-        *rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r**2) + (aA*betaAB_1**4*betaAB_2*r**2*rAB**4*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - aA*betaAB_1**4*betaAB_2*r*rA \
-        *rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aA*betaAB_1**3 \
-        *betaAB_2*r**3*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2*aA \
+        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r \
+        *rAB*rB))/r**2) + (aA*betaAB_1**4*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**3 - aA*betaAB_1**4*betaAB_2*r*rA*rAB**4*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aA*betaAB_1**3*betaAB_2 \
+        *r**3*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2*aA \
         *betaAB_1**3*betaAB_2*r**2*rA*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
         *theta)**2 + 3*aA*betaAB_1**3*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta) \
         *math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r**2*rAB**3*rB*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3*betaAB_2*r**2 \
-        *rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 3*aA*betaAB_1**3 \
-        *betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA \
-        *betaAB_1**3*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta)**2 - aA*betaAB_1**3*betaAB_2*r*rA*rAB**3*wA*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r*rAB**3*rB*wA*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3*betaAB_2*rA*rAB**3*rB*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 2*aA*betaAB_1**2*betaAB_2*r**3 \
-        *rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 2*aA*betaAB_1**2 \
-        *betaAB_2*r**3*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aA \
-        *betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - aA*betaAB_1**2*betaAB_2*r**2*rA*rAB**2*rB*wA*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta) + 3*aA*betaAB_1**2*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta) - 3*aA*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wA \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aA*betaAB_1**2*betaAB_2*r*rA**2 \
-        *rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aA*betaAB_1**2*betaAB_2 \
-        *r*rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aA*betaAB_1 \
-        **2*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aA \
-        *betaAB_1**2*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB**3*wA*math.sin(betaAB_2*theta) + 2*aA \
-        *betaAB_1*betaAB_2*r**2*rA*rAB**2*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2 \
-        *r**2*rA*rAB**2*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB**2*wA \
-        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wA*math.sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta) - 2*aA*betaAB_1 \
-        *betaAB_2*r**2*rAB**3*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rAB**3 \
-        *wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**2*rB**2*wA \
-        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**2*rB*wA*math.sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB**3*wA*math.sin(betaAB_2*theta) - 2*aA \
-        *betaAB_1*betaAB_2*r*rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2 \
-        *r*rA**2*rAB**2*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB**2*wA \
-        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wA*math.sin(betaAB_2 \
-        *theta) - aA*betaAB_1*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta) + 2*aA*betaAB_1 \
-        *betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA*rAB**3 \
-        *wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rA*rAB**2*rB**2*wA \
-        *math.sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*rA*rAB**2*rB*wA*math.sin(betaAB_2 \
-        *theta) + aA*betaAB_1*betaAB_2*r*rA*rAB*rB**2*wA*math.sin(betaAB_2*theta) + aA*betaAB_1 \
-        *betaAB_2*r*rAB**3*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rAB**2*rB**2 \
-        *wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*rA**2*rAB**2*rB*wA \
-        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*rA**2*rAB*rB**2*wA*math.sin(betaAB_2 \
-        *theta) - aA*betaAB_1*betaAB_2*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1 \
-        *betaAB_2*rA*rAB**2*rB**2*wA*math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**4 + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*r*rA*rAB**3*math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*rA*rAB**3*rB*math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1**2*r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2*theta)* \
-        *2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rAB**3*rB \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 \
-        + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rA*rAB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*r**2*rA*rAB*rB*math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3 \
-        *math.cos(betaAB_2*theta) - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1 \
-        *r*rA**2*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2 \
-        *theta) + 5*betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3*betaAB_2 \
+        *r**2*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 3*aA \
+        *betaAB_1**3*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta)**2 + aA*betaAB_1**3*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r*rA*rAB**3*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aA*betaAB_1**3*betaAB_2*r \
+        *rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aA*betaAB_1**3 \
+        *betaAB_2*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - 2 \
+        *aA*betaAB_1**2*betaAB_2*r**3*rAB**3*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) + 2*aA*betaAB_1**2*betaAB_2*r**3*rAB**2*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aA*betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aA*betaAB_1**2*betaAB_2*r**2 \
+        *rA*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aA \
+        *betaAB_1**2*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) - 3*aA*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aA*betaAB_1**2*betaAB_2*r*rA**2*rAB**3*wA \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aA*betaAB_1**2*betaAB_2*r \
+        *rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aA \
+        *betaAB_1**2*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) + 3*aA*betaAB_1**2*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB**3*wA \
+        *math.sin(betaAB_2*theta) + 2*aA*betaAB_1*betaAB_2*r**2*rA*rAB**2*rB*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rA*rAB**2*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB**2*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**4*wA*math.sin(betaAB_2 \
+        *theta) - 2*aA*betaAB_1*betaAB_2*r**2*rAB**3*rB*wA*math.sin(betaAB_2*theta) - aA \
+        *betaAB_1*betaAB_2*r**2*rAB**3*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2 \
+        *r**2*rAB**2*rB**2*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r**2*rAB**2 \
+        *rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB**3*wA \
+        *math.sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*rA**2*rAB**2*rB*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rA**2*rAB**2*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB**2*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wA \
+        *math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r*rA*rAB**4*wA*math.sin(betaAB_2 \
+        *theta) + 2*aA*betaAB_1*betaAB_2*r*rA*rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA \
+        *betaAB_1*betaAB_2*r*rA*rAB**3*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*r \
+        *rA*rAB**2*rB**2*wA*math.sin(betaAB_2*theta) - 2*aA*betaAB_1*betaAB_2*r*rA*rAB**2 \
+        *rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rA*rAB*rB**2*wA \
+        *math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*r*rAB**3*rB*wA*math.sin(betaAB_2 \
+        *theta) - aA*betaAB_1*betaAB_2*r*rAB**2*rB**2*wA*math.sin(betaAB_2*theta) + aA \
+        *betaAB_1*betaAB_2*rA**2*rAB**2*rB*wA*math.sin(betaAB_2*theta) - aA*betaAB_1 \
+        *betaAB_2*rA**2*rAB*rB**2*wA*math.sin(betaAB_2*theta) - aA*betaAB_1*betaAB_2*rA \
+        *rAB**3*rB*wA*math.sin(betaAB_2*theta) + aA*betaAB_1*betaAB_2*rA*rAB**2*rB**2*wA \
+        *math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4*math.cos(betaAB_2*theta)**4 \
+        + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4*math.cos(betaAB_2*theta)**3 \
+        + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 + betaAB_1**3*rA*rAB**3*rB \
+        *math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 - betaAB_1**2 \
+        *r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2 \
+        *theta)**2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r \
+        *rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1**2*rA*rAB**2*rB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        *r**2*rA*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r**2*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3*math.cos(betaAB_2*theta) \
+        - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1*r*rA**2*rAB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2*theta) + 5 \
+        *betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
         *math.cos(betaAB_2*theta) + betaAB_1*r*rA*rAB*rB**2*math.cos(betaAB_2*theta) - 4 \
-        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB*math.cos(betaAB_2 \
-        *theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) - betaAB_1*rA**2*rAB**2*rB \
-        *math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2*rAB*rB - r*rA**2*rB**2 + 2*r*rA \
-        *rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r*rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB* \
-        *2)
+        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB \
+        *math.cos(betaAB_2*theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA**2*rAB**2*rB*math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA*rAB**2*rB**2*math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2 \
+        *rAB*rB - r*rA**2*rB**2 + 2*r*rA*rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r \
+        *rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB**2)
     return res
 
 # Function fB
@@ -286,175 +298,186 @@ def fB(x, y):
     bB = -alphaA*h*rAB*math.log(rB)/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB \
         *math.log(rB) + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
     res = -alphaB*((-2*aB*betaAB_1*r*rAB*math.cos(betaAB_2*theta)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aB*r*(-betaAB_1**2*rAB**2*math.cos(betaAB_2 \
-        *theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2*betaAB_1*rAB**2 \
-        *math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB)*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*(betaAB_1**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *rAB**2*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB \
-        **2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aB*r*(-betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) + rA*rAB - rA*rB - rAB**2 + rAB*rB) \
+        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - 2*betaAB_1*r*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - rA*rAB \
+        + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 \
+        - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB \
+        + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - 2*betaAB_1*r*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
         *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
-        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aB*((2*betaAB_1**2*betaAB_2 \
-        *rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r + (aB*((2*betaAB_1**2 \
+        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
+        *betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2*betaAB_1**2 \
-        *betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2 \
-        *rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) + aB*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *2 + (-2*betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(-2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        /(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        + aB*((2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2 \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
         *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
         *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2*betaAB_1**2 \
-        *betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1 \
-        *betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*((2*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) \
-        - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4*betaAB_1**2*betaAB_2*rAB**2 \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rA*rAB \
-        *math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2*math.sin(betaAB_2*theta) - 2 \
-        *betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)* \
-        *3 + 2*(2*betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB* \
-        *2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(2 \
+        *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))*(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r \
+        *rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) \
+        + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)**2 + aB*((2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(4 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2 \
+        *betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 4*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta)) \
+        *(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB) \
+        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**3 + 2*(2 \
+        *betaAB_1**2*betaAB_2*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2*rA*rAB*math.sin(betaAB_2*theta) + 2*betaAB_1*betaAB_2*rAB**2 \
+        *math.sin(betaAB_2*theta) - betaAB_1*betaAB_2*rAB*rB*math.sin(betaAB_2*theta))*(-2 \
         *betaAB_1**2*betaAB_2*r*rAB**2*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
-        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r*rAB**2 \
-        *math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2*theta)) \
-        /(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2*betaAB_1**2 \
-        *betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2*betaAB_2**2*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB*math.cos(betaAB_2*theta) + 2 \
-        *betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*betaAB_2**2*rAB*rB \
-        *math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        + betaAB_1*betaAB_2*r**2*rAB*math.sin(betaAB_2*theta) - 2*betaAB_1*betaAB_2*r \
+        *rAB**2*math.sin(betaAB_2*theta) + betaAB_1*betaAB_2*rA*rAB*rB*math.sin(betaAB_2 \
+        *theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1 \
+        *rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (-2 \
+        *betaAB_1**2*betaAB_2**2*rAB**2*math.sin(betaAB_2*theta)**2 + 2*betaAB_1**2 \
+        *betaAB_2**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*betaAB_2**2*rA*rAB \
+        *math.cos(betaAB_2*theta) + 2*betaAB_1*betaAB_2**2*rAB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*betaAB_2**2*rAB*rB*math.cos(betaAB_2*theta))*(betaAB_1**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2 \
+        *theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB*rB)/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2*betaAB_2**2*r \
+        *rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2 \
+        *theta) - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1 \
+        *betaAB_2**2*rA*rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2 \
+        *math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2 \
+        *betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2 \
+        *theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB))*(betaAB_1**2*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2 \
+        *math.cos(betaAB_2*theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA \
+        *rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
         *r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*r*rAB**2*math.cos(betaAB_2*theta) \
-        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r*rAB \
-        *rB)/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB \
-        *math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB \
-        *rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)**2 + (2*betaAB_1**2 \
-        *betaAB_2**2*r*rAB**2*math.sin(betaAB_2*theta)**2 - 2*betaAB_1**2*betaAB_2**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + betaAB_1*betaAB_2**2*r**2*rAB*math.cos(betaAB_2*theta) \
-        - 2*betaAB_1*betaAB_2**2*r*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*betaAB_2**2*rA \
-        *rAB*rB*math.cos(betaAB_2*theta))/(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1*rA*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2 \
-        *theta) - betaAB_1*rAB*rB*math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)) \
-        *(betaAB_1**2*rAB**2*math.cos(betaAB_2*theta)**2 - betaAB_1*rA*rAB*math.cos(betaAB_2 \
-        *theta) + 2*betaAB_1*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rAB*rB \
-        *math.cos(betaAB_2*theta) - rA*rAB + rA*rB + rAB**2 - rAB*rB)/(betaAB_1**2*r*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rAB*math.cos(betaAB_2*theta) + 2*betaAB_1 \
-        *r*rAB**2*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA \
-        *rAB + r*rA*rB + r*rAB**2 - r*rAB*rB))/r**2) + (aB*betaAB_1**4*betaAB_2*r**2*rAB**4*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - aB*betaAB_1**4*betaAB_2*r*rAB* \
-        *4*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aB*betaAB_1**3 \
-        *betaAB_2*r**3*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB \
+        - betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) - r*rA*rAB + r*rA*rB + r*rAB**2 - r \
+        *rAB*rB))/r**2) + (aB*betaAB_1**4*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**3 - aB*betaAB_1**4*betaAB_2*r*rAB**4*rB*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**3 - 2*aB*betaAB_1**3*betaAB_2 \
+        *r**3*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB \
         *betaAB_1**3*betaAB_2*r**2*rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
         *theta)**2 + 3*aB*betaAB_1**3*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) \
         *math.cos(betaAB_2*theta)**2 + 2*aB*betaAB_1**3*betaAB_2*r**2*rAB**3*rB*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3*betaAB_2*r**2 \
-        *rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3 \
-        *betaAB_2*r*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB \
-        *betaAB_1**3*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)* \
-        *2 - 3*aB*betaAB_1**3*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta)**2 - aB*betaAB_1**3*betaAB_2*r*rAB**3*rB*wB*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3*betaAB_2*rA*rAB**3*rB*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2*aB*betaAB_1**2*betaAB_2*r**3 \
-        *rA*rAB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 2*aB*betaAB_1**2 \
-        *betaAB_2*r**3*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aB \
-        *betaAB_1**2*betaAB_2*r**2*rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) - aB*betaAB_1**2*betaAB_2*r**2*rA*rAB**2*rB*wB*math.sin(betaAB_2*theta) \
-        *math.cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2 \
-        *theta)*math.cos(betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wB \
-        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r*rA*rAB \
-        **3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aB*betaAB_1**2*betaAB_2*r \
-        *rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aB*betaAB_1* \
-        *2*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aB \
-        *betaAB_1**2*betaAB_2*r*rAB**3*rB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r**2*rA**2*rAB**2*wB*math.sin(betaAB_2*theta) - aB \
-        *betaAB_1*betaAB_2*r**2*rA**2*rAB*rB*wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1 \
-        *betaAB_2*r**2*rA*rAB**3*wB*math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r**2*rA \
-        *rAB**2*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rA*rAB**2*wB \
-        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wB*math.sin(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) - aB*betaAB_1 \
-        *betaAB_2*r**2*rAB**3*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rAB**3 \
-        *wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rAB**2*rB*wB*math.sin(betaAB_2 \
-        *theta) - aB*betaAB_1*betaAB_2*r*rA**2*rAB**2*rB*wB*math.sin(betaAB_2*theta) - aB \
-        *betaAB_1*betaAB_2*r*rA**2*rAB**2*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r \
-        *rA**2*rAB*rB**2*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wB \
-        *math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r*rA*rAB**3*rB*wB*math.sin(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1 \
-        *betaAB_2*r*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1*betaAB_2*r*rA \
-        *rAB**2*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA*rAB*rB**2*wB \
-        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2 \
-        *theta) + aB*betaAB_1*betaAB_2*r*rAB**3*rB**2*wB*math.sin(betaAB_2*theta) + aB*betaAB_1 \
-        *betaAB_2*r*rAB**3*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rAB**2*rB**2 \
-        *wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*rA**2*rAB**2*rB*wB \
-        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*rA**2*rAB*rB**2*wB*math.sin(betaAB_2 \
-        *theta) - aB*betaAB_1*betaAB_2*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1 \
-        *betaAB_2*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**4 + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*r*rA*rAB**3*math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4 \
-        *math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 \
-        + betaAB_1**3*rA*rAB**3*rB*math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2 \
-        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 \
-        - betaAB_1**2*r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
-        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2*theta)* \
-        *2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rAB**3*rB \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 \
-        + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta)**2 - betaAB_1*r**2*rA*rAB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*r**2*rA*rAB*rB*math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3 \
-        *math.cos(betaAB_2*theta) - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1 \
-        *r*rA**2*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2 \
-        *theta) + 5*betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3*betaAB_2 \
+        *r**2*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB \
+        *betaAB_1**3*betaAB_2*r*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2 \
+        *theta)**2 - aB*betaAB_1**3*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta)**2 - 3*aB*betaAB_1**3*betaAB_2*r*rAB**4*rB*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 - aB*betaAB_1**3*betaAB_2*r \
+        *rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**3 \
+        *betaAB_2*rA*rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta)**2 + 2 \
+        *aB*betaAB_1**2*betaAB_2*r**3*rA*rAB**2*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) - 2*aB*betaAB_1**2*betaAB_2*r**3*rAB**3*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - 3*aB*betaAB_1**2*betaAB_2*r**2 \
+        *rA*rAB**3*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aB*betaAB_1**2 \
+        *betaAB_2*r**2*rA*rAB**2*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        + 3*aB*betaAB_1**2*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r**2*rAB**3*rB*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + 3*aB*betaAB_1**2*betaAB_2*r*rA \
+        *rAB**3*rB*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) - aB*betaAB_1**2 \
+        *betaAB_2*r*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) \
+        - 3*aB*betaAB_1**2*betaAB_2*r*rAB**4*rB*wB*math.sin(betaAB_2*theta) \
+        *math.cos(betaAB_2*theta) + aB*betaAB_1**2*betaAB_2*r*rAB**3*rB**2*wB \
+        *math.sin(betaAB_2*theta)*math.cos(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2 \
+        *rA**2*rAB**2*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rA**2*rAB*rB \
+        *wB*math.sin(betaAB_2*theta) - 2*aB*betaAB_1*betaAB_2*r**2*rA*rAB**3*wB \
+        *math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r**2*rA*rAB**2*rB*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rA*rAB**2*wB \
+        *math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r**2*rA*rAB*rB*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r**2*rAB**4*wB*math.sin(betaAB_2 \
+        *theta) - aB*betaAB_1*betaAB_2*r**2*rAB**3*rB*wB*math.sin(betaAB_2*theta) - aB \
+        *betaAB_1*betaAB_2*r**2*rAB**3*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2 \
+        *r**2*rAB**2*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rA**2*rAB**2 \
+        *rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r*rA**2*rAB**2*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA**2*rAB*rB**2*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA**2*rAB*rB*wB \
+        *math.sin(betaAB_2*theta) + 2*aB*betaAB_1*betaAB_2*r*rA*rAB**3*rB*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rA*rAB**3*wB*math.sin(betaAB_2 \
+        *theta) - 2*aB*betaAB_1*betaAB_2*r*rA*rAB**2*rB**2*wB*math.sin(betaAB_2*theta) - 2 \
+        *aB*betaAB_1*betaAB_2*r*rA*rAB**2*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1 \
+        *betaAB_2*r*rA*rAB*rB**2*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*r \
+        *rAB**4*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rAB**3*rB**2*wB \
+        *math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*r*rAB**3*rB*wB*math.sin(betaAB_2 \
+        *theta) - aB*betaAB_1*betaAB_2*r*rAB**2*rB**2*wB*math.sin(betaAB_2*theta) + aB \
+        *betaAB_1*betaAB_2*rA**2*rAB**2*rB*wB*math.sin(betaAB_2*theta) - aB*betaAB_1 \
+        *betaAB_2*rA**2*rAB*rB**2*wB*math.sin(betaAB_2*theta) - aB*betaAB_1*betaAB_2*rA \
+        *rAB**3*rB*wB*math.sin(betaAB_2*theta) + aB*betaAB_1*betaAB_2*rA*rAB**2*rB**2*wB \
+        *math.sin(betaAB_2*theta))/(-betaAB_1**4*r*rAB**4*math.cos(betaAB_2*theta)**4 \
+        + betaAB_1**3*r**2*rAB**3*math.cos(betaAB_2*theta)**3 + betaAB_1**3*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**3 - 4*betaAB_1**3*r*rAB**4*math.cos(betaAB_2*theta)**3 \
+        + betaAB_1**3*r*rAB**3*rB*math.cos(betaAB_2*theta)**3 + betaAB_1**3*rA*rAB**3*rB \
+        *math.cos(betaAB_2*theta)**3 - betaAB_1**2*r**2*rA*rAB**2*math.cos(betaAB_2 \
+        *theta)**2 + 2*betaAB_1**2*r**2*rAB**3*math.cos(betaAB_2*theta)**2 - betaAB_1**2 \
+        *r**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r*rA*rAB**3 \
+        *math.cos(betaAB_2*theta)**2 - 2*betaAB_1**2*r*rA*rAB**2*rB*math.cos(betaAB_2 \
+        *theta)**2 - 6*betaAB_1**2*r*rAB**4*math.cos(betaAB_2*theta)**2 + 4*betaAB_1**2*r \
+        *rAB**3*rB*math.cos(betaAB_2*theta)**2 - betaAB_1**2*rA**2*rAB**2*rB \
+        *math.cos(betaAB_2*theta)**2 + 2*betaAB_1**2*rA*rAB**3*rB*math.cos(betaAB_2 \
+        *theta)**2 - betaAB_1**2*rA*rAB**2*rB**2*math.cos(betaAB_2*theta)**2 - betaAB_1 \
+        *r**2*rA*rAB**2*math.cos(betaAB_2*theta) + betaAB_1*r**2*rA*rAB*rB \
+        *math.cos(betaAB_2*theta) + betaAB_1*r**2*rAB**3*math.cos(betaAB_2*theta) \
+        - betaAB_1*r**2*rAB**2*rB*math.cos(betaAB_2*theta) - betaAB_1*r*rA**2*rAB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*r*rA**2*rAB*rB*math.cos(betaAB_2*theta) + 5 \
+        *betaAB_1*r*rA*rAB**3*math.cos(betaAB_2*theta) - 6*betaAB_1*r*rA*rAB**2*rB \
         *math.cos(betaAB_2*theta) + betaAB_1*r*rA*rAB*rB**2*math.cos(betaAB_2*theta) - 4 \
-        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB*math.cos(betaAB_2 \
-        *theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) - betaAB_1*rA**2*rAB**2*rB \
-        *math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2*math.cos(betaAB_2*theta) \
-        + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) - betaAB_1*rA*rAB**2*rB**2 \
-        *math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2*rAB*rB - r*rA**2*rB**2 + 2*r*rA \
-        *rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r*rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB* \
-        *2)
+        *betaAB_1*r*rAB**4*math.cos(betaAB_2*theta) + 5*betaAB_1*r*rAB**3*rB \
+        *math.cos(betaAB_2*theta) - betaAB_1*r*rAB**2*rB**2*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA**2*rAB**2*rB*math.cos(betaAB_2*theta) + betaAB_1*rA**2*rAB*rB**2 \
+        *math.cos(betaAB_2*theta) + betaAB_1*rA*rAB**3*rB*math.cos(betaAB_2*theta) \
+        - betaAB_1*rA*rAB**2*rB**2*math.cos(betaAB_2*theta) - r*rA**2*rAB**2 + 2*r*rA**2 \
+        *rAB*rB - r*rA**2*rB**2 + 2*r*rA*rAB**3 - 4*r*rA*rAB**2*rB + 2*r*rA*rAB*rB**2 - r \
+        *rAB**4 + 2*r*rAB**3*rB - r*rAB**2*rB**2)
     return res
 
 # Function H
@@ -471,41 +494,43 @@ def H(x, y):
     bB = -alphaA*h*rAB*math.log(rB)/(alphaA*alphaB + alphaA*h*rAB*math.log(rAB) - alphaA*h*rAB \
         *math.log(rB) + alphaB*h*rAB*math.log(rA) - alphaB*h*rAB*math.log(rAB))
     res = (aA*alphaA*betaAB_1**2*rAB**2*math.sqrt(betaAB_1**2*betaAB_2**2*math.sin(betaAB_2*theta)**2 \
-        + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1*math.cos(betaAB_2*theta) + 1) \
-        *math.cos(betaAB_2*theta)**2 + aA*alphaA*rA*rAB*math.sqrt(betaAB_1**2*betaAB_2**2 \
-        *math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
-        *math.cos(betaAB_2*theta) + 1) - aA*alphaA*rA*rB*math.sqrt(betaAB_1**2*betaAB_2**2 \
-        *math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
-        *math.cos(betaAB_2*theta) + 1) - aA*alphaA*rAB**2*math.sqrt(betaAB_1**2*betaAB_2**2 \
-        *math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
-        *math.cos(betaAB_2*theta) + 1) + aA*alphaA*rAB*rB*math.sqrt(betaAB_1**2*betaAB_2**2 \
-        *math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1 \
-        *math.cos(betaAB_2*theta) + 1))/(aA*betaAB_1**3*rAB**3*math.log(rAB)*math.cos(betaAB_2 \
-        *theta)**3 - aA*betaAB_1**2*rA*rAB**2*math.log(rAB)*math.cos(betaAB_2*theta)**2 + 3*aA \
-        *betaAB_1**2*rAB**3*math.log(rAB)*math.cos(betaAB_2*theta)**2 - aA*betaAB_1**2*rAB**2 \
-        *rB*math.log(rAB)*math.cos(betaAB_2*theta)**2 - 2*aA*betaAB_1*rA*rAB**2*math.log(rAB) \
+        + betaAB_1**2*math.cos(betaAB_2*theta)**2 + 2*betaAB_1*math.cos(betaAB_2*theta) \
+        + 1)*math.cos(betaAB_2*theta)**2 + aA*alphaA*rA*rAB*math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 \
+        + 2*betaAB_1*math.cos(betaAB_2*theta) + 1) - aA*alphaA*rA*rB*math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 \
+        + 2*betaAB_1*math.cos(betaAB_2*theta) + 1) - aA*alphaA*rAB**2*math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 \
+        + 2*betaAB_1*math.cos(betaAB_2*theta) + 1) + aA*alphaA*rAB*rB*math.sqrt(betaAB_1**2 \
+        *betaAB_2**2*math.sin(betaAB_2*theta)**2 + betaAB_1**2*math.cos(betaAB_2*theta)**2 \
+        + 2*betaAB_1*math.cos(betaAB_2*theta) + 1))/(aA*betaAB_1**3*rAB**3*math.log(rAB) \
+        *math.cos(betaAB_2*theta)**3 - aA*betaAB_1**2*rA*rAB**2*math.log(rAB) \
+        *math.cos(betaAB_2*theta)**2 + 3*aA*betaAB_1**2*rAB**3*math.log(rAB) \
+        *math.cos(betaAB_2*theta)**2 - aA*betaAB_1**2*rAB**2*rB*math.log(rAB) \
+        *math.cos(betaAB_2*theta)**2 - 2*aA*betaAB_1*rA*rAB**2*math.log(rAB) \
         *math.cos(betaAB_2*theta) + aA*betaAB_1*rA*rAB*rB*math.log(rAB)*math.cos(betaAB_2 \
-        *theta) + 3*aA*betaAB_1*rAB**3*math.log(rAB)*math.cos(betaAB_2*theta) - 2*aA*betaAB_1 \
-        *rAB**2*rB*math.log(rAB)*math.cos(betaAB_2*theta) - aA*rA*rAB**2*math.log(rAB) + aA*rA \
-        *rAB*rB*math.log(rAB) + aA*rAB**3*math.log(rAB) - aA*rAB**2*rB*math.log(rAB) - aB \
-        *betaAB_1**3*rAB**3*math.log(rAB)*math.cos(betaAB_2*theta)**3 + aB*betaAB_1**2*rA*rAB* \
-        *2*math.log(rAB)*math.cos(betaAB_2*theta)**2 - 3*aB*betaAB_1**2*rAB**3*math.log(rAB) \
-        *math.cos(betaAB_2*theta)**2 + aB*betaAB_1**2*rAB**2*rB*math.log(rAB)*math.cos(betaAB_2 \
-        *theta)**2 + 2*aB*betaAB_1*rA*rAB**2*math.log(rAB)*math.cos(betaAB_2*theta) - aB \
-        *betaAB_1*rA*rAB*rB*math.log(rAB)*math.cos(betaAB_2*theta) - 3*aB*betaAB_1*rAB**3 \
-        *math.log(rAB)*math.cos(betaAB_2*theta) + 2*aB*betaAB_1*rAB**2*rB*math.log(rAB) \
-        *math.cos(betaAB_2*theta) + aB*rA*rAB**2*math.log(rAB) - aB*rA*rAB*rB*math.log(rAB) \
-        - aB*rAB**3*math.log(rAB) + aB*rAB**2*rB*math.log(rAB) + bA*betaAB_1**3*rAB**3 \
-        *math.cos(betaAB_2*theta)**3 - bA*betaAB_1**2*rA*rAB**2*math.cos(betaAB_2*theta)**2 + 3 \
-        *bA*betaAB_1**2*rAB**3*math.cos(betaAB_2*theta)**2 - bA*betaAB_1**2*rAB**2*rB \
-        *math.cos(betaAB_2*theta)**2 - 2*bA*betaAB_1*rA*rAB**2*math.cos(betaAB_2*theta) + bA \
-        *betaAB_1*rA*rAB*rB*math.cos(betaAB_2*theta) + 3*bA*betaAB_1*rAB**3*math.cos(betaAB_2 \
-        *theta) - 2*bA*betaAB_1*rAB**2*rB*math.cos(betaAB_2*theta) - bA*rA*rAB**2 + bA*rA*rAB \
-        *rB + bA*rAB**3 - bA*rAB**2*rB - bB*betaAB_1**3*rAB**3*math.cos(betaAB_2*theta)**3 + bB \
+        *theta) + 3*aA*betaAB_1*rAB**3*math.log(rAB)*math.cos(betaAB_2*theta) - 2*aA \
+        *betaAB_1*rAB**2*rB*math.log(rAB)*math.cos(betaAB_2*theta) - aA*rA*rAB**2 \
+        *math.log(rAB) + aA*rA*rAB*rB*math.log(rAB) + aA*rAB**3*math.log(rAB) - aA*rAB**2 \
+        *rB*math.log(rAB) - aB*betaAB_1**3*rAB**3*math.log(rAB)*math.cos(betaAB_2 \
+        *theta)**3 + aB*betaAB_1**2*rA*rAB**2*math.log(rAB)*math.cos(betaAB_2*theta)**2 - 3 \
+        *aB*betaAB_1**2*rAB**3*math.log(rAB)*math.cos(betaAB_2*theta)**2 + aB*betaAB_1**2 \
+        *rAB**2*rB*math.log(rAB)*math.cos(betaAB_2*theta)**2 + 2*aB*betaAB_1*rA*rAB**2 \
+        *math.log(rAB)*math.cos(betaAB_2*theta) - aB*betaAB_1*rA*rAB*rB*math.log(rAB) \
+        *math.cos(betaAB_2*theta) - 3*aB*betaAB_1*rAB**3*math.log(rAB)*math.cos(betaAB_2 \
+        *theta) + 2*aB*betaAB_1*rAB**2*rB*math.log(rAB)*math.cos(betaAB_2*theta) + aB*rA \
+        *rAB**2*math.log(rAB) - aB*rA*rAB*rB*math.log(rAB) - aB*rAB**3*math.log(rAB) + aB \
+        *rAB**2*rB*math.log(rAB) + bA*betaAB_1**3*rAB**3*math.cos(betaAB_2*theta)**3 - bA \
+        *betaAB_1**2*rA*rAB**2*math.cos(betaAB_2*theta)**2 + 3*bA*betaAB_1**2*rAB**3 \
+        *math.cos(betaAB_2*theta)**2 - bA*betaAB_1**2*rAB**2*rB*math.cos(betaAB_2 \
+        *theta)**2 - 2*bA*betaAB_1*rA*rAB**2*math.cos(betaAB_2*theta) + bA*betaAB_1*rA*rAB \
+        *rB*math.cos(betaAB_2*theta) + 3*bA*betaAB_1*rAB**3*math.cos(betaAB_2*theta) - 2*bA \
+        *betaAB_1*rAB**2*rB*math.cos(betaAB_2*theta) - bA*rA*rAB**2 + bA*rA*rAB*rB + bA \
+        *rAB**3 - bA*rAB**2*rB - bB*betaAB_1**3*rAB**3*math.cos(betaAB_2*theta)**3 + bB \
         *betaAB_1**2*rA*rAB**2*math.cos(betaAB_2*theta)**2 - 3*bB*betaAB_1**2*rAB**3 \
-        *math.cos(betaAB_2*theta)**2 + bB*betaAB_1**2*rAB**2*rB*math.cos(betaAB_2*theta)**2 + 2 \
-        *bB*betaAB_1*rA*rAB**2*math.cos(betaAB_2*theta) - bB*betaAB_1*rA*rAB*rB \
-        *math.cos(betaAB_2*theta) - 3*bB*betaAB_1*rAB**3*math.cos(betaAB_2*theta) + 2*bB \
-        *betaAB_1*rAB**2*rB*math.cos(betaAB_2*theta) + bB*rA*rAB**2 - bB*rA*rAB*rB - bB*rAB**3 \
-        + bB*rAB**2*rB)
+        *math.cos(betaAB_2*theta)**2 + bB*betaAB_1**2*rAB**2*rB*math.cos(betaAB_2 \
+        *theta)**2 + 2*bB*betaAB_1*rA*rAB**2*math.cos(betaAB_2*theta) - bB*betaAB_1*rA*rAB \
+        *rB*math.cos(betaAB_2*theta) - 3*bB*betaAB_1*rAB**3*math.cos(betaAB_2*theta) + 2*bB \
+        *betaAB_1*rAB**2*rB*math.cos(betaAB_2*theta) + bB*rA*rAB**2 - bB*rA*rAB*rB - bB \
+        *rAB**3 + bB*rAB**2*rB)
     return res
@@ -291,7 +291,7 @@ args_list = [("x", x), ("y", y)]
 
 # constants list
 consts_list = [("rA", rA), ("rAB", rAB), ("rB", rB), ("betaAB_1", betaAB_1), ("betaAB_2", betaAB_2), \
-                ("alphaA", alphaA), ("alphaB", alphaB), ("wA", wA), ("wB", wB)]
+                ("alphaA", alphaA), ("alphaB", alphaB), ("wA", wA), ("wB", wB), ("h", h)]
 
 # parameters list
 params_list = [("r", r), ("theta", theta)]
@@ -307,6 +307,9 @@ funcs_list = [("RAB", RAB, args_list, params_list), ("nAB", nAB, args_list, para
                 ("fA", fA, args_list, paramsA_list), ("fB", fB, args_list, paramsB_list), \
                 ("H", H, args_list, paramsAB_list)]
 
+# test domain (random test points)
+domain = ("annulus", rB, rA)
+
 # generate code
 outdir = "../codes"
 name = "cht_04"
@@ -315,10 +318,11 @@ write_cpp_file(outdir, name, consts_list, funcs_list)
 write_fortran_file(outdir, name, consts_list, funcs_list)
 write_octave_file(outdir, name, consts_list, funcs_list)
 write_python_file(outdir, name, consts_list, funcs_list)
-write_cpp_test(outdir, name)
-write_fortran_test(outdir, name)
-write_octave_test(outdir, name)
-write_python_test(outdir, name)
+write_factors_file(outdir, name, consts_list, funcs_list)
+write_cpp_test(outdir, name, funcs_list, domain)
+write_fortran_test(outdir, name, funcs_list, domain)
+write_octave_test(outdir, name, funcs_list, domain)
+write_python_test(outdir, name, funcs_list, domain)
 print("\nGeneration complete.")
 
 # end of file
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | CHT_04
+===============================================================================
+
+DESCRIPTION:
+------------
+    Generates quadrilateral structured meshes in MSH format without Gmsh.
+    Reproduces the node layout, quad connectivity, and physical tagging of
+    `generate_quadmesh.geo` with vectorised NumPy operations.
+    Mesh refinement can be controlled through the command-line option `-N <value>`
+    where `<value>` is a numerical argument specifying the desired refinement level
+    (default: `1`).
+    Outputs are saved in `meshes/`.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python generate_quadmesh.py -N 1
+
+===============================================================================
+"""
+
+# import modules
+import os
+import sys
+import argparse
+import numpy as np
+from meshes import write_msh
+
+#============================================
+# PARAMETERS
+#============================================
+
+# domain center
+cx = 0.0
+cy = 0.0
+
+# outer boundary
+rA = 1.0
+betaA_1 = 0.0
+betaA_2 = 8.0
+
+# interface
+rAB = 0.75
+betaAB_1 = 0.04
+betaAB_2 = 8.0
+
+# inner boundary
+rB = 0.5
+betaB_1 = 0.0
+betaB_2 = 8.0
+
+# output controls
+outdir = "../meshes"
+name = "quadmesh"
+
+#============================================
+# REFINEMENT CONTROLS
+#============================================
+
+# round half away from zero (as Gmsh Round)
+def gmsh_round(value):
+    return int(np.sign(value)*np.floor(abs(value) + 0.5))
+
+# refinement controls
+def refinement(N):
+    """
+    Return the number of angular points and of points per radial line
+    (`np` and `Round(1.0/lc)` in `generate_quadmesh.geo`).
+    """
+    npts = gmsh_round(55*(1.38**(N - 1)))
+    nrad = gmsh_round(6*(1.4**(N - 1)))
+    return npts, nrad
+
+#============================================
+# MESH GENERATION
+#============================================
+
+# generate quadrilateral mesh
+def generate_quadmesh(N=1, betaA=(betaA_1, betaA_2), betaAB=(betaAB_1, betaAB_2),
+                      betaB=(betaB_1, betaB_2)):
+    """
+    Generate the structured quadrilateral mesh of refinement level N as a mesh
+    dictionary (see `meshes.py`), numbered as Gmsh numbers the `.geo` mesh:
+    boundary points (outer, interface, inner), radial line nodes (outer then
+    inner subdomain), and elements by geometrical entity.
+    """
+    npts, nrad = refinement(N)
+    # boundary points
+    t = np.arange(npts)*2.0*np.pi/npts
+    radii = [rA*(1.0 + betaA[0]*np.cos(betaA[1]*t)),
+             rAB*(1.0 + betaAB[0]*np.cos(betaAB[1]*t)),
+             rB*(1.0 + betaB[0]*np.cos(betaB[1]*t))]
+    points = np.concatenate([np.column_stack((cx + r*np.cos(t), cy + r*np.sin(t))) for r in radii])
+    # radial line nodes (interior nodes of lines 3*np+1:5*np)
+    s = np.arange(1, nrad - 1)/(nrad - 1)
+    start = points[:2*npts]
+    end = points[npts:3*npts]
+    inner = start[:, None, :] + (end - start)[:, None, :]*s[None, :, None]
+    nodes = np.concatenate((points, inner.reshape(-1, 2)))
+    # radial lines (node indices from the start to the end point)
+    k = np.arange(2*npts)
+    radial = np.empty((2*npts, nrad), dtype=np.int64)
+    radial[:, 0] = k
+    radial[:, -1] = k + npts
+    radial[:, 1:-1] = 3*npts + k[:, None]*(nrad - 2) + np.arange(nrad - 2)[None, :]
+    # boundary lines 1:3*np
+    ring = np.arange(3*npts).reshape(3, npts)
+    lines_b = np.stack((ring, np.roll(ring, -1, axis=1)), axis=-1).reshape(-1, 2)
+    # radial line segments 3*np+1:5*np
+    lines_r = np.stack((radial[:, :-1], radial[:, 1:]), axis=-1).reshape(-1, 2)
+    # quads of surfaces 1:2*np (between radial lines i and i+1)
+    nxt = np.concatenate((np.roll(radial[:npts], -1, axis=0), np.roll(radial[npts:], -1, axis=0)))
+    cells = np.stack((radial[:, :-1], nxt[:, :-1], nxt[:, 1:], radial[:, 1:]), axis=-1).reshape(-1, 4)
+    # physical and elementary tags
+    region = np.repeat([100, 200], npts)
+    mesh = {
+        "nodes": nodes,
+        "points": np.arange(3*npts),
+        "point_tags": np.repeat([1, 2, 3], npts),
+        "point_entities": np.arange(1, 3*npts + 1),
+        "lines": np.concatenate((lines_b, lines_r)),
+        "line_tags": np.concatenate((np.repeat([1, 2, 3], npts), np.repeat(region, nrad - 1))),
+        "line_entities": np.concatenate((np.arange(1, 3*npts + 1),
+                                         np.repeat(np.arange(3*npts + 1, 5*npts + 1), nrad - 1))),
+        "cells": cells,
+        "cell_tags": np.repeat(region, nrad - 1),
+        "cell_entities": np.repeat(np.arange(1, 2*npts + 1), nrad - 1),
+    }
+    for key in mesh:
+        if key != "nodes":
+            mesh[key] = mesh[key].astype(np.int32)
+    return mesh
+
+#============================================
+# OUTPUT
+#============================================
+
+# generate meshes from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate quadrilateral structured meshes in MSH format.")
+    parser.add_argument("-N", type=int, nargs="+", default=[1], help="refinement level(s)")
+    parser.add_argument("--outdir", default=outdir, help="output directory")
+    args = parser.parse_args(argv)
+    os.makedirs(args.outdir, exist_ok=True)
+    for N in args.N:
+        path = os.path.join(args.outdir, f"{name}_{N}.msh")
+        write_msh(path, generate_quadmesh(N))
+        print("Wrote", path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
@@ -10,7 +10,7 @@ global alpha = 2.0;
 global pi = 3.141592653589793;
 
 % Function p
-function res = p(x, y)
+function res = p(x, y, t)
     global L;
     global T;
     global nu;
@@ -23,7 +23,7 @@ function res = p(x, y)
 end
 
 % Function u
-function res = u(x, y)
+function res = u(x, y, t)
     global L;
     global T;
     global nu;
@@ -37,7 +37,7 @@ function res = u(x, y)
 end
 
 % Function f
-function res = f(x, y)
+function res = f(x, y, t)
     global L;
     global T;
     global nu;
@@ -51,7 +51,7 @@ function res = f(x, y)
 end
 
 % Function g
-function res = g(x, y)
+function res = g(x, y, t)
     global L;
     global T;
     global nu;
@@ -0,0 +1,60 @@
+# Auto-generated by generate_code.py
+
+import math
+
+# Global constants
+L = 1.0
+T = 1.0
+nu = 1.0
+rho = 1.0
+u0 = 1.0
+alpha = 2.0
+pi = 3.141592653589793
+
+# Coordinates of the factored kernels
+COORDINATES = {
+    "p": ("x", "y", "t"),
+    "u": ("x", "y", "t"),
+    "f": ("x", "y", "t"),
+    "g": ("x", "y", "t"),
+}
+
+# Coordinates the functions depend on
+DEPENDENCIES = {
+    "p": ("x", "y", "t"),
+    "u": ("x", "y", "t"),
+    "f": (),
+    "g": (),
+}
+
+# Function p (factors of x, y, t)
+def p(x, y, t):
+    x_f0 = math.cos(4*alpha*pi*x/L)
+    t_f0 = math.exp(-16*alpha**2*nu*pi**2*t/L**2)
+    y_f0 = math.cos(4*alpha*pi*y/L)
+    res = (1/4)*rho*u0**2*x_f0*t_f0 + (1/4)*rho*u0**2*y_f0*t_f0
+    return res
+
+# Function u (factors of x, y, t)
+def u(x, y, t):
+    x_f0 = math.sin(2*alpha*pi*x/L)
+    y_f0 = math.cos(2*alpha*pi*y/L)
+    t_f0 = math.exp(-8*alpha**2*nu*pi**2*t/L**2)
+    x_f1 = math.cos(2*alpha*pi*x/L)
+    y_f1 = math.sin(2*alpha*pi*y/L)
+    res = [0.0]*2
+    res[0] = u0*x_f0*y_f0*t_f0
+    res[1] = -u0*x_f1*y_f1*t_f0
+    return res
+
+# Function f (factors of x, y, t)
+def f(x, y, t):
+    res = [0.0]*2
+    res[0] = 0
+    res[1] = 0
+    return res
+
+# Function g (factors of x, y, t)
+def g(x, y, t):
+    res = 0
+    return res
@@ -1,7 +1,100 @@
 % Test file
 
-% Run with "octave inse_01.m"
+% Evaluates every function at the points of a binary file (int64 number of
+% points followed by the float64 x and y coordinates) or at quasi-random
+% points in the domain, and prints the throughput and checksum of each one
+
+% Run with "octave test.m [points.bin | npoints] [repeats]"
 
 inse_01
 
-% Insert code
+% points from binary file or quasi-random points in the domain
+test_args = argv();
+test_arg = "100000";
+if numel(test_args) >= 1
+    test_arg = test_args{1};
+end
+if exist(test_arg, "file") == 2
+    test_fh = fopen(test_arg, "r");
+    test_n = fread(test_fh, 1, "int64");
+    test_x = fread(test_fh, test_n, "double");
+    test_y = fread(test_fh, test_n, "double");
+    fclose(test_fh);
+else
+    test_n = str2double(test_arg);
+    test_u = (1:test_n)'*0.7548776662466927;
+    test_v = (1:test_n)'*0.5698402909980532;
+    test_u = test_u - floor(test_u);
+    test_v = test_v - floor(test_v);
+    test_x = 0.0 + test_u.*(1.0 - 0.0);
+    test_y = 0.0 + test_v.*(1.0 - 0.0);
+end
+test_repeats = 5;
+if numel(test_args) >= 2
+    test_repeats = str2double(test_args{2});
+end
+printf("%d points, %d repeats, 1 threads\n", test_n, test_repeats);
+
+% Function p
+test_res = zeros(1, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = p(test_x(test_i), test_y(test_i), 0.01);
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "p", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function u
+test_res = zeros(2, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = u(test_x(test_i), test_y(test_i), 0.01);
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "u", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function f
+test_res = zeros(2, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = f(test_x(test_i), test_y(test_i), 0.01);
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "f", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+
+% Function g
+test_res = zeros(1, test_n);
+test_best = Inf;
+for test_k = 0:test_repeats
+    tic;
+    for test_i = 1:test_n
+        test_res(:, test_i) = g(test_x(test_i), test_y(test_i), 0.01);
+    end
+    test_seconds = toc;
+    if test_k > 0 || test_repeats == 0
+        test_best = min(test_best, test_seconds);
+    end
+end
+printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\n", "g", ...
+    test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | FIELDS
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for evaluating the generated exact solutions, source terms
+and boundary data (`codes/<name>.py`) on arrays of points. The generated code
+is executed once with its `math` module replaced by NumPy equivalents, so
+each function is evaluated for all points in a single vectorised call.
+Scalar functions return arrays with the shape of the points, vector functions
+(`res = [0.0]*2`) return arrays with an extra trailing axis of length 2.
+Fields defined per subdomain (`phiA`/`phiB`, `fA`/`fB`, `uA`/`uB` in the
+conjugate heat transfer cases) are dispatched by region tag (100: A, 200: B):
+points are grouped by tag with a stable permutation, stored in the mesh cache
+for cell tags, so each subdomain function is evaluated once on a contiguous
+block of points and the results are scattered back into one global array.
+Functions with arguments beyond (x, y), such as the time `t` of unsteady
+cases, get them bound when loading the case (`load_case(codes, t=0.5)`) or
+passed after the points; the command-line tools load the cases with
+`load_bound_case`, binding the arguments not given to DEFAULT_ARGUMENTS. Fields of unsteady cases are evaluated at N points
+and M time levels at once by `evaluate_times`, which exploits the separable
+structure f(x, y, t) = S(x, y)*T(t) of each component: the spatial factor is
+evaluated once on all points, the temporal factor once per time level at a
+pivot point, and their outer product is written into a preallocated (M, N)
+array. The factorisation is checked at sampled space-time points, and the
+fields that are not separable are evaluated level by level instead.
+Functions are evaluated on tensor-product points (structured and polar
+grids, time series) by `evaluate_grid` from the factored kernels generated
+for the separable functions (`codes/<name>_factors.py`), with each factor
+evaluated once per coordinate value and the factors combined by
+broadcasting.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+import fields
+case = fields.load_case("../codes")
+f = fields.evaluate(case, "f", x, y)
+phi = fields.evaluate_mesh(case, "phi", mesh)
+u = fields.evaluate_times(case, "u", x, y, np.linspace(0.0, 1.0, 101))
+phiA = fields.evaluate_grid(case, "phiA", [r, theta], coordinates="polar")
+
+===============================================================================
+"""
+
+# import modules
+import os
+import glob
+import types
+import inspect
+import numpy as np
+from meshes import cached_stage
+
+#============================================
+# PARAMETERS
+#============================================
+
+# NumPy replacement of the `math` module used by the generated code
+NUMPY_MATH = types.SimpleNamespace(
+    pi=np.pi, e=np.e, inf=np.inf,
+    sqrt=np.sqrt, exp=np.exp, log=np.log, pow=np.power, fabs=np.fabs,
+    cos=np.cos, sin=np.sin, tan=np.tan, acos=np.arccos, asin=np.arcsin, atan=np.arctan,
+    atan2=np.arctan2, cosh=np.cosh, sinh=np.sinh, tanh=np.tanh,
+)
+
+# suffix of the functions of each subdomain (physical surface tag)
+SUBDOMAINS = {100: "A", 200: "B"}
+
+# region arrays
+REGION_KEYS = ["region_tags", "region_ptr", "region_order"]
+
+# suffix of the generated factored kernels
+FACTORS_SUFFIX = "_factors"
+
+# coordinates of the tensor-product grids
+GRID_COORDINATES = {"cartesian": ("x", "y"), "polar": ("r", "theta")}
+
+# time argument of the generated functions of unsteady cases
+TIME_ARGUMENT = "t"
+
+# values of the arguments beyond (x, y) not given to the command-line tools (as TEST_ARGUMENTS of the drivers)
+DEFAULT_ARGUMENTS = {"t": 0.01}
+
+# space-time points checking the separable factorisation
+SEPARABLE_SAMPLES = 64
+
+# relative tolerance of the separable factorisation (to the largest value)
+SEPARABLE_TOLERANCE = 1.0e-12
+
+#============================================
+# GENERATED CODE
+#============================================
+
+# path of generated Python code
+def code_path(codes_dir="../codes"):
+    """
+    Return the path of the generated Python code in `codes_dir`.
+    """
+    paths = [path for path in sorted(glob.glob(os.path.join(codes_dir, "*.py")))
+             if not os.path.basename(path).startswith("test") and not path.endswith(FACTORS_SUFFIX + ".py")]
+    if len(paths) != 1:
+        raise FileNotFoundError(f"Expected one generated Python file in {codes_dir}")
+    return paths[0]
+
+# vectorise a generated function
+def vectorize(func, **bound):
+    """
+    Wrap a generated function so that scalar results are broadcast to the
+    shape of the arguments and vector results are stacked along a last axis.
+    Keyword arguments bind arguments of the function beyond (x, y).
+    """
+    def wrapper(x, y, *args):
+        args = [np.asarray(arg, dtype=np.float64) for arg in (x, y) + args]
+        shape = np.broadcast(*args, *bound.values()).shape
+        res = func(*args, **bound)
+        if isinstance(res, list):
+            return np.stack([np.broadcast_to(comp, shape) for comp in res], axis=-1)
+        return np.array(np.broadcast_to(res, shape))
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+# arguments of a generated function beyond the points
+def extra_arguments(func):
+    """
+    Return the names of the arguments of a generated function after (x, y).
+    """
+    return list(inspect.signature(func).parameters)[2:]
+
+# load generated case
+def load_case(codes_dir="../codes", **params):
+    """
+    Load the generated Python code of a case and return a dictionary with its
+    name, path, global constants, vectorised functions and the arguments of
+    the functions beyond (x, y), and the factored kernels of the separable
+    functions when generated, with their unbound coordinates, and the unbound
+    coordinates each function depends on (see `tables.py`). Keyword
+    arguments define or override global names used by the functions, and are
+    bound to the arguments of the same name (e.g. `t`).
+    """
+    path = code_path(codes_dir)
+    with open(path, encoding="utf-8") as fh:
+        source = fh.read()
+    namespace = {"__name__": os.path.splitext(os.path.basename(path))[0]}
+    exec(compile(source, path, "exec"), namespace)
+    namespace["math"] = NUMPY_MATH
+    namespace.update(params)
+    consts = {key: float(value) for key, value in namespace.items()
+              if isinstance(value, (int, float)) and not key.startswith("__")}
+    generated = {key: value for key, value in namespace.items() if isinstance(value, types.FunctionType)}
+    arguments = {key: extra_arguments(value) for key, value in generated.items()}
+    funcs = {key: vectorize(value, **{arg: params[arg] for arg in arguments[key] if arg in params})
+             for key, value in generated.items()}
+    kernels, dependencies = {}, {}
+    factors_path = os.path.splitext(path)[0] + FACTORS_SUFFIX + ".py"
+    if os.path.isfile(factors_path):
+        with open(factors_path, encoding="utf-8") as fh:
+            factors = {"__name__": namespace["__name__"] + FACTORS_SUFFIX}
+            exec(compile(fh.read(), factors_path, "exec"), factors)
+        factors["math"] = NUMPY_MATH
+        factors.update(params)
+        for key, coords in factors.get("COORDINATES", {}).items():
+            kernels[key] = {"coordinates": [coord for coord in coords if coord not in params],
+                            "function": vectorize(factors[key], **{coord: params[coord] for coord in coords
+                                                                   if coord in params})}
+        for key, deps in factors.get("DEPENDENCIES", {}).items():
+            dependencies[key] = [dep for dep in deps if dep not in params]
+    return {"name": namespace["__name__"], "path": path, "constants": consts, "functions": funcs,
+            "arguments": arguments, "params": dict(params), "kernels": kernels, "dependencies": dependencies,
+            "namespace": namespace}
+
+# parameters binding all arguments of a case
+def bound_params(case, params=None):
+    """
+    Return the parameters binding the arguments beyond (x, y) of the
+    functions of a case: the given ones and DEFAULT_ARGUMENTS for the others.
+    Raises ValueError for arguments without a default value.
+    """
+    params = dict(params or {})
+    for name, args in case["arguments"].items():
+        for arg in args:
+            if arg in params:
+                continue
+            if arg not in DEFAULT_ARGUMENTS:
+                raise ValueError(f"No value given for argument '{arg}' of function {name} of {case['name']}")
+            params[arg] = DEFAULT_ARGUMENTS[arg]
+    return params
+
+# load generated case with all arguments bound
+def load_bound_case(codes_dir="../codes", params=None):
+    """
+    Load a case (see `load_case`) with the arguments beyond (x, y) of its
+    functions bound to the given parameters or to DEFAULT_ARGUMENTS (see
+    `bound_params`), as used by the command-line tools.
+    """
+    case = load_case(codes_dir, **(params or {}))
+    bound = bound_params(case, params)
+    return case if bound == case["params"] else load_case(codes_dir, **bound)
+
+#============================================
+# EVALUATION
+#============================================
+
+# evaluate a generated function
+def evaluate(case, name, x, y, *args):
+    """
+    Evaluate the generated function `name` at the points (x, y), with the
+    values of its unbound arguments beyond the points (e.g. `t`).
+    """
+    try:
+        func = case["functions"][name]
+    except KeyError:
+        raise KeyError(f"Function '{name}' not defined in {case['path']}") from None
+    return func(x, y, *args)
+
+# evaluate several generated functions
+def evaluate_all(case, names, x, y):
+    """
+    Evaluate several generated functions at the same points and return them in
+    a dictionary.
+    """
+    return {name: evaluate(case, name, x, y) for name in names}
+
+#============================================
+# SUBDOMAIN DISPATCH
+#============================================
+
+# functions of a field per subdomain
+def field_functions(case, field):
+    """
+    Return the functions of a field by region tag: {tag: func} for fields
+    defined per subdomain (e.g. "phi" -> phiA, phiB), or {None: func} for
+    fields defined on the whole domain.
+    """
+    funcs = case["functions"]
+    if field in funcs:
+        return {None: funcs[field]}
+    regions = {tag: funcs[field + suffix] for tag, suffix in SUBDOMAINS.items()
+               if field + suffix in funcs}
+    if not regions:
+        raise KeyError(f"Field '{field}' not defined in {case['path']}")
+    return regions
+
+# region permutation
+def region_permutation(labels):
+    """
+    Group entries by region label with a stable sort:
+      region_tags   (nr,)   int32  distinct labels
+      region_ptr    (nr+1,) int64  CSR pointer of each region in region_order
+      region_order  (n,)    int64  entry indices sorted by label
+    """
+    labels = np.asarray(labels)
+    order = np.argsort(labels, kind="stable")
+    tags, counts = np.unique(labels[order], return_counts=True)
+    ptr = np.zeros(len(tags) + 1, dtype=np.int64)
+    np.cumsum(counts, out=ptr[1:])
+    return {"region_tags": tags.astype(np.int32), "region_ptr": ptr, "region_order": order.astype(np.int64)}
+
+# cell region permutation
+def load_regions(mesh):
+    """
+    Return the region permutation of the mesh cells (by physical surface tag),
+    reading it from the mesh cache when available.
+    """
+    return cached_stage(mesh, REGION_KEYS, lambda mesh: region_permutation(mesh["cell_tags"]))
+
+# expand a cell permutation to points
+def expand_permutation(perm, nq):
+    """
+    Return the permutation of points stored cell by cell with nq points per
+    cell (e.g. quadrature points) from the permutation of the cells.
+    """
+    if nq == 1:
+        return perm
+    order = (np.asarray(perm["region_order"])[:, None]*nq + np.arange(nq)[None, :]).ravel()
+    return {"region_tags": perm["region_tags"], "region_ptr": np.asarray(perm["region_ptr"])*nq,
+            "region_order": order}
+
+# evaluate a field by region
+def dispatch(case, field, x, y, labels=None, perm=None):
+    """
+    Evaluate a field at the points (x, y) with region labels (or their
+    precomputed permutation), calling each subdomain function only on the
+    contiguous block of its own points. Returns one global array.
+    """
+    funcs = field_functions(case, field)
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if None in funcs:
+        return funcs[None](x, y)
+    if perm is None:
+        perm = region_permutation(labels)
+    order = np.asarray(perm["region_order"])
+    ptr = np.asarray(perm["region_ptr"])
+    out = None
+    for i, tag in enumerate(np.asarray(perm["region_tags"])):
+        if int(tag) not in funcs:
+            raise ValueError(f"No function of field '{field}' for region tag {tag}")
+        index = order[ptr[i]:ptr[i + 1]]
+        values = funcs[int(tag)](x[index], y[index])
+        if out is None:
+            out = np.empty((len(x),) + values.shape[1:])
+        out[index] = values
+    return out if out is not None else np.empty(0)
+
+# evaluate a field on mesh cells
+def evaluate_mesh(case, field, mesh, points=None, nq=1):
+    """
+    Evaluate a field at points stored cell by cell, nq points per cell (e.g.
+    quadrature points from `quadrature.py`), using the subdomain function of
+    each cell. Points default to the cell centroids.
+    """
+    if points is None:
+        from geometry import load_geometry
+        points = load_geometry(mesh)["cell_centroids"]
+    points = np.asarray(points)
+    perm = expand_permutation(load_regions(mesh), nq)
+    return dispatch(case, field, points[:, 0], points[:, 1], perm=perm)
+
+#============================================
+# SPACE-TIME EVALUATION
+#============================================
+
+# functions of a field with unbound time
+def time_functions(case, field):
+    """
+    Return the functions of a field by region tag (see `field_functions`)
+    with the time argument left unbound, called as func(x, y, t), and the
+    other arguments bound to the names given when loading the case.
+    """
+    namespace = case["namespace"]
+    res = {}
+    for tag, func in field_functions(case, field).items():
+        name = func.__name__
+        bound = {arg: namespace[arg] for arg in case["arguments"][name] if arg != TIME_ARGUMENT and arg in namespace}
+        if TIME_ARGUMENT in case["arguments"][name]:
+            res[tag] = vectorize(namespace[name], **bound)
+        else:
+            steady = vectorize(namespace[name], **bound)
+            res[tag] = lambda x, y, t, steady=steady: steady(x + 0.0*t, y)
+    return res
+
+# separable evaluation of a function
+def separable_times(func, x, y, times, out):
+    """
+    Evaluate func(x, y, t) at N points and M time levels into out (M, N, d)
+    as the outer product of the temporal factor at a pivot point and the
+    spatial factor at the first time level of each component, checked at
+    sampled space-time points. Returns False, with out undefined, when the
+    function is not separable.
+    """
+    m, n, d = out.shape
+    space = func(x, y, times[0]).reshape(n, d)
+    pivots = np.argmax(np.abs(space), axis=0)
+    temporal = func(x[pivots][None, :], y[pivots][None, :], times[:, None]).reshape(m, d, d)
+    for k in range(d):
+        scale = space[pivots[k], k]
+        factor = space[:, k]/scale if scale != 0.0 else np.zeros(n)
+        np.multiply(temporal[:, k, k][:, None], factor[None, :], out=out[:, :, k])
+    rng = np.random.default_rng(0)
+    levels = np.append(rng.integers(0, m, SEPARABLE_SAMPLES), m - 1)
+    points = np.append(rng.integers(0, n, SEPARABLE_SAMPLES), pivots)[:len(levels)]
+    direct = func(x[points], y[points], times[levels]).reshape(len(levels), d)
+    approx = out[levels, points]
+    if not (np.isfinite(direct).all() and np.isfinite(approx).all()):
+        return False
+    scale = max(np.abs(temporal).max(initial=0.0), np.abs(direct).max(initial=0.0))
+    return bool(np.abs(direct - approx).max(initial=0.0) <= SEPARABLE_TOLERANCE*scale)
+
+# evaluate a field at several time levels
+def evaluate_times(case, field, x, y, times, labels=None, perm=None, out=None):
+    """
+    Evaluate a field at N points (x, y) with region labels (or their
+    permutation, see `dispatch`) and M time levels, into a preallocated array
+    `out` of shape (M, N) for scalar fields or (M, N, d) for vector fields
+    (allocated when not given). Separable functions are evaluated once in
+    space and once per time level (see `separable_times`), the others level
+    by level.
+    """
+    funcs = time_functions(case, field)
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    times = np.asarray(times, dtype=np.float64).ravel()
+    if None in funcs:
+        blocks = [(funcs[None], slice(None))]
+    else:
+        if perm is None:
+            perm = region_permutation(labels)
+        order = np.asarray(perm["region_order"])
+        ptr = np.asarray(perm["region_ptr"])
+        blocks = []
+        for i, tag in enumerate(np.asarray(perm["region_tags"])):
+            if int(tag) not in funcs:
+                raise ValueError(f"No function of field '{field}' for region tag {tag}")
+            blocks.append((funcs[int(tag)], order[ptr[i]:ptr[i + 1]]))
+    for func, index in blocks:
+        bx, by = x[index], y[index]
+        if out is None:
+            shape = func(bx[:1], by[:1], times[:1]).shape[1:]
+            out = np.empty((len(times), len(x)) + shape)
+        if len(bx) == 0 or len(times) == 0:
+            continue
+        d = int(np.prod(out.shape[2:], dtype=np.int64))
+        inplace = isinstance(index, slice) and out.flags.c_contiguous
+        block = out.reshape(len(times), len(x), d) if inplace else np.empty((len(times), len(bx), d))
+        if not separable_times(func, bx, by, times, block):
+            for i, t in enumerate(times):
+                block[i] = func(bx, by, t).reshape(len(bx), d)
+        if not inplace:
+            out[:, index] = block.reshape((len(times), len(bx)) + out.shape[2:])
+    return out if out is not None else np.empty((len(times), 0))
+
+# evaluate a field on mesh cells at several time levels
+def evaluate_mesh_times(case, field, mesh, times, points=None, nq=1, out=None):
+    """
+    Evaluate a field at points stored cell by cell (see `evaluate_mesh`) and
+    M time levels, into an array of shape (M, N) or (M, N, d).
+    """
+    if points is None:
+        from geometry import load_geometry
+        points = load_geometry(mesh)["cell_centroids"]
+    points = np.asarray(points)
+    perm = expand_permutation(load_regions(mesh), nq)
+    return evaluate_times(case, field, points[:, 0], points[:, 1], times, perm=perm, out=out)
+
+#============================================
+# GRID EVALUATION
+#============================================
+
+# evaluate a generated function on a tensor-product grid
+def evaluate_grid(case, name, axes, coordinates="cartesian"):
+    """
+    Evaluate the generated function `name` at the tensor-product points of
+    the 1D arrays `axes`, the coordinates (x, y) of a Cartesian grid or (r,
+    theta) of a polar grid followed by the unbound arguments (e.g. `t`), and
+    return an array of shape (n1, n2, ...) for scalar functions or (n1, n2,
+    ..., d) for vector functions. Factored kernels in the same coordinates
+    evaluate each factor once per coordinate value and combine them by
+    broadcasting; other functions are evaluated at every grid point.
+    """
+    if coordinates not in GRID_COORDINATES:
+        raise ValueError(f"Unknown grid coordinates '{coordinates}' (expected one of "
+                         f"{', '.join(GRID_COORDINATES)}).")
+    axes = [np.asarray(axis, dtype=np.float64).ravel() for axis in axes]
+    grid = [axis.reshape((1,)*i + (-1,) + (1,)*(len(axes) - i - 1)) for i, axis in enumerate(axes)]
+    kernel = case.get("kernels", {}).get(name)
+    if kernel is not None and tuple(kernel["coordinates"][:2]) == GRID_COORDINATES[coordinates]:
+        return kernel["function"](*grid)
+    first, second = grid[:2]
+    if coordinates == "polar":
+        first, second = first*np.cos(second), first*np.sin(second)
+    return evaluate(case, name, first, second, *grid[2:])
+
+# end of file
@@ -148,7 +148,7 @@ alpha = 2.0
 pi = math.pi
 
 # arguments list
-args_list = [("x", x), ("y", y)]
+args_list = [("x", x), ("y", y), ("t", t)]
 
 # constants list
 consts_list = [("L", L), ("T", T), ("nu", nu), ("rho", rho), ("u0", u0), \
@@ -161,6 +161,9 @@ params_list = []
 funcs_list = [("p", p, args_list, params_list),("u", u, args_list, params_list), \
                 ("f", f, args_list, params_list), ("g", g, args_list, params_list)]
 
+# test domain (random test points)
+domain = ("box", 0.0, L, 0.0, L)
+
 # generate code
 outdir = "../codes"
 name = "inse_01"
@@ -169,10 +172,11 @@ write_cpp_file(outdir, name, consts_list, funcs_list)
 write_fortran_file(outdir, name, consts_list, funcs_list)
 write_octave_file(outdir, name, consts_list, funcs_list)
 write_python_file(outdir, name, consts_list, funcs_list)
-write_cpp_test(outdir, name)
-write_fortran_test(outdir, name)
-write_octave_test(outdir, name)
-write_python_test(outdir, name)
+write_factors_file(outdir, name, consts_list, funcs_list)
+write_cpp_test(outdir, name, funcs_list, domain)
+write_fortran_test(outdir, name, funcs_list, domain)
+write_octave_test(outdir, name, funcs_list, domain)
+write_python_test(outdir, name, funcs_list, domain)
 print("\nGeneration complete.")
 
 # end of file
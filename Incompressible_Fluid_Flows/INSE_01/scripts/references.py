@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | REFERENCES
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for precomputing and storing the exact solutions of a case
+(`codes/<name>.py`) on meshes loaded with `meshes.py`, so that verification
+runs load them by memory map instead of evaluating the generated functions
+again. For each field, the store holds the exact values at the cell
+centroids and cell Gauss points, the cell averages, the gradients at the
+Gauss points, and the values and averages on the boundary faces; source
+terms (`f`, `g`) only hold the cell values and averages. Arrays are stored
+as one `.npy` file each in the mesh cache (`references_<hash>/`), with a
+manifest recording the hash of the generated code and constants, the hash of
+the code generator, the quadrature order and the stored fields. The hash
+changes with the generated code or constants (e.g. `t`), so stale references
+are never used.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python references.py ../meshes/*.msh
+python references.py ../meshes/triamesh_4.msh --fields phi f H --order 6
+
+===============================================================================
+"""
+
+# import modules
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import numpy as np
+from meshes import load_mesh, file_hash, update_cache, read_cache
+from topology import load_topology
+from geometry import load_geometry
+from fields import load_bound_case, load_regions, field_functions, dispatch, DEFAULT_ARGUMENTS
+from quadrature import cell_quadrature, face_quadrature
+from errors import ERROR_ORDER, error_reference
+
+#============================================
+# PARAMETERS
+#============================================
+
+# fields stored by default (when defined by the case)
+DEFAULT_FIELDS = ["phi", "u", "p", "f", "g"]
+
+# source terms (cell values and averages only)
+SOURCE_FIELDS = ["f", "g"]
+
+# mesh arrays stored with the references
+MESH_KEYS = ["quadrature_points", "quadrature_weights", "boundary_faces", "boundary_points",
+             "boundary_weights"]
+
+# arrays stored for each field
+FIELD_KEYS = ["centroids", "quadrature", "averages", "gradient", "boundary", "boundary_averages"]
+
+#============================================
+# STORE LOCATION
+#============================================
+
+# hash of generated case
+def case_hash(case):
+    """
+    Hash the generated code and the constants (including overridden global
+    names) of a case (BLAKE2b, 16 hexadecimal digits).
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(file_hash(case["path"]).encode())
+    digest.update(json.dumps(case["constants"], sort_keys=True).encode())
+    return digest.hexdigest()
+
+# hash of the code generator
+def generator_hash(case):
+    """
+    Hash the code generator (`scripts/generate_code.py`) of a case, or None
+    when not found.
+    """
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(case["path"]))),
+                        "scripts", "generate_code.py")
+    return file_hash(path) if os.path.isfile(path) else None
+
+# directory of the references
+def reference_path(mesh, case, order=ERROR_ORDER):
+    """
+    Return the directory of the references of a case and quadrature order in
+    the mesh cache, or None for meshes without cache.
+    """
+    if "cachedir" not in mesh:
+        return None
+    return os.path.join(mesh["cachedir"], f"references_{case_hash(case)}_{order}")
+
+# read manifest
+def read_manifest(refdir):
+    """
+    Return the manifest of a references directory, or None.
+    """
+    try:
+        with open(os.path.join(refdir, "manifest.json"), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+# write manifest
+def write_manifest(refdir, manifest):
+    """
+    Write the manifest of a references directory (renamed into place).
+    """
+    fd, tmpfile = tempfile.mkstemp(dir=refdir, prefix=".tmp_", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2)
+    os.replace(tmpfile, os.path.join(refdir, "manifest.json"))
+
+#============================================
+# BUILD REFERENCES
+#============================================
+
+# fields defined by a case
+def case_fields(case, fields=None):
+    """
+    Return the fields to store: the given ones, or the default fields defined
+    by the case.
+    """
+    if fields is not None:
+        return list(fields)
+    found = []
+    for field in DEFAULT_FIELDS:
+        try:
+            field_functions(case, field)
+        except KeyError:
+            continue
+        found.append(field)
+    return found
+
+# mesh arrays of the references
+def build_mesh_arrays(mesh, order=ERROR_ORDER):
+    """
+    Return the Gauss points and weights of the cells and boundary faces.
+    """
+    cells = cell_quadrature(mesh, order)
+    faces = np.flatnonzero(np.asarray(load_topology(mesh)["face_cells"])[:, 1] < 0).astype(np.int32)
+    boundary = face_quadrature(mesh, order, faces)
+    return {
+        "quadrature_points": cells["points"], "quadrature_weights": cells["weights"],
+        "boundary_faces": faces, "boundary_points": boundary["points"], "boundary_weights": boundary["weights"],
+    }
+
+# references of a field
+def build_field(mesh, case, field, arrays, order=ERROR_ORDER):
+    """
+    Return the exact arrays of a field: values at the centroids and Gauss
+    points, cell averages, and (except for source terms) gradients at the
+    Gauss points and values and face averages on the boundary faces.
+    """
+    source = field in SOURCE_FIELDS
+    reference = error_reference(mesh, case, field, order, gradient=not source)
+    centroids = np.asarray(load_geometry(mesh)["cell_centroids"])
+    regions = load_regions(mesh)
+    res = {
+        f"{field}_centroids": dispatch(case, field, centroids[:, 0], centroids[:, 1], perm=regions),
+        f"{field}_quadrature": reference["exact"],
+        f"{field}_averages": reference["averages"],
+    }
+    if source:
+        return res
+    res[f"{field}_gradient"] = reference["gradient"]
+    # boundary faces take the subdomain of their cell
+    faces = np.asarray(arrays["boundary_faces"])
+    points = np.asarray(arrays["boundary_points"])
+    weights = np.asarray(arrays["boundary_weights"])
+    nb = len(faces)
+    nqf = len(weights)//nb if nb else 1
+    cells = np.asarray(load_topology(mesh)["face_cells"])[faces, 0]
+    labels = np.repeat(np.asarray(mesh["cell_tags"])[cells], nqf)
+    values = dispatch(case, field, points[:, 0], points[:, 1], labels=labels)
+    w = weights.reshape(nb, nqf)
+    averages = np.einsum("fq,fq...->f...", w, values.reshape((nb, nqf) + values.shape[1:]))
+    res[f"{field}_boundary"] = values
+    res[f"{field}_boundary_averages"] = averages/w.sum(axis=1).reshape((nb,) + (1,)*(averages.ndim - 1))
+    return res
+
+#============================================
+# STORE
+#============================================
+
+# references of a case on a mesh
+def reference_store(mesh, case, fields=None, order=ERROR_ORDER, mmap=True):
+    """
+    Return the exact arrays of the fields of a case on a mesh (see
+    FIELD_KEYS and MESH_KEYS), reading them from the mesh cache, memory-mapped,
+    when available, and building (and storing) the missing fields otherwise.
+    Meshes without cache get the arrays built in memory.
+    """
+    fields = case_fields(case, fields)
+    refdir = reference_path(mesh, case, order)
+    manifest = read_manifest(refdir) if refdir else None
+    if manifest is None:
+        arrays, stored = build_mesh_arrays(mesh, order), []
+    else:
+        arrays, stored = read_cache(refdir, mmap), manifest["fields"]
+    missing = [field for field in fields if field not in stored]
+    new = {}
+    for field in missing:
+        new.update(build_field(mesh, case, field, arrays, order))
+    arrays.update(new)
+    if refdir is not None and missing:
+        os.makedirs(refdir, exist_ok=True)
+        update_cache(refdir, new if manifest else arrays)
+        write_manifest(refdir, {
+            "case": case["name"], "code": os.path.basename(case["path"]), "code_hash": case_hash(case),
+            "generator_hash": generator_hash(case), "constants": case["constants"], "order": order,
+            "fields": stored + missing, "arrays": {key: list(np.shape(value)) for key, value in arrays.items()},
+        })
+    return arrays
+
+# error reference from the store
+def load_reference(mesh, case, field, order=ERROR_ORDER):
+    """
+    Return the exact reference values of a field for `errors.error_norms`
+    (see `errors.error_reference`), read from the reference store.
+    """
+    arrays = reference_store(mesh, case, [field], order)
+    nc = len(mesh["cells"])
+    weights = np.asarray(arrays["quadrature_weights"])
+    nq = len(weights)//nc
+    return {
+        "field": field, "order": order,
+        "quad": {"points": arrays["quadrature_points"], "weights": weights,
+                 "cells": np.repeat(np.arange(nc, dtype=np.int32), nq), "nq": nq},
+        "exact": arrays[f"{field}_quadrature"], "averages": arrays[f"{field}_averages"],
+        "areas": weights.reshape(nc, nq).sum(axis=1), "gradient": arrays.get(f"{field}_gradient"),
+        "regions": load_regions(mesh),
+    }
+
+#============================================
+# MAIN
+#============================================
+
+# build references from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute and store exact solutions on meshes.")
+    parser.add_argument("files", nargs="+", help="mesh files in MSH format")
+    parser.add_argument("--fields", nargs="*", help="fields to store (default: " + " ".join(DEFAULT_FIELDS) + ")")
+    parser.add_argument("--order", type=int, default=ERROR_ORDER, help="quadrature order")
+    parser.add_argument("--time", type=float, help="time of unsteady cases (argument `t` of the functions, "
+                        f"default {DEFAULT_ARGUMENTS['t']})")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    args = parser.parse_args(argv)
+    params = {"t": args.time} if args.time is not None else None
+    try:
+        case = load_bound_case(args.codes, params)
+    except ValueError as e:
+        parser.error(str(e))
+    for path in args.files:
+        mesh = load_mesh(path)
+        start = time.perf_counter()
+        arrays = reference_store(mesh, case, args.fields, args.order)
+        size = sum(np.asarray(value).nbytes for value in arrays.values())
+        print(f"{path}: {len(arrays)} arrays ({size/2**20:.1f} MB) in "
+              f"{time.perf_counter() - start:.3f} s -> {reference_path(mesh, case, args.order)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
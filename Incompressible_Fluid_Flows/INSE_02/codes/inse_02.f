@@ -24,10 +24,17 @@ function p(x, y) result(res)
     real(8) :: theta
     r = sqrt(x**2 + y**2)
     theta = atan2(y, x)
-    res = rho*((1.0d0/2.0d0)*r**2*(-omegaI*rI**2 + omegaO*rO**2)**2/(-rI**2 + rO** 2)**2 + 2*rI**2*rO* &
-        *2*(-omegaI + omegaO)*(-omegaI*rI**2 + omegaO* rO**2)*log(r)/(-rI**2 + rO**2)**2 &
-        - 1.0d0/2.0d0*rI**4*rO**4*( -omegaI + omegaO)**2/(r**2*(-rI**2 + rO**2)**2) - (-cI &
-        + cO)/(pi* (-rI**2 + rO**2)))
+    res = rho*((1.0d0/2.0d0)*r**2*(-omegaI*rI**2 + omegaO*rO**2)**2/(-rI**2 + rO** 2)**2 + 2*rI**2 &
+        *rO**2*(-omegaI + omegaO)*(-omegaI*rI**2 + omegaO* rO**2)*log(r)/(-rI**2 &
+        + rO**2)**2 - 1.0d0/2.0d0*rI**4*rO**4*( -omegaI + omegaO)**2/(r**2*(-rI**2 &
+        + rO**2)**2) - (-2*pi*(-1.0d0/ 2.0d0*rI**4*rO**4*(-omegaI + omegaO)**2*log(rI)/( &
+        -rI**2 + rO**2) **2 + rI**4*rO**2*(-omegaI + omegaO)*(-omegaI*rI**2 + omegaO &
+        *rO** 2)*(log(rI) - 0.5d0)/(-rI**2 + rO**2)**2 + (1.0d0/8.0d0)*rI**4*( -omegaI &
+        *rI**2 + omegaO*rO**2)**2/(-rI**2 + rO**2)**2) + 2*pi*( -1.0d0/2.0d0*rI**4*rO**4*( &
+        -omegaI + omegaO)**2*log(rO)/(-rI**2 + rO**2)**2 + rI**2*rO**4*(-omegaI + omegaO)*( &
+        -omegaI*rI**2 + omegaO*rO**2)*(log(rO) - 0.5d0)/(-rI**2 + rO**2)**2 + (1.0d0 &
+        / 8.0d0)*rO**4*(-omegaI*rI**2 + omegaO*rO**2)**2/(-rI**2 + rO**2)** 2))/(pi*( &
+        -rI**2 + rO**2)))
 end function p
 
 ! Subroutine u
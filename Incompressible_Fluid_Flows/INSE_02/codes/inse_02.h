@@ -23,7 +23,16 @@ inline double p(double x, double y) {
         -pow(rI, 2) + pow(rO, 2), 2) + 2*pow(rI, 2)*pow(rO, 2)*(-omegaI + omegaO)*(-omegaI \
         *pow(rI, 2) + omegaO*pow(rO, 2))*log(r)/pow(-pow(rI, 2) + pow(rO, 2), 2) - 1.0/2.0 \
         *pow(rI, 4)*pow(rO, 4)*pow(-omegaI + omegaO, 2)/(pow(r, 2)*pow(-pow(rI, 2) \
-        + pow(rO, 2), 2)) - (-cI + cO)/(pi*(-pow(rI, 2) + pow(rO, 2))));
+        + pow(rO, 2), 2)) - (-2*pi*(-1.0/2.0*pow(rI, 4)*pow(rO, 4)*pow(-omegaI + omegaO, 2) \
+        *log(rI)/pow(-pow(rI, 2) + pow(rO, 2), 2) + pow(rI, 4)*pow(rO, 2)*(-omegaI \
+        + omegaO)*(-omegaI*pow(rI, 2) + omegaO*pow(rO, 2))*(log(rI) - 0.5)/pow(-pow(rI, 2) \
+        + pow(rO, 2), 2) + (1.0/8.0)*pow(rI, 4)*pow(-omegaI*pow(rI, 2) + omegaO \
+        *pow(rO, 2), 2)/pow(-pow(rI, 2) + pow(rO, 2), 2)) + 2*pi*(-1.0/2.0*pow(rI, 4) \
+        *pow(rO, 4)*pow(-omegaI + omegaO, 2)*log(rO)/pow(-pow(rI, 2) + pow(rO, 2), 2) \
+        + pow(rI, 2)*pow(rO, 4)*(-omegaI + omegaO)*(-omegaI*pow(rI, 2) + omegaO*pow(rO, 2)) \
+        *(log(rO) - 0.5)/pow(-pow(rI, 2) + pow(rO, 2), 2) + (1.0/8.0)*pow(rO, 4)*pow( \
+        -omegaI*pow(rI, 2) + omegaO*pow(rO, 2), 2)/pow(-pow(rI, 2) + pow(rO, 2), 2)))/(pi*( \
+        -pow(rI, 2) + pow(rO, 2))));
     return res;
 }
 
@@ -22,8 +22,14 @@ function res = p(x, y)
     theta = atan2(y, x);
     res = rho.*(r.^2.*(-omegaI.*rI.^2 + omegaO.*rO.^2).^2./(2*(-rI.^2 + rO.^2).^2) + 2*rI.^2.*rO.^2.*( ...
         -omegaI + omegaO).*(-omegaI.*rI.^2 + omegaO.*rO.^2).*log(r)./(-rI.^2 + rO.^2).^2 ...
-        - rI.^4.*rO.^4.*(-omegaI + omegaO).^2./(2*r.^2.*(-rI.^2 + rO.^2).^2) - (-cI + cO). ...
-        /(pi.*(-rI.^2 + rO.^2)));
+        - rI.^4.*rO.^4.*(-omegaI + omegaO).^2./(2*r.^2.*(-rI.^2 + rO.^2).^2) - (-2*pi.*( ...
+        -rI.^4.*rO.^4.*(-omegaI + omegaO).^2.*log(rI)./(2*(-rI.^2 + rO.^2).^2) + rI.^4. ...
+        *rO.^2.*(-omegaI + omegaO).*(-omegaI.*rI.^2 + omegaO.*rO.^2).*(log(rI) - 0.5)./( ...
+        -rI.^2 + rO.^2).^2 + rI.^4.*(-omegaI.*rI.^2 + omegaO.*rO.^2).^2./(8*(-rI.^2 ...
+        + rO.^2).^2)) + 2*pi.*(-rI.^4.*rO.^4.*(-omegaI + omegaO).^2.*log(rO)./(2*(-rI.^2 ...
+        + rO.^2).^2) + rI.^2.*rO.^4.*(-omegaI + omegaO).*(-omegaI.*rI.^2 + omegaO.*rO.^2). ...
+        *(log(rO) - 0.5)./(-rI.^2 + rO.^2).^2 + rO.^4.*(-omegaI.*rI.^2 + omegaO.*rO.^2).^2. ...
+        /(8*(-rI.^2 + rO.^2).^2)))./(pi.*(-rI.^2 + rO.^2)));
 end
 
 % Function u
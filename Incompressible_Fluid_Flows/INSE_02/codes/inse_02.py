@@ -17,8 +17,14 @@ def p(x, y):
     theta = math.atan2(y, x)
     res = rho*((1/2)*r**2*(-omegaI*rI**2 + omegaO*rO**2)**2/(-rI**2 + rO**2)**2 + 2*rI**2*rO**2*( \
         -omegaI + omegaO)*(-omegaI*rI**2 + omegaO*rO**2)*math.log(r)/(-rI**2 + rO**2)**2 \
-        - 1/2*rI**4*rO**4*(-omegaI + omegaO)**2/(r**2*(-rI**2 + rO**2)**2) - (-cI + cO)/(pi \
-        *(-rI**2 + rO**2)))
+        - 1/2*rI**4*rO**4*(-omegaI + omegaO)**2/(r**2*(-rI**2 + rO**2)**2) - (-2*pi*(-1/2 \
+        *rI**4*rO**4*(-omegaI + omegaO)**2*math.log(rI)/(-rI**2 + rO**2)**2 + rI**4*rO**2*( \
+        -omegaI + omegaO)*(-omegaI*rI**2 + omegaO*rO**2)*(math.log(rI) - 0.5)/(-rI**2 \
+        + rO**2)**2 + (1/8)*rI**4*(-omegaI*rI**2 + omegaO*rO**2)**2/(-rI**2 + rO**2)**2) \
+        + 2*pi*(-1/2*rI**4*rO**4*(-omegaI + omegaO)**2*math.log(rO)/(-rI**2 + rO**2)**2 \
+        + rI**2*rO**4*(-omegaI + omegaO)*(-omegaI*rI**2 + omegaO*rO**2)*(math.log(rO) \
+        - 0.5)/(-rI**2 + rO**2)**2 + (1/8)*rO**4*(-omegaI*rI**2 + omegaO*rO**2)**2/(-rI**2 \
+        + rO**2)**2))/(pi*(-rI**2 + rO**2)))
     return res
 
 # Function u
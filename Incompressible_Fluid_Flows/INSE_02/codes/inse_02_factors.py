@@ -0,0 +1,70 @@
+# Auto-generated by generate_code.py
+
+import math
+
+# Global constants
+rO = 1.0
+rI = 0.5
+nu = 1.0
+rho = 1.0
+omegaO = 1.0
+omegaI = -2.0
+pi = 3.141592653589793
+
+# Coordinates of the factored kernels
+COORDINATES = {
+    "p": ("r", "theta"),
+    "u": ("r", "theta"),
+    "f": ("r", "theta"),
+    "g": ("r", "theta"),
+}
+
+# Coordinates the functions depend on
+DEPENDENCIES = {
+    "p": ("r",),
+    "u": ("r", "theta"),
+    "f": (),
+    "g": (),
+}
+
+# Function p (factors of r, theta)
+def p(r, theta):
+    r_f0 = (0.25*omegaI**2*r**4*rI**6 - 0.25*omegaI**2*r**4*rI**4*rO**2 - 0.125*omegaI**2*r**2*rI**8 \
+        + 1.0*omegaI**2*r**2*rI**6*rO**2*math.log(r) - 1.0*omegaI**2*r**2*rI**6*rO**2*math.log(rI) \
+        + 0.5*omegaI**2*r**2*rI**6*rO**2 - 1.0*omegaI**2*r**2*rI**4*rO**4*math.log(r) + 0.5*omegaI**2 \
+        *r**2*rI**4*rO**4*math.log(rI) + 0.5*omegaI**2*r**2*rI**4*rO**4*math.log(rO) - 0.375*omegaI**2 \
+        *r**2*rI**4*rO**4 - 0.25*omegaI**2*rI**6*rO**4 + 0.25*omegaI**2*rI**4*rO**6 - 0.5*omegaI*omegaO \
+        *r**4*rI**4*rO**2 + 0.5*omegaI*omegaO*r**4*rI**2*rO**4 - 1.0*omegaI*omegaO*r**2*rI**6*rO**2 \
+        *math.log(r) + 1.0*omegaI*omegaO*r**2*rI**6*rO**2*math.log(rI) - 0.25*omegaI*omegaO*r**2*rI**6 \
+        *rO**2 + 1.0*omegaI*omegaO*r**2*rI**2*rO**6*math.log(r) - 1.0*omegaI*omegaO*r**2*rI**2*rO**6 \
+        *math.log(rO) + 0.25*omegaI*omegaO*r**2*rI**2*rO**6 + 0.5*omegaI*omegaO*rI**6*rO**4 - 0.5 \
+        *omegaI*omegaO*rI**4*rO**6 + 0.25*omegaO**2*r**4*rI**2*rO**4 - 0.25*omegaO**2*r**4*rO**6 + 1.0 \
+        *omegaO**2*r**2*rI**4*rO**4*math.log(r) - 0.5*omegaO**2*r**2*rI**4*rO**4*math.log(rI) - 0.5 \
+        *omegaO**2*r**2*rI**4*rO**4*math.log(rO) + 0.375*omegaO**2*r**2*rI**4*rO**4 - 1.0*omegaO**2 \
+        *r**2*rI**2*rO**6*math.log(r) + 1.0*omegaO**2*r**2*rI**2*rO**6*math.log(rO) - 0.5*omegaO**2 \
+        *r**2*rI**2*rO**6 + 0.125*omegaO**2*r**2*rO**8 - 0.25*omegaO**2*rI**6*rO**4 + 0.25*omegaO**2 \
+        *rI**4*rO**6)/r**2
+    res = 2.0*rho/((rI - rO)**3*(rI + rO)**3)*r_f0
+    return res
+
+# Function u (factors of r, theta)
+def u(r, theta):
+    r_f0 = (omegaI*r**2*rI**2 + omegaI*rI**2*rO**2 - omegaO*r**2*rO**2 - omegaO*rI**2*rO**2)/r
+    theta_f0 = math.sin(theta)
+    theta_f1 = math.cos(theta)
+    res = [0.0]*2
+    res[0] = -1/((rI - rO)*(rI + rO))*r_f0*theta_f0
+    res[1] = 1/((rI - rO)*(rI + rO))*r_f0*theta_f1
+    return res
+
+# Function f (factors of r, theta)
+def f(r, theta):
+    res = [0.0]*2
+    res[0] = 0
+    res[1] = 0
+    return res
+
+# Function g (factors of r, theta)
+def g(r, theta):
+    res = 0
+    return res
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | AVERAGES
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for computing the exact cell averages of the generated
+fields (source terms `f`/`fA`/`fB`, exact solutions) and the exact face
+averages of diffusive and convective fluxes used to verify finite volume
+schemes, on meshes loaded with `meshes.py`. Integrals are computed on the
+exact geometry: cells with a face on a curved boundary or interface include
+the segment between the face chord and the exact curve (integrated in polar
+coordinates), and curved faces are integrated along the exact curve with the
+exact normals. For the conjugate heat transfer cases, the diffusive fluxes of
+both subdomains through the interface and, when the case defines the heat
+transfer coefficient `H`, the flux of the heat transfer law are provided.
+Cells and faces are processed in blocks by a pool of threads, with all the
+points of a block evaluated at once. Each integral is computed with Gauss
+rules of orders p and p + 2, and their difference is reported as the
+estimated integration error; with a tolerance, the order is raised (up to a
+maximum) only for the cells or faces whose estimate exceeds it.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python averages.py ../meshes/triamesh_4.msh --fields f phi --fluxes phi --tol 1e-12 --output averages.npz
+
+===============================================================================
+"""
+
+# import modules
+import sys
+import time
+import argparse
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from meshes import load_mesh
+from topology import load_topology, INTERFACE_TAG
+from geometry import load_geometry, curved_faces, curve_radius, CURVES
+from fields import load_bound_case, field_functions, region_permutation, dispatch, SUBDOMAINS, DEFAULT_ARGUMENTS
+from quadrature import gauss_legendre, cell_quadrature, face_quadrature
+from errors import exact_gradient
+
+#============================================
+# PARAMETERS
+#============================================
+
+# default order of the Gauss rules (the estimate uses order + 2)
+AVERAGE_ORDER = 4
+
+# maximum order of adaptive integration
+MAX_ORDER = 16
+
+# cells (faces) per thread block
+BLOCK_SIZE = 1 << 14
+
+#============================================
+# INTEGRANDS
+#============================================
+
+# field integrand
+def field_integrand(case, field):
+    """
+    Return the integrand func(x, y, normals, tags) of a generated field,
+    evaluated with the subdomain function of each point's region tag.
+    """
+    def func(x, y, normals, tags):
+        return dispatch(case, field, x, y, labels=tags)
+    return func
+
+# coefficient by region
+def region_coefficient(case, name, tags):
+    """
+    Return the values of a constant per region tag: `<name><suffix>` of the
+    subdomain (e.g. alphaA, alphaB) or `<name>` for the whole domain, or 1.
+    """
+    consts = case["constants"]
+    if name is None:
+        return np.ones(len(tags))
+    values = {tag: consts.get(name + suffix, consts.get(name)) for tag, suffix in SUBDOMAINS.items()}
+    unique, inverse = np.unique(tags, return_inverse=True)
+    coefficient = []
+    for tag in unique:
+        value = values.get(int(tag), consts.get(name))
+        if value is None:
+            raise KeyError(f"Constant '{name}' not defined for region tag {tag} in {case['path']}")
+        coefficient.append(value)
+    return np.asarray(coefficient, dtype=np.float64)[inverse.ravel()]
+
+# diffusive flux integrand
+def diffusive_flux(case, field, coefficient="alpha"):
+    """
+    Return the integrand func(x, y, normals, tags) of the diffusive flux
+    -k grad(field).n, with the coefficient k of each region (see
+    `region_coefficient`). Vector fields give one flux per component.
+    """
+    def func(x, y, normals, tags):
+        grad = exact_gradient(case, field, x, y, region_permutation(tags))
+        flux = np.einsum("n...d,nd->n...", grad, normals)
+        k = region_coefficient(case, coefficient, tags)
+        return -k.reshape((-1,) + (1,)*(flux.ndim - 1))*flux
+    return func
+
+# convective flux integrand
+def convective_flux(case, field, velocity="u"):
+    """
+    Return the integrand func(x, y, normals, tags) of the convective flux
+    field*(u.n) with the velocity field of each region.
+    """
+    def func(x, y, normals, tags):
+        perm = region_permutation(tags)
+        values = dispatch(case, field, x, y, perm=perm)
+        un = np.sum(dispatch(case, velocity, x, y, perm=perm)*normals, axis=-1)
+        return values*un.reshape((-1,) + (1,)*(values.ndim - 1))
+    return func
+
+#============================================
+# CELL INTEGRALS
+#============================================
+
+# integrals over segments between chords and curves
+def segment_integrals(func, curved, tags, order):
+    """
+    Return the integrals of func over the regions between the chords and the
+    exact curves of curved faces, in polar coordinates (Gauss rules in the
+    angle and in the radius between the chord and the curve), positive when
+    the curve lies farther from the centre than the chord.
+    """
+    xi, w = gauss_legendre(order)
+    theta, R, ends, dtheta = curved["theta"], curved["radius"], curved["ends"], curved["dtheta"]
+    # radius of the chord at each angle
+    d = ends[:, 1] - ends[:, 0]
+    e = np.stack((np.cos(theta), np.sin(theta)), axis=-1)
+    rc = (ends[:, 0, 0]*d[:, 1] - ends[:, 0, 1]*d[:, 0])[:, None]/(e[..., 0]*d[:, None, 1] - e[..., 1]*d[:, None, 0])
+    r = rc[..., None] + (R - rc)[..., None]*xi
+    x = (r*np.cos(theta)[..., None]).ravel()
+    y = (r*np.sin(theta)[..., None]).ravel()
+    m, qt, qr = r.shape
+    values = func(x, y, None, np.repeat(tags, qt*qr))
+    values = values.reshape((m, qt, qr) + values.shape[1:])
+    weights = (curved["wtheta"]*np.abs(dtheta)[:, None]*(R - rc))[..., None]*w*r
+    return np.einsum("mtr,mtr...->m...", weights, values)
+
+# exact curve data of faces
+def curve_data(mesh, consts, name, order):
+    """
+    Return the exact curve data of the curved faces of a mesh for segment
+    integrals: faces, owner and neighbour cells, end points, angles and radii
+    at the Gauss points, angle increments, angular weights, and the side (+1
+    when the owner cell lies on the centre side of the curve).
+    """
+    topo = load_topology(mesh)
+    nodes = np.asarray(mesh["nodes"])
+    face_tags = np.asarray(topo["face_tags"])
+    xi, w = gauss_legendre(order)
+    data = {key: [] for key in ["faces", "ends", "theta", "radius", "dtheta"]}
+    for tag, curve in CURVES.get(name, {}).items():
+        faces = np.flatnonzero(face_tags == tag)
+        ends = nodes[np.asarray(topo["faces"])[faces]]
+        theta_a = np.arctan2(ends[:, 0, 1], ends[:, 0, 0])
+        dtheta = np.angle(np.exp(1j*(np.arctan2(ends[:, 1, 1], ends[:, 1, 0]) - theta_a)))
+        theta = theta_a[:, None] + dtheta[:, None]*xi[None, :]
+        data["faces"].append(faces)
+        data["ends"].append(ends)
+        data["theta"].append(theta)
+        data["radius"].append(curve_radius(curve, consts, theta)[0])
+        data["dtheta"].append(dtheta)
+    if not data["faces"]:
+        return None
+    data = {key: np.concatenate(value) for key, value in data.items()}
+    geom = load_geometry(mesh)
+    midpoints = np.asarray(geom["face_midpoints"])[data["faces"]]
+    normals = np.asarray(geom["face_normals"])[data["faces"]]
+    data["side"] = np.sign(np.sum(normals*midpoints, axis=1))
+    data["face_cells"] = np.asarray(topo["face_cells"])[data["faces"]]
+    data["wtheta"] = np.broadcast_to(w, data["theta"].shape)
+    return data
+
+# integrals over cells
+def cell_integrals(mesh, func, order=AVERAGE_ORDER, cells=None, curves=None, workers=None):
+    """
+    Return the integrals of func(x, y, normals, tags) over the selected cells
+    (all by default), on the exact geometry when the curve data of the mesh
+    (see `curve_data`) is given. Straight cells are integrated in blocks by a
+    pool of threads.
+    """
+    nodes = np.asarray(mesh["nodes"])
+    all_cells = np.asarray(mesh["cells"])
+    tags = np.asarray(mesh["cell_tags"])
+    cells = np.arange(len(all_cells)) if cells is None else np.asarray(cells)
+    def block(index):
+        quad = cell_quadrature({"nodes": nodes, "cells": all_cells[index]}, order)
+        nq = quad["nq"]
+        values = func(quad["points"][:, 0], quad["points"][:, 1], None, np.repeat(tags[index], nq))
+        w = quad["weights"].reshape(len(index), nq)
+        return np.einsum("cq,cq...->c...", w, values.reshape((len(index), nq) + values.shape[1:]))
+    blocks = [cells[i:i + BLOCK_SIZE] for i in range(0, len(cells), BLOCK_SIZE)]
+    if len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            integrals = np.concatenate(list(pool.map(block, blocks)))
+    else:
+        integrals = block(cells)
+    if curves is None:
+        return integrals
+    # segments between the chords and the exact curves, for the owner and neighbour cells
+    local = np.full(len(all_cells), -1)
+    local[cells] = np.arange(len(cells))
+    for column, sign in ((0, 1.0), (1, -1.0)):
+        owner = curves["face_cells"][:, column]
+        select = np.flatnonzero(owner >= 0)
+        select = select[local[owner[select]] >= 0]
+        if len(select) == 0:
+            continue
+        subset = {key: value[select] for key, value in curves.items()}
+        segments = segment_integrals(func, subset, tags[owner[select]], order)
+        side = (sign*curves["side"][select]).reshape((-1,) + (1,)*(segments.ndim - 1))
+        np.add.at(integrals, local[owner[select]], side*segments)
+    return integrals
+
+#============================================
+# FACE INTEGRALS
+#============================================
+
+# integrals over faces
+def face_integrals(mesh, func, order=AVERAGE_ORDER, faces=None, consts=None, name=None, side=0, workers=None):
+    """
+    Return the integrals of func(x, y, normals, tags) over the selected faces
+    (all by default) and their lengths, with the unit normals pointing out of
+    the owner cell and the region tags of the owner cell (side=0) or the
+    neighbour cell (side=1). Faces on the curves of the case `name` are
+    integrated along the exact curves with the exact normals.
+    """
+    topo = load_topology(mesh)
+    geom = load_geometry(mesh)
+    faces = np.arange(len(topo["faces"])) if faces is None else np.asarray(faces)
+    cells = np.asarray(topo["face_cells"])[faces, side]
+    if np.any(cells < 0):
+        raise ValueError("Neighbour cells requested for boundary faces.")
+    face_tags = np.asarray(mesh["cell_tags"])[cells]
+    quad = face_quadrature(mesh, order, faces)
+    nq = quad["nq"]
+    points = quad["points"].reshape(len(faces), nq, 2).copy()
+    weights = quad["weights"].reshape(len(faces), nq).copy()
+    normals = np.repeat(np.asarray(geom["face_normals"])[faces][:, None, :], nq, axis=1)
+    if name is not None and CURVES.get(name):
+        curved = curved_faces(mesh, consts, name, order=nq)
+        position = np.full(len(topo["faces"]), -1)
+        position[faces] = np.arange(len(faces))
+        select = position[curved["faces"]] >= 0
+        rows = position[curved["faces"][select]]
+        points[rows] = curved["points"][select]
+        weights[rows] = curved["weights"][select]
+        # exact normals oriented out of the owner cell
+        exact = curved["normals"][select]
+        orient = np.sign(np.sum(exact[:, nq//2]*normals[rows, nq//2], axis=1))
+        normals[rows] = exact*orient[:, None, None]
+    def block(index):
+        values = func(points[index, :, 0].ravel(), points[index, :, 1].ravel(), normals[index].reshape(-1, 2),
+                      np.repeat(face_tags[index], nq))
+        return np.einsum("fq,fq...->f...", weights[index], values.reshape((len(index), nq) + values.shape[1:]))
+    blocks = [np.arange(i, min(i + BLOCK_SIZE, len(faces))) for i in range(0, len(faces), BLOCK_SIZE)]
+    if len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            integrals = np.concatenate(list(pool.map(block, blocks)))
+    else:
+        integrals = block(np.arange(len(faces)))
+    return integrals, weights.sum(axis=1)
+
+#============================================
+# ADAPTIVE INTEGRATION
+#============================================
+
+# integrals with error estimates
+def estimated_integrals(compute, sizes, order=AVERAGE_ORDER, tol=None, max_order=MAX_ORDER):
+    """
+    Return the integrals over the entities of the given sizes (areas or
+    lengths) computed by compute(index, order) with the rule of order p + 2,
+    the estimated errors |I(p + 2) - I(p)| (a conservative estimate of the
+    error of the returned integrals) and the order p of each entity. With a
+    tolerance, p is raised by 2, up to max_order, for the entities whose
+    estimated error of the average exceeds tol*max(1, |average|).
+    """
+    n = len(sizes)
+    index = np.arange(n)
+    coarse = compute(index, order)
+    fine = compute(index, order + 2)
+    integrals = fine.copy()
+    def error(values, reference):
+        return np.abs(values - reference).reshape(len(values), -1).max(axis=1)
+    estimates = error(fine, coarse)
+    orders = np.full(n, order, dtype=np.int32)
+    scale = sizes*np.maximum(1.0, error(integrals/sizes.reshape((-1,) + (1,)*(integrals.ndim - 1)), 0.0))
+    active = index[estimates > tol*scale] if tol is not None else index[:0]
+    while len(active) and order + 4 <= max_order:
+        order += 2
+        fine = compute(active, order + 2)
+        estimates[active] = error(fine, integrals[active])
+        integrals[active] = fine
+        orders[active] = order
+        active = active[estimates[active] > tol*scale[active]]
+    return integrals, estimates, orders
+
+# exact cell averages of a field
+def cell_averages(mesh, case, field, order=AVERAGE_ORDER, tol=None, max_order=MAX_ORDER, exact=True,
+                  workers=None):
+    """
+    Return the exact cell averages of a generated field on the exact geometry
+    (with `exact=True`) as a dictionary:
+      averages   (nc, ...)  float64  cell averages
+      areas      (nc,)      float64  cell areas
+      estimates  (nc,)      float64  estimated integration errors of the averages
+      orders     (nc,)      int32    orders of the Gauss rules
+    """
+    func = field_integrand(case, field)
+    def compute(index, p, func=func):
+        curves = curve_data(mesh, case["constants"], case["name"], p) if exact else None
+        return cell_integrals(mesh, func, p, index, curves, workers)
+    areas = compute(None, order + 2, lambda x, y, normals, tags: np.ones(len(x)))
+    integrals, estimates, orders = estimated_integrals(compute, areas, order, tol, max_order)
+    shape = (-1,) + (1,)*(integrals.ndim - 1)
+    return {"averages": integrals/areas.reshape(shape), "areas": areas, "estimates": estimates/areas,
+            "orders": orders}
+
+# exact face averages of a flux
+def face_averages(mesh, case, func, faces=None, order=AVERAGE_ORDER, tol=None, max_order=MAX_ORDER,
+                  exact=True, side=0, workers=None):
+    """
+    Return the exact face averages of an integrand func(x, y, normals, tags)
+    (e.g. `diffusive_flux`, `convective_flux`) over the selected faces, along
+    the exact curves (with `exact=True`), as a dictionary:
+      faces      (m,)       int64    faces
+      averages   (m, ...)   float64  face averages
+      lengths    (m,)       float64  face lengths
+      estimates  (m,)       float64  estimated integration errors of the averages
+      orders     (m,)       int32    orders of the Gauss rules
+    """
+    topo = load_topology(mesh)
+    faces = np.arange(len(topo["faces"])) if faces is None else np.asarray(faces)
+    name = case["name"] if exact else None
+    def compute(index, p):
+        return face_integrals(mesh, func, p, faces[index], case["constants"], name, side, workers)[0]
+    _, lengths = face_integrals(mesh, lambda x, y, normals, tags: np.ones(len(x)), order + 2, faces,
+                                case["constants"], name, side, workers)
+    integrals, estimates, orders = estimated_integrals(compute, lengths, order, tol, max_order)
+    shape = (-1,) + (1,)*(integrals.ndim - 1)
+    return {"faces": faces, "averages": integrals/lengths.reshape(shape), "lengths": lengths,
+            "estimates": estimates/lengths, "orders": orders}
+
+# exact interface fluxes
+def interface_fluxes(mesh, case, field="phi", coefficient="alpha", order=AVERAGE_ORDER, tol=None,
+                     max_order=MAX_ORDER, workers=None):
+    """
+    Return the face averages on the interface faces, along the exact
+    interface with the normal pointing from subdomain A to subdomain B, of:
+      flux_A    diffusive flux of subdomain A, -k^A grad(field^A).n
+      flux_B    diffusive flux of subdomain B, -k^B grad(field^B).n
+      jump      field^A - field^B
+      transfer  flux of the heat transfer law, -H (field^A - field^B)
+                (only when the case defines H)
+    each as a dictionary of `face_averages` (transfer equals flux_A for an
+    exact solution, and flux_A equals flux_B when the fluxes are conserved).
+    """
+    topo = load_topology(mesh)
+    faces = np.flatnonzero(np.asarray(topo["face_tags"]) == INTERFACE_TAG)
+    tag_a, tag_b = sorted(SUBDOMAINS)
+    # integrands take the tags of the owner cells, whose normals are flipped to point from A to B
+    def towards_b(tag, flux):
+        def func(x, y, normals, labels):
+            sign = np.where(labels == tag_a, 1.0, -1.0)
+            return flux(x, y, normals*sign[:, None], np.full(len(x), tag, dtype=np.int32))
+        return func
+    def jump(x, y, normals, labels):
+        return dispatch(case, field, x, y, labels=np.full(len(x), tag_a)) \
+            - dispatch(case, field, x, y, labels=np.full(len(x), tag_b))
+    flux = diffusive_flux(case, field, coefficient)
+    integrands = {"flux_A": towards_b(tag_a, flux), "flux_B": towards_b(tag_b, flux), "jump": jump}
+    if "H" in case["functions"]:
+        integrands["transfer"] = lambda x, y, normals, labels: -case["functions"]["H"](x, y)*jump(x, y, normals, labels)
+    return {key: face_averages(mesh, case, func, faces, order, tol, max_order, True, 0, workers)
+            for key, func in integrands.items()}
+
+#============================================
+# MAIN
+#============================================
+
+# compute averages from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact cell and face averages for finite volume verification.")
+    parser.add_argument("file", help="mesh file in MSH format")
+    parser.add_argument("--fields", nargs="*", default=["f"], help="fields to average over cells")
+    parser.add_argument("--fluxes", nargs="*", default=[], help="fields whose diffusive and convective face fluxes to average")
+    parser.add_argument("--coefficient", default="alpha", help="diffusion coefficient constant (per subdomain)")
+    parser.add_argument("--velocity", default="u", help="velocity field of the convective fluxes")
+    parser.add_argument("--order", type=int, default=AVERAGE_ORDER, help="order of the Gauss rules")
+    parser.add_argument("--tol", type=float, help="tolerance of adaptive integration")
+    parser.add_argument("--straight", action="store_true", help="integrate on the straight-sided mesh")
+    parser.add_argument("--workers", type=int, help="threads (default: all processors)")
+    parser.add_argument("--time", type=float, help="time of unsteady cases (argument `t` of the functions, "
+                        f"default {DEFAULT_ARGUMENTS['t']})")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    parser.add_argument("--output", help="write the averages to this NPZ file")
+    args = parser.parse_args(argv)
+    params = {"t": args.time} if args.time is not None else None
+    try:
+        case = load_bound_case(args.codes, params)
+    except ValueError as e:
+        parser.error(str(e))
+    mesh = load_mesh(args.file)
+    exact = not args.straight
+    results = {}
+    def report(key, res, start):
+        print(f"{key:24s} {len(res['averages']):9d} entities  max estimate {res['estimates'].max(initial=0.0):.3e}"
+              f"  max order {res['orders'].max(initial=0)}  {time.perf_counter() - start:.3f} s")
+        results.update({f"{key}_{name}": value for name, value in res.items()})
+    for field in args.fields:
+        start = time.perf_counter()
+        report(f"cell {field}", cell_averages(mesh, case, field, args.order, args.tol, exact=exact,
+                                              workers=args.workers), start)
+    for field in args.fluxes:
+        fluxes = [("diffusive", diffusive_flux(case, field, args.coefficient))]
+        try:
+            field_functions(case, args.velocity)
+        except KeyError:
+            pass
+        else:
+            fluxes.append(("convective", convective_flux(case, field, args.velocity)))
+        for kind, func in fluxes:
+            start = time.perf_counter()
+            report(f"face {kind} {field}", face_averages(mesh, case, func, None, args.order, args.tol,
+                                                         exact=exact, workers=args.workers), start)
+        if INTERFACE_TAG in CURVES.get(case["name"], {}):
+            start = time.perf_counter()
+            for key, res in interface_fluxes(mesh, case, field, args.coefficient, args.order, args.tol,
+                                             workers=args.workers).items():
+                report(f"interface {key} {field}", res, start)
+                start = time.perf_counter()
+    if args.output:
+        np.savez(args.output, **results)
+        print("Wrote", args.output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | ERRORS
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for computing the errors of numerical solutions against the
+generated exact solutions (`codes/<name>.py`) on meshes loaded with
+`meshes.py`. Numerical solutions are given as nodal values (interpolated with
+the linear or bilinear shape functions), cell values (compared with the exact
+cell averages) or values at the Gauss points of `quadrature.py`. The L1, L2
+and L-infinity norms of the error, and the H1 seminorm when gradients are
+available, are computed with vectorised quadrature over all cells at once,
+globally and per subdomain (cell tags 100, 200, ...). Vector fields use the
+Euclidean norm of the error at each point.
+The exact values and gradients at the Gauss points only depend on the mesh
+and case, so they are computed once (`error_reference`) and reused for every
+numerical solution. Exact gradients use the generated function `grad<field>`
+when available, and fourth-order central differences of the exact field
+otherwise.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python errors.py ../meshes/triamesh_4.msh phi solution.npy --location cells
+
+===============================================================================
+"""
+
+# import modules
+import sys
+import argparse
+import numpy as np
+from meshes import load_mesh
+from fields import load_bound_case, load_regions, field_functions, expand_permutation, dispatch, DEFAULT_ARGUMENTS
+from quadrature import cell_quadrature, interpolate
+
+#============================================
+# PARAMETERS
+#============================================
+
+# locations of the values of numerical solutions
+LOCATIONS = ["nodes", "cells", "quadrature"]
+
+# error norms
+NORMS = ["L1", "L2", "Linf", "H1"]
+
+# quadrature order of the error norms
+ERROR_ORDER = 4
+
+# step of the central differences of exact gradients
+FD_STEP = 1.0e-4
+
+#============================================
+# EXACT VALUES
+#============================================
+
+# exact gradient at points
+def exact_gradient(case, field, x, y, perm):
+    """
+    Return the gradient of an exact field at the points (x, y) with the region
+    permutation `perm`, with an extra trailing axis of length 2. Uses the
+    generated function `grad<field>` (per subdomain) when available, and
+    fourth-order central differences otherwise.
+    """
+    try:
+        field_functions(case, "grad" + field)
+    except KeyError:
+        pass
+    else:
+        return dispatch(case, "grad" + field, x, y, perm=perm)
+    h = FD_STEP
+    def diff(dx, dy):
+        return (8.0*(dispatch(case, field, x + h*dx, y + h*dy, perm=perm)
+                     - dispatch(case, field, x - h*dx, y - h*dy, perm=perm))
+                - (dispatch(case, field, x + 2.0*h*dx, y + 2.0*h*dy, perm=perm)
+                   - dispatch(case, field, x - 2.0*h*dx, y - 2.0*h*dy, perm=perm)))/(12.0*h)
+    return np.stack((diff(1.0, 0.0), diff(0.0, 1.0)), axis=-1)
+
+# exact reference values
+def error_reference(mesh, case, field, order=ERROR_ORDER, gradient=True):
+    """
+    Return the exact values of a field needed by `error_norms`:
+      quad      dict                 cell quadrature (see `cell_quadrature`)
+      order     int                  quadrature order
+      exact     (nc*nq, ...)         exact values at the Gauss points
+      averages  (nc, ...)            exact cell averages
+      areas     (nc,)                cell areas
+      gradient  (nc*nq, ..., 2)      exact gradients at the Gauss points (or None)
+      regions   dict                 region permutation of the cells (see `load_regions`)
+    """
+    quad = cell_quadrature(mesh, order)
+    nc, nq = len(mesh["cells"]), quad["nq"]
+    regions = load_regions(mesh)
+    perm = expand_permutation(regions, nq)
+    x, y = quad["points"][:, 0], quad["points"][:, 1]
+    exact = dispatch(case, field, x, y, perm=perm)
+    weights = quad["weights"].reshape(nc, nq)
+    areas = weights.sum(axis=1)
+    averages = np.einsum("cq,cq...->c...", weights, exact.reshape((nc, nq) + exact.shape[1:]))
+    averages /= areas.reshape((nc,) + (1,)*(averages.ndim - 1))
+    return {
+        "field": field, "quad": quad, "order": order, "exact": exact, "averages": averages, "areas": areas,
+        "gradient": exact_gradient(case, field, x, y, perm) if gradient else None, "regions": regions,
+    }
+
+#============================================
+# ERROR NORMS
+#============================================
+
+# location of numerical values
+def value_location(mesh, values, nq, location=None):
+    """
+    Return the location of the values of a numerical solution ("nodes",
+    "cells" or "quadrature"), inferred from their number when not given, and
+    check that their number matches it.
+    """
+    n = len(values)
+    sizes = {"nodes": len(mesh["nodes"]), "cells": len(mesh["cells"]), "quadrature": len(mesh["cells"])*nq}
+    if location is None:
+        matches = [key for key, size in sizes.items() if size == n]
+        if len(matches) != 1:
+            raise ValueError(f"Cannot infer the location of {n} values (nodes, cells and Gauss points: "
+                             f"{sizes['nodes']}, {sizes['cells']}, {sizes['quadrature']}).")
+        return matches[0]
+    if location not in LOCATIONS:
+        raise ValueError(f"Unknown location '{location}' (expected one of {', '.join(LOCATIONS)}).")
+    if sizes[location] != n:
+        raise ValueError(f"Expected {sizes[location]} values at the {location}, got {n}.")
+    return location
+
+# pointwise magnitude
+def magnitude(values):
+    """
+    Return the absolute values of scalars, or the Euclidean norms of vectors
+    (and gradients) over all trailing axes.
+    """
+    return np.abs(values) if values.ndim == 1 else np.sqrt((values**2).reshape(len(values), -1).sum(axis=1))
+
+# sums and maxima by region
+def region_sums(values, perm, maximum=False):
+    """
+    Return the sums (or maxima) of values over the regions of a region
+    permutation, reducing each contiguous block of sorted values.
+    """
+    ptr = np.asarray(perm["region_ptr"])
+    ufunc = np.maximum if maximum else np.add
+    return ufunc.reduceat(values[np.asarray(perm["region_order"])], ptr[:-1]) if len(values) else np.zeros(0)
+
+# error norms of a numerical solution
+def error_norms(mesh, values, reference, location=None, gradients=None):
+    """
+    Return the L1, L2, L-infinity and H1 (seminorm) errors of a numerical
+    solution against the exact reference values, as a dictionary with the
+    global norms and a "regions" dictionary {tag: norms}. Nodal values are
+    interpolated at the Gauss points (with gradients), cell values are
+    compared with the exact cell averages, and values at the Gauss points are
+    compared directly. Numerical gradients may be given at the location of
+    the values (constant per cell for cell values); otherwise H1 is None,
+    except for nodal values.
+    """
+    quad, order = reference["quad"], reference["order"]
+    nq = quad["nq"]
+    values = np.asarray(values, dtype=np.float64)
+    location = value_location(mesh, values, nq, location)
+    exact_grad = reference["gradient"]
+    # numerical values and gradients at the Gauss points (cell values stay per cell)
+    if location == "nodes":
+        if gradients is None and exact_grad is not None:
+            values, gradients = interpolate(mesh, values, order, gradient=True)
+        else:
+            values = interpolate(mesh, values, order)
+            gradients = None if gradients is None else interpolate(mesh, gradients, order)
+    elif location == "cells" and gradients is not None:
+        gradients = np.repeat(np.asarray(gradients, dtype=np.float64), nq, axis=0)
+    # L norms, discrete (area-weighted) for cell values
+    cell_perm = reference["regions"]
+    point_perm = expand_permutation(cell_perm, nq)
+    if location == "cells":
+        errors, weights, perm = magnitude(values - reference["averages"]), reference["areas"], cell_perm
+    else:
+        errors, weights, perm = magnitude(values - reference["exact"]), quad["weights"], point_perm
+    l1 = region_sums(weights*errors, perm)
+    l2 = region_sums(weights*errors**2, perm)
+    linf = region_sums(errors, perm, maximum=True)
+    # H1 seminorm at the Gauss points
+    h1 = None
+    if gradients is not None and exact_grad is not None:
+        h1 = region_sums(quad["weights"]*magnitude(np.asarray(gradients) - exact_grad)**2, point_perm)
+    def norms(r=None):
+        take = (lambda a: a.sum()) if r is None else (lambda a: a[r])
+        return {"L1": float(take(l1)), "L2": float(np.sqrt(take(l2))),
+                "Linf": float(linf.max(initial=0.0) if r is None else linf[r]),
+                "H1": None if h1 is None else float(np.sqrt(take(h1)))}
+    tags = np.asarray(cell_perm["region_tags"]).tolist()
+    return dict(norms(), regions={tag: norms(r) for r, tag in enumerate(tags)})
+
+# errors of a numerical solution
+def compute_errors(mesh, case, field, values, location=None, order=ERROR_ORDER, gradients=None):
+    """
+    Return the errors of a numerical solution of a field (see `error_norms`),
+    computing the exact reference values first. Reuse `error_reference` when
+    computing the errors of several solutions on the same mesh.
+    """
+    reference = error_reference(mesh, case, field, order, gradient=True)
+    return error_norms(mesh, values, reference, location, gradients)
+
+#============================================
+# MAIN
+#============================================
+
+# compute errors from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute the errors of numerical solutions.")
+    parser.add_argument("file", help="mesh file in MSH format")
+    parser.add_argument("field", help="exact field (e.g. phi, u, p)")
+    parser.add_argument("solution", help="numerical solution in NPY format (values at nodes, cells or Gauss points)")
+    parser.add_argument("--location", choices=LOCATIONS, help="location of the values (default: from their number)")
+    parser.add_argument("--order", type=int, default=ERROR_ORDER, help="quadrature order")
+    parser.add_argument("--time", type=float, help="time of unsteady cases (argument `t` of the functions, "
+                        f"default {DEFAULT_ARGUMENTS['t']})")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    args = parser.parse_args(argv)
+    params = {"t": args.time} if args.time is not None else None
+    try:
+        case = load_bound_case(args.codes, params)
+    except ValueError as e:
+        parser.error(str(e))
+    mesh = load_mesh(args.file)
+    errors = compute_errors(mesh, case, args.field, np.load(args.solution),
+                            args.location, args.order)
+    print(f"{'region':>8s}" + "".join(f"{norm:>14s}" for norm in NORMS))
+    rows = [("all", errors)] + list(errors["regions"].items())
+    for name, norms in rows:
+        print(f"{name!s:>8s}" + "".join(f"{norms[norm]:14.6e}" if norms[norm] is not None else f"{'-':>14s}"
+                                        for norm in NORMS))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | EXPORT
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for exporting meshes loaded with `meshes.py`, together with
+any set of fields (exact solutions, source terms, errors, ...), to VTK XML
+unstructured grid files (`.vtu`) for visualisation in ParaView or VisIt.
+All arrays are written as raw appended binary data directly from the NumPy
+arrays (no per-cell loop and no base64 encoding), optionally compressed with
+zlib in blocks by parallel threads. Fields are given by name as arrays with
+one value (scalar) or two components (vector, padded to three components) per
+node or per cell.
+Partitioned meshes (see `partitioning.py`) are exported as one `.vtu` piece
+per part plus a parallel `.pvtu` file, with halo cells flagged as ghost cells.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+python export.py ../meshes/triamesh_4.msh --fields phi f --compress --output triamesh_4.vtu
+python export.py ../meshes/triamesh_4.msh --fields phi -k 8 --output triamesh_4.pvtu
+
+===============================================================================
+"""
+
+# import modules
+import os
+import sys
+import zlib
+import argparse
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from meshes import load_mesh
+
+#============================================
+# PARAMETERS
+#============================================
+
+# VTK cell type of each number of nodes per cell
+VTK_TYPES = {3: 5, 4: 9}
+
+# VTK type names of NumPy types
+VTK_DTYPES = {"f8": "Float64", "f4": "Float32", "i8": "Int64", "i4": "Int32", "u1": "UInt8"}
+
+# VTK ghost cell flag of halo cells (DUPLICATECELL)
+GHOST_CELL = 1
+
+# uncompressed block size of zlib compressed arrays (bytes)
+BLOCK_BYTES = 1 << 20
+
+#============================================
+# DATA ARRAYS
+#============================================
+
+# encode array as appended data
+def encode_array(array, compress=False, level=6):
+    """
+    Return the raw appended data of an array: a UInt64 byte count followed by
+    the data, or the VTK zlib header (number of blocks, block size, last block
+    size, compressed block sizes) followed by the compressed blocks.
+    """
+    data = np.ascontiguousarray(array).tobytes()
+    if not compress:
+        return np.array([len(data)], dtype="<u8").tobytes() + data
+    # zlib releases the GIL, so blocks are compressed by a pool of threads
+    with ThreadPoolExecutor() as pool:
+        blocks = list(pool.map(lambda i: zlib.compress(data[i:i + BLOCK_BYTES], level),
+                               range(0, len(data), BLOCK_BYTES)))
+    last = len(data) - (len(blocks) - 1)*BLOCK_BYTES if blocks else 0
+    header = [len(blocks), BLOCK_BYTES, last] + [len(block) for block in blocks]
+    return np.array(header, dtype="<u8").tobytes() + b"".join(blocks)
+
+# prepare field for export
+def field_array(values, n):
+    """
+    Return a field as a little-endian array of n tuples: scalars as (n,),
+    two-dimensional vectors padded with a zero third component as (n, 3).
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == "b":
+        values = values.astype(np.uint8)
+    elif values.dtype.kind in "iu":
+        values = values.astype(np.int64 if values.dtype.itemsize > 4 else np.int32)
+    else:
+        values = values.astype(np.float64)
+    values = values.reshape(n, -1)
+    if values.shape[1] == 2:
+        values = np.column_stack((values, np.zeros(n, dtype=values.dtype)))
+    values = values.astype(values.dtype.newbyteorder("<"), copy=False)
+    return values[:, 0] if values.shape[1] == 1 else values
+
+# data array descriptor
+def data_array(name, array, offset=None):
+    """
+    Return the XML DataArray element of an array (PDataArray without offset).
+    """
+    tag = "PDataArray" if offset is None else "DataArray"
+    ncomp = 1 if array.ndim == 1 else array.shape[1]
+    attrs = f'type="{VTK_DTYPES[array.dtype.str[1:]]}"'
+    attrs += f' Name="{name}"' if name else ""
+    attrs += f' NumberOfComponents="{ncomp}"'
+    attrs += "" if offset is None else f' format="appended" offset="{offset}"'
+    return f"<{tag} {attrs}/>"
+
+#============================================
+# VTU FILES
+#============================================
+
+# write VTU file
+def write_vtu(path, mesh, point_data=None, cell_data=None, compress=False, ghost=None):
+    """
+    Write a mesh and its fields to a VTU file with raw appended binary data.
+    `point_data` and `cell_data` map field names to arrays with one entry per
+    node and per cell; `ghost` flags halo cells (vtkGhostType).
+    """
+    nodes = np.asarray(mesh["nodes"], dtype=np.float64)
+    cells = np.asarray(mesh["cells"])
+    nn, (nc, k) = len(nodes), cells.shape
+    point_data = {name: field_array(values, nn) for name, values in (point_data or {}).items()}
+    cell_data = {name: field_array(values, nc) for name, values in (cell_data or {}).items()}
+    if ghost is not None:
+        cell_data["vtkGhostType"] = np.where(np.asarray(ghost, dtype=bool), GHOST_CELL, 0).astype(np.uint8)
+    sections = {
+        "PointData": point_data,
+        "CellData": cell_data,
+        "Points": {"": field_array(nodes, nn)},
+        "Cells": {
+            "connectivity": cells.astype("<i8").ravel(),
+            "offsets": np.arange(k, k*nc + 1, k, dtype="<i8"),
+            "types": np.full(nc, VTK_TYPES[k], dtype=np.uint8),
+        },
+    }
+    lines = ['<?xml version="1.0"?>',
+             '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64"'
+             + (' compressor="vtkZLibDataCompressor">' if compress else ">"),
+             "  <UnstructuredGrid>",
+             f'    <Piece NumberOfPoints="{nn}" NumberOfCells="{nc}">']
+    blocks = []
+    offset = 0
+    for section, arrays in sections.items():
+        lines.append(f"      <{section}>")
+        for name, array in arrays.items():
+            block = encode_array(array, compress)
+            lines.append("        " + data_array(name, array, offset))
+            blocks.append(block)
+            offset += len(block)
+        lines.append(f"      </{section}>")
+    lines += ["    </Piece>", "  </UnstructuredGrid>", '  <AppendedData encoding="raw">', "   _"]
+    with open(path, "wb") as fh:
+        fh.write("\n".join(lines).encode("ascii"))
+        for block in blocks:
+            fh.write(block)
+        fh.write(b"\n  </AppendedData>\n</VTKFile>\n")
+
+# write partitioned VTU files
+def write_pvtu(path, mesh, parts, k, point_data=None, cell_data=None, compress=False, layers=0):
+    """
+    Write a partitioned mesh and its fields as one VTU piece per part, in a
+    directory named after the PVTU file, and the PVTU file referencing them.
+    With `layers` > 0 the halo cells of each part are included as ghost cells.
+    """
+    from partitioning import local_mesh
+    stem = os.path.splitext(os.path.basename(path))[0]
+    piecedir = os.path.join(os.path.dirname(path), stem)
+    os.makedirs(piecedir, exist_ok=True)
+    point_data = {name: np.asarray(values) for name, values in (point_data or {}).items()}
+    cell_data = {name: np.asarray(values) for name, values in (cell_data or {}).items()}
+    sources = []
+    for p in range(k):
+        local = local_mesh(mesh, parts, p, layers)
+        ghost = np.arange(len(local["cells"])) >= local["n_owned"] if layers > 0 else None
+        source = os.path.join(stem, f"{stem}_{p}.vtu")
+        write_vtu(os.path.join(os.path.dirname(path), source), local,
+                  {name: values[local["nodes_l2g"]] for name, values in point_data.items()},
+                  {name: values[local["cells_l2g"]] for name, values in cell_data.items()}, compress, ghost)
+        sources.append(source)
+    # declarations of the arrays of the pieces
+    arrays = {
+        "PPointData": {name: field_array(values[:1], 1) for name, values in point_data.items()},
+        "PCellData": {name: field_array(values[:1], 1) for name, values in cell_data.items()},
+    }
+    if layers > 0:
+        arrays["PCellData"]["vtkGhostType"] = np.zeros(1, dtype=np.uint8)
+    lines = ['<?xml version="1.0"?>',
+             '<VTKFile type="PUnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64">',
+             f'  <PUnstructuredGrid GhostLevel="{layers}">']
+    for section, declared in arrays.items():
+        lines.append(f"    <{section}>")
+        lines += ["      " + data_array(name, array) for name, array in declared.items()]
+        lines.append(f"    </{section}>")
+    lines += ["    <PPoints>", "      " + data_array("", np.zeros((1, 3))), "    </PPoints>"]
+    lines += [f'    <Piece Source="{source}"/>' for source in sources]
+    lines += ["  </PUnstructuredGrid>", "</VTKFile>", ""]
+    with open(path, "w", encoding="ascii") as fh:
+        fh.write("\n".join(lines))
+
+#============================================
+# EXACT FIELDS
+#============================================
+
+# evaluate exact fields for export
+def exact_fields(case, names, mesh):
+    """
+    Evaluate generated fields on a mesh for export: fields defined on the
+    whole domain at the nodes (point data), fields defined per subdomain at
+    the cell centroids with the function of each cell (cell data).
+    """
+    from fields import field_functions, evaluate_mesh
+    nodes = np.asarray(mesh["nodes"])
+    point_data, cell_data = {}, {}
+    for name in names:
+        funcs = field_functions(case, name)
+        if None in funcs:
+            point_data[name] = funcs[None](nodes[:, 0], nodes[:, 1])
+        else:
+            cell_data[name] = evaluate_mesh(case, name, mesh)
+    return point_data, cell_data
+
+#============================================
+# MAIN
+#============================================
+
+# export meshes from the command line
+def main(argv=None):
+    from fields import load_bound_case, DEFAULT_ARGUMENTS
+    parser = argparse.ArgumentParser(description="Export meshes and exact fields to VTU/PVTU files.")
+    parser.add_argument("file", help="mesh file in MSH format")
+    parser.add_argument("--fields", nargs="*", default=[], help="generated fields to export (e.g. phi f)")
+    parser.add_argument("--time", type=float, help="time of unsteady cases (argument `t` of the functions, "
+                        f"default {DEFAULT_ARGUMENTS['t']})")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    parser.add_argument("--compress", action="store_true", help="compress arrays with zlib")
+    parser.add_argument("-k", type=int, default=1, help="number of parts (writes a PVTU file)")
+    parser.add_argument("--layers", type=int, default=0, help="halo layers exported as ghost cells")
+    parser.add_argument("--output", required=True, help="output VTU (or PVTU) file")
+    args = parser.parse_args(argv)
+    params = {"t": args.time} if args.time is not None else None
+    mesh = load_mesh(args.file)
+    point_data, cell_data = {}, {"cell_tags": mesh["cell_tags"]}
+    if args.fields:
+        try:
+            case = load_bound_case(args.codes, params)
+        except ValueError as e:
+            parser.error(str(e))
+        exact_point, exact_cell = exact_fields(case, args.fields, mesh)
+        point_data.update(exact_point)
+        cell_data.update(exact_cell)
+    if args.k > 1:
+        from partitioning import load_partition
+        parts = load_partition(mesh, args.k)
+        cell_data["part"] = parts
+        write_pvtu(args.output, mesh, parts, args.k, point_data, cell_data, args.compress, args.layers)
+    else:
+        write_vtu(args.output, mesh, point_data, cell_data, args.compress)
+    print("Wrote", args.output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
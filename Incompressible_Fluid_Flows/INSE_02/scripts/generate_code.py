@@ -65,9 +65,9 @@ x, y = sympy.symbols("x y", real=True)
 # solution parameters
 a = (omegaO*rO**2 - omegaI*rI**2)/(rO**2 - rI**2)
 b = (omegaO - omegaI)*rO**2*rI**2/(rO**2 - rI**2)
+cO = 2*pi*(a**2*rO**4/8 + a*b*(sympy.log(rO) - 1/2)*rO**2 - b**2*sympy.log(rO)/2)
+cI = 2*pi*(a**2*rI**4/8 + a*b*(sympy.log(rI) - 1/2)*rI**2 - b**2*sympy.log(rI)/2)
 c = (cO - cI)/(pi*(rO**2 - rI**2))
-cO = 2*pi*(a**2*rO**4/8 + a*b*(sympy.log(rO) - 1/2)*rO**2 - b**2/(2*sympy.log(rO)))
-cI = 2*pi*(a**2*rI**4/8 + a*b*(sympy.log(rI) - 1/2)*rI**2 - b**2/(2*sympy.log(rI)))
 
 # exact solutions
 p = rho*(a**2*r**2/2 + 2*a*b*sympy.log(r) - b**2/(2*r**2) - c)
@@ -177,6 +177,9 @@ params_list = [("r", r), ("theta", theta)]
 funcs_list = [("p", p, args_list, params_list),("u", u, args_list, params_list), \
                 ("f", f, args_list, params_list), ("g", g, args_list, params_list)]
 
+# test domain (random test points)
+domain = ("annulus", rI, rO)
+
 # generate code
 outdir = "../codes"
 name = "inse_02"
@@ -185,10 +188,11 @@ write_cpp_file(outdir, name, consts_list, funcs_list)
 write_fortran_file(outdir, name, consts_list, funcs_list)
 write_octave_file(outdir, name, consts_list, funcs_list)
 write_python_file(outdir, name, consts_list, funcs_list)
-write_cpp_test(outdir, name)
-write_fortran_test(outdir, name)
-write_octave_test(outdir, name)
-write_python_test(outdir, name)
+write_factors_file(outdir, name, consts_list, funcs_list)
+write_cpp_test(outdir, name, funcs_list, domain)
+write_fortran_test(outdir, name, funcs_list, domain)
+write_octave_test(outdir, name, funcs_list, domain)
+write_python_test(outdir, name, funcs_list, domain)
 print("\nGeneration complete.")
 
 # end of file
@@ -0,0 +1,880 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | MESHES
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for reading and writing meshes in MSH format as NumPy arrays.
+Supports MSH 2.2 (ASCII) and MSH 4.1 (ASCII and binary, with its entity-block
+structure); both map onto the same array representation below, with the
+physical tag of an element taken from the (first) physical group of its
+entity in MSH 4.1.
+Includes a binary sidecar cache keyed by the hash of the mesh file, so that
+repeated loads memory-map the arrays instead of parsing the ASCII file again.
+Large files are read as a stream: the $Nodes and $Elements sections are
+parsed in blocks of fixed size and written directly into the memory-mapped
+cache, so the memory used does not grow with the mesh size.
+
+A mesh is a dictionary of NumPy arrays with 0-based node indices:
+  nodes           (nn, 2) float64   node coordinates
+  points          (n0,)   int32     nodes of point elements
+  lines           (n1, 2) int32     nodes of line elements (boundary faces)
+  cells           (nc, k) int32     nodes of triangles (k = 3) or quads (k = 4)
+  *_tags          (n,)    int32     physical tags of points, lines and cells
+  *_entities      (n,)    int32     elementary tags of points, lines and cells
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+import meshes
+mesh = meshes.load_mesh("../meshes/quadmesh_1.msh")
+
+python meshes.py ../meshes/*.msh
+python meshes.py --stream ../meshes/triamesh_9.msh
+python meshes.py --format 4.1 --binary --output ../meshes/binary ../meshes/*.msh
+
+===============================================================================
+"""
+
+# import modules
+import os
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+import argparse
+import numpy as np
+
+#============================================
+# PARAMETERS
+#============================================
+
+# cache format version (bump to invalidate existing caches)
+CACHE_VERSION = 1
+
+# cache directory name (created next to the mesh files)
+CACHE_DIRNAME = ".cache"
+
+# number of nodes per supported element type
+ELEMENT_NODES = {15: 1, 1: 2, 2: 3, 3: 4}
+
+# mesh block of each supported element type
+ELEMENT_BLOCKS = {15: "points", 1: "lines", 2: "cells", 3: "cells"}
+
+# mesh blocks (with the default number of nodes per element)
+BLOCKS = {"points": 1, "lines": 2, "cells": 3}
+
+# element type of each number of nodes per element
+ELEMENT_TYPES = {1: 15, 2: 1, 3: 2, 4: 3}
+
+# entity dimension of each mesh block
+BLOCK_DIMS = {"points": 0, "lines": 1, "cells": 2}
+
+# supported MSH versions for writing
+FORMATS = ["2.2", "4.1"]
+
+# block size of streamed reads (bytes)
+CHUNK_BYTES = 1 << 26
+
+# file size above which meshes are streamed into the cache (bytes)
+STREAM_BYTES = 1 << 28
+
+#============================================
+# PARSE SECTIONS
+#============================================
+
+# parse nodes section
+def parse_nodes(buf):
+    """
+    Parse the body of an ASCII $Nodes section (MSH 2.2) from a bytes buffer.
+    Returns the node numbers (int64) and the node coordinates (float64, nn x 2).
+    """
+    data = np.fromstring(buf.decode("ascii"), dtype=np.float64, sep=" ")
+    data = data.reshape(-1, 4)
+    return data[:, 0].astype(np.int64), np.ascontiguousarray(data[:, 1:3])
+
+# parse elements section
+def parse_elements(buf):
+    """
+    Parse the body of an ASCII $Elements section (MSH 2.2) from a bytes buffer.
+    Records are split by counting the tokens of every line with vectorised
+    operations, so no Python loop runs over the elements.
+    Returns a dictionary mapping each element type to an array of records with
+    columns: physical tag, elementary tag, node numbers.
+    """
+    data = np.fromstring(buf.decode("ascii"), dtype=np.int64, sep=" ")
+    if data.size == 0:
+        return {}
+    # count tokens per line
+    chars = np.frombuffer(buf, dtype=np.uint8)
+    blank = (chars == 32) | (chars == 9) | (chars == 10) | (chars == 13)
+    starts = np.flatnonzero(~blank & np.concatenate(([True], blank[:-1])))
+    breaks = np.flatnonzero(chars == 10)
+    counts = np.bincount(np.searchsorted(breaks, starts), minlength=breaks.size + 1)
+    counts = counts[counts > 0]
+    offsets = np.cumsum(counts) - counts
+    # group records by element type and number of tags
+    types = data[offsets + 1]
+    ntags = data[offsets + 2]
+    records = {}
+    for etype in np.unique(types):
+        if etype not in ELEMENT_NODES:
+            raise ValueError(f"Unsupported MSH element type: {etype}")
+        nnodes = ELEMENT_NODES[etype]
+        chunks = []
+        for ntag in np.unique(ntags[types == etype]):
+            if ntag < 2:
+                raise ValueError("MSH elements must carry physical and elementary tags.")
+            rows = offsets[(types == etype) & (ntags == ntag)]
+            cols = np.concatenate(([3, 4], np.arange(3 + ntag, 3 + ntag + nnodes)))
+            chunks.append((rows[:, None] + cols[None, :], rows))
+        index = np.concatenate([idx for (idx, _) in chunks])
+        order = np.argsort(np.concatenate([rows for (_, rows) in chunks]), kind="stable")
+        records[int(etype)] = data[index[order]]
+    return records
+
+#============================================
+# BUILD MESH
+#============================================
+
+# build mesh from parsed sections
+def build_mesh(node_ids, coords, records):
+    """
+    Assemble the mesh dictionary from parsed node and element records.
+    Node numbers are mapped to 0-based indices. Cells listed more than once
+    (an element written for every physical group it belongs to) are kept only
+    once, with the physical tag of their first occurrence.
+    """
+    order = np.argsort(node_ids, kind="stable")
+    sorted_ids = node_ids[order]
+    mesh = {"nodes": coords[order]}
+    blocks = {block: [] for block in BLOCKS}
+    for etype in sorted(records):
+        blocks[ELEMENT_BLOCKS[etype]].append(records[etype])
+    for block in BLOCKS:
+        if len(blocks[block]) > 1 and len({rec.shape[1] for rec in blocks[block]}) > 1:
+            raise ValueError(f"Mixed element types in block '{block}' are not supported.")
+        if blocks[block]:
+            rec = np.concatenate(blocks[block])
+        else:
+            rec = np.zeros((0, 2 + BLOCKS[block]), dtype=np.int64)
+        conn = np.searchsorted(sorted_ids, rec[:, 2:])
+        if conn.size and (conn.max() >= sorted_ids.size or np.any(sorted_ids[conn] != rec[:, 2:])):
+            raise ValueError("MSH elements reference undefined nodes.")
+        tags = rec[:, 0]
+        entities = rec[:, 1]
+        if block == "cells" and conn.shape[0] > 0:
+            _, first = np.unique(np.sort(conn, axis=1), axis=0, return_index=True)
+            first = np.sort(first)
+            conn, tags, entities = conn[first], tags[first], entities[first]
+        if block == "points":
+            conn = conn[:, 0]
+        mesh[block] = conn.astype(np.int32)
+        mesh[block[:-1] + "_tags"] = tags.astype(np.int32)
+        mesh[block[:-1] + "_entities"] = entities.astype(np.int32)
+    return mesh
+
+#============================================
+# READ MESH
+#============================================
+
+# read mesh file
+def read_msh(path):
+    """
+    Read an ASCII MSH 2.2 file, or an ASCII or binary MSH 4.1 file, into a
+    mesh dictionary.
+    """
+    with open(path, "rb") as fh:
+        contents = fh.read()
+    begin = contents.find(b"$MeshFormat")
+    if begin < 0:
+        raise ValueError(f"Missing section $MeshFormat in {path}")
+    start = contents.index(b"\n", begin) + 1
+    version = contents[start:contents.index(b"\n", start)].split()
+    if version[0].startswith(b"4"):
+        return read_msh4(contents, path)
+    sections = {}
+    for name in [b"MeshFormat", b"Nodes", b"Elements"]:
+        begin = contents.find(b"$" + name)
+        end = contents.find(b"$End" + name)
+        if begin < 0 or end < 0:
+            raise ValueError(f"Missing section ${name.decode()} in {path}")
+        body = contents[contents.index(b"\n", begin) + 1:end]
+        sections[name] = body
+    if not version[0].startswith(b"2") or version[1] != b"0":
+        raise ValueError(f"Unsupported MSH format in {path} (expected ASCII 2.2, or 4.1).")
+    nodes = sections[b"Nodes"]
+    elements = sections[b"Elements"]
+    nodes = nodes[nodes.index(b"\n") + 1:]
+    elements = elements[elements.index(b"\n") + 1:]
+    node_ids, coords = parse_nodes(nodes)
+    records = parse_elements(elements)
+    return build_mesh(node_ids, coords, records)
+
+# MSH format of a file
+def msh_format(path):
+    """
+    Return the version (str) and the binary flag of an MSH file.
+    """
+    with open(path, "rb") as fh:
+        for line in fh:
+            if line.startswith(b"$MeshFormat"):
+                version, filetype = fh.readline().split()[:2]
+                return version.decode(), filetype == b"1"
+    raise ValueError(f"Missing section $MeshFormat in {path}")
+
+#============================================
+# MSH 4.1
+#============================================
+
+# read values from a binary buffer
+def read_binary(contents, pos, dtype, count):
+    """
+    Return `count` values of type `dtype` at offset `pos` of a buffer and the
+    offset that follows them.
+    """
+    values = np.frombuffer(contents, dtype=dtype, count=count, offset=pos)
+    return values, pos + values.nbytes
+
+# parse MSH 4.1 entities section
+def parse_entities4(contents, pos, binary):
+    """
+    Parse an MSH 4.1 $Entities section starting at offset `pos` and return
+    the first physical tag of each entity, {(dim, tag): physical} (0 for
+    entities without physical groups), and the offset after the section data.
+    """
+    physicals = {}
+    if binary:
+        counts, pos = read_binary(contents, pos, np.uint64, 4)
+        for dim, count in enumerate(counts):
+            for _ in range(int(count)):
+                tag, pos = read_binary(contents, pos, np.int32, 1)
+                pos += 8*(3 if dim == 0 else 6)
+                nphys, pos = read_binary(contents, pos, np.uint64, 1)
+                phys, pos = read_binary(contents, pos, np.int32, int(nphys[0]))
+                if dim > 0:
+                    nbound, pos = read_binary(contents, pos, np.uint64, 1)
+                    pos += 4*int(nbound[0])
+                physicals[(dim, int(tag[0]))] = int(phys[0]) if len(phys) else 0
+        return physicals, pos
+    end = contents.index(b"$EndEntities", pos)
+    data = np.fromstring(contents[pos:end].decode("ascii"), dtype=np.float64, sep=" ")
+    i = 4
+    for dim, count in enumerate(data[:4].astype(np.int64)):
+        for _ in range(count):
+            tag = int(data[i])
+            i += 4 if dim == 0 else 7
+            nphys = int(data[i])
+            phys = data[i + 1:i + 1 + nphys]
+            i += 1 + nphys
+            if dim > 0:
+                i += 1 + int(data[i])
+            physicals[(dim, tag)] = int(phys[0]) if nphys else 0
+    return physicals, end
+
+# parse MSH 4.1 nodes section
+def parse_nodes4(contents, pos, binary):
+    """
+    Parse an MSH 4.1 $Nodes section starting at offset `pos` and return the
+    node numbers, node coordinates (nn x 2), and the offset after the data.
+    """
+    ids, coords = [], []
+    if binary:
+        header, pos = read_binary(contents, pos, np.uint64, 4)
+        for _ in range(int(header[0])):
+            block, pos = read_binary(contents, pos, np.int32, 3)
+            count, pos = read_binary(contents, pos, np.uint64, 1)
+            count = int(count[0])
+            ncoords = 3 + (int(block[0]) if block[2] else 0)
+            tags, pos = read_binary(contents, pos, np.uint64, count)
+            xyz, pos = read_binary(contents, pos, np.float64, count*ncoords)
+            ids.append(tags.astype(np.int64))
+            coords.append(xyz.reshape(count, ncoords)[:, :2])
+    else:
+        end = contents.index(b"$EndNodes", pos)
+        data = np.fromstring(contents[pos:end].decode("ascii"), dtype=np.float64, sep=" ")
+        i = 4
+        for _ in range(int(data[0])):
+            dim, _, parametric, count = data[i:i + 4].astype(np.int64)
+            i += 4
+            ncoords = 3 + (dim if parametric else 0)
+            ids.append(data[i:i + count].astype(np.int64))
+            i += count
+            coords.append(data[i:i + count*ncoords].reshape(count, ncoords)[:, :2])
+            i += count*ncoords
+        pos = end
+    if not ids:
+        return np.zeros(0, dtype=np.int64), np.zeros((0, 2)), pos
+    return np.concatenate(ids), np.ascontiguousarray(np.concatenate(coords)), pos
+
+# parse MSH 4.1 elements section
+def parse_elements4(contents, pos, binary, physicals):
+    """
+    Parse an MSH 4.1 $Elements section starting at offset `pos` and return
+    the element records by type (columns: physical tag, elementary tag, node
+    numbers, as `parse_elements`) and the offset after the data.
+    """
+    blocks = {}
+    if binary:
+        header, pos = read_binary(contents, pos, np.uint64, 4)
+        nblocks = int(header[0])
+    else:
+        end = contents.index(b"$EndElements", pos)
+        data = np.fromstring(contents[pos:end].decode("ascii"), dtype=np.int64, sep=" ")
+        nblocks = int(data[0])
+        i = 4
+    for _ in range(nblocks):
+        if binary:
+            block, pos = read_binary(contents, pos, np.int32, 3)
+            count, pos = read_binary(contents, pos, np.uint64, 1)
+            dim, tag, etype, count = int(block[0]), int(block[1]), int(block[2]), int(count[0])
+        else:
+            dim, tag, etype, count = (int(v) for v in data[i:i + 4])
+            i += 4
+        if etype not in ELEMENT_NODES:
+            raise ValueError(f"Unsupported MSH element type: {etype}")
+        ncols = 1 + ELEMENT_NODES[etype]
+        if binary:
+            values, pos = read_binary(contents, pos, np.uint64, count*ncols)
+            values = values.astype(np.int64)
+        else:
+            values = data[i:i + count*ncols]
+            i += count*ncols
+        rec = np.empty((count, ncols + 1), dtype=np.int64)
+        rec[:, 0] = physicals.get((dim, tag), 0)
+        rec[:, 1] = tag
+        rec[:, 2:] = values.reshape(count, ncols)[:, 1:]
+        blocks.setdefault(etype, []).append(rec)
+    if not binary:
+        pos = end
+    return {etype: np.concatenate(recs) for etype, recs in blocks.items()}, pos
+
+# read MSH 4.1 contents
+def read_msh4(contents, path):
+    """
+    Read the contents of an ASCII or binary MSH 4.1 file into a mesh dictionary.
+    """
+    start = contents.index(b"\n", contents.index(b"$MeshFormat")) + 1
+    end = contents.index(b"\n", start)
+    version, filetype, datasize = contents[start:end].split()[:3]
+    binary = filetype == b"1"
+    if version != b"4.1" or (binary and int(datasize) != 8):
+        raise ValueError(f"Unsupported MSH format in {path} (expected 4.1 with 8-byte data).")
+    if binary and np.frombuffer(contents, dtype=np.int32, count=1, offset=end + 1)[0] != 1:
+        raise ValueError(f"Unsupported byte order in {path}.")
+    pos = contents.index(b"$EndMeshFormat", end)
+    physicals, node_ids, coords, records = {}, None, None, None
+    while True:
+        begin = contents.find(b"$", pos)
+        if begin < 0:
+            break
+        eol = contents.index(b"\n", begin)
+        name = contents[begin + 1:eol].strip()
+        pos = eol + 1
+        if name.startswith(b"End"):
+            continue
+        if name == b"Entities":
+            physicals, pos = parse_entities4(contents, pos, binary)
+        elif name == b"Nodes":
+            node_ids, coords, pos = parse_nodes4(contents, pos, binary)
+        elif name == b"Elements":
+            records, pos = parse_elements4(contents, pos, binary, physicals)
+        elif name == b"PartitionedEntities":
+            raise ValueError(f"Partitioned MSH files are not supported ({path}).")
+        pos = contents.index(b"$End" + name, pos)
+    if node_ids is None or records is None:
+        raise ValueError(f"Missing section $Nodes or $Elements in {path}")
+    return build_mesh(node_ids, coords, records)
+
+# entities of a mesh
+def mesh_entities(mesh):
+    """
+    Return the entities of a mesh by dimension as lists of (tag, physical
+    tags, bounding box), and the entity (dim, tag) of each node: the entity of
+    the lowest-dimensional element containing it.
+    """
+    nodes = np.asarray(mesh["nodes"])
+    nn = len(nodes)
+    node_dim = np.full(nn, -1, dtype=np.int64)
+    node_tag = np.zeros(nn, dtype=np.int64)
+    entities = {}
+    for block in ("cells", "lines", "points"):
+        dim = BLOCK_DIMS[block]
+        conn = np.asarray(mesh[block]).reshape(len(mesh[block]), -1)
+        ents = np.asarray(mesh[block[:-1] + "_entities"])
+        tags = np.asarray(mesh[block[:-1] + "_tags"])
+        node_dim[conn] = dim
+        node_tag[conn] = np.repeat(ents, conn.shape[1]).reshape(conn.shape)
+        # bounding boxes and physical tags of each entity from elements sorted by entity
+        order = np.argsort(ents, kind="stable")
+        starts = np.flatnonzero(np.concatenate(([True], ents[order][1:] != ents[order][:-1]))) if len(ents) else []
+        xyz = nodes[conn[order]]
+        lo = np.minimum.reduceat(xyz.min(axis=1), starts) if len(ents) else []
+        hi = np.maximum.reduceat(xyz.max(axis=1), starts) if len(ents) else []
+        pairs, first = np.unique(np.column_stack((ents, tags)), axis=0, return_index=True)
+        pairs = pairs[np.lexsort((first, pairs[:, 0]))]
+        phys = np.split(pairs[:, 1], np.flatnonzero(pairs[1:, 0] != pairs[:-1, 0]) + 1)
+        entities[dim] = [(int(ents[order[s]]), p, l, h) for s, p, l, h in zip(starts, phys, lo, hi)]
+    # nodes of no element (e.g. centres of circles) go to the first entity found
+    free = node_dim < 0
+    if np.any(free):
+        dim = next((d for d in (2, 1, 0) if entities[d]), 0)
+        node_dim[free] = dim
+        node_tag[free] = entities[dim][0][0] if entities[dim] else 0
+    return entities, node_dim, node_tag
+
+# write MSH 4.1 file
+def write_msh4(path, mesh, binary=False):
+    """
+    Write a mesh dictionary to an ASCII or binary MSH 4.1 file, with one node
+    block per entity and one element block per entity and element type.
+    """
+    nodes = np.asarray(mesh["nodes"], dtype=np.float64)
+    nn = nodes.shape[0]
+    entities, node_dim, node_tag = mesh_entities(mesh)
+    parts = []
+    def text(line):
+        parts.append((line + "\n").encode("ascii"))
+    def rows(fmt, table):
+        parts.append((fmt*len(table) % tuple(np.asarray(table).ravel())).encode("ascii"))
+    # header
+    text("$MeshFormat")
+    text("4.1 %d 8" % int(binary))
+    if binary:
+        parts.append(np.array([1], dtype=np.int32).tobytes())
+        text("")
+    text("$EndMeshFormat")
+    # entities
+    text("$Entities")
+    counts = [len(entities[dim]) for dim in range(3)] + [0]
+    if binary:
+        parts.append(np.array(counts, dtype=np.uint64).tobytes())
+    else:
+        text(" ".join(str(c) for c in counts))
+    for dim in range(3):
+        for tag, phys, lo, hi in entities[dim]:
+            box = [lo[0], lo[1], 0.0] if dim == 0 else [lo[0], lo[1], 0.0, hi[0], hi[1], 0.0]
+            if binary:
+                parts.append(np.array([tag], dtype=np.int32).tobytes() + np.array(box).tobytes()
+                             + np.array([len(phys)], dtype=np.uint64).tobytes()
+                             + np.asarray(phys, dtype=np.int32).tobytes()
+                             + (np.array([0], dtype=np.uint64).tobytes() if dim > 0 else b""))
+            else:
+                text(" ".join([str(tag)] + ["%.16g" % v for v in box] + [str(len(phys))]
+                              + [str(p) for p in phys] + (["0"] if dim > 0 else [])))
+    text("$EndEntities")
+    # nodes, grouped by entity
+    order = np.lexsort((np.arange(nn), node_tag, node_dim))
+    key = node_dim[order]*(node_tag.max(initial=0) + 1) + node_tag[order]
+    starts = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+    bounds = np.append(starts, nn)
+    text("$Nodes")
+    header = [len(starts), nn, 1 if nn else 0, nn]
+    if binary:
+        parts.append(np.array(header, dtype=np.uint64).tobytes())
+    else:
+        text(" ".join(str(h) for h in header))
+    for b in range(len(starts)):
+        index = order[bounds[b]:bounds[b + 1]]
+        dim, tag = int(node_dim[index[0]]), int(node_tag[index[0]])
+        xyz = np.column_stack((nodes[index], np.zeros(len(index))))
+        if binary:
+            parts.append(np.array([dim, tag, 0], dtype=np.int32).tobytes()
+                         + np.array([len(index)], dtype=np.uint64).tobytes()
+                         + (index + 1).astype(np.uint64).tobytes() + xyz.tobytes())
+        else:
+            text(f"{dim} {tag} 0 {len(index)}")
+            rows("%d\n", index + 1)
+            rows("%.16g %.16g %.16g\n", xyz)
+    if binary:
+        text("")
+    text("$EndNodes")
+    # elements, grouped by entity and type
+    element_blocks = []
+    for block in BLOCKS:
+        conn = np.asarray(mesh[block]).reshape(len(mesh[block]), -1)
+        if conn.shape[0] == 0:
+            continue
+        ents = np.asarray(mesh[block[:-1] + "_entities"])
+        order = np.argsort(ents, kind="stable")
+        starts = np.flatnonzero(np.concatenate(([True], ents[order][1:] != ents[order][:-1])))
+        for index in np.split(order, starts[1:]):
+            element_blocks.append((BLOCK_DIMS[block], int(ents[index[0]]), ELEMENT_TYPES[conn.shape[1]],
+                                   conn[index] + 1))
+    ne = sum(len(conn) for (_, _, _, conn) in element_blocks)
+    text("$Elements")
+    header = [len(element_blocks), ne, 1 if ne else 0, ne]
+    if binary:
+        parts.append(np.array(header, dtype=np.uint64).tobytes())
+    else:
+        text(" ".join(str(h) for h in header))
+    first = 1
+    for dim, tag, etype, conn in element_blocks:
+        table = np.column_stack((np.arange(first, first + len(conn)), conn))
+        if binary:
+            parts.append(np.array([dim, tag, etype], dtype=np.int32).tobytes()
+                         + np.array([len(conn)], dtype=np.uint64).tobytes() + table.astype(np.uint64).tobytes())
+        else:
+            text(f"{dim} {tag} {etype} {len(conn)}")
+            rows(" ".join(["%d"]*table.shape[1]) + "\n", table)
+        first += len(conn)
+    if binary:
+        text("")
+    text("$EndElements")
+    with open(path, "wb") as fh:
+        fh.write(b"".join(parts))
+
+#============================================
+# STREAM MESH
+#============================================
+
+# blocks of a section
+def section_blocks(fh, name, chunk_bytes=CHUNK_BYTES):
+    """
+    Yield the body of a section as blocks of about `chunk_bytes` bytes ending
+    at line breaks, and leave the file at the `$End<name>` line.
+    """
+    marker = b"$End" + name
+    while True:
+        block = fh.read(chunk_bytes)
+        if not block:
+            raise ValueError(f"Missing section {marker.decode()}")
+        block += fh.readline()
+        end = block.find(marker)
+        if end >= 0:
+            fh.seek(end - len(block), os.SEEK_CUR)
+            if end:
+                yield block[:end]
+            return
+        yield block
+
+# stream mesh file
+def iter_msh(path, chunk_bytes=CHUNK_BYTES):
+    """
+    Read an ASCII MSH 2.2 file as a stream of parsed blocks. Yields tuples:
+      ("nodes", count)            number of nodes, before the node blocks
+      ("node_block", (ids, xy))   node numbers and coordinates of a block
+      ("elements", count)         number of elements, before the element blocks
+      ("element_block", records)  element records of a block (see parse_elements)
+    """
+    with open(path, "rb") as fh:
+        for line in iter(fh.readline, b""):
+            if not line.startswith(b"$") or line.startswith(b"$End"):
+                continue
+            name = line[1:].strip()
+            if name == b"MeshFormat":
+                version = fh.readline().split()
+                if not version[0].startswith(b"2") or version[1] != b"0":
+                    raise ValueError(f"Unsupported MSH format in {path} (expected ASCII 2.2).")
+            elif name == b"Nodes":
+                yield "nodes", int(fh.readline())
+                for block in section_blocks(fh, name, chunk_bytes):
+                    yield "node_block", parse_nodes(block)
+            elif name == b"Elements":
+                yield "elements", int(fh.readline())
+                for block in section_blocks(fh, name, chunk_bytes):
+                    yield "element_block", parse_elements(block)
+
+# stream mesh file into cache
+def stream_cache(path, cachedir, chunk_bytes=CHUNK_BYTES):
+    """
+    Read an ASCII MSH 2.2 file block by block into a new cache directory, with
+    arrays written through memory maps. Nodes must be numbered 1 to nn (as
+    written by Gmsh). Cells written once per physical group are kept for the
+    first physical tag of their elementary entity, as in `build_mesh`.
+    """
+    parent = os.path.dirname(cachedir)
+    os.makedirs(parent, exist_ok=True)
+    tmpdir = tempfile.mkdtemp(dir=parent, prefix=".tmp_")
+    try:
+        nodes = None
+        first_tag = {}
+        raw = {}
+        width = {}
+        for kind, data in iter_msh(path, chunk_bytes):
+            if kind == "nodes":
+                nodes = np.lib.format.open_memmap(os.path.join(tmpdir, "nodes.npy"), mode="w+",
+                                                  dtype=np.float64, shape=(data, 2))
+            elif kind == "node_block":
+                ids, coords = data
+                if ids.size and (ids.min() < 1 or ids.max() > len(nodes)):
+                    raise ValueError(f"Node numbers of {path} are not 1 to {len(nodes)}; use read_msh.")
+                nodes[ids - 1] = coords
+            elif kind == "element_block":
+                for etype in sorted(data):
+                    block = ELEMENT_BLOCKS[etype]
+                    rec = data[etype]
+                    if block == "cells":
+                        entities, first, inverse = np.unique(rec[:, 1], return_index=True, return_inverse=True)
+                        tags = np.array([first_tag.setdefault((etype, int(entity)), int(rec[i, 0]))
+                                         for entity, i in zip(entities, first)])
+                        rec = rec[rec[:, 0] == tags[inverse.ravel()]]
+                    if width.setdefault(block, rec.shape[1] - 2) != rec.shape[1] - 2:
+                        raise ValueError(f"Mixed element types in block '{block}' are not supported.")
+                    for key, values in ((block, rec[:, 2:] - 1), (block[:-1] + "_tags", rec[:, 0]),
+                                        (block[:-1] + "_entities", rec[:, 1])):
+                        if key not in raw:
+                            raw[key] = open(os.path.join(tmpdir, "." + key + ".raw"), "wb")
+                        raw[key].write(values.astype(np.int32).tobytes())
+        if nodes is None:
+            raise ValueError(f"Missing section $Nodes in {path}")
+        nodes.flush()
+        del nodes
+        # convert raw blocks to .npy files
+        for block, k in BLOCKS.items():
+            k = width.get(block, k)
+            for key in (block, block[:-1] + "_tags", block[:-1] + "_entities"):
+                filename = os.path.join(tmpdir, "." + key + ".raw")
+                if key in raw:
+                    raw.pop(key).close()
+                    data = np.memmap(filename, dtype=np.int32, mode="r")
+                else:
+                    data = np.zeros(0, dtype=np.int32)
+                shape = (len(data)//k, k) if key == block and block != "points" else (len(data),)
+                out = np.lib.format.open_memmap(os.path.join(tmpdir, key + ".npy"), mode="w+",
+                                                dtype=np.int32, shape=shape)
+                flat = out.reshape(-1)
+                step = chunk_bytes//4
+                for start in range(0, len(data), step):
+                    flat[start:start + step] = data[start:start + step]
+                out.flush()
+                del out, flat, data
+                if os.path.exists(filename):
+                    os.remove(filename)
+        arrays = sorted(f[:-4] for f in os.listdir(tmpdir) if f.endswith(".npy"))
+        with open(os.path.join(tmpdir, "manifest.json"), "w", encoding="utf-8") as fh:
+            json.dump({"version": CACHE_VERSION, "arrays": arrays}, fh, indent=2)
+        os.replace(tmpdir, cachedir)
+    except BaseException:
+        for fh in raw.values():
+            fh.close()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        if not os.path.isdir(cachedir):
+            raise
+
+#============================================
+# WRITE MESH
+#============================================
+
+# write mesh file
+def write_msh(path, mesh, version="2.2", binary=False):
+    """
+    Write a mesh dictionary to an ASCII MSH 2.2 file, or to an ASCII or
+    binary MSH 4.1 file (`version="4.1"`, see `write_msh4`).
+    Elements are written in the order points, lines, cells, each with its
+    physical and elementary tags; rows are formatted in bulk, without a Python
+    loop over the elements.
+    """
+    if version == "4.1":
+        return write_msh4(path, mesh, binary)
+    if version != "2.2" or binary:
+        raise ValueError(f"Unsupported MSH format for writing: {version}{' binary' if binary else ''}.")
+    nodes = np.asarray(mesh["nodes"], dtype=np.float64)
+    nn = nodes.shape[0]
+    contents = ["$MeshFormat", "2.2 0 8", "$EndMeshFormat", "$Nodes", str(nn)]
+    table = np.column_stack((np.arange(1, nn + 1), nodes, np.zeros(nn)))
+    contents.append(("%d %.16g %.16g %.16g\n"*nn % tuple(table.ravel())).rstrip("\n"))
+    contents.extend(["$EndNodes", "$Elements"])
+    blocks = []
+    for block in BLOCKS:
+        conn = np.asarray(mesh[block]).reshape(len(mesh[block]), -1)
+        if conn.shape[0] == 0:
+            continue
+        etype = ELEMENT_TYPES[conn.shape[1]]
+        tags = np.asarray(mesh[block[:-1] + "_tags"])
+        entities = np.asarray(mesh[block[:-1] + "_entities"])
+        blocks.append((etype, np.column_stack((tags, entities, conn + 1)).astype(np.int64)))
+    ne = sum(rec.shape[0] for (_, rec) in blocks)
+    contents.append(str(ne))
+    first = 1
+    for (etype, rec) in blocks:
+        ncols = rec.shape[1]
+        table = np.column_stack((np.arange(first, first + rec.shape[0]),
+                                 np.full(rec.shape[0], etype), np.full(rec.shape[0], 2), rec))
+        fmt = " ".join(["%d"]*(ncols + 3)) + "\n"
+        contents.append((fmt*rec.shape[0] % tuple(table.ravel())).rstrip("\n"))
+        first += rec.shape[0]
+    contents.append("$EndElements")
+    with open(path, "w", encoding="ascii") as fh:
+        fh.write("\n".join(contents) + "\n")
+
+#============================================
+# MESH CACHE
+#============================================
+
+# hash mesh file
+def file_hash(path, blocksize=1 << 20):
+    """
+    Hash the contents of a file (BLAKE2b, 16 hexadecimal digits).
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(str(CACHE_VERSION).encode())
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(blocksize), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# cache directory of mesh file
+def cache_path(path):
+    """
+    Return the cache directory of a mesh file: `.cache/<name>_<hash>/` next to it.
+    """
+    folder, filename = os.path.split(os.path.abspath(path))
+    name = os.path.splitext(filename)[0]
+    return os.path.join(folder, CACHE_DIRNAME, f"{name}_{file_hash(path)}")
+
+# write mesh cache
+def write_cache(cachedir, mesh):
+    """
+    Write the arrays of a mesh as raw .npy files in a new cache directory.
+    The directory is written to a temporary location and renamed into place, so
+    concurrent writers never expose a partially written cache.
+    """
+    parent = os.path.dirname(cachedir)
+    os.makedirs(parent, exist_ok=True)
+    tmpdir = tempfile.mkdtemp(dir=parent, prefix=".tmp_")
+    try:
+        arrays = mesh_arrays(mesh)
+        for key, value in arrays.items():
+            np.save(os.path.join(tmpdir, key + ".npy"), np.ascontiguousarray(value))
+        with open(os.path.join(tmpdir, "manifest.json"), "w", encoding="utf-8") as fh:
+            json.dump({"version": CACHE_VERSION, "arrays": sorted(arrays)}, fh, indent=2)
+        os.replace(tmpdir, cachedir)
+    except OSError:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        if not os.path.isdir(cachedir):
+            raise
+
+# update mesh cache
+def update_cache(cachedir, arrays):
+    """
+    Add (or overwrite) arrays in an existing cache directory.
+    Each array is written to a temporary file and renamed into place.
+    """
+    for key, value in arrays.items():
+        fd, tmpfile = tempfile.mkstemp(dir=cachedir, prefix=".tmp_", suffix=".npy")
+        with os.fdopen(fd, "wb") as fh:
+            np.save(fh, np.ascontiguousarray(value))
+        os.replace(tmpfile, os.path.join(cachedir, key + ".npy"))
+
+# read mesh cache
+def read_cache(cachedir, mmap=True):
+    """
+    Read all arrays of a cache directory, memory-mapped (read-only) by default.
+    """
+    mode = "r" if mmap else None
+    mesh = {}
+    for filename in sorted(os.listdir(cachedir)):
+        if filename.endswith(".npy") and not filename.startswith("."):
+            mesh[filename[:-4]] = np.load(os.path.join(cachedir, filename), mmap_mode=mode)
+    return mesh
+
+#============================================
+# LOAD MESH
+#============================================
+
+# load mesh with cache
+def load_mesh(path, cache=True, mmap=True, renumber=None):
+    """
+    Load a mesh file into a mesh dictionary.
+    With `cache=True` the binary cache is read when present and written
+    otherwise (streamed for files larger than STREAM_BYTES); arrays are
+    memory-mapped from the cache when `mmap=True`.
+    With `renumber` ("rcm", "hilbert" or "morton", see `renumbering.py`) nodes
+    and cells are renumbered for memory locality, and the permutations
+    (new -> old) are stored as `node_perm` and `cell_perm`; renumbered meshes
+    have their own cache directory.
+    """
+    if renumber:
+        from renumbering import renumber_mesh
+    if not cache:
+        mesh = read_msh(path)
+        return renumber_mesh(mesh, renumber) if renumber else mesh
+    cachedir = cache_path(path)
+    if renumber:
+        cachedir += "_" + renumber
+    if not os.path.isdir(cachedir):
+        if not renumber and os.path.getsize(path) > STREAM_BYTES and msh_format(path) == ("2.2", False):
+            stream_cache(path, cachedir)
+        else:
+            mesh = read_msh(path)
+            write_cache(cachedir, renumber_mesh(mesh, renumber) if renumber else mesh)
+    mesh = read_cache(cachedir, mmap=mmap)
+    mesh["cachedir"] = cachedir
+    return mesh
+
+# mesh arrays
+def mesh_arrays(mesh):
+    """
+    Return the array entries of a mesh dictionary (drops bookkeeping entries).
+    """
+    return {key: value for key, value in mesh.items() if isinstance(value, np.ndarray)}
+
+# cached mesh stage
+def cached_stage(mesh, keys, builder):
+    """
+    Return the arrays `keys` of a derived mesh stage (topology, geometry, ...).
+    Arrays already in the mesh (loaded from the cache) are reused; otherwise
+    `builder(mesh)` computes them, and they are stored in the mesh dictionary
+    and, for cached meshes, written to the cache directory.
+    """
+    if all(key in mesh for key in keys):
+        return {key: mesh[key] for key in keys}
+    arrays = builder(mesh)
+    if mesh.get("cachedir"):
+        update_cache(mesh["cachedir"], arrays)
+    mesh.update(arrays)
+    return {key: arrays[key] for key in keys}
+
+#============================================
+# MAIN
+#============================================
+
+# build caches from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build binary caches of MSH files.")
+    parser.add_argument("files", nargs="+", help="mesh files in MSH format")
+    parser.add_argument("--stream", action="store_true", help="stream all files into the cache")
+    parser.add_argument("--chunk", type=int, default=CHUNK_BYTES >> 20, help="block size of streamed reads (MB)")
+    parser.add_argument("--output", help="convert the files into this directory")
+    parser.add_argument("--format", choices=FORMATS, default="4.1", help="MSH version of converted files")
+    parser.add_argument("--binary", action="store_true", help="write converted files in binary mode")
+    args = parser.parse_args(argv)
+    for path in args.files:
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+            target = os.path.join(args.output, os.path.basename(path))
+            write_msh(target, read_msh(path), args.format, args.binary)
+            print("Wrote", target, f"(MSH {args.format}{' binary' if args.binary else ''})")
+            continue
+        cachedir = cache_path(path)
+        if args.stream and not os.path.isdir(cachedir):
+            stream_cache(path, cachedir, args.chunk << 20)
+        mesh = load_mesh(path)
+        print("Cached", path, "->", mesh["cachedir"], f"({len(mesh['nodes'])} nodes, {len(mesh['cells'])} cells)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
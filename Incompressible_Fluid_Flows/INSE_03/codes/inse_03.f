@@ -62,9 +62,9 @@ subroutine f(x, y, res)
         *pi*(r - rI)/(rI - rO))*cos(0.5d0* alpha*theta) - 4*alpha*beta*pi*r**2*rI**2*u0**2*sin(alpha &
         *theta) + 8*alpha*beta*pi*r**2*rI*rO*u0**2*sin(alpha*theta) - 4*alpha* beta*pi*r**2*rO**2*u0**2 &
         *sin(alpha*theta) - 8*alpha*beta*pi*r*rI **3*sin(0.5d0*alpha*theta) + 16*alpha*beta*pi*r*rI**2 &
-        *rO*sin( 0.5d0*alpha*theta) - 8*alpha*beta*pi*r*rI*rO**2*sin(0.5d0*alpha* theta) + alpha*r*rI* &
-        *3*u0**2*cos(alpha*theta - 2.0d0*beta*pi*r/( rI - rO) + 2.0d0*beta*pi*rI/(rI - rO)) - alpha*r &
-        *rI**3*u0**2*cos( alpha*theta + 2.0d0*beta*pi*r/(rI - rO) - 2.0d0*beta*pi*rI/(rI - rO)) - 3 &
+        *rO*sin( 0.5d0*alpha*theta) - 8*alpha*beta*pi*r*rI*rO**2*sin(0.5d0*alpha* theta) + alpha*r &
+        *rI**3*u0**2*cos(alpha*theta - 2.0d0*beta*pi*r/( rI - rO) + 2.0d0*beta*pi*rI/(rI - rO)) - alpha &
+        *r*rI**3*u0**2*cos( alpha*theta + 2.0d0*beta*pi*r/(rI - rO) - 2.0d0*beta*pi*rI/(rI - rO)) - 3 &
         *alpha*r*rI**2*rO*u0**2*cos(alpha*theta - 2.0d0*beta*pi*r /(rI - rO) + 2.0d0*beta*pi*rI/(rI &
         - rO)) + 3*alpha*r*rI**2*rO*u0 **2*cos(alpha*theta + 2.0d0*beta*pi*r/(rI - rO) - 2.0d0*beta*pi &
         * rI/(rI - rO)) + 3*alpha*r*rI*rO**2*u0**2*cos(alpha*theta - 2.0d0* beta*pi*r/(rI - rO) + 2.0d0 &
@@ -89,8 +89,8 @@ subroutine f(x, y, res)
         - rO)) + 2*alpha**2*beta*pi*r*rO**2*u0** 2*sin(0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI &
         - rO))*cos( beta*pi*(r - rI)/(rI - rO)) + 2*alpha**2*beta*pi*r*rO**2*u0**2* sin(beta*pi*(r &
         - rI)/(rI - rO))*cos(0.5d0*alpha*theta)**2*cos( beta*pi*(r - rI)/(rI - rO)) - 2*alpha**2*rI**3 &
-        *u0**2*sin(0.5d0* alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 + 6*alpha**2* rI**2*rO*u0* &
-        *2*sin(0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 - 6*alpha**2*rI*rO**2*u0**2 &
+        *u0**2*sin(0.5d0* alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 + 6*alpha**2* rI**2*rO &
+        *u0**2*sin(0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 - 6*alpha**2*rI*rO**2*u0**2 &
         *sin(0.5d0*alpha*theta)**2* sin(beta*pi*(r - rI)/(rI - rO))**2 + 2*alpha**2*rO**3*u0**2 &
         *sin( 0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 + 4* alpha*beta**3*nu*pi**3*r**2 &
         *u0*sin(0.5d0*alpha*theta)*sin(beta*pi *(r - rI)/(rI - rO)) - 4*alpha*beta**2*nu*pi**2*r*rI*u0 &
@@ -98,8 +98,8 @@ subroutine f(x, y, res)
         *sin(0.5d0*alpha*theta)*cos(beta*pi*(r - rI)/(rI - rO)) - 8*beta**2*pi**2*r**2*rI*u0**2 &
         *cos(0.5d0*alpha*theta)**2* cos(beta*pi*(r - rI)/(rI - rO))**2 + 8*beta**2*pi**2*r**2*rO*u0** 2 &
         *cos(0.5d0*alpha*theta)**2*cos(beta*pi*(r - rI)/(rI - rO))**2 - 8*beta**2*pi**2*r*rI**2 &
-        *cos(0.5d0*alpha*theta) + 8*beta**2*pi**2* r*rI*rO*cos(0.5d0*alpha*theta))*cos(theta)/(8*beta* &
-        *2*pi**2*r**3* rI - 8*beta**2*pi**2*r**3*rO)
+        *cos(0.5d0*alpha*theta) + 8*beta**2*pi**2* r*rI*rO*cos(0.5d0*alpha*theta))*cos(theta)/(8 &
+        *beta**2*pi**2*r**3* rI - 8*beta**2*pi**2*r**3*rO)
     res(2) = (4*alpha**2*beta*nu*pi*r*rI**2*u0*cos(0.5d0*alpha*theta)*cos(beta*pi*(r - rI)/(rI - rO)) &
         - 8*alpha**2*beta*nu*pi*r*rI*rO*u0*cos(0.5d0* alpha*theta)*cos(beta*pi*(r - rI)/(rI - rO)) + 4 &
         *alpha**2*beta*nu *pi*r*rO**2*u0*cos(0.5d0*alpha*theta)*cos(beta*pi*(r - rI)/(rI - rO)) - 8 &
@@ -109,9 +109,9 @@ subroutine f(x, y, res)
         *pi*(r - rI)/(rI - rO))*cos(0.5d0* alpha*theta) - 4*alpha*beta*pi*r**2*rI**2*u0**2*sin(alpha &
         *theta) + 8*alpha*beta*pi*r**2*rI*rO*u0**2*sin(alpha*theta) - 4*alpha* beta*pi*r**2*rO**2*u0**2 &
         *sin(alpha*theta) - 8*alpha*beta*pi*r*rI **3*sin(0.5d0*alpha*theta) + 16*alpha*beta*pi*r*rI**2 &
-        *rO*sin( 0.5d0*alpha*theta) - 8*alpha*beta*pi*r*rI*rO**2*sin(0.5d0*alpha* theta) + alpha*r*rI* &
-        *3*u0**2*cos(alpha*theta - 2.0d0*beta*pi*r/( rI - rO) + 2.0d0*beta*pi*rI/(rI - rO)) - alpha*r &
-        *rI**3*u0**2*cos( alpha*theta + 2.0d0*beta*pi*r/(rI - rO) - 2.0d0*beta*pi*rI/(rI - rO)) - 3 &
+        *rO*sin( 0.5d0*alpha*theta) - 8*alpha*beta*pi*r*rI*rO**2*sin(0.5d0*alpha* theta) + alpha*r &
+        *rI**3*u0**2*cos(alpha*theta - 2.0d0*beta*pi*r/( rI - rO) + 2.0d0*beta*pi*rI/(rI - rO)) - alpha &
+        *r*rI**3*u0**2*cos( alpha*theta + 2.0d0*beta*pi*r/(rI - rO) - 2.0d0*beta*pi*rI/(rI - rO)) - 3 &
         *alpha*r*rI**2*rO*u0**2*cos(alpha*theta - 2.0d0*beta*pi*r /(rI - rO) + 2.0d0*beta*pi*rI/(rI &
         - rO)) + 3*alpha*r*rI**2*rO*u0 **2*cos(alpha*theta + 2.0d0*beta*pi*r/(rI - rO) - 2.0d0*beta*pi &
         * rI/(rI - rO)) + 3*alpha*r*rI*rO**2*u0**2*cos(alpha*theta - 2.0d0* beta*pi*r/(rI - rO) + 2.0d0 &
@@ -136,8 +136,8 @@ subroutine f(x, y, res)
         - rO)) + 2*alpha**2*beta*pi*r*rO**2*u0** 2*sin(0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI &
         - rO))*cos( beta*pi*(r - rI)/(rI - rO)) + 2*alpha**2*beta*pi*r*rO**2*u0**2* sin(beta*pi*(r &
         - rI)/(rI - rO))*cos(0.5d0*alpha*theta)**2*cos( beta*pi*(r - rI)/(rI - rO)) - 2*alpha**2*rI**3 &
-        *u0**2*sin(0.5d0* alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 + 6*alpha**2* rI**2*rO*u0* &
-        *2*sin(0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 - 6*alpha**2*rI*rO**2*u0**2 &
+        *u0**2*sin(0.5d0* alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 + 6*alpha**2* rI**2*rO &
+        *u0**2*sin(0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 - 6*alpha**2*rI*rO**2*u0**2 &
         *sin(0.5d0*alpha*theta)**2* sin(beta*pi*(r - rI)/(rI - rO))**2 + 2*alpha**2*rO**3*u0**2 &
         *sin( 0.5d0*alpha*theta)**2*sin(beta*pi*(r - rI)/(rI - rO))**2 + 4* alpha*beta**3*nu*pi**3*r**2 &
         *u0*sin(0.5d0*alpha*theta)*sin(beta*pi *(r - rI)/(rI - rO)) - 4*alpha*beta**2*nu*pi**2*r*rI*u0 &
@@ -145,8 +145,8 @@ subroutine f(x, y, res)
         *sin(0.5d0*alpha*theta)*cos(beta*pi*(r - rI)/(rI - rO)) - 8*beta**2*pi**2*r**2*rI*u0**2 &
         *cos(0.5d0*alpha*theta)**2* cos(beta*pi*(r - rI)/(rI - rO))**2 + 8*beta**2*pi**2*r**2*rO*u0** 2 &
         *cos(0.5d0*alpha*theta)**2*cos(beta*pi*(r - rI)/(rI - rO))**2 - 8*beta**2*pi**2*r*rI**2 &
-        *cos(0.5d0*alpha*theta) + 8*beta**2*pi**2* r*rI*rO*cos(0.5d0*alpha*theta))*sin(theta)/(8*beta* &
-        *2*pi**2*r**3* rI - 8*beta**2*pi**2*r**3*rO)
+        *cos(0.5d0*alpha*theta) + 8*beta**2*pi**2* r*rI*rO*cos(0.5d0*alpha*theta))*sin(theta)/(8 &
+        *beta**2*pi**2*r**3* rI - 8*beta**2*pi**2*r**3*rO)
 end subroutine f
 
 ! Function g
@@ -78,16 +78,16 @@ def f(x, y):
         /2)*alpha*theta)**2*math.cos(beta*pi*(r - rI)/(rI - rO)) - 2*alpha**2*rI**3*u0**2*math.sin((1 \
         /2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 6*alpha**2*rI**2*rO*u0**2 \
         *math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 - 6*alpha**2*rI*rO**2 \
-        *u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 2*alpha**2*rO* \
-        *3*u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 4*alpha*beta* \
-        *3*nu*pi**3*r**2*u0*math.sin((1/2)*alpha*theta)*math.sin(beta*pi*(r - rI)/(rI - rO)) - 4*alpha \
-        *beta**2*nu*pi**2*r*rI*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI)/(rI - rO)) + 4 \
-        *alpha*beta**2*nu*pi**2*r*rO*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI)/(rI \
-        - rO)) - 8*beta**2*pi**2*r**2*rI*u0**2*math.cos((1/2)*alpha*theta)**2*math.cos(beta*pi*(r - rI) \
-        /(rI - rO))**2 + 8*beta**2*pi**2*r**2*rO*u0**2*math.cos((1/2)*alpha*theta)**2*math.cos(beta*pi \
-        *(r - rI)/(rI - rO))**2 - 8*beta**2*pi**2*r*rI**2*math.cos((1/2)*alpha*theta) + 8*beta**2*pi**2 \
-        *r*rI*rO*math.cos((1/2)*alpha*theta))*math.cos(theta)/(8*beta**2*pi**2*r**3*rI - 8*beta**2*pi* \
-        *2*r**3*rO)
+        *u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 2*alpha**2 \
+        *rO**3*u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 4*alpha \
+        *beta**3*nu*pi**3*r**2*u0*math.sin((1/2)*alpha*theta)*math.sin(beta*pi*(r - rI)/(rI - rO)) - 4 \
+        *alpha*beta**2*nu*pi**2*r*rI*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI)/(rI \
+        - rO)) + 4*alpha*beta**2*nu*pi**2*r*rO*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI) \
+        /(rI - rO)) - 8*beta**2*pi**2*r**2*rI*u0**2*math.cos((1/2)*alpha*theta)**2*math.cos(beta*pi*(r \
+        - rI)/(rI - rO))**2 + 8*beta**2*pi**2*r**2*rO*u0**2*math.cos((1/2)*alpha*theta)**2 \
+        *math.cos(beta*pi*(r - rI)/(rI - rO))**2 - 8*beta**2*pi**2*r*rI**2*math.cos((1/2)*alpha*theta) \
+        + 8*beta**2*pi**2*r*rI*rO*math.cos((1/2)*alpha*theta))*math.cos(theta)/(8*beta**2*pi**2*r**3 \
+        *rI - 8*beta**2*pi**2*r**3*rO)
     res[1] = (4*alpha**2*beta*nu*pi*r*rI**2*u0*math.cos((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI) \
         /(rI - rO)) - 8*alpha**2*beta*nu*pi*r*rI*rO*u0*math.cos((1/2)*alpha*theta)*math.cos(beta*pi*(r \
         - rI)/(rI - rO)) + 4*alpha**2*beta*nu*pi*r*rO**2*u0*math.cos((1/2)*alpha*theta)*math.cos(beta \
@@ -129,16 +129,16 @@ def f(x, y):
         /2)*alpha*theta)**2*math.cos(beta*pi*(r - rI)/(rI - rO)) - 2*alpha**2*rI**3*u0**2*math.sin((1 \
         /2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 6*alpha**2*rI**2*rO*u0**2 \
         *math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 - 6*alpha**2*rI*rO**2 \
-        *u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 2*alpha**2*rO* \
-        *3*u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 4*alpha*beta* \
-        *3*nu*pi**3*r**2*u0*math.sin((1/2)*alpha*theta)*math.sin(beta*pi*(r - rI)/(rI - rO)) - 4*alpha \
-        *beta**2*nu*pi**2*r*rI*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI)/(rI - rO)) + 4 \
-        *alpha*beta**2*nu*pi**2*r*rO*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI)/(rI \
-        - rO)) - 8*beta**2*pi**2*r**2*rI*u0**2*math.cos((1/2)*alpha*theta)**2*math.cos(beta*pi*(r - rI) \
-        /(rI - rO))**2 + 8*beta**2*pi**2*r**2*rO*u0**2*math.cos((1/2)*alpha*theta)**2*math.cos(beta*pi \
-        *(r - rI)/(rI - rO))**2 - 8*beta**2*pi**2*r*rI**2*math.cos((1/2)*alpha*theta) + 8*beta**2*pi**2 \
-        *r*rI*rO*math.cos((1/2)*alpha*theta))*math.sin(theta)/(8*beta**2*pi**2*r**3*rI - 8*beta**2*pi* \
-        *2*r**3*rO)
+        *u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 2*alpha**2 \
+        *rO**3*u0**2*math.sin((1/2)*alpha*theta)**2*math.sin(beta*pi*(r - rI)/(rI - rO))**2 + 4*alpha \
+        *beta**3*nu*pi**3*r**2*u0*math.sin((1/2)*alpha*theta)*math.sin(beta*pi*(r - rI)/(rI - rO)) - 4 \
+        *alpha*beta**2*nu*pi**2*r*rI*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI)/(rI \
+        - rO)) + 4*alpha*beta**2*nu*pi**2*r*rO*u0*math.sin((1/2)*alpha*theta)*math.cos(beta*pi*(r - rI) \
+        /(rI - rO)) - 8*beta**2*pi**2*r**2*rI*u0**2*math.cos((1/2)*alpha*theta)**2*math.cos(beta*pi*(r \
+        - rI)/(rI - rO))**2 + 8*beta**2*pi**2*r**2*rO*u0**2*math.cos((1/2)*alpha*theta)**2 \
+        *math.cos(beta*pi*(r - rI)/(rI - rO))**2 - 8*beta**2*pi**2*r*rI**2*math.cos((1/2)*alpha*theta) \
+        + 8*beta**2*pi**2*r*rI*rO*math.cos((1/2)*alpha*theta))*math.sin(theta)/(8*beta**2*pi**2*r**3 \
+        *rI - 8*beta**2*pi**2*r**3*rO)
     return res
 
 # Function g
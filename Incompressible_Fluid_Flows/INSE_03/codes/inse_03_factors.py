@@ -0,0 +1,55 @@
+# Auto-generated by generate_code.py
+
+import math
+
+# Global constants
+rO = 1.0
+rI = 0.5
+nu = 1.0
+rho = 1.0
+u0 = 1.0
+alpha = 4.0
+beta = 1.0
+pi = 3.141592653589793
+
+# Coordinates of the factored kernels
+COORDINATES = {
+    "p": ("r", "theta"),
+    "u": ("r", "theta"),
+    "g": ("r", "theta"),
+}
+
+# Coordinates the functions depend on
+DEPENDENCIES = {
+    "p": ("r", "theta"),
+    "u": ("r", "theta"),
+    "f": ("r", "theta"),
+    "g": (),
+}
+
+# Function p (factors of r, theta)
+def p(r, theta):
+    r_f0 = 1/r
+    theta_f0 = math.cos((1/2)*alpha*theta)
+    res = rI*rho*r_f0*theta_f0
+    return res
+
+# Function u (factors of r, theta)
+def u(r, theta):
+    r_f0 = -u0*math.cos(beta*pi*r/(-rI + rO) - beta*pi*rI/(-rI + rO))
+    theta_f0 = math.sin(theta)*math.cos((1/2)*alpha*theta)
+    r_f1 = -1/2*alpha*rI*u0*math.sin(beta*pi*r/(-rI + rO) - beta*pi*rI/(-rI + rO))/(beta*pi*r) + (1/2) \
+        *alpha*rO*u0*math.sin(beta*pi*r/(-rI + rO) - beta*pi*rI/(-rI + rO))/(beta*pi*r)
+    theta_f1 = math.sin((1/2)*alpha*theta)*math.cos(theta)
+    r_f2 = u0*math.cos(beta*pi*r/(-rI + rO) - beta*pi*rI/(-rI + rO))
+    theta_f2 = math.cos(theta)*math.cos((1/2)*alpha*theta)
+    theta_f3 = math.sin(theta)*math.sin((1/2)*alpha*theta)
+    res = [0.0]*2
+    res[0] = r_f0*theta_f0 + r_f1*theta_f1
+    res[1] = r_f2*theta_f2 + r_f1*theta_f3
+    return res
+
+# Function g (factors of r, theta)
+def g(r, theta):
+    res = 0
+    return res
@@ -168,6 +168,9 @@ params_list = [("r", r), ("theta", theta)]
 funcs_list = [("p", p, args_list, params_list),("u", u, args_list, params_list), \
                 ("f", f, args_list, params_list), ("g", g, args_list, params_list)]
 
+# test domain (random test points)
+domain = ("annulus", rI, rO)
+
 # generate code
 outdir = "../codes"
 name = "inse_03"
@@ -176,10 +179,11 @@ write_cpp_file(outdir, name, consts_list, funcs_list)
 write_fortran_file(outdir, name, consts_list, funcs_list)
 write_octave_file(outdir, name, consts_list, funcs_list)
 write_python_file(outdir, name, consts_list, funcs_list)
-write_cpp_test(outdir, name)
-write_fortran_test(outdir, name)
-write_octave_test(outdir, name)
-write_python_test(outdir, name)
+write_factors_file(outdir, name, consts_list, funcs_list)
+write_cpp_test(outdir, name, funcs_list, domain)
+write_fortran_test(outdir, name, funcs_list, domain)
+write_octave_test(outdir, name, funcs_list, domain)
+write_python_test(outdir, name, funcs_list, domain)
 print("\nGeneration complete.")
 
 # end of file
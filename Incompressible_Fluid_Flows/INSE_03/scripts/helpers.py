@@ -11,6 +11,17 @@ Utility functions for code generation in multiple programming languages:
 C/C++, Fortran, Octave/Matlab, and Python.
 Includes code formatting and line-wrapping helpers to keep generated source
 code within a configurable indent and line width.
+The generated test files are timing drivers evaluating every function at the
+points of a binary file or at quasi-random points in the case domain (the
+same points in all languages), printing the throughput and a checksum of
+each function, with OpenMP threads in C/C++ and Fortran.
+The factored kernels (`<name>_factors.py`) rewrite the functions that are
+sums of products of one-coordinate factors (detected symbolically, in polar
+coordinates when defined as parameters, Cartesian otherwise, and the other
+arguments such as t), so that on tensor-product points each factor is
+evaluated once per coordinate value. They also list the coordinates each
+function depends on (e.g. only theta for the radii and normals of curved
+boundaries, see `tables.py`).
 
 AUTHOR:
 -------
@@ -91,6 +102,30 @@ def write_fortran_constants(consts_list):
     """).strip()
     return code
 
+# prefix of the Fortran constants named as a function (Fortran names are case-insensitive)
+FORTRAN_CONSTANT_PREFIX = "const_"
+
+# renamed Fortran constants
+def fortran_constant_renames(consts_list, funcs_list):
+    """
+    Return the new names {constname: newname} of the constants whose names
+    differ only in case from the name of a function (e.g. rAB and RAB), which
+    clash in Fortran.
+    """
+    funcnames = {func_name.lower() for (func_name, _, _, _) in funcs_list}
+    return {constname: FORTRAN_CONSTANT_PREFIX + constname for (constname, _) in consts_list
+            if constname.lower() in funcnames}
+
+# rename Fortran constants
+def rename_fortran_constants(code, renames):
+    """
+    Replace the names of renamed constants in Fortran code (whole names,
+    matched with their case as written by the code generator).
+    """
+    for constname, newname in renames.items():
+        code = re.sub(rf"(?<![\w.]){re.escape(constname)}(?!\w)", newname, code)
+    return code
+
 # write Octave/Matlab constants
 def write_octave_constants(consts_list):
     """
@@ -142,14 +177,14 @@ def write_cpp_function(name, expr, args_list, params_list):
         return write_cpp_scalar_function(name, expr, args_list, params_list)
 
 # write Fortran function
-def write_fortran_function(name, expr, args_list, params_list):
+def write_fortran_function(name, expr, args_list, params_list, renames=None):
     """
     Generate a Fortran function definition from a symbolic expression.
     """
     if isinstance(expr, sympy.Matrix):
-        return write_fortran_vector_function(name, expr, args_list, params_list)
+        return write_fortran_vector_function(name, expr, args_list, params_list, renames)
     else:
-        return write_fortran_scalar_function(name, expr, args_list, params_list)
+        return write_fortran_scalar_function(name, expr, args_list, params_list, renames)
 
 # write Octave/Matlab function
 def write_octave_function(name, expr, args_list, consts_list, params_list):
@@ -219,7 +254,7 @@ def write_cpp_scalar_function(name, expr, args_list, params_list):
     return code
 
 # write Fortran scalar function
-def write_fortran_scalar_function(name, expr, args_list, params_list):
+def write_fortran_scalar_function(name, expr, args_list, params_list, renames=None):
     """
     Generate a Fortran function definition from a scalar symbolic expression.
     """
@@ -231,7 +266,7 @@ def write_fortran_scalar_function(name, expr, args_list, params_list):
         fexpr = fcode(parexpr, assign_to=None, source_format="free")
         fexpr = fexpr.replace("&\n", "")
         fexpr = re.sub(r" {2,}", " ", fexpr)
-        fexpr = fexpr.strip()
+        fexpr = rename_fortran_constants(fexpr.strip(), renames or {})
         fexpr = wrap_code_line(f"{parname} = {fexpr}", width=100, indent=" "*4,continuation=" &")
         decl_lines.extend(fexpr)
     if len(decl_lines) > 1:
@@ -242,7 +277,7 @@ def write_fortran_scalar_function(name, expr, args_list, params_list):
     fexpr = fcode(expr, assign_to=None, source_format="free")
     fexpr = fexpr.replace("&\n", "")
     fexpr = re.sub(r" {2,}", " ", fexpr)
-    fexpr = fexpr.strip()
+    fexpr = rename_fortran_constants(fexpr.strip(), renames or {})
     comp = "\n".join(wrap_code_line(f"res = {fexpr}", width=100, indent=" "*16,continuation=" &"))
     if decl != "":
         code = textwrap.dedent(f"""
@@ -396,7 +431,7 @@ def write_cpp_vector_function(name, expr, args_list, params_list):
     return code
 
 # write Fortran vector function
-def write_fortran_vector_function(name, expr, args_list, params_list):
+def write_fortran_vector_function(name, expr, args_list, params_list, renames=None):
     """
     Generate a Fortran function definition from a vector symbolic expression.
     """
@@ -409,7 +444,7 @@ def write_fortran_vector_function(name, expr, args_list, params_list):
         fexpr = fcode(parexpr, assign_to=None, source_format="free")
         fexpr = fexpr.replace("&\n", "")
         fexpr = re.sub(r" {2,}", " ", fexpr)
-        fexpr = fexpr.strip()
+        fexpr = rename_fortran_constants(fexpr.strip(), renames or {})
         fexpr = wrap_code_line(f"{parname} = {fexpr}", width=100, indent=" "*4,continuation=" &")
         decl_lines.extend(fexpr)
     if len(decl_lines) > 1:
@@ -422,7 +457,7 @@ def write_fortran_vector_function(name, expr, args_list, params_list):
         fexpr = fcode(compexpr, assign_to=None, source_format="free")
         fexpr = fexpr.replace("&\n", "")
         fexpr = re.sub(r" {2,}", " ", fexpr)
-        fexpr = fexpr.strip()
+        fexpr = rename_fortran_constants(fexpr.strip(), renames or {})
         fexpr = wrap_code_line(f"res({i+1}) = {fexpr}", width=100, indent=" "*4,continuation=" &")
         comp_lines.extend(fexpr)
     comp_lines[1:] = [" "*12 + line for line in comp_lines[1:]]
@@ -535,10 +570,180 @@ def write_python_vector_function(name, expr, args_list, params_list):
         """).strip()
     return code
 
+#============================================
+# SEPARABLE FACTORS
+#============================================
+
+# coordinates of the factored kernels when defined as parameters
+POLAR_COORDINATES = ("r", "theta")
+
+# largest expressions analysed for separability (number of tree nodes)
+SEPARABLE_MAX_NODES = 1000
+
+# random values checking the separated expressions
+SEPARABLE_CHECKS = [0.7548776662466927, 0.5698402909980532, 0.3247179572447460]
+
+# coordinates of a factored kernel
+def separable_coordinates(args_list, params_list):
+    """
+    Return the names of the coordinates of the factored kernel of a function:
+    the polar coordinates when defined as parameters or the first two
+    arguments otherwise, followed by the other arguments (e.g. t).
+    """
+    parnames = [parname for (parname, _) in params_list]
+    argnames = [argname for (argname, _) in args_list]
+    if all(coord in parnames for coord in POLAR_COORDINATES):
+        return list(POLAR_COORDINATES) + argnames[2:]
+    return argnames
+
+# coordinates a function depends on
+def function_dependencies(expr, args_list, params_list):
+    """
+    Return the names of the kernel coordinates (see `separable_coordinates`)
+    and other arguments a function depends on, through its expression and
+    the parameters it uses.
+    """
+    coords = separable_coordinates(args_list, params_list)
+    names = coords + [argname for (argname, _) in args_list if argname not in coords]
+    params = {parname: sympy.sympify(parexpr) for (parname, parexpr) in params_list if parname not in coords}
+    found, pending = set(), [sympy.sympify(expr)]
+    while pending:
+        for symbol in pending.pop().free_symbols:
+            if symbol.name not in found:
+                found.add(symbol.name)
+                if symbol.name in params:
+                    pending.append(params[symbol.name])
+    return [name for name in names if name in found]
+
+# terms of a separable expression
+def separable_terms(expr, coords):
+    """
+    Return the terms of a scalar symbolic expression written as a sum of
+    products of one-coordinate factors, as a list of (coefficient, {coordinate:
+    factor}), from a multiplicative separation or, failing that, from the
+    separation of the expanded terms. Terms sharing the factors of all but one
+    coordinate are gathered, by the coordinate giving the fewest terms.
+    Returns None when the expression is not separable or depends on other
+    coordinates (e.g. x and y in a polar kernel) or exceeds SEPARABLE_MAX_NODES.
+    """
+    expr = sympy.sympify(expr)
+    if sum(1 for _ in sympy.preorder_traversal(expr)) > SEPARABLE_MAX_NODES:
+        return None
+    symbols = {symbol.name: symbol for symbol in expr.free_symbols}
+    variables = [symbols[coord] for coord in coords if coord in symbols]
+    if any(name in symbols for name in ("x", "y", "r", "theta", "t") if name not in coords):
+        return None
+    def separate(term):
+        if not variables:
+            return (term, {})
+        factors = sympy.separatevars(term, symbols=variables, dict=True, force=True)
+        if factors is None:
+            return None
+        return (factors.pop("coeff"), {var: factor for var, factor in factors.items() if factor != 1})
+    terms = [separate(expr)]
+    if terms[0] is None:
+        terms = [separate(term) for term in sympy.Add.make_args(sympy.expand(expr))]
+        if any(term is None for term in terms):
+            return None
+    best = terms
+    for var in variables:
+        groups = {}
+        for coeff, factors in terms:
+            key = tuple(sorted((str(other), factor) for other, factor in factors.items() if other != var))
+            groups.setdefault(key, []).append(coeff*factors.get(var, sympy.Integer(1)))
+        if len(groups) < len(best):
+            best = []
+            for key, parts in groups.items():
+                factors = {symbols[other]: factor for other, factor in key}
+                factor = sympy.Add(*parts)
+                if factor.free_symbols & {var}:
+                    best.append((sympy.Integer(1), dict(factors, **{var.name: factor})))
+                else:
+                    best.append((factor, factors))
+            best = [(coeff, {symbols[var] if isinstance(var, str) else var: factor
+                             for var, factor in factors.items()}) for coeff, factors in best]
+    # check the separated expression at random values of all symbols
+    values = {symbol: SEPARABLE_CHECKS[i % len(SEPARABLE_CHECKS)] + i for i, symbol in
+              enumerate(sorted(expr.free_symbols, key=str))}
+    exact = complex(expr.evalf(subs=values))
+    approx = complex(sum((coeff*sympy.Mul(*factors.values()) for coeff, factors in best),
+                         sympy.Integer(0)).evalf(subs=values))
+    if abs(exact - approx) > 1.0e-10*max(1.0, abs(exact)):
+        return None
+    return best
+
+# write Python factored kernel
+def write_python_factors_function(name, expr, args_list, params_list):
+    """
+    Generate a Python factored kernel from a separable symbolic expression (or
+    None): a function of the kernel coordinates where each one-coordinate
+    factor is a local variable, so that on tensor-product points (coordinates
+    shaped for broadcasting) every factor is evaluated once per coordinate
+    value and the terms are combined by broadcasting.
+    """
+    coords = separable_coordinates(args_list, params_list)
+    comps = list(expr) if isinstance(expr, sympy.Matrix) else [expr]
+    params = [(parname, parexpr) for (parname, parexpr) in params_list
+              if parname not in POLAR_COORDINATES]
+    if any(set(map(str, parexpr.free_symbols)) & {"x", "y", "r", "theta", "t"} for (_, parexpr) in params):
+        return None
+    terms_list = [separable_terms(comp, coords) for comp in comps]
+    if any(terms is None for terms in terms_list):
+        return None
+    def line(expr):
+        return re.sub(r" {2,}", " ", pycode(expr).replace("\n", "")).strip()
+    body, names = [], {}
+    for (parname, parexpr) in params:
+        body.extend(wrap_code_line(f"{parname} = {line(parexpr)}", width=100, indent=" "*4, continuation=" \\"))
+    results = []
+    for terms in terms_list:
+        products = []
+        for coeff, factors in terms:
+            parts = [] if coeff in (1, -1) else [f"({line(coeff)})" if coeff.is_Add else line(coeff)]
+            for var in sorted(factors, key=lambda var: coords.index(var.name)):
+                factor = factors[var]
+                if factor == var:
+                    names[factor] = var.name
+                elif factor not in names:
+                    count = sum(1 for key in names.values() if key.startswith(var.name + "_f"))
+                    names[factor] = f"{var.name}_f{count}"
+                    body.extend(wrap_code_line(f"{names[factor]} = {line(factor)}", width=100, indent=" "*4,
+                                               continuation=" \\"))
+                parts.append(f"({names[factor]})" if names[factor].startswith("-") else names[factor])
+            products.append(("-" if coeff == -1 else "") + ("*".join(parts) if parts else "1.0"))
+        results.append(" + ".join(products).replace("+ -", "- ") if products else "0.0")
+    if isinstance(expr, sympy.Matrix):
+        body.append(f"res = [0.0]*{len(expr)}")
+        for i, result in enumerate(results):
+            body.extend(wrap_code_line(f"res[{i}] = {result}", width=100, indent=" "*4, continuation=" \\"))
+    else:
+        body.extend(wrap_code_line(f"res = {results[0]}", width=100, indent=" "*4, continuation=" \\"))
+    body.append("return res")
+    lines = [f"# Function {name} (factors of {', '.join(coords)})", f"def {name}({', '.join(coords)}):"]
+    lines.extend(" "*4 + text for text in body)
+    return "\n".join(lines)
+
 #============================================
 # WRAP CODE LINE
 #============================================
 
+# find break position
+def find_break_position(line, width):
+    """
+    Find the rightmost operator (+, -, *, /) before the given width to break a
+    code line, skipping power operators (**) and exponents of float literals (1e-5).
+    """
+    for pos in range(min(width, len(line)) - 1, 0, -1):
+        char = line[pos]
+        if char not in "+-*/":
+            continue
+        if char == "*" and (line[pos - 1] == "*" or line[pos + 1:pos + 2] == "*"):
+            continue
+        if char in "+-" and line[pos - 1] in "eE" and line[pos - 2:pos - 1].isdigit():
+            continue
+        return pos
+    return -1
+
 # wrap code line
 def wrap_code_line(line, width=100, indent="", continuation="\\"):
     """
@@ -550,7 +755,7 @@ def wrap_code_line(line, width=100, indent="", continuation="\\"):
         return [line]
     parts = []
     while len(line) > width:
-        break_pos = max(line.rfind(op, 0, width) for op in ["+", "-", "*", "/"])
+        break_pos = find_break_position(line, width)
         if break_pos == -1:
             break_pos = line.rfind(" ", 0, width)
         if break_pos == -1:
@@ -592,11 +797,12 @@ def write_cpp_file(outdir, name, consts_list, funcs_list):
 # generate implementations in Fortran
 def write_fortran_file(outdir, name, consts_list, funcs_list):
     contents = ["! Auto-generated by generate_code.py", "module " + name.upper(), "implicit none"]
-    contents.append(write_fortran_constants(consts_list))
+    renames = fortran_constant_renames(consts_list, funcs_list)
+    contents.append(rename_fortran_constants(write_fortran_constants(consts_list), renames))
     contents.append("contains")
     for (func_name, func_expr, func_args_list, func_params_list) in funcs_list:
         try:
-            code = write_fortran_function(func_name, func_expr, func_args_list, func_params_list)
+            code = write_fortran_function(func_name, func_expr, func_args_list, func_params_list, renames)
             contents.append(code)
         except Exception as e:
             print("Fortran generation failed for", name, ":", e)
@@ -630,57 +836,438 @@ def write_python_file(outdir, name, consts_list, funcs_list):
     contents = "\n\n".join(contents) + "\n"
     write_file(os.path.join(outdir, name + ".py"), contents)
 
+# generate factored kernels in Python
+def write_factors_file(outdir, name, consts_list, funcs_list):
+    contents = ["# Auto-generated by generate_code.py", "import math"]
+    contents.append(write_python_constants(consts_list))
+    coordinates, dependencies = [], []
+    for (func_name, func_expr, func_args_list, func_params_list) in funcs_list:
+        deps = [f'"{dep}"' for dep in function_dependencies(func_expr, func_args_list, func_params_list)]
+        dependencies.append(f'"{func_name}": ({", ".join(deps)}{"," if len(deps) == 1 else ""})')
+        try:
+            code = write_python_factors_function(func_name, func_expr, func_args_list, func_params_list)
+        except Exception as e:
+            print("Factored kernel generation failed for", func_name, ":", e)
+            continue
+        if code is None:
+            print("Not separable:", func_name)
+            continue
+        contents.append(code)
+        coords = ", ".join(f'"{coord}"' for coord in separable_coordinates(func_args_list, func_params_list))
+        coordinates.append(f'"{func_name}": ({coords})')
+    contents.insert(3, "# Coordinates of the factored kernels\nCOORDINATES = {\n" +
+                    "".join(" "*4 + entry + ",\n" for entry in coordinates) + "}")
+    contents.insert(4, "# Coordinates the functions depend on\nDEPENDENCIES = {\n" +
+                    "".join(" "*4 + entry + ",\n" for entry in dependencies) + "}")
+    contents = "\n\n".join(contents) + "\n"
+    write_file(os.path.join(outdir, name + "_factors.py"), contents)
+
 #============================================
 # WRITE TESTS
 #============================================
 
+# default number of points of the test drivers
+TEST_POINTS = 100000
+
+# default timed repetitions of the test drivers (after one warm-up pass)
+TEST_REPEATS = 5
+
+# generators of the quasi-random test points (R2 sequence)
+TEST_SEQUENCE = (0.7548776662466927, 0.5698402909980532)
+
+# values of the function arguments beyond (x, y) in the test drivers
+TEST_ARGUMENTS = {"t": 0.01}
+
+# functions of the test drivers
+def test_functions(funcs_list):
+    """
+    Return the names, number of components (1 for scalar functions) and
+    values of the arguments beyond (x, y) (see TEST_ARGUMENTS, 0 otherwise)
+    of the functions in `funcs_list`.
+    """
+    return [(func_name, len(func_expr) if isinstance(func_expr, sympy.Matrix) else 1,
+             [float(TEST_ARGUMENTS.get(str(arg_name), 0.0)) for (arg_name, _) in func_args_list[2:]])
+            for (func_name, func_expr, func_args_list, _) in funcs_list]
+
+# mapping of test points to the domain
+def test_domain(domain, u, v, x, y, sqrt, cos, sin):
+    """
+    Return the statements mapping the quasi-random numbers u and v in [0, 1)
+    to a point (x, y) of the domain ("box", xmin, xmax, ymin, ymax) or
+    ("annulus", rmin, rmax), uniformly distributed by area, with the names of
+    the variables and functions of a language.
+    """
+    if domain[0] == "box":
+        xmin, xmax, ymin, ymax = (repr(float(value)) for value in domain[1:])
+        return [f"{x} = {xmin} + {u}*({xmax} - {xmin})", f"{y} = {ymin} + {v}*({ymax} - {ymin})"]
+    if domain[0] == "annulus":
+        rmin, rmax = (repr(float(value)) for value in domain[1:])
+        radius = f"{sqrt}({rmin}*{rmin} + {u}*({rmax}*{rmax} - {rmin}*{rmin}))"
+        angle = f"6.283185307179586*{v}"
+        return [f"{x} = {radius}*{cos}({angle})", f"{y} = {radius}*{sin}({angle})"]
+    raise ValueError(f"Unknown test domain '{domain[0]}' (expected 'box' or 'annulus').")
+
 # write C/C++ test file
-def write_cpp_test(outdir, name):
-    code = textwrap.dedent(f"""
-    // Test file\n
-    // Compile with "gcc test.cpp -o test"
-    // Run with ".\\test"\n
-    #include <stdio.h>
-    #include "{name}.h"\n
-    int main() {{\n
-        // Insert code\n
+def write_cpp_test(outdir, name, funcs_list, domain=("box", 0.0, 1.0, 0.0, 1.0)):
+    blocks = []
+    for (func_name, dim, values) in test_functions(funcs_list):
+        args = "".join(f", {value!r}" for value in values)
+        if dim == 1:
+            call = f"res[i] = {func_name}(x[i], y[i]{args});"
+        else:
+            call = f"{func_name}(x[i], y[i]{args}, &res[{dim}*i]);"
+        blocks.append(textwrap.indent(textwrap.dedent(f"""
+        // Function {func_name}
+        {{
+            std::vector<double> res({dim}*npoints);
+            double best = 1.0e300;
+            for (int k = 0; k <= repeats; k++) {{
+                auto start = std::chrono::steady_clock::now();
+                #pragma omp parallel for
+                for (long long i = 0; i < npoints; i++) {{
+                    {call}
+                }}
+                std::chrono::duration<double> seconds = std::chrono::steady_clock::now() - start;
+                if ((k > 0 || repeats == 0) && seconds.count() < best) best = seconds.count();
+            }}
+            report("{func_name}", res, npoints, best);
+        }}
+        """).strip(), " "*4))
+    mapping = test_domain(domain, "u", "v", "x[i]", "y[i]", "sqrt", "cos", "sin")
+    code = textwrap.dedent("""
+    // Test file
+
+    // Evaluates every function at the points of a binary file (int64 number of
+    // points followed by the float64 x and y coordinates) or at quasi-random
+    // points in the domain, and prints the throughput and checksum of each one
+
+    // Compile with "g++ -O2 -fopenmp test.cpp -o test"
+    // Run with "./test [points.bin | npoints] [repeats] [threads]"
+
+    #include <cmath>
+    #include <cstdio>
+    #include <cstdlib>
+    #include <chrono>
+    #include <vector>
+    #ifdef _OPENMP
+    #include <omp.h>
+    #endif
+    #include "{name}.h"
+
+    // load points from binary file
+    static bool load_points(const char* path, std::vector<double>& x, std::vector<double>& y) {{
+        FILE* fh = fopen(path, "rb");
+        if (!fh) return false;
+        long long npoints = 0;
+        bool ok = fread(&npoints, sizeof(npoints), 1, fh) == 1;
+        if (ok) {{
+            x.resize(npoints);
+            y.resize(npoints);
+            ok = fread(x.data(), sizeof(double), npoints, fh) == (size_t)npoints
+                && fread(y.data(), sizeof(double), npoints, fh) == (size_t)npoints;
+        }}
+        fclose(fh);
+        return ok;
+    }}
+
+    // quasi-random points in the domain
+    static void random_points(long long npoints, std::vector<double>& x, std::vector<double>& y) {{
+        x.resize(npoints);
+        y.resize(npoints);
+        for (long long i = 0; i < npoints; i++) {{
+            double u = (i + 1)*{su};
+            double v = (i + 1)*{sv};
+            u -= floor(u);
+            v -= floor(v);
+            {mapping}
+        }}
+    }}
+
+    // print throughput and checksum
+    static void report(const char* name, const std::vector<double>& res, long long npoints, double best) {{
+        double checksum = 0.0;
+        for (size_t i = 0; i < res.size(); i++) checksum += res[i];
+        printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\\n", name, npoints/best,
+            1.0e9*best/npoints, checksum);
+    }}
+
+    int main(int argc, char** argv) {{
+
+        std::vector<double> x, y;
+        const char* arg = argc > 1 ? argv[1] : "{npoints}";
+        if (!load_points(arg, x, y)) random_points(atoll(arg), x, y);
+        long long npoints = x.size();
+        int repeats = argc > 2 ? atoi(argv[2]) : {repeats};
+        int threads = 1;
+    #ifdef _OPENMP
+        threads = argc > 3 ? atoi(argv[3]) : omp_get_max_threads();
+        omp_set_num_threads(threads);
+    #endif
+        printf("%lld points, %d repeats, %d threads\\n", npoints, repeats, threads);
+
+    {blocks}
+
         return 0;
     }}
-    """).lstrip()
+    """).lstrip().format(name=name, su=TEST_SEQUENCE[0], sv=TEST_SEQUENCE[1], npoints=TEST_POINTS,
+                         repeats=TEST_REPEATS, mapping="\n        ".join(line + ";" for line in mapping),
+                         blocks="\n\n".join(blocks))
     write_file(os.path.join(outdir, "test.cpp"), code)
 
 # write Fortran test file
-def write_fortran_test(outdir, name):
-    code = textwrap.dedent(f"""
-    ! Test file\n
-    ! Compile with "gfortran -cpp test.f -o test"
-    ! Run with ".\\test"\n
-    #include "{name}.f"\n
-    program test\n
-        use {name.upper()}\n
-        ! Insert code\n
+def write_fortran_test(outdir, name, funcs_list, domain=("box", 0.0, 1.0, 0.0, 1.0)):
+    blocks = []
+    for (func_name, dim, values) in test_functions(funcs_list):
+        args = "".join(f", {value!r}d0" for value in values)
+        if dim == 1:
+            call = f"test_res(1, test_i) = {func_name}(test_x(test_i), test_y(test_i){args})"
+        else:
+            call = f"call {func_name}(test_x(test_i), test_y(test_i){args}, test_res(:, test_i))"
+        blocks.append(textwrap.indent(textwrap.dedent(f"""
+        ! Function {func_name}
+        allocate(test_res({dim}, test_n))
+        test_best = huge(1.0d0)
+        do test_k = 0, test_repeats
+            call system_clock(test_count0, test_rate)
+            !$omp parallel do
+            do test_i = 1, test_n
+                {call}
+            end do
+            !$omp end parallel do
+            call system_clock(test_count1)
+            if (test_k > 0 .or. test_repeats == 0) then
+                test_best = min(test_best, real(test_count1 - test_count0, 8)/real(test_rate, 8))
+            end if
+        end do
+        call report("{func_name}", test_res, test_n, test_best)
+        deallocate(test_res)
+        """).strip(), " "*4))
+    mapping = test_domain(domain, "test_u", "test_v", "test_x(test_i)", "test_y(test_i)", "sqrt", "cos", "sin")
+    mapping = [re.sub(r"(\d\.\d+(e-?\d+)?)", r"\1d0", line) for line in mapping]
+    code = textwrap.dedent("""
+    ! Test file
+
+    ! Evaluates every function at the points of a binary file (int64 number of
+    ! points followed by the float64 x and y coordinates) or at quasi-random
+    ! points in the domain, and prints the throughput and checksum of each one
+
+    ! Compile with "gfortran -O2 -cpp -ffree-form -ffree-line-length-none -fopenmp test.f -o test"
+    ! Run with "./test [points.bin | npoints] [repeats] [threads]"
+
+    #include "{name}.f"
+
+    program test
+
+        use {module}
+        !$ use omp_lib
+
+        implicit none
+        integer(8) :: test_n, test_i, test_count0, test_count1, test_rate
+        integer :: test_k, test_repeats, test_threads, test_unit
+        real(8), allocatable :: test_x(:), test_y(:), test_res(:, :)
+        real(8) :: test_u, test_v, test_best
+        character(len=4096) :: test_arg
+        logical :: test_exists
+
+        ! points from binary file or quasi-random points in the domain
+        test_arg = "{npoints}"
+        if (command_argument_count() >= 1) call get_command_argument(1, test_arg)
+        inquire(file=trim(test_arg), exist=test_exists)
+        if (test_exists) then
+            open(newunit=test_unit, file=trim(test_arg), access="stream", form="unformatted", status="old")
+            read(test_unit) test_n
+            allocate(test_x(test_n), test_y(test_n))
+            read(test_unit) test_x
+            read(test_unit) test_y
+            close(test_unit)
+        else
+            read(test_arg, *) test_n
+            allocate(test_x(test_n), test_y(test_n))
+            do test_i = 1, test_n
+                test_u = real(test_i, 8)*{su}d0
+                test_v = real(test_i, 8)*{sv}d0
+                test_u = test_u - aint(test_u)
+                test_v = test_v - aint(test_v)
+                {mapping}
+            end do
+        end if
+        test_repeats = {repeats}
+        if (command_argument_count() >= 2) then
+            call get_command_argument(2, test_arg)
+            read(test_arg, *) test_repeats
+        end if
+        test_threads = 1
+        !$ test_threads = omp_get_max_threads()
+        !$ if (command_argument_count() >= 3) call get_command_argument(3, test_arg)
+        !$ if (command_argument_count() >= 3) read(test_arg, *) test_threads
+        !$ call omp_set_num_threads(test_threads)
+        print "(i0, a, i0, a, i0, a)", test_n, " points, ", test_repeats, " repeats, ", test_threads, " threads"
+
+    {blocks}
+
+    contains
+
+        ! print throughput and checksum
+        subroutine report(name, res, npoints, best)
+            character(len=*), intent(in) :: name
+            real(8), intent(in) :: res(:, :)
+            integer(8), intent(in) :: npoints
+            real(8), intent(in) :: best
+            print "(a, t14, es12.4, a, f10.2, a, es19.12)", name, npoints/best, " points/s", &
+                1.0d9*best/npoints, " ns/point  checksum ", sum(res)
+        end subroutine report
+
     end program test
-    """).lstrip()
+    """).lstrip().format(name=name, module=name.upper(), su=TEST_SEQUENCE[0], sv=TEST_SEQUENCE[1],
+                         npoints=TEST_POINTS, repeats=TEST_REPEATS, mapping="\n            ".join(mapping),
+                         blocks="\n\n".join(blocks))
     write_file(os.path.join(outdir, "test.f"), code)
 
 # write Octave/Matlab test file
-def write_octave_test(outdir, name):
-    code = textwrap.dedent(f"""
-    % Test file\n
-    % Run with "octave {name}.m"\n
-    {name}\n
-    % Insert code
-    """).lstrip()
+def write_octave_test(outdir, name, funcs_list, domain=("box", 0.0, 1.0, 0.0, 1.0)):
+    blocks = []
+    for (func_name, dim, values) in test_functions(funcs_list):
+        args = "".join(f", {value!r}" for value in values)
+        blocks.append(textwrap.dedent(f"""
+        % Function {func_name}
+        test_res = zeros({dim}, test_n);
+        test_best = Inf;
+        for test_k = 0:test_repeats
+            tic;
+            for test_i = 1:test_n
+                test_res(:, test_i) = {func_name}(test_x(test_i), test_y(test_i){args});
+            end
+            test_seconds = toc;
+            if test_k > 0 || test_repeats == 0
+                test_best = min(test_best, test_seconds);
+            end
+        end
+        printf("%-12s %12.4e points/s %10.2f ns/point  checksum % .12e\\n", "{func_name}", ...
+            test_n/test_best, 1.0e9*test_best/test_n, sum(test_res(:)));
+        """).strip())
+    mapping = test_domain(domain, "test_u", "test_v", "test_x", "test_y", "sqrt", "cos", "sin")
+    mapping = [line.replace("*", ".*") for line in mapping]
+    code = textwrap.dedent("""
+    % Test file
+
+    % Evaluates every function at the points of a binary file (int64 number of
+    % points followed by the float64 x and y coordinates) or at quasi-random
+    % points in the domain, and prints the throughput and checksum of each one
+
+    % Run with "octave test.m [points.bin | npoints] [repeats]"
+
+    {name}
+
+    % points from binary file or quasi-random points in the domain
+    test_args = argv();
+    test_arg = "{npoints}";
+    if numel(test_args) >= 1
+        test_arg = test_args{{1}};
+    end
+    if exist(test_arg, "file") == 2
+        test_fh = fopen(test_arg, "r");
+        test_n = fread(test_fh, 1, "int64");
+        test_x = fread(test_fh, test_n, "double");
+        test_y = fread(test_fh, test_n, "double");
+        fclose(test_fh);
+    else
+        test_n = str2double(test_arg);
+        test_u = (1:test_n)'*{su};
+        test_v = (1:test_n)'*{sv};
+        test_u = test_u - floor(test_u);
+        test_v = test_v - floor(test_v);
+        {mapping}
+    end
+    test_repeats = {repeats};
+    if numel(test_args) >= 2
+        test_repeats = str2double(test_args{{2}});
+    end
+    printf("%d points, %d repeats, 1 threads\\n", test_n, test_repeats);
+
+    {blocks}
+    """).lstrip().format(name=name, su=TEST_SEQUENCE[0], sv=TEST_SEQUENCE[1], npoints=TEST_POINTS,
+                         repeats=TEST_REPEATS, mapping="\n    ".join(line + ";" for line in mapping),
+                         blocks="\n\n".join(blocks))
     write_file(os.path.join(outdir, "test.m"), code)
 
 # write Python test file
-def write_python_test(outdir, name):
-    code = textwrap.dedent(f"""
-    # Test file\n
-    # Run with "python {name}.py"\n
-    import {name}\n
-    # Insert code
-    """).lstrip()
+def write_python_test(outdir, name, funcs_list, domain=("box", 0.0, 1.0, 0.0, 1.0)):
+    functions = ", ".join(f'("{func_name}", {dim}, {tuple(values)!r})'
+                          for (func_name, dim, values) in test_functions(funcs_list))
+    mapping = test_domain(domain, "u", "v", "x[i]", "y[i]", "math.sqrt", "math.cos", "math.sin")
+    code = textwrap.dedent("""
+    # Test file
+
+    # Evaluates every function at the points of a binary file (int64 number of
+    # points followed by the float64 x and y coordinates) or at quasi-random
+    # points in the domain, and prints the throughput and checksum of each one
+
+    # Run with "python test.py [points.bin | npoints] [repeats]"
+
+    import os
+    import sys
+    import math
+    import time
+    import array
+    import {name}
+
+    # functions, number of components and arguments beyond (x, y)
+    FUNCTIONS = [{functions}]
+
+    # load points from binary file
+    def load_points(path):
+        with open(path, "rb") as fh:
+            n = array.array("q")
+            n.fromfile(fh, 1)
+            x = array.array("d")
+            y = array.array("d")
+            x.fromfile(fh, n[0])
+            y.fromfile(fh, n[0])
+        return x, y
+
+    # quasi-random points in the domain
+    def random_points(n):
+        x = array.array("d", bytes(8*n))
+        y = array.array("d", bytes(8*n))
+        for i in range(n):
+            u = (i + 1)*{su}
+            v = (i + 1)*{sv}
+            u -= math.floor(u)
+            v -= math.floor(v)
+            {mapping}
+        return x, y
+
+    # evaluate function at all points
+    def evaluate(func, dim, args, x, y):
+        res = []
+        if dim == 1:
+            for xi, yi in zip(x, y):
+                res.append(func(xi, yi, *args))
+        else:
+            for xi, yi in zip(x, y):
+                res.extend(func(xi, yi, *args))
+        return res
+
+    arg = sys.argv[1] if len(sys.argv) > 1 else "{npoints}"
+    x, y = load_points(arg) if os.path.isfile(arg) else random_points(int(arg))
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else {repeats}
+    print(f"{{len(x)}} points, {{repeats}} repeats, 1 threads")
+    for func_name, dim, args in FUNCTIONS:
+        func = getattr({name}, func_name)
+        best = math.inf
+        for k in range(repeats + 1):
+            start = time.perf_counter()
+            res = evaluate(func, dim, args, x, y)
+            seconds = time.perf_counter() - start
+            if k > 0 or repeats == 0:
+                best = min(best, seconds)
+        checksum = 0.0
+        for value in res:
+            checksum += value
+        print(f"{{func_name:<12s}} {{len(x)/best:12.4e}} points/s {{1.0e9*best/len(x):10.2f}} ns/point  "
+              f"checksum {{checksum: .12e}}")
+    """).lstrip().format(name=name, functions=functions, su=TEST_SEQUENCE[0], sv=TEST_SEQUENCE[1],
+                         npoints=TEST_POINTS, repeats=TEST_REPEATS, mapping="\n        ".join(mapping))
     write_file(os.path.join(outdir, "test.py"), code)
 
 # end of file
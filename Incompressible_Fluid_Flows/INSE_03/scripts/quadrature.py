@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | QUADRATURE
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for generating Gauss quadrature points and weights on all
+cells (triangles and quadrilaterals) and faces of meshes loaded with
+`meshes.py`, as flat arrays ordered cell by cell (face by face). Combined with
+`fields.py`, exact fields are evaluated at all quadrature points at once and
+integrated per cell with `np.bincount`, which gives the cell averages of the
+source terms and exact solutions used by finite volume solvers.
+Quadrilaterals use tensor Gauss-Legendre rules with the bilinear map,
+triangles use collapsed (Duffy) Gauss-Legendre rules. A rule of order p
+integrates polynomials of degree p exactly on affine cells.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+import meshes, fields, quadrature
+mesh = meshes.load_mesh("../meshes/quadmesh_1.msh")
+case = fields.load_case("../codes")
+fA = quadrature.cell_averages(mesh, case["functions"]["fA"], order=4)
+
+===============================================================================
+"""
+
+# import modules
+import numpy as np
+from topology import load_topology
+
+#============================================
+# REFERENCE RULES
+#============================================
+
+# Gauss-Legendre rule on [0, 1]
+def gauss_legendre(order):
+    """
+    Return the points and weights of the Gauss-Legendre rule on [0, 1] exact
+    for polynomials of degree `order`.
+    """
+    xi, w = np.polynomial.legendre.leggauss(order//2 + 1)
+    return 0.5*(xi + 1.0), 0.5*w
+
+# quadrilateral rule on [0, 1]^2
+def quad_rule(order):
+    """
+    Return the points (nq, 2) and weights (nq,) of the tensor Gauss-Legendre
+    rule on the reference square [0, 1]^2.
+    """
+    xi, w = gauss_legendre(order)
+    u, v = np.meshgrid(xi, xi, indexing="ij")
+    return np.column_stack((u.ravel(), v.ravel())), np.outer(w, w).ravel()
+
+# triangle rule on the reference triangle
+def triangle_rule(order):
+    """
+    Return the points (nq, 2) and weights (nq,) of the collapsed Gauss-Legendre
+    rule on the reference triangle (0, 0), (1, 0), (0, 1) (weights sum to 1/2).
+    """
+    xi, w = gauss_legendre(order + 1)
+    u, v = np.meshgrid(xi, xi, indexing="ij")
+    points = np.column_stack(((u*(1.0 - v)).ravel(), v.ravel()))
+    weights = (np.outer(w, w)*(1.0 - v)).ravel()
+    return points, weights
+
+# shape functions and derivatives
+def shape_functions(points, k):
+    """
+    Return the linear (k = 3) or bilinear (k = 4) shape functions (nq, k) and
+    their derivatives (nq, k, 2) at reference points.
+    """
+    u, v = points[:, 0], points[:, 1]
+    if k == 3:
+        N = np.column_stack((1.0 - u - v, u, v))
+        dN = np.broadcast_to(np.array([[-1.0, -1.0], [1.0, 0.0], [0.0, 1.0]]), (len(u), 3, 2))
+    elif k == 4:
+        N = np.column_stack(((1.0 - u)*(1.0 - v), u*(1.0 - v), u*v, (1.0 - u)*v))
+        dN = np.stack((np.column_stack((v - 1.0, 1.0 - v, v, -v)),
+                       np.column_stack((u - 1.0, -u, u, 1.0 - u))), axis=-1)
+    else:
+        raise ValueError(f"Unsupported cell with {k} nodes.")
+    return N, dN
+
+#============================================
+# MESH QUADRATURE
+#============================================
+
+# quadrature on cells
+def cell_quadrature(mesh, order=2):
+    """
+    Return the Gauss points of all cells as a dictionary:
+      points  (nc*nq, 2) float64  physical coordinates
+      weights (nc*nq,)   float64  weights times the Jacobian determinant
+      cells   (nc*nq,)   int32    cell of each point
+      nq      int                 points per cell
+    """
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    nc, k = cells.shape
+    ref, w = triangle_rule(order) if k == 3 else quad_rule(order)
+    N, dN = shape_functions(ref, k)
+    X = nodes[cells]
+    points = np.einsum("qk,ckd->cqd", N, X, optimize=True)
+    J = np.einsum("qke,ckd->cqde", dN, X, optimize=True)
+    det = np.abs(J[..., 0, 0]*J[..., 1, 1] - J[..., 0, 1]*J[..., 1, 0])
+    return {
+        "points": points.reshape(-1, 2),
+        "weights": (det*w).ravel(),
+        "cells": np.repeat(np.arange(nc, dtype=np.int32), len(w)),
+        "nq": len(w),
+    }
+
+# quadrature on faces
+def face_quadrature(mesh, order=2, faces=None):
+    """
+    Return the Gauss points of the (straight) faces of the mesh topology, or of
+    the selected `faces`, as a dictionary:
+      points  (nf*nq, 2) float64  physical coordinates
+      weights (nf*nq,)   float64  weights times the face length
+      faces   (nf*nq,)   int32    face of each point
+      nq      int                 points per face
+    """
+    topo = load_topology(mesh)
+    nodes = np.asarray(mesh["nodes"])
+    if faces is None:
+        faces = np.arange(len(topo["faces"]))
+    faces = np.asarray(faces)
+    xi, w = gauss_legendre(order)
+    X = nodes[np.asarray(topo["faces"])[faces]]
+    delta = X[:, 1] - X[:, 0]
+    points = X[:, None, 0] + xi[None, :, None]*delta[:, None, :]
+    lengths = np.hypot(delta[:, 0], delta[:, 1])
+    return {
+        "points": points.reshape(-1, 2),
+        "weights": (lengths[:, None]*w[None, :]).ravel(),
+        "faces": np.repeat(faces.astype(np.int32), len(w)),
+        "nq": len(w),
+    }
+
+# interpolation of nodal values
+def interpolate(mesh, values, order=2, gradient=False):
+    """
+    Return the linear (bilinear) interpolation of nodal values at the Gauss
+    points of all cells, ordered as in `cell_quadrature`, and optionally its
+    gradient (with an extra trailing axis of length 2).
+    """
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    k = cells.shape[1]
+    ref, _ = triangle_rule(order) if k == 3 else quad_rule(order)
+    N, dN = shape_functions(ref, k)
+    U = np.asarray(values)[cells]
+    res = np.einsum("qk,ck...->cq...", N, U, optimize=True)
+    res = res.reshape((-1,) + res.shape[2:])
+    if not gradient:
+        return res
+    J = np.einsum("qke,ckd->cqde", dN, nodes[cells], optimize=True)
+    det = J[..., 0, 0]*J[..., 1, 1] - J[..., 0, 1]*J[..., 1, 0]
+    Jinv = np.stack((np.stack((J[..., 1, 1], -J[..., 0, 1]), axis=-1),
+                     np.stack((-J[..., 1, 0], J[..., 0, 0]), axis=-1)), axis=-2)/det[..., None, None]
+    # gradient in reference coordinates, mapped with the inverse Jacobian
+    grad = np.einsum("qke,ck...->cq...e", dN, U, optimize=True)
+    grad = np.einsum("cq...e,cqed->cq...d", grad, Jinv, optimize=True)
+    return res, grad.reshape((-1,) + grad.shape[2:])
+
+#============================================
+# INTEGRATION
+#============================================
+
+# sum weighted values per entity
+def integrate(values, weights, index, n):
+    """
+    Return the integrals over n entities (cells or faces) of values sampled at
+    quadrature points with the given weights and entity index.
+    """
+    values = np.asarray(values)
+    if values.ndim == 1:
+        return np.bincount(index, weights=values*weights, minlength=n)
+    return np.column_stack([np.bincount(index, weights=values[:, i]*weights, minlength=n)
+                            for i in range(values.shape[1])])
+
+# cell averages of a function
+def cell_averages(mesh, func, order=2, quad=None):
+    """
+    Return the averages over all cells of a vectorised function func(x, y)
+    (e.g. from `fields.load_case`), computed with a rule of the given order.
+    """
+    if quad is None:
+        quad = cell_quadrature(mesh, order)
+    nc = len(mesh["cells"])
+    points = quad["points"]
+    values = func(points[:, 0], points[:, 1])
+    areas = np.bincount(quad["cells"], weights=quad["weights"], minlength=nc)
+    means = integrate(values, quad["weights"], quad["cells"], nc)
+    return means/(areas if means.ndim == 1 else areas[:, None])
+
+# face averages of a function
+def face_averages(mesh, func, order=2, faces=None, quad=None):
+    """
+    Return the averages over the (selected) faces of a vectorised function
+    func(x, y), computed with a rule of the given order.
+    """
+    if quad is None:
+        quad = face_quadrature(mesh, order, faces)
+    nf = len(quad["weights"])//quad["nq"]
+    local = np.repeat(np.arange(nf), quad["nq"])
+    points = quad["points"]
+    values = func(points[:, 0], points[:, 1])
+    lengths = np.bincount(local, weights=quad["weights"], minlength=nf)
+    means = integrate(values, quad["weights"], local, nf)
+    return means/(lengths if means.ndim == 1 else lengths[:, None])
+
+# end of file
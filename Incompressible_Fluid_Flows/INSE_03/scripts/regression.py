@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | REGRESSION
+===============================================================================
+
+DESCRIPTION:
+------------
+Performance regression gate for the generated code of a case (`codes/`),
+meant to run before committing regenerated code. It measures the operation
+counts of every generated function (additions, multiplications, divisions,
+powers and calls to mathematical functions per evaluation, counted on the
+generated Python code, together with a weighted cost) and the evaluation
+time per point of each backend (see `benchmarks.py`), and compares them with
+a stored baseline (JSON file). The comparison is printed as a table, and the
+exit status is 1 when the operation cost or the time per point of any
+function grows beyond the given relative tolerances, or when a function,
+mesh or backend of the baseline is missing from the current measurements
+(e.g. code that no longer builds). Timings are only compared on the meshes
+present in the baseline, and depend on the machine, so baselines should be
+recorded on the machine running the gate (`--update`, which refuses
+baselines with skipped functions, failed backends or empty timings unless
+`--allow-incomplete` is given); the operation counts are machine
+independent (`--ops-only`).
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+– g++ and gfortran (optional, see `benchmarks.py`)
+
+USAGE:
+------
+python regression.py ../meshes/triamesh_4.msh --baseline baseline.json --update
+python regression.py ../meshes/triamesh_4.msh --baseline baseline.json
+python regression.py --baseline baseline.json --ops-only
+
+===============================================================================
+"""
+
+# import modules
+import os
+import ast
+import sys
+import json
+import argparse
+import tempfile
+from fields import code_path, DEFAULT_ARGUMENTS
+from benchmarks import run_benchmarks
+
+#============================================
+# PARAMETERS
+#============================================
+
+# backends timed by the gate (when available)
+GATE_BACKENDS = ["numpy", "cpp", "fortran"]
+
+# timed repetitions (best of, to filter out timing noise)
+GATE_REPEATS = 20
+
+# relative growth of the operation cost failing the gate
+OPS_TOLERANCE = 0.10
+
+# relative growth of the time per point failing the gate
+TIME_TOLERANCE = 0.25
+
+# operation names of the Python operators
+OPERATORS = {ast.Add: "add", ast.Sub: "add", ast.Mult: "mul", ast.Div: "div", ast.Pow: "pow", ast.USub: "neg"}
+
+# relative cost of operations (calls not listed cost CALL_COST)
+OP_COSTS = {"add": 1, "neg": 1, "mul": 1, "div": 4, "pow": 8, "sqrt": 4, "fabs": 1, "floor": 1}
+
+# relative cost of calls to mathematical functions not in OP_COSTS
+CALL_COST = 20
+
+# comparison statuses failing the gate
+FAIL_STATUSES = ["REGRESSION", "MISSING"]
+
+#============================================
+# OPERATION COUNTS
+#============================================
+
+# operations of an expression tree
+def count_operations(node, counts):
+    """
+    Count the arithmetic operations and calls of mathematical functions in a
+    syntax tree (list constructions such as `[0.0]*2` are not counted).
+    """
+    if isinstance(node, ast.BinOp) and not isinstance(node.left, ast.List):
+        name = OPERATORS.get(type(node.op))
+        if name:
+            counts[name] = counts.get(name, 0) + 1
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in OPERATORS:
+        counts["neg"] = counts.get("neg", 0) + 1
+    elif isinstance(node, ast.Call):
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "call")
+        counts[name] = counts.get(name, 0) + 1
+    for child in ast.iter_child_nodes(node):
+        count_operations(child, counts)
+    return counts
+
+# operation counts of generated functions
+def operation_counts(codes_dir="../codes"):
+    """
+    Return the operation counts of the functions of the generated Python code
+    as {name: {"ops": {operation: count}, "total": count, "cost": cost}}.
+    """
+    with open(code_path(codes_dir), encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+    res = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            ops = {}
+            for stmt in node.body:
+                count_operations(stmt, ops)
+            res[node.name] = {"ops": dict(sorted(ops.items())), "total": sum(ops.values()),
+                              "cost": sum(count*OP_COSTS.get(op, CALL_COST) for op, count in ops.items())}
+    return res
+
+#============================================
+# MEASUREMENTS
+#============================================
+
+# measure current code
+def measure(paths, codes_dir="../codes", backends=None, repeats=GATE_REPEATS, params=None):
+    """
+    Return the operation counts of the generated functions and, when meshes
+    are given, their times per point by mesh and backend (see
+    `benchmarks.run_benchmarks`, with its parameters and their defaults) and
+    the errors of the backends failing on each mesh.
+    """
+    res = {"operations": operation_counts(codes_dir), "timings": {}, "errors": {}}
+    if paths:
+        record = run_benchmarks(paths, codes_dir, backends or GATE_BACKENDS, repeats, params)
+        keys = ["case", "time", "host", "params", "code_hashes", "versions", "skipped"]
+        res.update({key: record[key] for key in keys})
+        for mesh, results in record["meshes"].items():
+            res["timings"][mesh] = {backend: {func: entry["ns_per_point"] for func, entry in funcs.items()}
+                                    for backend, funcs in results["backends"].items() if "error" not in funcs}
+            errors = {backend: funcs["error"] for backend, funcs in results["backends"].items() if "error" in funcs}
+            if errors:
+                res["errors"][mesh] = errors
+    return res
+
+# incomplete measurements
+def incomplete(current):
+    """
+    Return the reasons why measurements are incomplete as a baseline: skipped
+    functions, backends failing to build or run, and meshes or backends
+    without timings (backends whose tools or code are not available are
+    not counted).
+    """
+    reasons = [f"skipped {key}: {reason}" for key, reason in current.get("skipped", {}).items()
+               if key.startswith("function ") or reason.startswith("build failed")]
+    for mesh, errors in current.get("errors", {}).items():
+        reasons.extend(f"{backend} failed on {mesh}: {error}" for backend, error in errors.items())
+    for mesh, backends in current["timings"].items():
+        if not backends:
+            reasons.append(f"no timings on {mesh}")
+        reasons.extend(f"no {backend} timings on {mesh}" for backend, funcs in backends.items() if not funcs)
+    return reasons
+
+# compare with baseline
+def compare(baseline, current, ops_tolerance=OPS_TOLERANCE, time_tolerance=TIME_TOLERANCE, timings=True):
+    """
+    Return the rows (function, metric, baseline, current, relative change,
+    status) comparing the operation costs and (optionally) the times per
+    point of the current code with the baseline; status is "REGRESSION" when
+    the growth exceeds the tolerance, "MISSING" when a function, backend or
+    mesh of the baseline is missing from the current measurements,
+    "improved", "ok" or "new".
+    """
+    rows = []
+    def row(func, metric, old, new, tolerance):
+        if old is None or new is None:
+            rows.append((func, metric, old, new, None, "new" if old is None else "MISSING"))
+            return
+        change = (new - old)/old if old else 0.0
+        status = "REGRESSION" if change > tolerance else "improved" if change < -tolerance else "ok"
+        rows.append((func, metric, old, new, change, status))
+    old_ops, new_ops = baseline.get("operations", {}), current["operations"]
+    for func in list(old_ops) + [func for func in new_ops if func not in old_ops]:
+        row(func, "ops cost", old_ops.get(func, {}).get("cost"), new_ops.get(func, {}).get("cost"), ops_tolerance)
+    if not timings:
+        return rows
+    for mesh, old_backends in baseline.get("timings", {}).items():
+        backends = current["timings"].get(mesh, {})
+        for backend, old_funcs in old_backends.items():
+            funcs = backends.get(backend, {})
+            for func in list(old_funcs) + [func for func in funcs if func not in old_funcs]:
+                row(func, f"{backend} ns/point ({mesh})", old_funcs.get(func), funcs.get(func), time_tolerance)
+    return rows
+
+# print comparison
+def print_comparison(rows, only_changes=False):
+    """
+    Print the comparison rows as a table (only the changed ones, optionally).
+    """
+    print(f"{'function':>12s} {'metric':<34s} {'baseline':>12s} {'current':>12s} {'change':>9s}  status")
+    for func, metric, old, new, change, status in rows:
+        if only_changes and status == "ok":
+            continue
+        fmt = lambda value: f"{value:12.4g}" if value is not None else f"{'-':>12s}"
+        diff = f"{100.0*change:+8.1f}%" if change is not None else f"{'-':>9s}"
+        print(f"{func:>12s} {metric:<34s} {fmt(old)} {fmt(new)} {diff}  {status}")
+
+#============================================
+# BASELINE
+#============================================
+
+# read baseline
+def read_baseline(path):
+    """
+    Return the baseline stored in a JSON file.
+    """
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+# write baseline
+def write_baseline(path, baseline):
+    """
+    Write a baseline to a JSON file (renamed into place).
+    """
+    fd, tmpfile = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp_", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(baseline, fh, indent=2)
+    os.replace(tmpfile, path)
+
+#============================================
+# MAIN
+#============================================
+
+# run the gate from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the cost of the generated code with a baseline.")
+    parser.add_argument("files", nargs="*", help="mesh files in MSH format (timings at the nodes)")
+    parser.add_argument("--baseline", required=True, help="baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="write the current measurements as the baseline")
+    parser.add_argument("--allow-incomplete", action="store_true",
+                        help="write baselines with skipped functions, failed backends or empty timings")
+    parser.add_argument("--ops-only", action="store_true", help="only compare the operation counts")
+    parser.add_argument("--ops-tolerance", type=float, default=OPS_TOLERANCE, help="relative growth of operation costs")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE, help="relative growth of times")
+    parser.add_argument("--backends", nargs="*", help="timed backends (default: " + " ".join(GATE_BACKENDS) + ")")
+    parser.add_argument("--repeats", type=int, default=GATE_REPEATS, help="timed repetitions")
+    parser.add_argument("--time", type=float, help="time of unsteady cases (argument `t` of the functions, "
+                        f"default {DEFAULT_ARGUMENTS['t']})")
+    parser.add_argument("--all", action="store_true", help="print unchanged rows too")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    args = parser.parse_args(argv)
+    params = {"t": args.time} if args.time is not None else None
+    try:
+        current = measure([] if args.ops_only else args.files, args.codes, args.backends, args.repeats, params)
+    except ValueError as e:
+        parser.error(str(e))
+    for key, reason in current.get("skipped", {}).items():
+        print(f"Skipped {key}: {reason}")
+    for mesh, errors in current["errors"].items():
+        for backend, error in errors.items():
+            print(f"Failed {backend} on {mesh}: {error}")
+    if args.update:
+        reasons = incomplete(current)
+        if not args.ops_only and not current["timings"]:
+            reasons.append("no timings (give mesh files or --ops-only)")
+        if reasons and not args.allow_incomplete:
+            print("Baseline not written, measurements incomplete (use --allow-incomplete to write it):")
+            for reason in reasons:
+                print("  " + reason.splitlines()[0])
+            return 1
+        write_baseline(args.baseline, current)
+        print("Wrote", args.baseline)
+        return 0
+    if not os.path.isfile(args.baseline):
+        parser.error(f"baseline {args.baseline} not found (record one with --update)")
+    baseline = read_baseline(args.baseline)
+    if current["timings"] and baseline.get("host") != current.get("host"):
+        print(f"Note: baseline recorded on {baseline.get('host')}, timings measured on {current.get('host')}")
+    rows = compare(baseline, current, args.ops_tolerance, args.time_tolerance, timings=not args.ops_only)
+    print_comparison(rows, only_changes=not args.all)
+    failed = [row for row in rows if row[5] in FAIL_STATUSES]
+    print(f"\n{len(failed)} regressions or missing in {len(rows)} comparisons "
+          f"(tolerances: ops {100.0*args.ops_tolerance:.0f}%, time {100.0*args.time_tolerance:.0f}%)")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file
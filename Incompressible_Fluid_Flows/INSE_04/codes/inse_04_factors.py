@@ -0,0 +1,146 @@
+# Auto-generated by generate_code.py
+
+import math
+
+# Global constants
+rO = 1.0
+rI = 0.5
+betaO_1 = 0.1
+betaO_2 = 8.0
+betaI_1 = 0.1
+betaI_2 = 8.0
+nu = 1.0
+rho = 1.0
+u0 = 1.0
+n = 4.0
+pi = 3.141592653589793
+
+# Coordinates of the factored kernels
+COORDINATES = {
+    "RO": ("r", "theta"),
+    "RI": ("r", "theta"),
+    "nO": ("r", "theta"),
+    "nI": ("r", "theta"),
+    "p": ("r", "theta"),
+    "u": ("r", "theta"),
+}
+
+# Coordinates the functions depend on
+DEPENDENCIES = {
+    "RO": ("theta",),
+    "RI": ("theta",),
+    "nO": ("theta",),
+    "nI": ("theta",),
+    "p": ("r", "theta"),
+    "u": ("r", "theta"),
+    "f": ("r", "theta"),
+    "g": ("r", "theta"),
+}
+
+# Function RO (factors of r, theta)
+def RO(r, theta):
+    theta_f0 = betaO_1*math.cos(betaO_2*theta) + 1
+    res = rO*theta_f0
+    return res
+
+# Function RI (factors of r, theta)
+def RI(r, theta):
+    theta_f0 = betaI_1*math.cos(betaI_2*theta) + 1
+    res = rI*theta_f0
+    return res
+
+# Function nO (factors of r, theta)
+def nO(r, theta):
+    theta_f0 = (betaO_1*betaO_2*math.sin(theta)*math.sin(betaO_2*theta) - betaO_1*math.cos(theta) \
+        *math.cos(betaO_2*theta) - math.cos(theta))/math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2 \
+        *theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)
+    theta_f1 = (betaO_1*betaO_2*math.sin(betaO_2*theta)*math.cos(theta) + betaO_1*math.sin(theta) \
+        *math.cos(betaO_2*theta) + math.sin(theta))/math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2 \
+        *theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)
+    res = [0.0]*2
+    res[0] = -theta_f0
+    res[1] = theta_f1
+    return res
+
+# Function nI (factors of r, theta)
+def nI(r, theta):
+    theta_f0 = (betaI_1*betaI_2*math.sin(theta)*math.sin(betaI_2*theta) - betaI_1*math.cos(theta) \
+        *math.cos(betaI_2*theta) - math.cos(theta))/math.sqrt(betaI_1**2*betaI_2**2*math.sin(betaI_2 \
+        *theta)**2 + betaI_1**2*math.cos(betaI_2*theta)**2 + 2*betaI_1*math.cos(betaI_2*theta) + 1)
+    theta_f1 = (betaI_1*betaI_2*math.sin(betaI_2*theta)*math.cos(theta) + betaI_1*math.sin(theta) \
+        *math.cos(betaI_2*theta) + math.sin(theta))/math.sqrt(betaI_1**2*betaI_2**2*math.sin(betaI_2 \
+        *theta)**2 + betaI_1**2*math.cos(betaI_2*theta)**2 + 2*betaI_1*math.cos(betaI_2*theta) + 1)
+    res = [0.0]*2
+    res[0] = theta_f0
+    res[1] = -theta_f1
+    return res
+
+# Function p (factors of r, theta)
+def p(r, theta):
+    theta_f0 = rho*math.cos(n*theta)
+    theta_f1 = betaI_1*rI*rho*math.cos(betaI_2*theta)*math.cos(n*theta)/(betaI_1*rI*math.cos(betaI_2 \
+        *theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO) + rI*rho*math.cos(n*theta)/(betaI_1*rI \
+        *math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO)
+    res = r*theta_f0 + theta_f1
+    return res
+
+# Function u (factors of r, theta)
+def u(r, theta):
+    theta_f0 = -betaI_1*betaO_1*betaO_2*rI*u0*math.sin(betaO_2*theta)*math.cos(theta)*math.cos(betaI_2 \
+        *theta)/((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO) \
+        *math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) - betaI_1*betaO_1*rI*u0*math.sin(theta) \
+        *math.cos(betaI_2*theta)*math.cos(betaO_2*theta)/((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1 \
+        *rO*math.cos(betaO_2*theta) + rI - rO)*math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2 \
+        *theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) \
+        - betaI_1*rI*u0*math.sin(theta)*math.cos(betaI_2*theta)/((betaI_1*rI*math.cos(betaI_2*theta) \
+        - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO)*math.sqrt(betaO_1**2*betaO_2**2 \
+        *math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1 \
+        *math.cos(betaO_2*theta) + 1)) - betaO_1*betaO_2*rI*u0*math.sin(betaO_2*theta)*math.cos(theta) \
+        /((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO) \
+        *math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) - betaO_1*rI*u0*math.sin(theta) \
+        *math.cos(betaO_2*theta)/((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2 \
+        *theta) + rI - rO)*math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2 \
+        *math.cos(betaO_2*theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) - rI*u0*math.sin(theta) \
+        /((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO) \
+        *math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1))
+    theta_f1 = -betaO_1*betaO_2*u0*math.sin(betaO_2*theta)*math.cos(theta)/math.sqrt(betaO_1**2 \
+        *betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1 \
+        *math.cos(betaO_2*theta) + 1) - betaO_1*u0*math.sin(theta)*math.cos(betaO_2*theta) \
+        /math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1) - u0*math.sin(theta)/math.sqrt(betaO_1**2 \
+        *betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1 \
+        *math.cos(betaO_2*theta) + 1)
+    theta_f2 = -betaO_1*betaO_2*u0*math.sin(theta)*math.sin(betaO_2*theta)/math.sqrt(betaO_1**2 \
+        *betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1 \
+        *math.cos(betaO_2*theta) + 1) + betaO_1*u0*math.cos(theta)*math.cos(betaO_2*theta) \
+        /math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1) + u0*math.cos(theta)/math.sqrt(betaO_1**2 \
+        *betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1 \
+        *math.cos(betaO_2*theta) + 1)
+    theta_f3 = -betaI_1*betaO_1*betaO_2*rI*u0*math.sin(theta)*math.sin(betaO_2*theta)*math.cos(betaI_2 \
+        *theta)/((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO) \
+        *math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) + betaI_1*betaO_1*rI*u0*math.cos(theta) \
+        *math.cos(betaI_2*theta)*math.cos(betaO_2*theta)/((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1 \
+        *rO*math.cos(betaO_2*theta) + rI - rO)*math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2 \
+        *theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) \
+        + betaI_1*rI*u0*math.cos(theta)*math.cos(betaI_2*theta)/((betaI_1*rI*math.cos(betaI_2*theta) \
+        - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO)*math.sqrt(betaO_1**2*betaO_2**2 \
+        *math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2*theta)**2 + 2*betaO_1 \
+        *math.cos(betaO_2*theta) + 1)) - betaO_1*betaO_2*rI*u0*math.sin(theta)*math.sin(betaO_2*theta) \
+        /((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO) \
+        *math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) + betaO_1*rI*u0*math.cos(theta) \
+        *math.cos(betaO_2*theta)/((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2 \
+        *theta) + rI - rO)*math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2 \
+        *math.cos(betaO_2*theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1)) + rI*u0*math.cos(theta) \
+        /((betaI_1*rI*math.cos(betaI_2*theta) - betaO_1*rO*math.cos(betaO_2*theta) + rI - rO) \
+        *math.sqrt(betaO_1**2*betaO_2**2*math.sin(betaO_2*theta)**2 + betaO_1**2*math.cos(betaO_2 \
+        *theta)**2 + 2*betaO_1*math.cos(betaO_2*theta) + 1))
+    res = [0.0]*2
+    res[0] = theta_f0 + r*theta_f1
+    res[1] = r*theta_f2 + theta_f3
+    return res
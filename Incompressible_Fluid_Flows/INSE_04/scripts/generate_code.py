@@ -213,6 +213,9 @@ funcs_list = [("RO", RO, args_list, params_list), ("RI", RI, args_list, params_l
                 ("p", p, args_list, params_list),("u", u, args_list, params_list), \
                 ("f", f, args_list, params_list), ("g", g, args_list, params_list)]
 
+# test domain (random test points)
+domain = ("annulus", rI*(1 + betaI_1), rO*(1 - betaO_1))
+
 # generate code
 outdir = "../codes"
 name = "inse_04"
@@ -221,10 +224,11 @@ write_cpp_file(outdir, name, consts_list, funcs_list)
 write_fortran_file(outdir, name, consts_list, funcs_list)
 write_octave_file(outdir, name, consts_list, funcs_list)
 write_python_file(outdir, name, consts_list, funcs_list)
-write_cpp_test(outdir, name)
-write_fortran_test(outdir, name)
-write_octave_test(outdir, name)
-write_python_test(outdir, name)
+write_factors_file(outdir, name, consts_list, funcs_list)
+write_cpp_test(outdir, name, funcs_list, domain)
+write_fortran_test(outdir, name, funcs_list, domain)
+write_octave_test(outdir, name, funcs_list, domain)
+write_python_test(outdir, name, funcs_list, domain)
 print("\nGeneration complete.")
 
 # end of file
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+CFDTestSuite | GEOMETRY
+===============================================================================
+
+DESCRIPTION:
+------------
+Utility functions for computing the geometrical quantities of meshes loaded
+with `meshes.py`: cell areas, centroids and diameters, face lengths,
+midpoints and unit normals, and the characteristic mesh size h used in
+convergence analysis. All quantities are computed with vectorised NumPy
+operations and stored in the mesh cache.
+Includes the exact parametrisations r = R*(1 + beta_1*cos(beta_2*theta)) of
+the circular and rose-shaped boundaries and interfaces of each case, to
+compute Gauss points, normals, and area corrections on the exact curves.
+Arbitrary points are classified into subdomains by comparing r with the
+exact curve radii R(theta), or located in the mesh cells with a uniform
+bucket grid (stored in the mesh cache) and vectorised point-in-cell tests.
+
+AUTHOR:
+-------
+Ricardo Costa (rcosta@dep.uminho.pt)
+
+LICENSE:
+--------
+MIT License (see LICENSE file for details)
+
+REPOSITORY:
+-----------
+https://github.com/ricardodpcosta/CFDTestSuite
+
+DEPENDENCIES:
+-------------
+– Python (version >= 3.9)
+– NumPy (version >= 1.20)
+
+USAGE:
+------
+import meshes, geometry
+mesh = meshes.load_mesh("../meshes/quadmesh_1.msh")
+geom = geometry.load_geometry(mesh)
+h = geometry.mesh_size(geom)
+cells = geometry.locate_points(mesh, x, y)
+python geometry.py ../meshes/*.msh
+
+===============================================================================
+"""
+
+# import modules
+import os
+import sys
+import ast
+import glob
+import argparse
+import numpy as np
+from meshes import cached_stage, load_mesh
+from topology import load_topology, csr_invert
+
+#============================================
+# PARAMETERS
+#============================================
+
+# geometry arrays
+GEOMETRY_KEYS = ["cell_areas", "cell_centroids", "cell_diameters",
+                 "face_lengths", "face_midpoints", "face_normals"]
+
+# point locator arrays
+LOCATOR_KEYS = ["locator_box", "locator_shape", "locator_ptr", "locator_cells"]
+
+# mean number of cells per bucket of the point locator
+LOCATOR_DENSITY = 0.25
+
+# number of points located at once
+LOCATOR_CHUNK = 2**18
+
+# curved boundaries and interfaces of each case (physical line tag -> curve)
+# curve: (radius, beta_1, beta_2, sign) as names of the generated constants,
+# where sign orients the normal as the generated functions nAB, nO, nI
+# (+1 away from the centre, -1 towards the centre)
+CURVES = {
+    "cht_01": {1: ("rA", None, None, 1.0), 2: ("rAB", None, None, -1.0), 3: ("rB", None, None, -1.0)},
+    "cht_02": {1: ("rA", None, None, 1.0), 2: ("rAB", "betaAB_1", "betaAB_2", -1.0), 3: ("rB", None, None, -1.0)},
+    "cht_03": {1: ("rA", None, None, 1.0), 2: ("rAB", None, None, -1.0), 3: ("rB", None, None, -1.0)},
+    "cht_04": {1: ("rA", None, None, 1.0), 2: ("rAB", "betaAB_1", "betaAB_2", -1.0), 3: ("rB", None, None, -1.0)},
+    "inse_01": {},
+    "inse_02": {1: ("rO", None, None, 1.0), 2: ("rI", None, None, -1.0)},
+    "inse_03": {1: ("rO", None, None, 1.0), 2: ("rI", None, None, -1.0)},
+    "inse_04": {1: ("rO", "betaO_1", "betaO_2", 1.0), 2: ("rI", "betaI_1", "betaI_2", -1.0)},
+}
+
+#============================================
+# CELL GEOMETRY
+#============================================
+
+# signed cell areas
+def signed_areas(nodes, cells):
+    """
+    Return the signed areas of polygonal cells (positive if counterclockwise).
+    """
+    x = nodes[cells, 0]
+    y = nodes[cells, 1]
+    return 0.5*np.sum(x*np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1)*y, axis=1)
+
+# cell centroids
+def cell_centroids(nodes, cells, areas=None):
+    """
+    Return the centroids of polygonal cells (shoelace formula).
+    """
+    x = nodes[cells, 0]
+    y = nodes[cells, 1]
+    xn = np.roll(x, -1, axis=1)
+    yn = np.roll(y, -1, axis=1)
+    cross = x*yn - xn*y
+    if areas is None:
+        areas = 0.5*np.sum(cross, axis=1)
+    cx = np.sum((x + xn)*cross, axis=1)/(6.0*areas)
+    cy = np.sum((y + yn)*cross, axis=1)/(6.0*areas)
+    return np.column_stack((cx, cy))
+
+# cell diameters
+def cell_diameters(nodes, cells):
+    """
+    Return the diameters of cells (largest distance between two vertices).
+    """
+    k = cells.shape[1]
+    xy = nodes[cells]
+    diam = np.zeros(len(cells))
+    for shift in range(1, k//2 + 1):
+        dist = np.hypot(*(xy - np.roll(xy, -shift, axis=1)).transpose(2, 0, 1))
+        diam = np.maximum(diam, dist.max(axis=1))
+    return diam
+
+#============================================
+# BUILD GEOMETRY
+#============================================
+
+# build mesh geometry
+def build_geometry(mesh):
+    """
+    Build the geometrical quantities of a mesh:
+      cell_areas       (nc,)   float64   cell areas
+      cell_centroids   (nc, 2) float64   cell centroids
+      cell_diameters   (nc,)   float64   cell diameters
+      face_lengths     (nf,)   float64   face lengths
+      face_midpoints   (nf, 2) float64   face midpoints
+      face_normals     (nf, 2) float64   unit normals pointing out of the owner cell
+    """
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    topo = load_topology(mesh)
+    faces = np.asarray(topo["faces"])
+    owner = np.asarray(topo["face_cells"])[:, 0]
+    # cells
+    signed = signed_areas(nodes, cells)
+    centroids = cell_centroids(nodes, cells, signed)
+    diameters = cell_diameters(nodes, cells)
+    # faces (oriented as in the owner cell)
+    a = nodes[faces[:, 0]]
+    b = nodes[faces[:, 1]]
+    d = b - a
+    lengths = np.hypot(d[:, 0], d[:, 1])
+    normals = np.column_stack((d[:, 1], -d[:, 0]))/lengths[:, None]
+    normals *= np.sign(signed[owner])[:, None]
+    return {
+        "cell_areas": np.abs(signed),
+        "cell_centroids": centroids,
+        "cell_diameters": diameters,
+        "face_lengths": lengths,
+        "face_midpoints": 0.5*(a + b),
+        "face_normals": normals,
+    }
+
+# load mesh geometry
+def load_geometry(mesh):
+    """
+    Return the geometry arrays of a mesh, reading them from the mesh cache
+    when available and building (and caching) them otherwise.
+    """
+    return cached_stage(mesh, GEOMETRY_KEYS, build_geometry)
+
+#============================================
+# MESH SIZE
+#============================================
+
+# characteristic mesh size
+def mesh_size(geom, kind="max"):
+    """
+    Return the characteristic size h of a mesh:
+      "max"    largest cell diameter
+      "mean"   mean cell diameter
+      "area"   square root of the mean cell area
+    """
+    if kind == "max":
+        return float(np.max(geom["cell_diameters"]))
+    if kind == "mean":
+        return float(np.mean(geom["cell_diameters"]))
+    if kind == "area":
+        return float(np.sqrt(np.mean(geom["cell_areas"])))
+    raise ValueError(f"Unknown mesh size kind: {kind}")
+
+#============================================
+# CASE CONSTANTS
+#============================================
+
+# load case constants
+def load_constants(codes_dir="../codes"):
+    """
+    Return the case name and the global constants of the generated Python code
+    (`codes/<name>.py`), read from its constants block without importing it.
+    """
+    paths = [path for path in sorted(glob.glob(os.path.join(codes_dir, "*.py")))
+             if not os.path.basename(path).startswith("test") and not path.endswith("_factors.py")]
+    if len(paths) != 1:
+        raise FileNotFoundError(f"Expected one generated Python file in {codes_dir}")
+    name = os.path.splitext(os.path.basename(paths[0]))[0]
+    with open(paths[0], encoding="utf-8") as fh:
+        source = fh.read()
+    block = source.split("# Global constants", 1)[-1].split("\n\n", 1)[0]
+    consts = {}
+    for node in ast.parse(block).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                consts[node.targets[0].id] = float(ast.literal_eval(node.value))
+            except (ValueError, TypeError):
+                pass
+    return name, consts
+
+#============================================
+# CURVED BOUNDARIES
+#============================================
+
+# curve radius
+def curve_radius(curve, consts, theta):
+    """
+    Return R(theta) and dR/dtheta of a curve r = R*(1 + beta_1*cos(beta_2*theta)).
+    """
+    radius, beta_1, beta_2, _ = curve
+    R0 = consts[radius]
+    b1 = consts[beta_1] if beta_1 else 0.0
+    b2 = consts[beta_2] if beta_2 else 0.0
+    R = R0*(1.0 + b1*np.cos(b2*theta))
+    dR = -R0*b1*b2*np.sin(b2*theta)
+    return R, dR
+
+# curve points
+def curve_points(curve, consts, theta):
+    """
+    Return the points, unit normals (oriented as the generated normal
+    functions), and speed |dP/dtheta| of a curve at the angles theta.
+    """
+    R, dR = curve_radius(curve, consts, theta)
+    c = np.cos(theta)
+    s = np.sin(theta)
+    points = np.stack((R*c, R*s), axis=-1)
+    speed = np.sqrt(R**2 + dR**2)
+    normals = curve[3]*np.stack((R*c + dR*s, R*s - dR*c), axis=-1)/speed[..., None]
+    return points, normals, speed
+
+# quadrature on curved faces
+def curved_faces(mesh, consts, name, order=3, tags=None):
+    """
+    Return Gauss quadrature data on the exact curves for the faces tagged as
+    curved boundaries or interfaces of the case `name`:
+      faces      (m,)       int64     face indices
+      tags       (m,)       int32     physical tags of the faces
+      points     (m, q, 2)  float64   Gauss points on the exact curve
+      weights    (m, q)     float64   Gauss weights times arc length element
+      normals    (m, q, 2)  float64   exact unit normals (generated convention)
+      segments   (m,)       float64   signed area between chord and curve
+    The segment area is positive when the curve lies farther from the centre
+    than the chord. Faces are assumed to have their end nodes on the curve.
+    """
+    topo = load_topology(mesh)
+    nodes = np.asarray(mesh["nodes"])
+    curves = CURVES[name]
+    face_tags = np.asarray(topo["face_tags"])
+    tags = sorted(curves) if tags is None else tags
+    xi, wi = np.polynomial.legendre.leggauss(order)
+    data = {key: [] for key in ["faces", "tags", "points", "weights", "normals", "segments"]}
+    for tag in tags:
+        faces = np.flatnonzero(face_tags == tag)
+        ends = nodes[np.asarray(topo["faces"])[faces]]
+        theta_a = np.arctan2(ends[:, 0, 1], ends[:, 0, 0])
+        theta_b = np.arctan2(ends[:, 1, 1], ends[:, 1, 0])
+        dtheta = np.angle(np.exp(1j*(theta_b - theta_a)))
+        theta = theta_a[:, None] + 0.5*dtheta[:, None]*(xi[None, :] + 1.0)
+        points, normals, speed = curve_points(curves[tag], consts, theta)
+        R, _ = curve_radius(curves[tag], consts, theta)
+        half = 0.5*dtheta[:, None]*wi[None, :]
+        swept = 0.5*np.sum(half*R**2, axis=1)
+        chord = 0.5*(ends[:, 0, 0]*ends[:, 1, 1] - ends[:, 0, 1]*ends[:, 1, 0])
+        data["faces"].append(faces)
+        data["tags"].append(np.full(len(faces), tag, dtype=np.int32))
+        data["points"].append(points)
+        data["weights"].append(np.abs(half)*speed)
+        data["normals"].append(normals)
+        data["segments"].append(np.sign(dtheta)*(swept - chord))
+    if not data["faces"]:
+        return {"faces": np.zeros(0, dtype=np.int64), "tags": np.zeros(0, dtype=np.int32),
+                "points": np.zeros((0, order, 2)), "weights": np.zeros((0, order)),
+                "normals": np.zeros((0, order, 2)), "segments": np.zeros(0)}
+    return {key: np.concatenate(value) for key, value in data.items()}
+
+# exact cell areas
+def curved_cell_areas(mesh, consts, name, order=5):
+    """
+    Return the cell areas corrected for the exact curved boundaries and
+    interfaces: the area between each curved face and its chord is added to
+    the cell on the centre side of the curve and removed from the other cell.
+    """
+    topo = load_topology(mesh)
+    geom = load_geometry(mesh)
+    curved = curved_faces(mesh, consts, name, order=order)
+    faces = curved["faces"]
+    areas = np.array(geom["cell_areas"], dtype=np.float64)
+    midpoints = np.asarray(geom["face_midpoints"])[faces]
+    normals = np.asarray(geom["face_normals"])[faces]
+    # +1 if the owner cell lies on the centre side of the curve
+    side = np.sign(np.sum(normals*midpoints, axis=1))
+    face_cells = np.asarray(topo["face_cells"])[faces]
+    np.add.at(areas, face_cells[:, 0], side*curved["segments"])
+    inner = face_cells[:, 1] >= 0
+    np.add.at(areas, face_cells[inner, 1], -side[inner]*curved["segments"][inner])
+    return areas
+
+#============================================
+# POINT CLASSIFICATION
+#============================================
+
+# classify points into subdomains
+def classify_points(x, y, consts, name, tol=1e-12):
+    """
+    Return the subdomain tag of the points (x, y) from the exact curves of the
+    case: 100 between the curves with tags 1 and 2, 200 between the curves
+    with tags 2 and 3, and so on (curves ordered from the outside in), and 0
+    for points outside the domain. Points on the outer and inner boundaries
+    (within tol) are inside, and points on an interface belong to its outer
+    side.
+    """
+    curves = CURVES[name]
+    if not curves:
+        raise ValueError(f"No curved boundaries defined for case '{name}'; use locate_points.")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    r = np.hypot(x, y)
+    theta = np.arctan2(y, x)
+    radii = [curve_radius(curves[tag], consts, theta)[0] for tag in sorted(curves)]
+    # one region more for each interface with r < R(theta) (curves do not cross)
+    region = np.ones(r.shape, dtype=np.int32)
+    for R in radii[1:-1]:
+        region += (r < R)
+    tags = (100*region).astype(np.int32)
+    tags[(r > radii[0] + tol) | (r < radii[-1] - tol)] = 0
+    return tags
+
+# check point classification on a mesh
+def check_classification(mesh, consts, name, tol=1e-12):
+    """
+    Classify the nodes and cell centroids of a mesh of the case and return
+    the numbers of nodes (used by the cells) classified outside the domain
+    and of cells whose centroid is classified in another subdomain than the
+    cell tag (both 0 for a mesh of the case).
+    """
+    nodes = np.asarray(mesh["nodes"])[np.unique(np.asarray(mesh["cells"]))]
+    centroids = np.asarray(load_geometry(mesh)["cell_centroids"])
+    outside = int(np.count_nonzero(classify_points(nodes[:, 0], nodes[:, 1], consts, name, tol) == 0))
+    tags = classify_points(centroids[:, 0], centroids[:, 1], consts, name, tol)
+    return outside, int(np.count_nonzero(tags != np.asarray(mesh["cell_tags"])))
+
+#============================================
+# POINT LOCATION
+#============================================
+
+# build point locator
+def build_locator(mesh):
+    """
+    Build a uniform bucket grid over the mesh bounding box, listing in each
+    bucket the cells whose bounding boxes overlap it:
+      locator_box    (4,)    float64  xmin, ymin, bucket width, bucket height
+      locator_shape  (2,)    int64    buckets in x and y
+      locator_ptr    (nb+1,) int64    CSR pointer of bucket-to-cell table
+      locator_cells  (m,)    int32    candidate cells of each bucket
+    """
+    nodes = np.asarray(mesh["nodes"])
+    X = nodes[np.asarray(mesh["cells"])]
+    lo = X.min(axis=1)
+    hi = X.max(axis=1)
+    xmin, ymin = lo.min(axis=0)
+    xmax, ymax = hi.max(axis=0)
+    width, height = xmax - xmin, ymax - ymin
+    nb = max(len(X)/LOCATOR_DENSITY, 1.0)
+    nx = max(int(np.sqrt(nb*width/height)), 1)
+    ny = max(int(nb/nx), 1)
+    dx, dy = width/nx, height/ny
+    i0 = np.clip(((lo[:, 0] - xmin)/dx).astype(np.int64), 0, nx - 1)
+    i1 = np.clip(((hi[:, 0] - xmin)/dx).astype(np.int64), 0, nx - 1)
+    j0 = np.clip(((lo[:, 1] - ymin)/dy).astype(np.int64), 0, ny - 1)
+    j1 = np.clip(((hi[:, 1] - ymin)/dy).astype(np.int64), 0, ny - 1)
+    # one entry per (cell, bucket) pair of each bounding box
+    ni = i1 - i0 + 1
+    nj = j1 - j0 + 1
+    count = ni*nj
+    cell = np.repeat(np.arange(len(X)), count)
+    local = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    bi = i0[cell] + local % ni[cell]
+    bj = j0[cell] + local//ni[cell]
+    ptr, cells = csr_invert(bj*nx + bi, cell, nx*ny)
+    return {
+        "locator_box": np.array([xmin, ymin, dx, dy]),
+        "locator_shape": np.array([nx, ny], dtype=np.int64),
+        "locator_ptr": ptr,
+        "locator_cells": cells,
+    }
+
+# load point locator
+def load_locator(mesh):
+    """
+    Return the point locator of a mesh, reading it from the mesh cache when
+    available and building (and caching) it otherwise.
+    """
+    return cached_stage(mesh, LOCATOR_KEYS, build_locator)
+
+# locate points in cells
+def locate_points(mesh, x, y, tol=1e-12):
+    """
+    Return the index of a cell containing each point (x, y), or -1 for points
+    outside the mesh. Cells are assumed convex; points on shared faces are
+    assigned to the lowest-numbered cell.
+    """
+    loc = load_locator(mesh)
+    nodes = np.asarray(mesh["nodes"])
+    cells = np.asarray(mesh["cells"])
+    xmin, ymin, dx, dy = loc["locator_box"]
+    nx, ny = (int(n) for n in loc["locator_shape"])
+    ptr = np.asarray(loc["locator_ptr"])
+    candidates = np.asarray(loc["locator_cells"])
+    # edge lines a*x + b*y + c >= 0 inside each (counter-clockwise) cell
+    X = nodes[cells]
+    E = np.roll(X, -1, axis=1) - X
+    E *= np.sign(signed_areas(nodes, cells))[:, None, None]
+    lines = np.stack((-E[..., 1], E[..., 0], E[..., 1]*X[..., 0] - E[..., 0]*X[..., 1]), axis=-1)
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    found = np.full(len(x), -1, dtype=np.int32)
+    for start in range(0, len(x), LOCATOR_CHUNK):
+        px = x[start:start + LOCATOR_CHUNK]
+        py = y[start:start + LOCATOR_CHUNK]
+        bi = np.floor((px - xmin)/dx).astype(np.int64)
+        bj = np.floor((py - ymin)/dy).astype(np.int64)
+        # points on the bounding box edges (within tol) belong to the edge buckets
+        bi[(bi == nx) & (px <= xmin + nx*dx + tol)] = nx - 1
+        bj[(bj == ny) & (py <= ymin + ny*dy + tol)] = ny - 1
+        bi[(bi == -1) & (px >= xmin - tol)] = 0
+        bj[(bj == -1) & (py >= ymin - tol)] = 0
+        inside = (bi >= 0) & (bi < nx) & (bj >= 0) & (bj < ny)
+        point = np.flatnonzero(inside)
+        bucket = bj[point]*nx + bi[point]
+        count = ptr[bucket + 1] - ptr[bucket]
+        # one test per (point, candidate cell) pair
+        pair = np.repeat(point, count)
+        entry = np.arange(count.sum()) + np.repeat(ptr[bucket] - np.cumsum(count) + count, count)
+        cell = candidates[entry]
+        L = lines[cell]
+        cross = L[..., 0]*px[pair, None] + L[..., 1]*py[pair, None] + L[..., 2]
+        hit = np.all(cross >= -tol, axis=1)
+        # first hit of each point (candidates are sorted by cell index)
+        hit = np.flatnonzero(hit)
+        first = np.ones(len(hit), dtype=bool)
+        first[1:] = pair[hit[1:]] != pair[hit[:-1]]
+        result = np.full(len(px), -1, dtype=np.int32)
+        result[pair[hit[first]]] = cell[hit[first]]
+        found[start:start + len(px)] = result
+    return found
+
+#============================================
+# MAIN
+#============================================
+
+# check meshes from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the geometry and subdomains of meshes of the case.")
+    parser.add_argument("files", nargs="+", help="mesh files in MSH format")
+    parser.add_argument("--codes", default="../codes", help="directory of the generated code")
+    args = parser.parse_args(argv)
+    name, consts = load_constants(args.codes)
+    failed = 0
+    for path in args.files:
+        mesh = load_mesh(path)
+        geom = load_geometry(mesh)
+        line = f"{path}: h = {mesh_size(geom):.6e}"
+        if CURVES[name]:
+            outside, mismatched = check_classification(mesh, consts, name)
+            line += f", nodes classified outside {outside}, cells in another subdomain {mismatched}"
+            failed += outside + mismatched > 0
+        print(line)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# end of file